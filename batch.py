@@ -0,0 +1,37 @@
+import argparse
+import logging
+
+from constants import HEADLESS_OUTPUT_PATH, HISTORY_DIR
+from models.config_manager import ConfigManager
+from models.logger import setup_logging
+from models.session_history import SessionHistory
+from controllers.headless_runner import run_batch
+
+logger = logging.getLogger(__name__)
+
+def main():
+    """Play many headless sessions and write them to JSON Lines."""
+    parser = argparse.ArgumentParser(description="Headless batch runner for Spin The Wheel sessions.")
+    parser.add_argument("sessions", type=int, help="Number of sessions to play.")
+    parser.add_argument("-o", "--output", default=HEADLESS_OUTPUT_PATH, help="JSON Lines output path.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Seed of the first session.")
+    parser.add_argument("--history", nargs="?", const=HISTORY_DIR, default=None,
+                        help=f"Also append the sessions to a session history (default directory: {HISTORY_DIR}).")
+    args = parser.parse_args()
+    setup_logging()
+
+    config_manager = ConfigManager()
+    history = SessionHistory(args.history) if args.history else None
+    try:
+        report = run_batch(config_manager.config, args.sessions, args.output, args.workers, args.seed,
+                           history=history)
+    finally:
+        if history is not None:
+            history.close()
+    print(f"{report['sessions']} sessions in {report['seconds']:.2f}s on {report['workers']} workers: "
+          f"{report['sessions_per_second']:.0f} sessions/s, "
+          f"{report['sessions_per_second_per_core']:.0f} sessions/s per core")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import logging
+import sys
+
+from constants import BENCH_BASELINE_PATH, BENCH_REPEATS, BENCH_THRESHOLD, LATENCY_BENCH_INPUTS
+from models.logger import setup_logging
+from . import bench_render, bench_loading  # noqa: F401 (registers benchmarks)
+from .harness import run, save_baseline, compare
+from .latency import measure_input_latency
+
+logger = logging.getLogger(__name__)
+
+def main():
+    """Run the benchmark suite, optionally saving or comparing a baseline."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Rendering and loading benchmarks.")
+    parser.add_argument("-k", dest="names", action="append", help="Only run benchmarks containing this text.")
+    parser.add_argument("--save", nargs="?", const=BENCH_BASELINE_PATH, help="Store results as a baseline JSON.")
+    parser.add_argument("--compare", nargs="?", const=BENCH_BASELINE_PATH, help="Fail on regressions against a baseline.")
+    parser.add_argument("--threshold", type=float, default=BENCH_THRESHOLD, help="Allowed relative slowdown.")
+    parser.add_argument("--repeats", type=int, default=BENCH_REPEATS, help="Timed repeats per benchmark.")
+    parser.add_argument("--latency", nargs="?", type=int, const=LATENCY_BENCH_INPUTS,
+                        help="Also measure input-to-display latency with this many synthetic inputs.")
+    args = parser.parse_args()
+    setup_logging(logging.WARNING)
+
+    results = run(args.names, args.repeats)
+    for name, result in results.items():
+        print(f"{name:<40} {result['median_ms']:10.3f} ms  (min {result['min_ms']:.3f}, {result['loops']} loops)")
+    if args.latency:
+        for event_name, stats in measure_input_latency(args.latency).items():
+            print(f"latency {event_name:<32} p50 {stats['p50']:7.2f} ms  p95 {stats['p95']:7.2f} ms  "
+                  f"p99 {stats['p99']:7.2f} ms  ({stats['count']} inputs)")
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"Baseline written to {args.save}")
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before:.3f} ms -> {after:.3f} ms ({(ratio - 1) * 100:+.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import imageio.v2 as imageio
+import numpy as np
+
+from constants import CONFIG_PATH, QUESTIONS
+from controllers.media_loader import MediaLoader
+from models.config_manager import ConfigManager
+from .bench_render import CONFIG
+from .harness import benchmark, init_display
+
+GIF_SIZES = {"small": (120, 90, 10), "medium": (320, 240, 20), "large": (640, 480, 30)}
+
+def _in_temp_dir():
+    """Switch to a fresh working directory; returns a teardown restoring the old one."""
+    old_cwd = os.getcwd()
+    tmp = tempfile.mkdtemp(prefix="kft_bench_")
+    os.chdir(tmp)
+
+    def teardown():
+        os.chdir(old_cwd)
+        shutil.rmtree(tmp, ignore_errors=True)
+    return teardown
+
+def _load_gif(size):
+    init_display()
+    teardown = _in_temp_dir()
+    width, height, frames = GIF_SIZES[size]
+    rng = np.random.default_rng(0)
+    gif_dir = Path('assets') / 'gifs'
+    gif_dir.mkdir(parents=True)
+    data = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(frames)]
+    imageio.mimsave(gif_dir / "1.1.gif", data, duration=100)
+    loader = MediaLoader()
+    return (lambda: loader.load_gif("1.1")), teardown
+
+@benchmark("media_loader.load_gif[small]")
+def bench_load_gif_small():
+    return _load_gif("small")
+
+@benchmark("media_loader.load_gif[medium]")
+def bench_load_gif_medium():
+    return _load_gif("medium")
+
+@benchmark("media_loader.load_gif[large]")
+def bench_load_gif_large():
+    return _load_gif("large")
+
+def _config_manager():
+    teardown = _in_temp_dir()
+    Path(CONFIG_PATH).parent.mkdir(parents=True)
+    Path(CONFIG_PATH).write_text(json.dumps(CONFIG), encoding='utf-8')
+    return ConfigManager(), teardown
+
+@benchmark("config_manager.load_config")
+def bench_load_config():
+    manager, teardown = _config_manager()
+    return manager.load_config, teardown
+
+@benchmark("config_manager.save_config")
+def bench_save_config():
+    manager, teardown = _config_manager()
+    counts = [5] * len(QUESTIONS)
+    return (lambda: manager.save_config("Star Wars", "music.mp3", "None", (60, 30, 30), counts)), teardown
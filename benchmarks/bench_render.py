@@ -0,0 +1,116 @@
+import random
+import pygame
+
+from constants import WIDTH, HEIGHT, CONFIG_BG_COLOR, FONT_SIZE, RESPONSE_FONT_SCALE, TEXT_MARGIN
+from models.spin_wheel import SpinWheelModel
+from views.config_view import ConfigView
+from views.wheel_renderer import WheelRenderer
+from views.game_view import GameView
+from utils import draw_gradient_background, wrap_text
+from .harness import benchmark, init_display
+
+CONFIG = {
+    "prompt": "Star Wars",
+    "music": "music.mp3",
+    "bg_img": "None",
+    "bg_color": [60, 30, 30],
+    "questions": [{"text": f"Q{i}", "num_answers": 5, "answers": [f"Answer {j}" for j in range(10)]}
+                  for i in range(10)],
+}
+
+LONG_RESPONSE = " ".join(["You started from the bottom and the wheel kept spinning anyway."] * 12)
+
+def _draw_wheel(segments, spinning=False):
+    screen = init_display()
+    view = GameView(screen, CONFIG)
+    wheel = SpinWheelModel([f"Segment {i}" for i in range(segments)], sound=False)
+    wheel.angle = 17.0
+    wheel.spinning = spinning
+    view._draw_wheel(wheel)
+
+    def draw():
+        if spinning:
+            wheel.angle -= 7.3
+        view._draw_wheel(wheel)
+    return draw
+
+@benchmark("game_view.draw_wheel[4]")
+def bench_draw_wheel_4():
+    return _draw_wheel(4)
+
+@benchmark("game_view.draw_wheel[8]")
+def bench_draw_wheel_8():
+    return _draw_wheel(8)
+
+@benchmark("game_view.draw_wheel[32]")
+def bench_draw_wheel_32():
+    return _draw_wheel(32)
+
+@benchmark("game_view.draw_wheel[200]")
+def bench_draw_wheel_200():
+    return _draw_wheel(200)
+
+@benchmark("game_view.draw_wheel[200,spinning]")
+def bench_draw_wheel_200_spinning():
+    return _draw_wheel(200, spinning=True)
+
+@benchmark("game_view.build_wheel[200]")
+def bench_build_wheel_200():
+    init_display()
+    renderer = WheelRenderer()
+    wheel = SpinWheelModel([f"Name {i}" for i in range(200)], sound=False)
+    return lambda: renderer.build(wheel.segments, renderer.boundaries(wheel))
+
+@benchmark("game_view.build_wheel[5000,weighted]")
+def bench_build_wheel_weighted():
+    init_display()
+    renderer = WheelRenderer()
+    wheel = SpinWheelModel([f"Entry {i}" for i in range(5000)], sound=False,
+                           weights=[1 + i % 7 for i in range(5000)])
+    return lambda: renderer.build(wheel.segments, renderer.boundaries(wheel))
+
+@benchmark("spin_wheel.land[5000,weighted]")
+def bench_land_weighted():
+    wheel = SpinWheelModel([f"Entry {i}" for i in range(5000)], rng=random.Random(0), sound=False,
+                           weights=[1 + i % 7 for i in range(5000)])
+    wheel.alias_table
+
+    def land():
+        wheel.land()
+        wheel.get_selected_segment()
+    return land
+
+@benchmark("game_view.render_background")
+def bench_render_background():
+    view = GameView(init_display(), CONFIG)
+    return view.render_background
+
+@benchmark("utils.draw_gradient_background")
+def bench_draw_gradient_background():
+    screen = init_display()
+    return lambda: draw_gradient_background(screen, HEIGHT, CONFIG_BG_COLOR, (50, 50, 100))
+
+@benchmark("utils.wrap_text[long]")
+def bench_wrap_text():
+    init_display()
+    font = pygame.font.SysFont("Arial", int(FONT_SIZE * RESPONSE_FONT_SCALE))
+    return lambda: wrap_text(LONG_RESPONSE, font, WIDTH - TEXT_MARGIN)
+
+@benchmark("config_view.render")
+def bench_config_view_render():
+    view = ConfigView(init_display(), CONFIG)
+    return view.render
+
+@benchmark("config_view.render[typing]")
+def bench_config_view_typing():
+    view = ConfigView(init_display(), CONFIG)
+    view.prompt_box.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=view.prompt_box.rect.center, button=1))
+    keys = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, unicode='a'),
+            pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode='')]
+    step = [0]
+
+    def type_and_render():
+        step[0] += 1
+        view.prompt_box.handle_event(keys[step[0] % 2])
+        view.render()
+    return type_and_render
@@ -0,0 +1,128 @@
+import json
+import logging
+import platform
+import statistics
+import time
+from pathlib import Path
+
+import pygame
+
+from constants import WIDTH, HEIGHT, BENCH_MIN_REPEAT_TIME, BENCH_REPEATS, BENCH_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+BENCHMARKS = {}
+
+def benchmark(name):
+    """Register a benchmark.
+
+    The decorated function does the setup and returns a zero-argument
+    callable that is timed; it may also return (callable, teardown).
+
+    Args:
+        name (str): Unique benchmark name.
+    """
+    def decorator(func):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name} registered twice")
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+def init_display():
+    """Open the (dummy-driver) display once and return the screen surface."""
+    if not pygame.display.get_init():
+        pygame.display.init()
+        pygame.font.init()
+    return pygame.display.get_surface() or pygame.display.set_mode((WIDTH, HEIGHT))
+
+def time_callable(func, repeats=BENCH_REPEATS, min_repeat_time=BENCH_MIN_REPEAT_TIME):
+    """Time a callable, calibrating the loop count so each repeat runs long enough.
+
+    Args:
+        func (callable): Zero-argument callable to time.
+        repeats (int): Number of timed repeats.
+        min_repeat_time (float): Minimum seconds per repeat.
+
+    Returns:
+        dict: Median and minimum milliseconds per call, plus loops and repeats.
+    """
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_repeat_time:
+            break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_repeat_time / elapsed) + 1))
+    per_call = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        per_call.append((time.perf_counter() - start) / loops)
+    return {
+        "median_ms": statistics.median(per_call) * 1000.0,
+        "min_ms": min(per_call) * 1000.0,
+        "loops": loops,
+        "repeats": repeats,
+    }
+
+def run(names=None, repeats=BENCH_REPEATS, min_repeat_time=BENCH_MIN_REPEAT_TIME):
+    """Run registered benchmarks.
+
+    Args:
+        names (list): Substrings selecting benchmarks, or None for all.
+        repeats (int): Number of timed repeats per benchmark.
+        min_repeat_time (float): Minimum seconds per repeat.
+
+    Returns:
+        dict: Results keyed by benchmark name.
+    """
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if names and not any(n in name for n in names):
+            continue
+        prepared = setup()
+        func, teardown = prepared if isinstance(prepared, tuple) else (prepared, None)
+        try:
+            results[name] = time_callable(func, repeats, min_repeat_time)
+        finally:
+            if teardown:
+                teardown()
+        logger.info("%-40s %10.3f ms", name, results[name]["median_ms"])
+    return results
+
+def save_baseline(results, path):
+    """Store results as a baseline JSON file.
+
+    Args:
+        results (dict): Results from run().
+        path (str): Output path.
+    """
+    data = {"machine": platform.platform(), "python": platform.python_version(), "results": results}
+    Path(path).write_text(json.dumps(data, indent=4), encoding='utf-8')
+
+def compare(results, baseline_path, threshold=BENCH_THRESHOLD):
+    """Compare results with a stored baseline.
+
+    Args:
+        results (dict): Results from run().
+        baseline_path (str): Baseline JSON path.
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        list: (name, baseline ms, current ms, ratio) for each regressed benchmark.
+    """
+    baseline = json.loads(Path(baseline_path).read_text(encoding='utf-8'))["results"]
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["median_ms"], result["median_ms"]
+        ratio = after / before if before > 0 else float('inf')
+        if ratio > 1 + threshold:
+            regressions.append((name, before, after, ratio))
+    return regressions
@@ -0,0 +1,52 @@
+import pygame
+
+from constants import FPS, SPACE_KEY, MOUSE_LEFT_BUTTON, LATENCY_BENCH_INPUTS
+from models.latency_tracer import latency_tracer
+from models.logger import GameState
+from .harness import init_display
+
+def _frame(state_manager, dt):
+    """Run one frame the way main.main does: dequeue, dispatch, update, flip."""
+    for event in pygame.event.get():
+        latency_tracer.stamp(event)
+        state_manager.handle_event(event)
+    state_manager.update(dt)
+    pygame.display.flip()
+    latency_tracer.on_flip()
+
+def measure_input_latency(inputs=LATENCY_BENCH_INPUTS, fps=FPS):
+    """Post synthetic clicks and key presses and measure their input-to-flip latency.
+
+    Each round clicks PLAY in the menu (a state switch) and presses SPACE on a
+    wheel waiting to be spun, then restarts the game.
+
+    Args:
+        inputs (int): Number of rounds.
+        fps (int): Virtual frame rate used for dt.
+
+    Returns:
+        dict: LatencyTracer.stats() for the synthetic inputs.
+    """
+    from main import build_app
+    state_manager, _ = build_app(init_display(), sound=False)
+    game = state_manager.controllers["game"]
+    play_pos = next(b["pos"] for b in state_manager.controllers["menu"].view.buttons if b["action"] == "game")
+    get_pos = pygame.mouse.get_pos
+    pygame.mouse.get_pos = lambda: play_pos
+    dt = 1.0 / fps
+    latency_tracer.samples.clear()
+    try:
+        for _ in range(inputs):
+            state_manager.set_state("menu")
+            _frame(state_manager, dt)
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=play_pos, button=MOUSE_LEFT_BUTTON))
+            _frame(state_manager, dt)
+            game.game_state.set_state(GameState.SPINNING)
+            game.game_state.current_draw = 0
+            game.generate_new_wheel()
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=SPACE_KEY, mod=0, unicode=' '))
+            _frame(state_manager, dt)
+            game.restart()
+    finally:
+        pygame.mouse.get_pos = get_pos
+    return latency_tracer.stats()
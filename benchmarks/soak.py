@@ -0,0 +1,265 @@
+import argparse
+import gc
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+import logging
+
+import numpy as np
+import pygame
+
+from constants import (
+    RESTART_KEY, SOAK_FPS, SOAK_MAX_GAME_FRAMES, SOAK_RESULTS_FRAMES, SOAK_WARMUP,
+    SOAK_SNAPSHOT_EVERY, SOAK_GROWTH_THRESHOLDS, SOAK_OUTPUT_PATH
+)
+from models.logger import GameState, setup_logging
+from . import harness
+
+logger = logging.getLogger(__name__)
+
+class VirtualMouse:
+    """Replaces pygame.mouse.get_pos with a scripted position while active."""
+
+    def __init__(self):
+        self.pos = (0, 0)
+        self._original = None
+
+    def __enter__(self):
+        self._original = pygame.mouse.get_pos
+        pygame.mouse.get_pos = lambda: self.pos
+        return self
+
+    def __exit__(self, *exc):
+        pygame.mouse.get_pos = self._original
+        return False
+
+def rss_bytes():
+    """Get the current resident set size, falling back to the peak where /proc is missing."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+def count_live_surfaces():
+    """Count distinct pygame Surfaces referenced from any GC-tracked object.
+
+    Surfaces are not tracked by the garbage collector themselves, so they are
+    found through the referents of tracked containers, frames and instances.
+    """
+    seen = set()
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface):
+                seen.add(id(ref))
+    return len(seen)
+
+def detect_growth(values, threshold):
+    """Check a per-iteration series for sustained growth.
+
+    Args:
+        values (list): Measurements, one per iteration.
+        threshold (float): Relative growth from the fitted start to end that is flagged.
+
+    Returns:
+        dict: slope per iteration, relative growth, share of non-decreasing steps and a
+            flagged bool set when growth exceeds the threshold and most steps do not decrease.
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 3:
+        return {"slope": 0.0, "growth": 0.0, "monotonic": 0.0, "flagged": False}
+    x = np.arange(len(values))
+    slope, intercept = np.polyfit(x, values, 1)
+    start = max(abs(intercept), 1e-12)
+    growth = slope * (len(values) - 1) / start
+    monotonic = float(np.mean(np.diff(values) >= 0))
+    return {
+        "slope": float(slope),
+        "growth": float(growth),
+        "monotonic": monotonic,
+        "flagged": bool(growth > threshold and monotonic >= 0.6),
+    }
+
+class SoakRunner:
+    """Replays scripted menu, config, game, results and restart loops.
+
+    This class drives StateManager.handle_event/update with a virtual clock and
+    records frame time, RSS, live Surfaces and top allocators per iteration.
+    """
+
+    def __init__(self, state_manager, fps=SOAK_FPS, snapshot_every=SOAK_SNAPSHOT_EVERY):
+        """Initialize the SoakRunner.
+
+        Args:
+            state_manager: StateManager with menu, config and game controllers registered.
+            fps (int): Virtual frame rate; every frame advances the clock by 1 / fps.
+            snapshot_every (int): Take a tracemalloc snapshot every n iterations, 0 to disable.
+        """
+        self.state_manager = state_manager
+        self.dt = 1.0 / fps
+        self.snapshot_every = snapshot_every
+        self.mouse = VirtualMouse()
+        self.frame_times = []
+        self._first_snapshot = None
+
+    def frame(self, events=()):
+        """Run one frame: dispatch scripted events, update and flip."""
+        start = time.perf_counter()
+        for event in events:
+            self.state_manager.handle_event(event)
+        self.state_manager.update(self.dt)
+        pygame.display.flip()
+        self.frame_times.append(time.perf_counter() - start)
+
+    def click(self, pos):
+        """Move the virtual mouse and run a frame with a left click there."""
+        self.mouse.pos = pos
+        self.frame([
+            pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1),
+        ])
+
+    def key(self, key, unicode=''):
+        """Run a frame with a key press."""
+        self.frame([pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0)])
+
+    def play_iteration(self):
+        """Play one scripted loop: menu -> config -> menu -> game -> results -> restart."""
+        controllers = self.state_manager.controllers
+        menu_buttons = {b["action"]: b["pos"] for b in controllers["menu"].view.buttons}
+        config_view = controllers["config"].view
+
+        self.frame()
+        self.click(menu_buttons["config"])
+        self.frame()
+        self.click(config_view.prompt_box.rect.center)
+        for char in " soak":
+            self.key(ord(char), char)
+        for _ in " soak":
+            self.key(pygame.K_BACKSPACE)
+        self.click(config_view.back_button["rect"].center)
+        self.frame()
+        self.click(menu_buttons["game"])
+
+        game = controllers["game"]
+        for _ in range(SOAK_MAX_GAME_FRAMES):
+            if game.game_state.state == GameState.RESULTS:
+                break
+            self.frame()
+        else:
+            raise RuntimeError("Game did not reach the results screen")
+        for _ in range(SOAK_RESULTS_FRAMES):
+            self.frame()
+        self.key(RESTART_KEY, 'r')
+        if self.state_manager.current_state != "menu":
+            raise RuntimeError(f"Restart did not return to the menu (in {self.state_manager.current_state})")
+
+    def run(self, iterations, output_path=None):
+        """Play iterations and record one measurement row per iteration.
+
+        Args:
+            iterations (int): Number of full loops to play.
+            output_path (str): Optional JSON Lines file for the per-iteration rows.
+
+        Returns:
+            list: Per-iteration measurement dicts.
+        """
+        rows = []
+        tracemalloc.start()
+        out = open(output_path, 'w', encoding='utf-8') if output_path else None
+        try:
+            with self.mouse:
+                for i in range(iterations):
+                    self.frame_times = []
+                    self.play_iteration()
+                    gc.collect()
+                    frame_ms = np.asarray(self.frame_times) * 1000.0
+                    row = {
+                        "iteration": i,
+                        "frames": len(frame_ms),
+                        "frame_ms_mean": float(frame_ms.mean()),
+                        "frame_ms_p95": float(np.percentile(frame_ms, 95)),
+                        "rss_bytes": rss_bytes(),
+                        "surfaces": count_live_surfaces(),
+                        "traced_bytes": tracemalloc.get_traced_memory()[0],
+                    }
+                    if self.snapshot_every and i % self.snapshot_every == 0:
+                        row["top_allocators"] = self._top_allocators()
+                    rows.append(row)
+                    if out:
+                        out.write(json.dumps(row) + "\n")
+                        out.flush()
+                    logger.info("Iteration %d: %.2f ms/frame, %d surfaces, %.1f MB RSS", i,
+                                row["frame_ms_mean"], row["surfaces"], row["rss_bytes"] / 1e6)
+        finally:
+            if out:
+                out.close()
+            tracemalloc.stop()
+        return rows
+
+    def _top_allocators(self, limit=5):
+        """Top source lines by allocated bytes, as growth since the first snapshot when available."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        if self._first_snapshot is None:
+            self._first_snapshot = snapshot
+            stats = snapshot.statistics("lineno")
+            return [{"where": str(s.traceback), "bytes": s.size, "count": s.count} for s in stats[:limit]]
+        stats = snapshot.compare_to(self._first_snapshot, "lineno")
+        return [{"where": str(s.traceback), "bytes": s.size_diff, "count": s.count_diff} for s in stats[:limit]]
+
+def analyze(rows, warmup=SOAK_WARMUP, thresholds=SOAK_GROWTH_THRESHOLDS):
+    """Flag series that keep growing after the warmup iterations.
+
+    Args:
+        rows (list): Per-iteration rows from SoakRunner.run.
+        warmup (int): Iterations ignored at the start.
+        thresholds (dict): Relative growth threshold per measured key.
+
+    Returns:
+        dict: Growth report per key.
+    """
+    rows = rows[warmup:] if len(rows) > warmup + 2 else rows
+    return {key: detect_growth([row[key] for row in rows], threshold) for key, threshold in thresholds.items()}
+
+def main():
+    """Run the soak test and exit with status 1 if any leak or creep is flagged."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.soak", description="Soak test of full game loops.")
+    parser.add_argument("iterations", type=int, help="Number of menu/config/game/results/restart loops.")
+    parser.add_argument("--fps", type=int, default=SOAK_FPS, help="Virtual frame rate.")
+    parser.add_argument("-o", "--output", default=SOAK_OUTPUT_PATH, help="JSON Lines file for per-iteration rows.")
+    parser.add_argument("--snapshot-every", type=int, default=SOAK_SNAPSHOT_EVERY,
+                        help="tracemalloc snapshot interval in iterations (0 disables).")
+    parser.add_argument("--warmup", type=int, default=SOAK_WARMUP, help="Iterations ignored by the analysis.")
+    args = parser.parse_args()
+    setup_logging(logging.WARNING)
+
+    from main import build_app
+    screen = harness.init_display()
+    state_manager, _ = build_app(screen, sound=False)
+    rows = SoakRunner(state_manager, args.fps, args.snapshot_every).run(args.iterations, args.output)
+    report = analyze(rows, args.warmup)
+    flagged = False
+    for key, result in report.items():
+        status = "GROWING" if result["flagged"] else "ok"
+        flagged |= result["flagged"]
+        print(f"{key:<16} {status:<8} growth {result['growth']:+.1%}  slope {result['slope']:+.4g}/iter  "
+              f"non-decreasing {result['monotonic']:.0%}")
+    snapshots = [row["top_allocators"] for row in rows if "top_allocators" in row]
+    if len(snapshots) > 1:
+        top = snapshots[-1]
+        print("Top allocators (growth since first snapshot):")
+        for entry in top:
+            print(f"  {entry['bytes']:+10d} B  {entry['count']:+6d}  {entry['where']}")
+    print(f"Per-iteration rows written to {args.output}")
+    sys.exit(1 if flagged else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,54 @@
+import logging
+import math
+import os
+
 import pygame
 
-WIDTH, HEIGHT = 1200, 800
+# Layout values are given in logical pixels of a LOGICAL_WIDTH x LOGICAL_HEIGHT screen and
+# rendered at RENDER_SCALE times that resolution; the window can be any size.
+LOGICAL_WIDTH, LOGICAL_HEIGHT = 1200, 800
+RENDER_SCALE_ENV = "KFT_RENDER_SCALE"  # e.g. 0.5 on weak devices, 1.8 for sharp 4K output
+
+def render_scale(text):
+    """Parse a render scale, falling back to 1.0 for anything but a positive number.
+
+    Args:
+        text (str): Value of KFT_RENDER_SCALE, or None when unset.
+
+    Returns:
+        float: Render scale.
+    """
+    if not text:
+        return 1.0
+    try:
+        scale = float(text)
+    except ValueError:
+        scale = math.nan
+    if not math.isfinite(scale) or scale <= 0:
+        logging.getLogger(__name__).warning("Invalid %s %r, rendering at scale 1.0", RENDER_SCALE_ENV, text)
+        return 1.0
+    return scale
+
+RENDER_SCALE = render_scale(os.environ.get(RENDER_SCALE_ENV))
+
+def px(value, scale=RENDER_SCALE):
+    """Convert a length in logical pixels to render pixels, keeping nonzero lengths at least 1 pixel."""
+    scaled = round(value * scale)
+    return scaled if scaled or not value else (1 if value > 0 else -1)
+
+WIDTH, HEIGHT = px(LOGICAL_WIDTH), px(LOGICAL_HEIGHT)
 CENTER = (WIDTH // 2, HEIGHT // 2)
-WHEEL_RADIUS = 300
+WHEEL_RADIUS = px(300)
 FPS = 60
-FONT_SIZE = 32
-CONFIG_FONT_SIZE = 20
-LABEL_FONT_SIZE = 18
+FONT_SIZE = px(32)
+CONFIG_FONT_SIZE = px(20)
+LABEL_FONT_SIZE = px(18)
 RESPONSE_FONT_SCALE = 0.8
 SMALL_FONT_SCALE = 0.7
-RESULTS_FONT_SIZE = 24
-BORDER_RADIUS = 10
-PADDING = 10
-INPUT_BOX_OFFSET = 25
+RESULTS_FONT_SIZE = px(24)
+BORDER_RADIUS = px(10)
+PADDING = px(10)
+INPUT_BOX_OFFSET = px(25)
 SEGMENT_COLORS = [
     (255, 50, 50),   # Red
     (50, 255, 50),   # Green
@@ -45,45 +81,48 @@ GIF_DISPLAY_TIME = 3.0
 FRAME_DELAY_DEFAULT = 0.1
 WAIT_TIME = 1.5
 TEXT_BG_ALPHA = 128
-TEXT_MARGIN = 40
-RESULT_Y_START = 100
-RESULT_Y_GAP = 20
-RESPONSE_Y_GAP = 40
-BUTTON_WIDTH = 200
-SAVE_BUTTON_WIDTH = 250
-BUTTON_HEIGHT = 50
-BUTTON_Y_OFFSET = -100
+TEXT_MARGIN = px(40)
+RESULT_Y_START = px(100)
+RESULT_Y_GAP = px(20)
+RESPONSE_Y_GAP = px(40)
+BUTTON_WIDTH = px(200)
+SAVE_BUTTON_WIDTH = px(250)
+BUTTON_HEIGHT = px(50)
+BUTTON_Y_OFFSET = px(-100)
 EXIT_BUTTON_COLOR = (100, 100, 255)
 SAVE_BUTTON_COLOR = (100, 255, 100)
 SAVE_BUTTON_BORDER_COLOR = (0, 0, 0)
-BORDER_THICKNESS = 2
-PROGRESS_TEXT_POS = (20, 20)
-RESULT_TEXT_Y = HEIGHT - 100
-INSTRUCTIONS_Y = HEIGHT - 60
-TITLE_Y = 50
-RESPONSE_TEXT_Y_OFFSET = -110
+BORDER_THICKNESS = px(2)
+PROGRESS_TEXT_POS = (px(20), px(20))
+RESULT_TEXT_Y = HEIGHT - px(100)
+INSTRUCTIONS_Y = HEIGHT - px(60)
+TITLE_Y = px(50)
+RESPONSE_TEXT_Y_OFFSET = px(-110)
 SPACE_KEY = pygame.K_SPACE
+RESTART_KEY = pygame.K_r
 MOUSE_LEFT_BUTTON = 1
 SPIN_INITIAL_VELOCITY_MIN = 720
 SPIN_INITIAL_VELOCITY_MAX = 1080
 SPIN_VELOCITY_MODIFIER_MIN = 0.5
 SPIN_VELOCITY_MODIFIER_MAX = 1.5
 SPIN_ADDITIONAL_ROTATIONS = 6.8
-INDICATOR_Y_OFFSET = -20
-INDICATOR_SIZE = 15
+INDICATOR_Y_OFFSET = px(-20)
+INDICATOR_SIZE = px(15)
 INDICATOR_COLOR = (200, 0, 0)
 TEXT_RADIUS_SCALE = 0.65
-FONT_SIZE_REDUCTION = 4
+FONT_SIZE_REDUCTION = px(4)
 FULL_CIRCLE = 360
 ANG_VELOCITY = -1080
 INDICATOR_POSITION = 90
-CIRCLE_RADIUS = 20
+CIRCLE_RADIUS = px(20)
 CIRCLE_BORDER_COLOR = (0, 0, 0)
 CIRCLE_FILL_COLOR = (255, 255, 255)
 CONFIG_BG_COLOR = (30, 30, 45)
 CONFIG_PANEL_COLOR = (40, 40, 60)
 CONFIG_ACCENT_COLOR = (70, 120, 200)
 CONFIG_BUTTON_COLOR = (60, 180, 100)
+CONFIG_SAVE_TEXT = "Zapisz i Generuj"
+CONFIG_SAVING_TEXT = "Generowanie..."
 CONFIG_BUTTON_HOVER_COLOR = (80, 210, 120)
 BACK_BUTTON_COLOR = (180, 70, 70)
 BACK_BUTTON_HOVER_COLOR = (210, 90, 90)
@@ -94,54 +133,197 @@ LABEL_COLOR = (200, 200, 220)
 TEXT_COLOR = (255, 255, 255)
 MENU_BG_COLOR = (30, 30, 30)
 MENU_BUTTON_COLOR = (70, 70, 70)
-MENU_BUTTON_WIDTH = 200
-MENU_BUTTON_HEIGHT = 60
-MENU_BUTTON_SPACING = 20
-MENU_BUTTONS_OFFSET = 50
-CONFIG_INPUT_WIDTH = 460
-CONFIG_INPUT_HEIGHT = 40
-CONFIG_NUM_INPUT_WIDTH = 60
-CONFIG_NUM_INPUT_HEIGHT = 35
-CONFIG_BUTTON_X = 980
-CONFIG_BUTTON_Y = 650
-CONFIG_BACK_BUTTON_Y = 720
-CONFIG_PANEL_X = 40
-CONFIG_PANEL_Y = 40
-CONFIG_PANEL_WIDTH = 720
-CONFIG_PANEL_HEIGHT = 590
-CONFIG_QUESTIONS_RECT_X = 70
-CONFIG_QUESTIONS_RECT_Y = 130
-CONFIG_QUESTIONS_RECT_WIDTH = 660
-CONFIG_QUESTIONS_RECT_HEIGHT = 470
-CONFIG_PROMPT_X = 70
-CONFIG_PROMPT_Y = 90
-CONFIG_COLOR_PICKER_Y = 230
-CONFIG_MUSIC_Y = 310
-CONFIG_BG_IMAGE_Y = 390
+MENU_BUTTON_WIDTH = px(200)
+MENU_BUTTON_HEIGHT = px(60)
+MENU_BUTTON_SPACING = px(20)
+MENU_BUTTONS_OFFSET = px(50)
+CONFIG_INPUT_WIDTH = px(460)
+CONFIG_INPUT_HEIGHT = px(40)
+CONFIG_NUM_INPUT_WIDTH = px(60)
+CONFIG_NUM_INPUT_HEIGHT = px(35)
+CONFIG_BUTTON_X = px(980)
+CONFIG_BUTTON_Y = px(650)
+CONFIG_BACK_BUTTON_Y = px(720)
+CONFIG_PANEL_X = px(40)
+CONFIG_PANEL_Y = px(40)
+CONFIG_PANEL_WIDTH = px(720)
+CONFIG_PANEL_HEIGHT = px(590)
+CONFIG_QUESTIONS_RECT_X = px(70)
+CONFIG_QUESTIONS_RECT_Y = px(130)
+CONFIG_QUESTIONS_RECT_WIDTH = px(660)
+CONFIG_QUESTIONS_RECT_HEIGHT = px(470)
+CONFIG_PROMPT_X = px(70)
+CONFIG_PROMPT_Y = px(90)
+CONFIG_COLOR_PICKER_Y = px(230)
+CONFIG_MUSIC_Y = px(310)
+CONFIG_BG_IMAGE_Y = px(390)
 SPIN_SOUND_PATH = "assets/sfx/spin.mp3"
 RESULT_IMAGE_PATH = "result.png"
 SECOND_IN_MS = 1000.0
 # New constants for ConfigView
-CONFIG_TITLE_Y = 20
-CONFIG_QUESTION_CIRCLE_RADIUS = 15
-CONFIG_QUESTION_CIRCLE_X = 90
-CONFIG_QUESTION_TEXT_X = 120
-CONFIG_QUESTION_Y_START = 150
-CONFIG_QUESTION_Y_GAP = 45
-CONFIG_PROMPT_PANEL_X = 40
-CONFIG_PROMPT_PANEL_Y = 660
-CONFIG_PROMPT_PANEL_WIDTH = 720
-CONFIG_PROMPT_PANEL_HEIGHT = 90
-CONFIG_PROMPT_TEXT_X_OFFSET = 10
-CONFIG_PROMPT_TEXT_Y_OFFSET = 5
-CONFIG_PROMPT_PREVIEW_Y_OFFSET = 30
-CONFIG_PROMPT_PREVIEW_LINE_GAP = 20
-CONFIG_PROMPT_PREVIEW_WIDTH = 700
-CONFIG_COLOR_PICKER_RECT_WIDTH = 35
-CONFIG_COLOR_PICKER_RECT_HEIGHT = 35
-CONFIG_COLOR_PICKER_SPACING = 45
-CONFIG_COLOR_PICKER_LABEL_Y_OFFSET = 25
-CONFIG_COLOR_PICKER_BORDER_RADIUS = 5
-CONFIG_COLOR_PICKER_CHECKMARK_SIZE = 7
-CONFIG_COLOR_PICKER_CHECKMARK_OFFSET = 3
-CONFIG_COLOR_PICKER_CHECKMARK_THICKNESS = 2
\ No newline at end of file
+CONFIG_TITLE_Y = px(20)
+CONFIG_QUESTION_CIRCLE_RADIUS = px(15)
+CONFIG_QUESTION_CIRCLE_X = px(90)
+CONFIG_QUESTION_TEXT_X = px(120)
+CONFIG_QUESTION_Y_START = px(150)
+CONFIG_QUESTION_Y_GAP = px(45)
+CONFIG_PROMPT_PANEL_X = px(40)
+CONFIG_PROMPT_PANEL_Y = px(660)
+CONFIG_PROMPT_PANEL_WIDTH = px(720)
+CONFIG_PROMPT_PANEL_HEIGHT = px(90)
+CONFIG_PROMPT_TEXT_X_OFFSET = px(10)
+CONFIG_PROMPT_TEXT_Y_OFFSET = px(5)
+CONFIG_PROMPT_PREVIEW_Y_OFFSET = px(30)
+CONFIG_PROMPT_PREVIEW_LINE_GAP = px(20)
+CONFIG_PROMPT_PREVIEW_WIDTH = px(700)
+CONFIG_COLOR_PICKER_RECT_WIDTH = px(35)
+CONFIG_COLOR_PICKER_RECT_HEIGHT = px(35)
+CONFIG_COLOR_PICKER_SPACING = px(45)
+CONFIG_COLOR_PICKER_LABEL_Y_OFFSET = px(25)
+CONFIG_COLOR_PICKER_BORDER_RADIUS = px(5)
+CONFIG_COLOR_PICKER_CHECKMARK_SIZE = px(7)
+CONFIG_COLOR_PICKER_CHECKMARK_OFFSET = px(3)
+CONFIG_COLOR_PICKER_CHECKMARK_THICKNESS = px(2)
+# Headless batch runner
+HEADLESS_CHUNK_SIZE = 64
+HEADLESS_OUTPUT_PATH = "sessions.jsonl"
+
+# Offscreen video rendering
+VIDEO_FPS = 30
+VIDEO_QUEUE_SIZE = 32
+VIDEO_RESULTS_HOLD_TIME = 4.0
+VIDEO_FORMAT = "mp4"
+VIDEO_OUTPUT_DIR = "videos"
+
+# Result image saving
+RESULT_IMAGE_NAMING = "timestamp"  # "overwrite", "timestamp" or "sequence"
+RESULT_IMAGE_FORMAT = "png"
+RESULT_IMAGE_COMPRESSION = 6
+RESULT_IMAGE_QUALITY = 90
+RESULT_PRINT_SCALE = 1  # >1 re-renders the results screen offscreen at this scale before saving
+SAVING_BUTTON_COLOR = (230, 200, 80)
+SAVE_FAILED_BUTTON_COLOR = (230, 90, 90)
+
+# Logging
+LOG_LEVEL = logging.INFO
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+HOT_PATH_LOG_LEVEL = logging.DEBUG  # level of per-frame and per-event messages
+HOT_PATH_LOG_INTERVAL = 1.0  # seconds between records of the same hot-path message
+HOT_PATH_LOG_SAMPLE = 1  # log only every n-th call of a hot-path message
+
+# Frame profiler
+FRAME_PROFILER_CAPACITY = 600
+FRAME_PROFILER_HOTKEY = pygame.K_F3
+FRAME_PROFILER_ENV = "KFT_FRAME_PROFILER"  # set to 1 to record from startup
+FRAME_PROFILE_DUMP_PATH = "frame_profile.csv"  # .csv or .json
+PROFILER_OVERLAY_POS = (WIDTH - px(330), px(10))
+PROFILER_OVERLAY_SIZE = (px(320), px(150))
+PROFILER_OVERLAY_ALPHA = 180
+PROFILER_FONT_SIZE = px(16)
+
+# State-scoped profiling captures
+PROFILE_OUTPUT_DIR = "profiles"
+PROFILE_MODE = "cprofile"  # "cprofile" or "sample"
+PROFILE_SAMPLE_INTERVAL = 0.005
+PROFILE_HOTKEY = pygame.K_F9
+PROFILE_STATES_ENV = "KFT_PROFILE_STATES"  # e.g. "game.showing_gif,config"
+PROFILE_FRAMES_ENV = "KFT_PROFILE_FRAMES"
+PROFILE_MODE_ENV = "KFT_PROFILE_MODE"
+
+# Metrics
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT_ENV = "KFT_METRICS_PORT"  # set to serve /metrics over HTTP on localhost
+METRICS_TEXTFILE_PATH = "metrics.prom"
+METRICS_EXPORT_INTERVAL = 15.0
+METRICS_DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FRAME_TIME_BUCKETS = (0.008, 0.012, 0.0167, 0.02, 0.025, 0.0333, 0.05, 0.1, 0.25)
+SPIN_DURATION_BUCKETS = (1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 8.0, 10.0)
+
+# Benchmarks
+BENCH_BASELINE_PATH = "benchmarks/baseline.json"
+BENCH_REPEATS = 5
+BENCH_MIN_REPEAT_TIME = 0.05
+BENCH_THRESHOLD = 0.2
+
+# Soak test
+SOAK_FPS = 30
+SOAK_MAX_GAME_FRAMES = 20000
+SOAK_RESULTS_FRAMES = 30
+SOAK_WARMUP = 3
+SOAK_SNAPSHOT_EVERY = 10
+SOAK_GROWTH_THRESHOLDS = {"frame_ms_mean": 0.5, "rss_bytes": 0.1, "surfaces": 0.05, "traced_bytes": 0.2}
+SOAK_OUTPUT_PATH = "soak.jsonl"
+
+# Memory accounting
+MEMORY_TOP_ALLOCATORS = 10
+MEMORY_TRANSITION_HISTORY = 50
+MEMORY_WALK_DEPTH = 4
+MEMORY_TRACE_ENV = "KFT_MEMORY_TRACE"  # set to the number of tracemalloc frames to record
+MEMORY_OVERLAY_HOTKEY = pygame.K_F4
+MEMORY_OVERLAY_POS = (px(10), px(10))
+MEMORY_OVERLAY_SIZE = (px(360), px(230))
+MEMORY_OVERLAY_REFRESH = 0.5
+
+# Input latency
+LATENCY_HISTORY = 1000
+LATENCY_BUCKETS = (0.008, 0.016, 0.033, 0.05, 0.066, 0.1, 0.15, 0.25, 0.5)
+LATENCY_BENCH_INPUTS = 100
+
+# Event routing
+ROUTER_CELL_SIZE = px(64)
+
+# Wheel rendering
+WHEEL_ARC_STEP = 2.0  # degrees between rim points
+WHEEL_LABEL_MIN_PX = 9  # smaller labels are hidden
+WHEEL_LABEL_PADDING = px(12)
+WHEEL_LABEL_FILL = 0.8  # share of the segment width a label may use
+WHEEL_BORDER_MIN_PX = 6  # segment width at which radial borders start
+WHEEL_CACHE_SIZE = 12
+GIF_DIR = "assets/gifs"
+GIF_VARIANTS = 5  # variants drawn blindly when no GIF index is used
+
+# Asset manifest and preload
+ASSETS_DIR = "assets"
+BACKGROUNDS_DIR = "assets/backgrounds"
+ASSET_MANIFEST_PATH = "assets/manifest.json"
+ASSET_TYPES = {".png": "image", ".jpg": "image", ".jpeg": "image", ".bmp": "image", ".webp": "image",
+               ".gif": "gif", ".mp3": "audio", ".ogg": "audio", ".wav": "audio"}
+ASSET_HASH_CHUNK = 1 << 20
+ASSET_PRELOAD_WORKERS = 4
+ASSET_CONVERT_BUDGET_MS = 8  # main-thread conversion time per loading-screen frame
+LOADING_BAR_SIZE = (px(500), px(24))
+LOADING_BAR_COLOR = (100, 100, 200)
+
+# Background jobs
+JOB_WORKERS = 2
+JOB_COMPLETION_BUDGET_MS = 2
+JOB_PRIORITY_LOW = 0
+JOB_PRIORITY_NORMAL = 1
+JOB_PRIORITY_HIGH = 2
+
+# Hot reload
+FILE_WATCH_INTERVAL = 1.0
+FILE_WATCH_SETTLE = 0.1
+
+# State resources
+RESOURCE_BUDGET_BYTES = 48 * 1024 * 1024
+RESOURCE_BUDGET_ENV = "KFT_RESOURCE_BUDGET_MB"
+
+# Universe library
+UNIVERSE_DB_PATH = "data/universes.db"
+UNIVERSE_SEARCH_LIMIT = 3  # library matches shown under the prompt
+
+# Session history
+HISTORY_DIR = "history"
+HISTORY_SEGMENT_BYTES = 64 * 1024 * 1024
+HISTORY_FLUSH_INTERVAL = 5.0  # seconds a finished session may wait before it is written
+HISTORY_BATCH_SIZE = 4096
+HISTORY_MAX_DRAWS = len(QUESTIONS)
+
+# Suspend and resume
+SNAPSHOT_PATH = "data/session.snap"
+
+# Display
+WINDOW_SIZE_ENV = "KFT_WINDOW_SIZE"  # e.g. 1920x1080; the render resolution is scaled to fit it
+FULLSCREEN_ENV = "KFT_FULLSCREEN"  # set to 1 to fill the screen
+DISPLAY_SMOOTH_SCALE = False  # bilinear scaling when the window is scaled on the CPU; slower than nearest
@@ -0,0 +1,228 @@
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import imageio.v2 as imageio
+import pygame
+
+from constants import ASSET_PRELOAD_WORKERS, ASSET_CONVERT_BUDGET_MS, BACKGROUNDS_DIR, SPIN_SOUND_PATH
+from controllers.event_router import EventRouter
+from models.assets import AssetManifest, asset_store, presize
+from models.frame_profiler import frame_profiler
+from models.metrics import metrics
+
+logger = logging.getLogger(__name__)
+preload_seconds = metrics.histogram("kft_asset_preload_seconds", "Time from preload start to the last converted asset.")
+
+def decode_gif_info(path):
+    """Read a GIF's frame count, frame duration and size without keeping its frames.
+
+    Args:
+        path (str): GIF path.
+
+    Returns:
+        dict: 'frames', 'duration' (ms, or None if unset) and 'size' (width, height).
+    """
+    reader = imageio.get_reader(path)
+    try:
+        first = reader.get_data(0)
+        return {"frames": reader.get_length(), "duration": reader.get_meta_data().get('duration'),
+                "size": (first.shape[1], first.shape[0])}
+    finally:
+        reader.close()
+
+def required_assets(config):
+    """List the assets the configuration refers to.
+
+    Args:
+        config (dict): Configuration data.
+
+    Returns:
+        list: Asset paths relative to the working directory.
+    """
+    paths = [SPIN_SOUND_PATH]
+    if config.get("bg_img", "None") != "None":
+        paths.append((Path(BACKGROUNDS_DIR) / config["bg_img"]).as_posix())
+    if config.get("music"):
+        paths.append((Path(BACKGROUNDS_DIR) / config["music"]).as_posix())
+    return paths
+
+class AssetPreloader:
+    """Decodes assets on a thread pool and finishes them on the main thread.
+
+    This class submits every job at start(). Worker threads only decode
+    files; step(), called once per frame on the main thread, converts the
+    decoded images to the display format and stores everything in the
+    asset store, within a time budget so the loading screen keeps animating.
+    """
+
+    def __init__(self, manifest, required=(), store=asset_store, workers=ASSET_PRELOAD_WORKERS):
+        """Initialize the AssetPreloader.
+
+        Args:
+            manifest (AssetManifest): Scanned manifest of the files on disk.
+            required (list): Asset paths the game refers to; missing ones are reported at start().
+            store (AssetStore): Store that receives the decoded assets.
+            workers (int): Number of decoding threads.
+        """
+        self.manifest = manifest
+        self.required = list(required)
+        self.store = store
+        self.workers = workers
+        self.jobs = []
+        self.total = 0
+        self.done = 0
+        self._executor = None
+        self._started_at = None
+
+    def jobs_for(self):
+        """Choose what to preload: required images and sounds, plus metadata of every GIF.
+
+        Returns:
+            list: (kind, path) pairs.
+        """
+        jobs = []
+        for path in self.required:
+            if path not in self.manifest:
+                continue
+            kind = self.manifest.entries[self.manifest.relative(path)]["type"]
+            if kind in ("image", "sound"):
+                jobs.append((kind, path))
+        jobs += [("gif", path) for path in self.manifest.of_type("gif")]
+        return jobs
+
+    def start(self):
+        """Report missing required assets once and submit the decoding jobs."""
+        self.store.use_manifest(self.manifest)
+        for path in self.required:
+            self.store.exists(path)
+        self._started_at = time.perf_counter()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="AssetPreload")
+        self.jobs = [(kind, path, self._executor.submit(self._decode, kind, path)) for kind, path in self.jobs_for()]
+        self.total = len(self.jobs)
+        logger.info("Preloading %d assets on %d threads", self.total, self.workers)
+
+    def _decode(self, kind, path):
+        """Decode one asset on a worker thread; images are scaled for the render resolution here too."""
+        if kind == "image":
+            return presize(pygame.image.load(path), self.store.image_scale)
+        if kind == "sound":
+            return pygame.mixer.Sound(path)
+        return decode_gif_info(path)
+
+    @property
+    def started(self):
+        """bool: True once start() has submitted the jobs."""
+        return self._executor is not None
+
+    @property
+    def progress(self):
+        """float: Share of the assets finished, from 0 to 1."""
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def finished(self):
+        """bool: True once every asset was stored or failed."""
+        return self.started and not self.jobs
+
+    def step(self, budget_ms=ASSET_CONVERT_BUDGET_MS):
+        """Store decoded assets on the main thread until the budget is spent.
+
+        Args:
+            budget_ms (float): Time allowed for this call in milliseconds.
+
+        Returns:
+            bool: True once preloading has finished.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        pending = []
+        for kind, path, future in self.jobs:
+            if not future.done() or time.perf_counter() > deadline:
+                pending.append((kind, path, future))
+                continue
+            self._finish(kind, path, future)
+            self.done += 1
+        self.jobs = pending
+        if self.finished and self._started_at is not None:
+            self._executor.shutdown(wait=False)
+            elapsed = time.perf_counter() - self._started_at
+            preload_seconds.observe(elapsed)
+            logger.info("Preloaded %d assets in %.1f ms", self.total, elapsed * 1000)
+            self._started_at = None
+        return self.finished
+
+    def _finish(self, kind, path, future):
+        """Store one decoded asset, converting images to the display format."""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error("Error preloading %s: %s", path, e)
+            self.store.missing.add(Path(path).as_posix())
+            return
+        if kind == "image":
+            self.store.add_image(path, result)
+        elif kind == "sound":
+            self.store.sounds[Path(path).as_posix()] = result
+        else:
+            self.store.gif_info[Path(path).as_posix()] = result
+
+    def wait(self):
+        """Finish preloading synchronously, e.g. for headless runs."""
+        if not self.started:
+            self.start()
+        while not self.step(budget_ms=float("inf")):
+            time.sleep(0.001)
+
+class LoadingController:
+    """Shows preload progress and moves on once every asset is ready."""
+
+    def __init__(self, loading_view, preloader, state_manager, next_state="menu"):
+        """Initialize the LoadingController.
+
+        Args:
+            loading_view: LoadingView instance.
+            preloader (AssetPreloader): Preloader to drive.
+            state_manager: StateManager to switch state on.
+            next_state (str): State entered once preloading has finished.
+        """
+        self.view = loading_view
+        self.preloader = preloader
+        self.state_manager = state_manager
+        self.next_state = next_state
+        self.router = EventRouter()
+
+    def on_enter(self):
+        """Start the preload when the loading screen is shown."""
+        if not self.preloader.started:
+            self.preloader.start()
+
+    def handle_event(self, event):
+        """Ignore input while loading."""
+        return None
+
+    def update(self, dt):
+        """Store finished assets, render progress and leave when done.
+
+        Args:
+            dt (float): Delta time in seconds.
+        """
+        finished = self.preloader.step()
+        with frame_profiler.phase("render"):
+            self.view.render(self.preloader.progress, self.preloader.done, self.preloader.total)
+        if finished:
+            self.state_manager.set_state(self.next_state)
+
+def load_manifest():
+    """Load the saved manifest, rescan the assets directory and save it again if anything changed.
+
+    Returns:
+        AssetManifest: Manifest of the files on disk.
+    """
+    manifest = AssetManifest.load()
+    if manifest.scan() and manifest.root.is_dir():
+        try:
+            manifest.save()
+        except OSError as e:
+            logger.error("Error saving asset manifest: %s", e)
+    return manifest
@@ -1,6 +1,10 @@
+import copy
 import pygame
 import logging
-from utils import handle_button_click
+from constants import JOB_PRIORITY_LOW
+from controllers.event_router import EventRouter, event_pos
+from models.frame_profiler import frame_profiler
+from models.job_scheduler import JobScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,10 @@ class InputHandler:
         self.view = view
         self.done = False
         self.go_back = False
+        self.focused = None
+        self.router = EventRouter(self._layout)
+        self.router.on(pygame.MOUSEBUTTONDOWN, self._on_click)
+        self.router.on(pygame.KEYDOWN, self._on_key)
 
     def handle_event(self, event):
         """Handle configuration input events.
@@ -26,23 +34,37 @@ class InputHandler:
         Args:
             event: Pygame event object.
         """
-        buttons = [self.view.save_button, self.view.back_button]
-        if handle_button_click(event, buttons):
-            mouse_pos = pygame.mouse.get_pos()
-            save_rect = pygame.Rect(*self.view.save_button["rect"])
-            back_rect = pygame.Rect(*self.view.back_button["rect"])
-            if save_rect.collidepoint(mouse_pos):
-                self.done = True
-                logger.info("Save button clicked")
-            elif back_rect.collidepoint(mouse_pos):
-                self.go_back = True
-                logger.info("Back button clicked")
-        self.view.prompt_box.handle_event(event)
-        self.view.color_picker.handle_event(event)
-        self.view.music_box.handle_event(event)
-        self.view.bg_box.handle_event(event)
-        for input_box in self.view.answer_inputs:
-            input_box.handle_event(event)
+        self.router.dispatch(event)
+
+    def _layout(self):
+        """Build the hit targets: both buttons, every input box and each color swatch."""
+        view = self.view
+        targets = [(view.save_button["rect"], "save"), (view.back_button["rect"], "back")]
+        for box in [view.prompt_box, view.music_box, view.bg_box] + list(view.answer_inputs):
+            targets.append((box.rect, box))
+        targets += [(rect, view.color_picker) for rect, _ in getattr(view.color_picker, "rects", [])]
+        return targets
+
+    def _on_click(self, event):
+        target = self.router.hit(event_pos(event))
+        if target == "save":
+            self.done = True
+            logger.info("Save button clicked")
+        elif target == "back":
+            self.go_back = True
+            logger.info("Back button clicked")
+        elif target is not None:
+            target.handle_event(event)
+        # A click anywhere else takes the focus away from the active box.
+        if self.focused is not None and self.focused is not target:
+            self.focused.handle_event(event)
+        self.focused = target if getattr(target, "active", False) else None
+
+    def _on_key(self, event):
+        if self.focused is not None:
+            self.focused.handle_event(event)
+            if not self.focused.active:
+                self.focused = None
 
     @property
     def is_done(self):
@@ -66,18 +88,77 @@ class ConfigSaver:
     """Handles saving configuration and generating AI answers.
 
     This class manages persistence and AI interaction for configuration.
+    With a universe library, a universe stored before is switched to
+    without an AI request, and every saved universe is stored. lookup()
+    only reads and write() and store() take a copy of the configuration,
+    so they can run on a worker thread; apply() changes the shared
+    configuration and must run on the main thread.
     """
 
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, library=None):
         """Initialize the ConfigSaver.
 
         Args:
             config_manager: ConfigManager instance.
+            library (UniverseLibrary): Library of generated universes, or None to always generate.
         """
         self.config_manager = config_manager
+        self.library = library
+
+    def lookup(self, prompt):
+        """Find the answers of a universe in the library, or generate them.
+
+        Args:
+            prompt (str): Universe prompt.
+
+        Returns:
+            list: Questions in the config.json format, with answers and optional weights.
+        """
+        stored = self.library.load(prompt) if self.library is not None else None
+        if stored is not None:
+            logger.info("Universe %s found in the library", stored["prompt"])
+            return stored["questions"]
+        return self.config_manager.request_ai_answers(prompt)
+
+    def apply(self, questions, prompt, music, bg_img, bg_color, answer_counts):
+        """Take the looked up answers and apply the new configuration. Must be called on the main thread.
+
+        Args:
+            questions (list): Questions from lookup().
+            prompt (str): Universe prompt.
+            music (str): Music file path.
+            bg_img (str): Background image path.
+            bg_color (tuple): Background color.
+            answer_counts (list): Number of answers per question.
+
+        Returns:
+            dict: Copy of the applied configuration, for write() and store().
+        """
+        self.config_manager.apply_answers(questions)
+        data = self.config_manager.config_data(prompt, music, bg_img, bg_color, answer_counts)
+        self.config_manager.apply_config(data)
+        logger.info("Configuration applied")
+        return copy.deepcopy(data)
+
+    def write(self, config):
+        """Write the configuration file.
+
+        Args:
+            config (dict): Configuration from apply().
+        """
+        self.config_manager.write_config(config)
+
+    def store(self, config):
+        """Store a saved universe in the library.
+
+        Args:
+            config (dict): Configuration to store; pass a copy when this runs on a worker thread.
+        """
+        if self.library is not None:
+            self.library.save(config)
 
     def save(self, prompt, music, bg_img, bg_color, answer_counts):
-        """Save the configuration.
+        """Look up the answers, save the configuration and store the universe, all on the calling thread.
 
         Args:
             prompt (str): Universe prompt.
@@ -86,9 +167,9 @@ class ConfigSaver:
             bg_color (tuple): Background color.
             answer_counts (list): Number of answers per question.
         """
-        self.config_manager.generate_ai_answers(prompt)
-        self.config_manager.save_config(prompt, music, bg_img, bg_color, answer_counts)
-        logger.info("Configuration saved")
+        config = self.apply(self.lookup(prompt), prompt, music, bg_img, bg_color, answer_counts)
+        self.write(config)
+        self.store(config)
 
 class ConfigController:
     """Coordinates configuration input and updates.
@@ -96,52 +177,116 @@ class ConfigController:
     This class integrates input handling and saving logic.
     """
 
-    def __init__(self, config_view, config_manager, state_manager):
+    def __init__(self, config_view, config_manager, state_manager, jobs=None, library=None):
         """Initialize the ConfigController.
 
         Args:
             config_view: ConfigView instance.
             config_manager: ConfigManager instance.
+            state_manager: StateManager instance.
+            jobs (JobScheduler): Scheduler for the AI request, config write and library store,
+                or None to run them inline.
+            library (UniverseLibrary): Library searched as the universe is typed and used when saving,
+                or None to always generate answers.
         """
         self.view = config_view
         self.config_manager = config_manager
         self.state_manager = state_manager
+        self.jobs = jobs if jobs is not None else JobScheduler(workers=0)
+        self.save_job = None
+        self.library = library
+        self.search_job = None
+        self._searched = None
         self.input_handler = InputHandler(config_view)
-        self.config_saver = ConfigSaver(config_manager)
+        self.config_saver = ConfigSaver(config_manager, library)
         logger.info("ConfigController initialized")
 
     def handle_event(self, event):
         """Handle configuration input events.
 
+        Input is ignored while a save is running.
+
         Args:
             event: Pygame event object.
         """
+        if self.saving:
+            return
         self.input_handler.handle_event(event)
         if self.input_handler.is_done:
             self.save()
         self.go_back = self.input_handler.should_go_back
 
+    @property
+    def saving(self):
+        """bool: True while the AI request and config write are running."""
+        return self.save_job is not None and not self.save_job.done
+
     def save(self):
-        """Save the configuration."""
-        answer_counts = [input_box.get_value() for input_box in self.view.answer_inputs]
-        self.config_saver.save(
-            self.view.prompt_box.get_value(),
-            self.view.music_box.get_value(),
-            self.view.bg_box.get_value(),
-            self.view.color_picker.selected_color,
-            answer_counts
-        )
+        """Look up or generate the answers as a background job, then save the configuration.
+
+        The library lookup or AI request runs on a worker. The job's callback
+        applies the new configuration on the main thread, which renders from
+        it; the file write and the library store then run as low-priority
+        jobs on a copy. The save counts as running until the file is written.
+        """
+        values = (self.view.prompt_box.get_value(), self.view.music_box.get_value(), self.view.bg_box.get_value(),
+                  self.view.color_picker.selected_color,
+                  [input_box.get_value() for input_box in self.view.answer_inputs])
+        self.view.set_saving(True)
+        self.save_job = self.jobs.submit(self.config_saver.lookup, values[0], name="config_save",
+                                         on_done=lambda questions: self._on_looked_up(questions, values),
+                                         on_error=self._on_save_failed)
+
+    def _on_looked_up(self, questions, values):
+        try:
+            config = self.config_saver.apply(questions, *values)
+        except ValueError as e:
+            self._on_save_failed(e)
+            return
+        self.save_job = self.jobs.submit(self.config_saver.write, config, name="config_write",
+                                         priority=JOB_PRIORITY_LOW, on_done=lambda _: self.view.set_saving(False),
+                                         on_error=self._on_save_failed)
+        if self.library is not None:
+            self.jobs.submit(self.config_saver.store, config, name="library_save", priority=JOB_PRIORITY_LOW,
+                             on_error=lambda e: logger.error("Universe not stored in the library: %s", e))
+
+    def _on_save_failed(self, error):
+        logger.error("Configuration not saved: %s", error)
+        self.view.set_saving(False)
+        self.input_handler.done = False
+
+    def search_library(self, universe):
+        """Look up stored universes matching the typed name as a background job.
+
+        A search still pending for an older text is cancelled.
+
+        Args:
+            universe (str): Text of the prompt box.
+        """
+        if self.search_job is not None:
+            self.search_job.cancel()
+        self._searched = universe
+        self.search_job = self.jobs.submit(self.library.search, universe, name="library_search",
+                                           on_done=self.view.prompt_preview.set_matches)
 
     def update(self, dt):
         """Update and render the configuration UI."""
+        if self.library is not None and self.view.prompt_box.text != self._searched:
+            self.search_library(self.view.prompt_box.text)
         if self.input_handler.should_go_back:
             self.input_handler.go_back = False
             self.state_manager.set_state('menu')
 
-        if self.input_handler.is_done:
+        if self.input_handler.is_done and not self.saving:
             self.input_handler.done = False
             self.state_manager.set_state('menu')
-        self.view.render()
+        with frame_profiler.phase("render"):
+            self.view.render()
+
+    @property
+    def router(self):
+        """EventRouter: Router dispatching this screen's input."""
+        return self.input_handler.router
 
     @property
     def is_done(self):
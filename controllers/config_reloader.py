@@ -0,0 +1,125 @@
+import copy
+import logging
+
+from models.assets import asset_store
+from models.metrics import metrics
+from models.config_manager import diff_config
+from utils import load_json_file
+
+logger = logging.getLogger(__name__)
+config_reloads = metrics.counter("kft_config_reloads_total", "Configuration reloads by result.", ("result",))
+
+class ConfigReloader:
+    """Applies edits of the config file and assets while the game runs.
+
+    This class reads the changed file on a background job, diffs it against
+    the configuration it last applied and calls only the handlers
+    registered for the keys that changed, e.g. the background for "bg_img" or the wheels
+    for "questions". Changed assets are rescanned and evicted from the
+    asset store before the asset handlers run. Diffing against the last
+    applied snapshot rather than the live configuration means a save from
+    the config screen, which changes the live configuration and writes the
+    file, still notifies the handlers when the file is reloaded.
+    """
+
+    def __init__(self, config_manager, jobs, manifest=None, store=asset_store):
+        """Initialize the ConfigReloader.
+
+        Args:
+            config_manager: ConfigManager whose configuration is replaced.
+            jobs (JobScheduler): Scheduler reading files off the main thread.
+            manifest (AssetManifest): Manifest rescanned when assets change, or None to ignore assets.
+            store (AssetStore): Store whose changed assets are evicted.
+        """
+        self.config_manager = config_manager
+        self.jobs = jobs
+        self.manifest = manifest
+        self.store = store
+        self.handlers = []
+        self.asset_handlers = []
+        self.applied = copy.deepcopy(config_manager.config)
+
+    def on(self, keys, handler):
+        """Register a handler for configuration changes.
+
+        Args:
+            keys (tuple): Configuration keys the handler depends on.
+            handler (callable): Called once per reload touching any of the keys, with the changes
+                from diff_config().
+        """
+        self.handlers.append((frozenset(keys), handler))
+
+    def on_assets(self, handler):
+        """Register a handler for changed assets.
+
+        Args:
+            handler (callable): Called with the set of changed asset paths, e.g. "assets/backgrounds/bg.png".
+        """
+        self.asset_handlers.append(handler)
+
+    def config_file_changed(self, path):
+        """Reload the configuration file in the background.
+
+        Args:
+            path (Path): Configuration file.
+        """
+        self.jobs.submit(load_json_file, str(path), name="config_reload", on_done=self.apply,
+                         on_error=self._reload_failed)
+
+    def apply(self, data):
+        """Replace the configuration and notify the handlers of the changed keys.
+
+        Args:
+            data (dict): New configuration.
+
+        Returns:
+            dict: Changes from diff_config().
+        """
+        try:
+            self.config_manager.apply_config(data)
+        except ValueError as e:
+            self._reload_failed(e)
+            return {}
+        changes = diff_config(self.applied, data)
+        self.applied = copy.deepcopy(data)
+        config_reloads.inc(result="ok")
+        if not changes:
+            return changes
+        logger.info("Configuration reloaded, changed: %s", ", ".join(sorted(changes)))
+        for keys, handler in self.handlers:
+            if keys.intersection(changes):
+                handler(changes)
+        return changes
+
+    def assets_changed(self, path):
+        """Rescan the assets in the background.
+
+        Args:
+            path (Path): Assets directory.
+        """
+        if self.manifest is not None:
+            self.jobs.submit(self._rescan, name="asset_rescan", on_done=self.apply_assets)
+
+    def apply_assets(self, paths):
+        """Evict changed assets and notify the asset handlers.
+
+        Args:
+            paths (set): Changed asset paths.
+        """
+        if not paths:
+            return
+        logger.info("Assets changed: %s", ", ".join(sorted(paths)))
+        self.store.invalidate(paths)
+        for handler in self.asset_handlers:
+            handler(paths)
+
+    def _rescan(self):
+        """Rescan the manifest and list the assets that were added, changed or removed."""
+        old = self.manifest.entries
+        self.manifest.scan()
+        new = self.manifest.entries
+        return {(self.manifest.root / key).as_posix() for key in set(old) | set(new) if old.get(key) != new.get(key)}
+
+    def _reload_failed(self, error):
+        config_reloads.inc(result="error")
+        logger.error("Keeping the current configuration, reload failed: %s", error)
@@ -0,0 +1,123 @@
+import pygame
+import logging
+from constants import ROUTER_CELL_SIZE
+from views.display import display
+
+logger = logging.getLogger(__name__)
+
+class EventRouter:
+    """Dispatches events by type and hit-tests interactive rects.
+
+    Handlers are looked up in a dict keyed by event type, so events nobody
+    registered for cost one dict lookup. Interactive rects come from a layout
+    callback and are bucketed into a uniform grid on the first hit test.
+    Layouts are in canvas coordinates, which window resizes do not change
+    (Display maps event positions), so the grid is never rebuilt.
+    """
+
+    def __init__(self, layout=None, cell_size=ROUTER_CELL_SIZE):
+        """Initialize the EventRouter.
+
+        Args:
+            layout (callable): Returns a list of (rect, target) pairs, called when the grid is rebuilt.
+            cell_size (int): Grid cell size in pixels.
+        """
+        self.layout = layout
+        self.cell_size = cell_size
+        self.handlers = {}
+        self.targets = []
+        self._grid = None
+
+    def on(self, event_type, handler):
+        """Register a handler for an event type.
+
+        Handlers run in registration order until one returns something other than None.
+
+        Args:
+            event_type (int): Pygame event type, e.g. pygame.MOUSEBUTTONDOWN.
+            handler (callable): Called with the event.
+        """
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    @property
+    def event_types(self):
+        """set: Event types with at least one handler."""
+        return set(self.handlers)
+
+    def dispatch(self, event):
+        """Pass an event to the handlers of its type.
+
+        Args:
+            event: Pygame event object.
+
+        Returns:
+            The first non-None handler result, or None.
+        """
+        handlers = self.handlers.get(event.type)
+        if handlers is None:
+            return None
+        for handler in handlers:
+            result = handler(event)
+            if result is not None:
+                return result
+        return None
+
+    def _build(self):
+        self.targets = []
+        self._grid = {}
+        size = self.cell_size
+        for rect, target in (self.layout() if self.layout else []):
+            if not isinstance(rect, pygame.Rect):
+                logger.error("Unsupported hit target rect: %s", rect)
+                continue
+            self.targets.append((rect, target))
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    self._grid.setdefault((cx, cy), []).append((rect, target))
+        logger.debug("Hit index rebuilt with %d targets", len(self.targets))
+
+    def hit(self, pos):
+        """Find the target under a point.
+
+        Args:
+            pos (tuple): Screen position (x, y).
+
+        Returns:
+            The first registered target whose rect contains pos, or None.
+        """
+        if self._grid is None:
+            self._build()
+        x, y = pos
+        for rect, target in self._grid.get((int(x) // self.cell_size, int(y) // self.cell_size), ()):
+            if rect.collidepoint(x, y):
+                return target
+        return None
+
+def event_pos(event):
+    """Get the position of a mouse event, falling back to the current mouse position.
+
+    Args:
+        event: Pygame event object.
+
+    Returns:
+        tuple: Screen position (x, y).
+    """
+    return getattr(event, 'pos', None) or display.mouse_pos()
+
+def allow_events(*routers, extra=()):
+    """Block every event type except the ones handled by the given routers.
+
+    Args:
+        *routers: EventRouter instances whose event types are allowed.
+        extra (tuple): Further event types to allow, e.g. pygame.QUIT.
+
+    Returns:
+        set: Allowed event types.
+    """
+    allowed = set(extra)
+    for router in routers:
+        allowed |= router.event_types
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(sorted(allowed))
+    logger.info("Allowed events: %s", ", ".join(pygame.event.event_name(t) for t in sorted(allowed)))
+    return allowed
@@ -1,20 +1,30 @@
 import sys
+import time
 
 import pygame
 import random
 import logging
 
-from models.logger import GameState
+from controllers.event_router import EventRouter, event_pos
+from models.assets import asset_store
+from models.frame_profiler import frame_profiler
+from models.gif_index import gif_index
+from models.memory_tracker import surface_bytes
+from models.logger import GameState, HotPathLogger
 from utils import load_json_file
 from constants import (
-    WIDTH, HEIGHT, SPACE_KEY, MOUSE_LEFT_BUTTON, GIF_SCALE_FACTOR, GIF_DISPLAY_TIME,
-    FRAME_DELAY_DEFAULT, WAIT_TIME, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_Y_OFFSET,
-    SAVE_BUTTON_WIDTH, RESULT_IMAGE_PATH, TEXT_RESP_PATH, SECOND_IN_MS, WHEEL_RADIUS, PADDING
+    SPACE_KEY, MOUSE_LEFT_BUTTON, GIF_DISPLAY_TIME, WAIT_TIME, RESULT_PRINT_SCALE, TEXT_RESP_PATH, RESTART_KEY,
+    SPIN_SOUND_PATH, JOB_PRIORITY_HIGH
 )
+from models.job_scheduler import JobScheduler
+from models.result_saver import ResultSaver
+from models.session_history import gif_variant
 from models.spin_wheel import SpinWheelModel
 from .media_loader import MediaLoader
+from .wheel_deck import WheelDeck
 
 logger = logging.getLogger(__name__)
+hot_logger = HotPathLogger(logger)
 
 class GameController:
     """Handles game input and coordinates model and view.
@@ -22,30 +32,118 @@ class GameController:
     This class manages game logic and state transitions.
     """
 
-    def __init__(self, game_state_model, game_view, config_manager):
+    def __init__(self, game_state_model, game_view, config_manager, sound=True, jobs=None, history=None):
         """Initialize the GameController.
 
         Args:
             game_state_model: GameStateTracker instance.
             game_view: GameView instance.
             config_manager: ConfigManager instance.
+            sound (bool): Play the wheel spin sound if True.
+            jobs (JobScheduler): Scheduler for GIF decoding and result saves, or None to run them inline.
+            history (SessionHistory): History every completed session is appended to, or None.
         """
         self.game_state = game_state_model
         self.view = game_view
         self.config = config_manager
         self.wheel = None
-        self.media_loader = MediaLoader()
+        self.sound = sound
+        self.deck = None
+        self.jobs = jobs if jobs is not None else JobScheduler(workers=0)
+        self.gif_job = None
+        self.gif_id = None
+        self.history = history
+        self.session_draws = []
+        self._session_start = None
+        self.media_loader = MediaLoader(gif_index)
         self.responses = load_json_file(TEXT_RESP_PATH)
-        self.is_result_saved = False
+        self.result_saver = ResultSaver(jobs=self.jobs)
+        self.router = EventRouter(self._layout)
+        self.router.on(pygame.KEYDOWN, self._on_key)
+        self.router.on(pygame.MOUSEBUTTONDOWN, self._on_click)
         self.generate_new_wheel()
         logger.info("GameController initialized")
 
     def generate_new_wheel(self):
-        """Generate a new wheel."""
-        data = self.config.config["questions"][self.game_state.current_draw]
-        choices = data["answers"][:data["num_answers"]]
-        self.wheel = SpinWheelModel(choices)
-        logger.info(f"New wheel generated for draw {self.game_state.current_draw + 1}")
+        """Switch to the wheel of the current draw, taking it from the deck when one is built."""
+        draw = self.game_state.current_draw
+        if self.deck is not None and draw >= 0:
+            self.wheel = self.deck.wheel(draw)
+        else:
+            data = self.config.config["questions"][draw]
+            # The placeholder wheel shown before the first draw is never spun, so it needs no sound.
+            self.wheel = SpinWheelModel.from_question(data, sound=self.spin_sound if draw >= 0 else None,
+                                                      gif_index=gif_index)
+        hot_logger.log("New wheel generated for draw %d", draw + 1)
+
+    @property
+    def spin_sound(self):
+        """pygame.mixer.Sound or None: Spin sound shared by all wheels, taken from the asset store."""
+        return asset_store.sound(SPIN_SOUND_PATH) if self.sound else None
+
+    def on_enter(self):
+        """Show the first wheel from the deck when PLAY begins a new game."""
+        if self.game_state.current_draw < 0:
+            self.preload_deck()
+            if self.deck.questions:
+                self.wheel = self.deck.wheel(0)
+
+    def preload_deck(self):
+        """Start building every question's wheel on a background thread, unless an up-to-date deck exists."""
+        questions = self.config.config["questions"]
+        if self.deck is None or self.deck.questions != questions:
+            self.release_deck()
+            self.deck = WheelDeck(questions, self.view.wheel_renderer, self.spin_sound, gif_index, self.jobs)
+
+    def release_deck(self):
+        """Drop the deck and the wheel images cached for it."""
+        if self.deck is not None:
+            self.deck.cancel()
+            self.deck = None
+        self.view.wheel_renderer.clear()
+
+    def config_changed(self, changes):
+        """Rebuild only the wheels of edited questions, refreshing the preview shown before the first draw.
+
+        The number of draws follows the number of questions.
+
+        Args:
+            changes (dict): Changes from diff_config().
+        """
+        draws = changes.get("questions", [])
+        self.game_state.total_draws = len(self.config.config["questions"])
+        if self.deck is None:
+            return
+        self.deck.rebuild(draws, self.config.config["questions"])
+        if self.game_state.current_draw < 0 and 0 in draws:
+            self.wheel = self.deck.wheel(0)
+
+    def deck_bytes(self):
+        """Get the pixel memory of the deck's wheel images.
+
+        Returns:
+            int: Bytes held by the built cards' base images.
+        """
+        if self.deck is None:
+            return 0
+        return sum(surface_bytes(card.base) for card in self.deck.cards if card is not None and card.base is not None)
+
+    def restart(self):
+        """Reset the game so the next PLAY starts from the first question."""
+        self.game_state.reset()
+        if self.gif_job is not None:
+            self.gif_job.cancel()
+            self.gif_job = None
+        self.gif_id = None
+        self.media_loader = MediaLoader(gif_index)
+        self.release_deck()
+        self.generate_new_wheel()
+        logger.info("Game restarted")
+
+    @property
+    def profile_state(self):
+        """str: Current game state name, used to scope profiling captures."""
+        return self.game_state.state.value
 
     def get_random_response(self, result):
         """Get a random response.
@@ -56,8 +154,18 @@ class GameController:
         Returns:
             str: Random response.
         """
+        return self.pick_response()[1]
+
+    def pick_response(self):
+        """Pick a random response for the current draw.
+
+        Returns:
+            tuple: (index in the draw's response pool, response text).
+        """
         question_idx = self.game_state.current_draw + 1
-        return random.choice(self.responses[f"{question_idx}"][f"{question_idx}/10"])
+        pool = self.responses[f"{question_idx}"][f"{question_idx}/10"]
+        idx = random.randrange(len(pool))
+        return idx, pool[idx]
 
     def update(self, dt):
         """Update the game state.
@@ -69,29 +177,112 @@ class GameController:
             self.wheel.update(dt)
             if not self.wheel.spinning:
                 result, idx = self.wheel.get_selected_segment()
-                response = self.get_random_response(result)
+                response_idx, response = self.pick_response()
+                self.session_draws.append((self.wheel.selected_index(), gif_variant(idx), response_idx,
+                                           self.wheel.spin_time))
                 self.game_state.add_result(result, response)
-                if self.media_loader.load_gif(idx):
-                    self.game_state.set_state(GameState.SHOWING_GIF)
-                    self.game_state.reset_wait_timer(GIF_DISPLAY_TIME)
-                else:
-                    self.game_state.set_state(GameState.WAITING)
-                    self.game_state.reset_wait_timer(WAIT_TIME)
+                self.game_state.set_state(GameState.WAITING)
+                self.game_state.reset_wait_timer(WAIT_TIME)
+                self.load_gif(idx)
         elif self.game_state.state == GameState.SHOWING_GIF:
             self.media_loader.update(dt)
             if self.game_state.update_timer(dt):
-                self.game_state.increment_draw()
-                if self.game_state.state != GameState.RESULTS:
-                    self.generate_new_wheel()
-                    self.wheel.spin()
-                    self.game_state.set_state(GameState.SPINNING)
+                self.next_draw()
         elif self.game_state.state == GameState.WAITING:
-            if self.game_state.update_timer(dt):
-                if self.game_state.state != GameState.RESULTS:
-                    self.generate_new_wheel()
-                    self.wheel.spin()
-                    self.game_state.set_state(GameState.SPINNING)
-                self.game_state.increment_draw()
+            # The wait starts once the GIF is known to be missing, so a slow decode does not skip it.
+            if (self.gif_job is None or self.gif_job.done) and self.game_state.update_timer(dt):
+                self.next_draw()
+        with frame_profiler.phase("render"):
+            self.render()
+
+    def next_draw(self):
+        """Spin the next question's wheel, or record the session once every question was drawn."""
+        self.game_state.increment_draw()
+        if self.game_state.state == GameState.RESULTS:
+            self.record_session()
+            return
+        if self.game_state.current_draw == 0:
+            self.session_draws = []
+            self._session_start = time.monotonic()
+        self.generate_new_wheel()
+        self.wheel.spin()
+        self.game_state.set_state(GameState.SPINNING)
+
+    def record_session(self):
+        """Append the completed session to the history."""
+        if self.history is None or self._session_start is None:
+            return
+        self.history.append(self.config.config["prompt"], self.session_draws,
+                            duration=time.monotonic() - self._session_start)
+        self._session_start = None
+
+    def snapshot(self):
+        """Capture the game for a later restore().
+
+        Returns:
+            dict: Game part of a snapshot, see models.snapshot.encode_snapshot().
+        """
+        game_state = self.game_state
+        return {
+            "game_state": game_state.state,
+            "draw": game_state.current_draw,
+            "wait_timer": game_state.wait_timer,
+            "wheel": self.wheel.motion,
+            "session_elapsed": time.monotonic() - self._session_start if self._session_start is not None else 0.0,
+            "gif": self.gif_id,
+            "results": list(game_state.results),
+            "responses": list(game_state.result_responses),
+            "session_draws": list(self.session_draws),
+        }
+
+    def restore(self, snapshot):
+        """Continue a game captured by snapshot(), rebuilding only the current wheel and GIF.
+
+        A result's GIF is decoded again and shown from its first frame.
+
+        Args:
+            snapshot (dict): Snapshot of the same configuration.
+        """
+        game_state = self.game_state
+        game_state.reset()
+        game_state.current_draw = snapshot["draw"]
+        game_state.wait_timer = snapshot["wait_timer"]
+        game_state.results = list(snapshot["results"])
+        game_state.result_responses = list(snapshot["responses"])
+        self.session_draws = [tuple(draw) for draw in snapshot["session_draws"]]
+        self._session_start = time.monotonic() - snapshot["session_elapsed"]
+        state = snapshot["game_state"]
+        if state != GameState.RESULTS:
+            self.generate_new_wheel()
+            self.wheel.restore_motion(snapshot["wheel"])
+        if state in (GameState.WAITING, GameState.SHOWING_GIF) and snapshot["gif"]:
+            game_state.set_state(GameState.WAITING)
+            self.load_gif(snapshot["gif"])
+        else:
+            game_state.set_state(state)
+        logger.info("Game restored at draw %d in state %s", game_state.current_draw + 1, state.value)
+
+    def load_gif(self, gif_id):
+        """Decode the result's GIF in the background and show it once its frames are ready.
+
+        Args:
+            gif_id (str): GIF id "<segment>.<variant>", or None for no GIF.
+        """
+        self.media_loader.release()
+        self.gif_id = gif_id
+        self.gif_job = self.jobs.submit(self.media_loader.decode_gif, gif_id, name="gif_decode",
+                                        priority=JOB_PRIORITY_HIGH, on_done=self._show_gif, with_job=True)
+
+    def _show_gif(self, decoded):
+        """Convert the decoded frames across frames, then switch to showing the GIF."""
+        if decoded is None:
+            return
+        yield from self.media_loader.show_frames(*decoded)
+        self.game_state.set_state(GameState.SHOWING_GIF)
+        self.game_state.reset_wait_timer(GIF_DISPLAY_TIME)
+
+    def render(self):
+        """Render the view for the current game state."""
         if self.game_state.state == GameState.SPINNING:
             self.view.render_spinning(self.wheel, self.game_state.current_draw)
         elif self.game_state.state == GameState.WAITING:
@@ -99,29 +290,53 @@ class GameController:
         elif self.game_state.state == GameState.SHOWING_GIF:
             self.view.render_gif(self.media_loader, self.game_state.results[-1], self.game_state.result_responses[-1])
         elif self.game_state.state == GameState.RESULTS:
-            self.view.render_results(self.game_state.results, self.game_state.result_responses, self.is_result_saved)
+            self.view.render_results(self.game_state.results, self.game_state.result_responses, self.result_saver.status)
 
     def handle_event(self, event):
         """Handle input events.
 
         Args:
             event: Pygame event object.
+
+        Returns:
+            str or None: "menu" after a restart from the results screen, otherwise None.
         """
+        return self.router.dispatch(event)
+
+    def _layout(self):
+        """Build the hit targets of the results screen buttons."""
+        return [(self.view.exit_rect, "exit"), (self.view.save_rect, "save")]
+
+    def _on_key(self, event):
+        if event.key == SPACE_KEY:
+            self._spin_by_user(event)
+        elif event.key == RESTART_KEY and self.game_state.state == GameState.RESULTS:
+            self.restart()
+            return "menu"
+        return None
+
+    def _on_click(self, event):
+        if event.button != MOUSE_LEFT_BUTTON:
+            return None
+        if self.game_state.state != GameState.RESULTS:
+            self._spin_by_user(event)
+            return None
+        target = self.router.hit(event_pos(event))
+        if target == "exit":
+            logger.info("Exit button clicked")
+            self.result_saver.shutdown()
+            pygame.quit()
+            sys.exit()
+        elif target == "save":
+            if RESULT_PRINT_SCALE > 1:
+                surface = self.view.render_results_print(
+                    self.game_state.results, self.game_state.result_responses, RESULT_PRINT_SCALE)
+            else:
+                surface = self.view.screen
+            self.result_saver.save(surface)
+        return None
+
+    def _spin_by_user(self, event):
         if self.game_state.state == GameState.SPINNING and not self.wheel.spinning:
-            if (event.type == pygame.KEYDOWN and event.key == SPACE_KEY) or \
-               (event.type == pygame.MOUSEBUTTONDOWN and event.button == MOUSE_LEFT_BUTTON):
-                self.wheel.spin()
-                logger.info("Wheel spun by user")
-        elif self.game_state.state == GameState.RESULTS:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == MOUSE_LEFT_BUTTON:
-                mouse_pos = pygame.mouse.get_pos()
-                exit_button = pygame.Rect(WIDTH // 2 - WHEEL_RADIUS, HEIGHT + BUTTON_Y_OFFSET, BUTTON_WIDTH, BUTTON_HEIGHT)
-                save_button = pygame.Rect(WIDTH // 2, HEIGHT + BUTTON_Y_OFFSET, SAVE_BUTTON_WIDTH, BUTTON_HEIGHT)
-                if exit_button.collidepoint(mouse_pos):
-                    logger.info("Exit button clicked")
-                    pygame.quit()
-                    sys.exit()
-                elif save_button.collidepoint(mouse_pos):
-                    pygame.image.save(self.view.screen, RESULT_IMAGE_PATH)
-                    self.is_result_saved = True
-                    logger.info("Results saved")
\ No newline at end of file
+            self.wheel.spin(event)
+            hot_logger.log("Wheel spun by user")
@@ -0,0 +1,182 @@
+import json
+import logging
+import multiprocessing
+import random
+import time
+from pathlib import Path
+
+from constants import TEXT_RESP_PATH, HEADLESS_CHUNK_SIZE, GIF_DIR
+from models.gif_index import GifIndex
+from models.logger import GameState, GameStateTracker
+from models.session_history import gif_variant
+from models.spin_wheel import SpinWheelModel
+from utils import load_json_file
+
+logger = logging.getLogger(__name__)
+
+class HeadlessGame:
+    """Plays complete games without a display, audio or animation time.
+
+    This class drives the same models as GameController, but lands every
+    spin immediately instead of animating it frame by frame.
+    """
+
+    def __init__(self, config, responses, gif_index=None):
+        """Initialize the HeadlessGame.
+
+        Args:
+            config (dict): Configuration data with questions and answers.
+            responses (dict): Response pools loaded from TEXT_RESP_PATH.
+            gif_index (GifIndex): Index the GIF variants are chosen from, or None to draw them blindly.
+        """
+        self.config = config
+        self.responses = responses
+        self.gif_index = gif_index
+
+    def play(self, seed):
+        """Play one full session.
+
+        Args:
+            seed (int): Seed for the session's random generator.
+
+        Returns:
+            dict: Session record with the seed, draws, responses and GIF ids (None where a segment has no GIF).
+        """
+        rng = random.Random(seed)
+        game_state = GameStateTracker(len(self.config["questions"]))
+        draws = []
+        for draw, wheel in self._turns(rng, game_state):
+            wheel.land()
+            result, gif_id, response_key, response_idx, response = self._record(draw, wheel, rng, game_state)
+            draws.append({
+                "question": draw,
+                "segment": wheel.selected_index(),
+                "result": result,
+                "gif": gif_id,
+                "response_id": f"{response_key}#{response_idx}",
+                "response": response,
+            })
+        return {"seed": seed, "universe": self.config.get("prompt", ""), "draws": draws}
+
+    def _turns(self, rng, game_state):
+        """Step through the draws of one session.
+
+        The caller spins each wheel, then calls _record() before asking for
+        the next one.
+
+        Args:
+            rng (random.Random): Session random generator.
+            game_state (GameStateTracker): Tracker of the session, left in RESULTS at the end.
+
+        Yields:
+            tuple: (zero-based draw index, SpinWheelModel of the draw).
+        """
+        questions = self.config["questions"]
+        game_state.set_state(GameState.SPINNING)
+        while True:
+            game_state.increment_draw()
+            if game_state.state == GameState.RESULTS:
+                return
+            draw = game_state.current_draw
+            yield draw, SpinWheelModel.from_question(questions[draw], rng=rng, sound=False, gif_index=self.gif_index)
+
+    def _record(self, draw, wheel, rng, game_state):
+        """Pick the response to a stopped wheel and add the outcome to the session.
+
+        Args:
+            draw (int): Zero-based draw index.
+            wheel (SpinWheelModel): Wheel that has stopped.
+            rng (random.Random): Session random generator.
+            game_state (GameStateTracker): Tracker of the session.
+
+        Returns:
+            tuple: (result, GIF id, pool key, index in pool, response text).
+        """
+        result, gif_id = wheel.get_selected_segment()
+        response_key, response_idx, response = self._pick_response(draw, rng)
+        game_state.add_result(result, response)
+        return result, gif_id, response_key, response_idx, response
+
+    def _pick_response(self, draw, rng):
+        """Pick a response the same way GameController.pick_response does.
+
+        Args:
+            draw (int): Zero-based draw index.
+            rng (random.Random): Session random generator.
+
+        Returns:
+            tuple: (pool key, index in pool, response text).
+        """
+        question_idx = draw + 1
+        key = f"{question_idx}/10"
+        pool = self.responses[f"{question_idx}"][key]
+        idx = rng.randrange(len(pool))
+        return key, idx, pool[idx]
+
+_worker_game = None
+
+def _init_worker(config, responses, gif_dir):
+    """Create the per-process HeadlessGame with its own GIF index and silence per-draw logging."""
+    global _worker_game
+    logging.getLogger().setLevel(logging.WARNING)
+    index = GifIndex(gif_dir)
+    index.scan()
+    _worker_game = HeadlessGame(config, responses, index)
+
+def _play_seed(seed):
+    return _worker_game.play(seed)
+
+def history_draws(record):
+    """Convert the draws of a session record to SessionHistory.append() draws.
+
+    Args:
+        record (dict): Session record from HeadlessGame.play().
+
+    Returns:
+        list: (segment index, GIF variant, response index, spin seconds) per draw; headless spins take no time.
+    """
+    return [(draw["segment"], gif_variant(draw["gif"]), int(draw["response_id"].split("#")[1]), 0.0)
+            for draw in record["draws"]]
+
+def run_batch(config, sessions, output_path, workers=None, base_seed=0, responses=None, history=None,
+              gif_dir=GIF_DIR):
+    """Play many sessions across a process pool and stream them to JSON Lines.
+
+    Args:
+        config (dict): Configuration data with questions and answers.
+        sessions (int): Number of sessions to play.
+        output_path (str): Path of the JSON Lines output file.
+        workers (int): Number of worker processes, defaults to the CPU count.
+        base_seed (int): Seed of the first session; session i uses base_seed + i.
+        responses (dict): Response pools, loaded from TEXT_RESP_PATH if None.
+        history (SessionHistory): History the sessions are also appended to, or None.
+        gif_dir (str): Directory whose GIFs the sessions choose from.
+
+    Returns:
+        dict: Throughput report with sessions, workers, seconds, sessions_per_second
+            and sessions_per_second_per_core.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    responses = responses if responses is not None else load_json_file(TEXT_RESP_PATH)
+    seeds = range(base_seed, base_seed + sessions)
+    chunksize = max(1, min(HEADLESS_CHUNK_SIZE, sessions // (workers * 4) or 1))
+    start = time.perf_counter()
+    with Path(output_path).open('w', encoding='utf-8') as out, \
+            multiprocessing.Pool(workers, initializer=_init_worker, initargs=(config, responses, gif_dir)) as pool:
+        for record in pool.imap_unordered(_play_seed, seeds, chunksize=chunksize):
+            out.write(json.dumps(record, ensure_ascii=False))
+            out.write('\n')
+            if history is not None:
+                history.append(record["universe"], history_draws(record), seed=record["seed"])
+    elapsed = time.perf_counter() - start
+    rate = sessions / elapsed if elapsed > 0 else float('inf')
+    report = {
+        "sessions": sessions,
+        "workers": workers,
+        "seconds": elapsed,
+        "sessions_per_second": rate,
+        "sessions_per_second_per_core": rate / workers,
+    }
+    logger.info("Played %d sessions on %d workers in %.2fs (%.0f/s, %.0f/s per core)",
+                sessions, workers, elapsed, rate, rate / workers)
+    return report
@@ -2,9 +2,17 @@ import imageio.v2 as imageio
 import pygame
 from pathlib import Path
 import logging
-from constants import WIDTH, HEIGHT, GIF_SCALE_FACTOR, SECOND_IN_MS, FRAME_DELAY_DEFAULT
+import time
+from models.assets import asset_store
+from models.logger import HotPathLogger
+from models.memory_tracker import surface_bytes
+from models.metrics import metrics
+from constants import WIDTH, HEIGHT, GIF_SCALE_FACTOR, SECOND_IN_MS, FRAME_DELAY_DEFAULT, GIF_DIR
 
 logger = logging.getLogger(__name__)
+hot_logger = HotPathLogger(logger)
+gif_load_seconds = metrics.histogram("kft_gif_load_seconds", "Time to load and decode a GIF.")
+gif_loads = metrics.counter("kft_gif_loads_total", "GIF load attempts by result.", ("result",))
 
 class MediaLoader:
     """Handles loading of media assets like GIFs.
@@ -12,8 +20,13 @@ class MediaLoader:
     This class manages media loading and animation.
     """
 
-    def __init__(self):
-        """Initialize the MediaLoader."""
+    def __init__(self, gif_index=None):
+        """Initialize the MediaLoader.
+
+        Args:
+            gif_index (GifIndex): Index of the GIFs on disk, or None to check each file on load.
+        """
+        self.gif_index = gif_index
         self.gif_frames = []
         self.current_frame = 0
         self.frame_timer = 0
@@ -23,37 +36,100 @@ class MediaLoader:
         """Load a GIF for the given result.
 
         Args:
-            result (str): Result identifier.
+            result (str): GIF id "<segment>.<variant>", or None for no GIF.
 
         Returns:
             bool: True if GIF loaded successfully.
         """
-        self.gif_frames = []
-        self.current_frame = 0
-        safe_result = str(result)
-        gif_path = Path('assets') / 'gifs' / f"{safe_result}.gif"
-        if not gif_path.exists():
-            logger.warning(f"GIF not found: {gif_path}")
+        self.release()
+        decoded = self.decode_gif(result)
+        if decoded is None:
             return False
+        for _ in self.show_frames(*decoded):
+            pass
+        return True
+
+    def decode_gif(self, result, job=None):
+        """Decode and scale a GIF's frames without touching the display, so it can run on a worker.
+
+        Args:
+            result (str): GIF id "<segment>.<variant>", or None for no GIF.
+            job (Job): Background job to report progress to and stop early for, or None.
+
+        Returns:
+            tuple or None: (frames, frame_delay), or None if the GIF is missing, unreadable or the job was cancelled.
+        """
+        if self.gif_index is not None:
+            gif_path = self.gif_index.path(result) if result is not None else None
+            if gif_path is None:
+                hot_logger.log("No GIF indexed for %s", result)
+                gif_loads.inc(result="missing")
+                return None
+        else:
+            gif_path = Path(GIF_DIR) / f"{result}.gif"
+            if not gif_path.exists():
+                logger.warning("GIF not found: %s", gif_path)
+                gif_loads.inc(result="missing")
+                return None
+        start = time.perf_counter()
         try:
             gif_reader = imageio.get_reader(gif_path)
-            try:
-                self.frame_delay = gif_reader.get_meta_data()['duration'] / SECOND_IN_MS
-            except KeyError:
-                self.frame_delay = FRAME_DELAY_DEFAULT
-            for frame_idx in range(gif_reader.get_length()):
+            info = asset_store.gif_info.get(gif_path.as_posix())
+            duration = info["duration"] if info else gif_reader.get_meta_data().get('duration')
+            frame_delay = duration / SECOND_IN_MS if duration else FRAME_DELAY_DEFAULT
+            frames = []
+            frame_count = gif_reader.get_length()
+            for frame_idx in range(frame_count):
+                if job is not None:
+                    if job.cancelled:
+                        return None
+                    job.report(frame_idx / frame_count)
                 frame_data = gif_reader.get_data(frame_idx)
                 frame_surface = pygame.image.frombuffer(
                     frame_data.tobytes(), frame_data.shape[1::-1], "RGB")
                 scale_factor = min(WIDTH / frame_surface.get_width(), HEIGHT / frame_surface.get_height()) * GIF_SCALE_FACTOR
                 new_size = (int(frame_surface.get_width() * scale_factor), int(frame_surface.get_height() * scale_factor))
-                frame_surface = pygame.transform.scale(frame_surface, new_size)
-                self.gif_frames.append(frame_surface)
-            logger.info(f"Loaded GIF: {gif_path}")
-            return True
+                frames.append(pygame.transform.scale(frame_surface, new_size))
+            gif_load_seconds.observe(time.perf_counter() - start)
+            gif_loads.inc(result="ok")
+            hot_logger.log("Loaded GIF: %s", gif_path)
+            return frames, frame_delay
         except Exception as e:
-            logger.error(f"Error loading GIF {gif_path}: {e}")
-            return False
+            logger.error("Error loading GIF %s: %s", gif_path, e)
+            gif_loads.inc(result="error")
+            return None
+
+    def show_frames(self, frames, frame_delay):
+        """Convert decoded frames for fast blits and make them current. Must run on the main thread.
+
+        This is a generator yielding after each frame, so a job scheduler can
+        spread the conversion over several frames.
+
+        Args:
+            frames (list): Frames from decode_gif().
+            frame_delay (float): Seconds per frame.
+        """
+        converted = []
+        for frame in frames:
+            converted.append(frame.convert() if pygame.display.get_surface() is not None else frame)
+            yield
+        self.gif_frames = converted
+        self.current_frame = 0
+        self.frame_timer = 0
+        self.frame_delay = frame_delay
+
+    def frame_bytes(self):
+        """Get the pixel memory of the decoded frames.
+
+        Returns:
+            int: Bytes held by gif_frames.
+        """
+        return sum(surface_bytes(frame) for frame in self.gif_frames)
+
+    def release(self):
+        """Drop the decoded frames."""
+        self.gif_frames = []
+        self.current_frame = 0
 
     def update(self, dt):
         """Update frame timer for GIF animation.
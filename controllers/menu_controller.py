@@ -2,7 +2,8 @@ import pygame
 import logging
 
 from constants import MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT
-from utils import handle_button_click
+from controllers.event_router import EventRouter, event_pos
+from models.frame_profiler import frame_profiler
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,8 @@ class MenuController:
             menu_view: MenuView instance.
         """
         self.view = menu_view
+        self.router = EventRouter(self._layout)
+        self.router.on(pygame.MOUSEBUTTONDOWN, self._on_click)
         logger.info("MenuController initialized")
 
     def handle_event(self, event):
@@ -30,20 +33,27 @@ class MenuController:
         Returns:
             str or None: Action name or None if no action.
         """
-        buttons = [{"pos": b["pos"], "label": b["label"], "action": b["action"]} for b in self.view.buttons]
-        if handle_button_click(event, buttons):
-            mouse_pos = event.pos
-            for button in self.view.buttons:
-                rect = pygame.Rect(
-                    button["pos"][0] - MENU_BUTTON_WIDTH // 2,
-                    button["pos"][1] - MENU_BUTTON_HEIGHT // 2,
-                    MENU_BUTTON_WIDTH,
-                    MENU_BUTTON_HEIGHT
-                )
-                if rect.collidepoint(mouse_pos):
-                    logger.info(f"Menu button clicked: {button['action']}")
-                    return button["action"]
-        return None
+        return self.router.dispatch(event)
+
+    def _layout(self):
+        """Build the (rect, action) hit targets of the menu buttons."""
+        targets = []
+        for button in self.view.buttons:
+            w, h = button.get("w", MENU_BUTTON_WIDTH), button.get("h", MENU_BUTTON_HEIGHT)
+            rect = pygame.Rect(button["pos"][0] - w // 2, button["pos"][1] - h // 2, w, h)
+            targets.append((rect, button["action"]))
+        return targets
+
+    @property
+    def predicted_state(self):
+        """str or None: State of the button under the mouse, likely to be entered next."""
+        return self.view.hovered_button
+
+    def _on_click(self, event):
+        action = self.router.hit(event_pos(event))
+        if action is not None:
+            logger.info("Menu button clicked: %s", action)
+        return action
 
     def update(self, dt):
         """Update and render the menu.
@@ -51,4 +61,5 @@ class MenuController:
         Args:
             dt (float): Delta time in seconds (not used currently).
         """
-        self.view.render()
\ No newline at end of file
+        with frame_profiler.phase("render"):
+            self.view.render()
\ No newline at end of file
@@ -0,0 +1,76 @@
+import logging
+
+from models.logger import GameState
+from models.snapshot import config_hash
+
+logger = logging.getLogger(__name__)
+
+class SessionSnapshotter:
+    """Snapshots the running game at every transition and resumes it after a restart.
+
+    This class compares the application state, game state and draw after
+    each frame and saves a snapshot when any of them changed. On startup,
+    a snapshot of a game in progress is restored straight into the game,
+    skipping the loading screen; assets it needs are loaded on first use.
+    A finished game, one that reached its results screen, is not resumed.
+    """
+
+    def __init__(self, state_manager, config_manager, store):
+        """Initialize the SessionSnapshotter.
+
+        Args:
+            state_manager: StateManager instance with a "game" controller.
+            config_manager: ConfigManager instance.
+            store (SnapshotStore): Store the snapshots are written to.
+        """
+        self.state_manager = state_manager
+        self.config_manager = config_manager
+        self.store = store
+        self._key = None
+
+    @property
+    def game(self):
+        """GameController: Controller of the "game" state."""
+        return self.state_manager.controllers["game"]
+
+    def _transition_key(self):
+        game_state = self.game.game_state
+        return self.state_manager.current_state, game_state.state, game_state.current_draw
+
+    def capture(self):
+        """Capture the application and game state.
+
+        Returns:
+            dict: Snapshot, see models.snapshot.encode_snapshot().
+        """
+        snapshot = self.game.snapshot()
+        snapshot["app_state"] = self.state_manager.current_state
+        snapshot["config_hash"] = config_hash(self.config_manager.config)
+        return snapshot
+
+    def update(self):
+        """Save a snapshot if a transition happened since the last one."""
+        key = self._transition_key()
+        if key != self._key:
+            self._key = key
+            self.store.save(self.capture())
+
+    def resume(self):
+        """Restore the game of the latest snapshot.
+
+        Returns:
+            bool: True if a game was restored and the "game" state entered.
+        """
+        snapshot = self.store.load()
+        if snapshot is None or snapshot["app_state"] != "game" or snapshot["draw"] < 0:
+            return False
+        if snapshot["game_state"] == GameState.RESULTS:
+            logger.info("The snapshot's game was finished, starting a new game")
+            return False
+        if snapshot["config_hash"] != config_hash(self.config_manager.config):
+            logger.info("Configuration changed since the snapshot, starting a new game")
+            return False
+        self.game.restore(snapshot)
+        self.state_manager.set_state("game")
+        self._key = self._transition_key()
+        return True
@@ -1,17 +1,39 @@
 import logging
 
+from models.frame_profiler import frame_profiler
+from models.job_scheduler import JobScheduler
+from models.latency_tracer import latency_tracer
+from models.memory_tracker import memory_tracker
+from models.resource_manager import ResourceManager
+from models.state_profiler import StateProfiler
+
 logger = logging.getLogger(__name__)
 
 class StateManager:
     """Manages application states and transitions.
 
-    This class coordinates state changes and controller updates.
+    This class coordinates state changes and controller updates. Controllers
+    may define lifecycle hooks: on_exit() and on_enter() run around every
+    switch, on_suspend() and on_resume() while the window is minimized. A
+    controller exposing predicted_state (e.g. the menu button under the
+    mouse) gets that state's resources preloaded before the switch. The
+    manager owns the job scheduler controllers submit background work to
+    and applies finished jobs at the start of every frame.
     """
 
-    def __init__(self):
-        """Initialize the StateManager."""
+    def __init__(self, jobs=None):
+        """Initialize the StateManager.
+
+        Args:
+            jobs (JobScheduler): Scheduler pumped every frame, or None for a new one.
+        """
+        self.jobs = jobs if jobs is not None else JobScheduler()
         self.current_state = "menu"
         self.controllers = {}
+        self.state_profiler = StateProfiler.from_env()
+        self.resources = ResourceManager.from_env()
+        self.suspended = False
+        self._predicted = None
 
     def register_controller(self, state, controller):
         """Register a controller for a specific state.
@@ -25,14 +47,49 @@ class StateManager:
     def set_state(self, new_state):
         """Change the current state.
 
+        Calls the old controller's on_exit(), activates the new state's
+        resources (releasing inactive ones over budget), then calls the new
+        controller's on_enter().
+
         Args:
             new_state (str): New state to transition to.
         """
         if new_state in self.controllers:
-            logger.info(f"Switching state from {self.current_state} to {new_state}")
+            self._call_hook(self.current_state, "on_exit")
+            logger.info("Switching state from %s to %s", self.current_state, new_state)
+            memory_tracker.on_transition(self.current_state, new_state)
             self.current_state = new_state
+            self._predicted = None
+            self.resources.activate(new_state)
+            self._call_hook(new_state, "on_enter")
         else:
-            logger.warning(f"State {new_state} not registered")
+            logger.warning("State %s not registered", new_state)
+
+    def suspend(self):
+        """Suspend the current state, e.g. while the window is minimized.
+
+        Every state counts as inactive while suspended, so resources over the
+        budget are released from all of them.
+        """
+        if not self.suspended:
+            self.suspended = True
+            self._call_hook(self.current_state, "on_suspend")
+            self.resources.activate(None)
+            logger.info("State %s suspended", self.current_state)
+
+    def resume(self):
+        """Resume the current state after suspend()."""
+        if self.suspended:
+            self.suspended = False
+            self.resources.activate(self.current_state)
+            self._call_hook(self.current_state, "on_resume")
+            logger.info("State %s resumed", self.current_state)
+
+    def _call_hook(self, state, name):
+        """Call a lifecycle hook of a state's controller if it defines one."""
+        hook = getattr(self.controllers.get(state), name, None)
+        if callable(hook):
+            hook()
 
     def update(self, dt):
         """Update the current state's controller.
@@ -40,8 +97,33 @@ class StateManager:
         Args:
             dt (float): Delta time in seconds.
         """
+        with frame_profiler.phase("jobs"):
+            self.jobs.pump()
         if self.current_state in self.controllers:
-            self.controllers[self.current_state].update(dt)
+            with frame_profiler.phase("update"):
+                self.controllers[self.current_state].update(dt)
+            if self.state_profiler.armed or self.state_profiler.capturing:
+                self.state_profiler.on_frame(self.profile_state())
+            self._preload_predicted()
+
+    def _preload_predicted(self):
+        """Preload the resources of the state the current controller predicts."""
+        predicted = getattr(self.controllers[self.current_state], "predicted_state", None)
+        if not isinstance(predicted, str) or predicted == self._predicted:
+            return
+        self._predicted = predicted
+        if predicted != self.current_state and predicted in self.controllers:
+            logger.debug("Predicted transition to %s, preloading", predicted)
+            self.resources.preload(predicted)
+
+    def profile_state(self):
+        """Get the detailed state used to scope profiling captures.
+
+        Returns:
+            str: "state" or "state.sub_state" when the controller exposes profile_state.
+        """
+        sub_state = getattr(self.controllers.get(self.current_state), "profile_state", None)
+        return f"{self.current_state}.{sub_state}" if isinstance(sub_state, str) else self.current_state
 
     def handle_event(self, event):
         """Handle events for the current state's controller.
@@ -53,8 +135,10 @@ class StateManager:
             str or None: Action name or None if no action.
         """
         if self.current_state in self.controllers:
-            action = self.controllers[self.current_state].handle_event(event)
+            with frame_profiler.phase("events"):
+                action = self.controllers[self.current_state].handle_event(event)
             if action and action in self.controllers:
+                latency_tracer.input_applied(event, "switch")
                 self.set_state(action)
             return action
         return None
\ No newline at end of file
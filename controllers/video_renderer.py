@@ -0,0 +1,186 @@
+import os
+import logging
+import multiprocessing
+import queue
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pygame
+
+from constants import (
+    WIDTH, HEIGHT, GIF_DISPLAY_TIME, WAIT_TIME, TEXT_RESP_PATH, VIDEO_FPS, VIDEO_QUEUE_SIZE,
+    VIDEO_RESULTS_HOLD_TIME, VIDEO_FORMAT, GIF_DIR
+)
+from models.gif_index import GifIndex
+from models.logger import GameStateTracker
+from models.result_saver import SaveStatus
+from views.game_view import GameView
+from utils import load_json_file
+from .headless_runner import HeadlessGame
+from .media_loader import MediaLoader
+
+logger = logging.getLogger(__name__)
+
+class OffscreenSession(HeadlessGame):
+    """Renders a full game to an offscreen surface at a fixed virtual frame rate.
+
+    This class replays the game flow with a constant dt per frame, so the
+    output does not depend on how fast frames are actually produced.
+    """
+
+    def __init__(self, config, responses, fps=VIDEO_FPS, gif_index=None):
+        """Initialize the OffscreenSession.
+
+        Args:
+            config (dict): Configuration data with questions and answers.
+            responses (dict): Response pools loaded from TEXT_RESP_PATH.
+            fps (int): Virtual frames per second of the output.
+            gif_index (GifIndex): Index the GIFs are chosen and loaded from, or None to draw them blindly.
+        """
+        super().__init__(config, responses, gif_index)
+        self.fps = fps
+        self.dt = 1.0 / fps
+        if not pygame.display.get_init():
+            pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.view = GameView(self.screen, config)
+        self.media_loader = MediaLoader(gif_index)
+
+    def frames(self, seed):
+        """Render every frame of one session.
+
+        Args:
+            seed (int): Seed for the session's random generator.
+
+        Yields:
+            pygame.Surface: The screen after each rendered frame.
+        """
+        rng = random.Random(seed)
+        game_state = GameStateTracker(len(self.config["questions"]))
+        for draw, wheel in self._turns(rng, game_state):
+            wheel.spin()
+            while wheel.spinning:
+                wheel.update(self.dt)
+                self.view.render_spinning(wheel, draw)
+                yield self.screen
+            result, gif_id, _, _, response = self._record(draw, wheel, rng, game_state)
+            if self.media_loader.load_gif(gif_id):
+                for _ in range(round(GIF_DISPLAY_TIME * self.fps)):
+                    self.media_loader.update(self.dt)
+                    self.view.render_gif(self.media_loader, result, response)
+                    yield self.screen
+            else:
+                for _ in range(round(WAIT_TIME * self.fps)):
+                    self.view.render_waiting(wheel, draw, result, False)
+                    yield self.screen
+        for _ in range(round(VIDEO_RESULTS_HOLD_TIME * self.fps)):
+            self.view.render_results(game_state.results, game_state.result_responses, SaveStatus.IDLE)
+            yield self.screen
+
+def _encode_frames(frame_queue, output_path, fps, size):
+    """Encoder process: write raw RGB frames from the queue until a None sentinel.
+
+    Args:
+        frame_queue (multiprocessing.Queue): Queue of RGB frame bytes.
+        output_path (str): Path of the video file.
+        fps (int): Frames per second of the output.
+        size (tuple): (width, height) of each frame.
+    """
+    import imageio.v2 as imageio
+    import numpy as np
+    width, height = size
+    with imageio.get_writer(output_path, fps=fps) as writer:
+        while True:
+            data = frame_queue.get()
+            if data is None:
+                break
+            writer.append_data(np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3))
+
+def _put_frame(frame_queue, data, encoder):
+    """Put a frame on the bounded queue, failing fast if the encoder has died."""
+    while True:
+        try:
+            frame_queue.put(data, timeout=1.0)
+            return
+        except queue.Full:
+            if not encoder.is_alive():
+                raise RuntimeError(f"Video encoder exited with code {encoder.exitcode}")
+
+def render_session(config, seed, output_path, fps=VIDEO_FPS, responses=None, queue_size=VIDEO_QUEUE_SIZE,
+                   gif_dir=GIF_DIR):
+    """Render one session to a video file.
+
+    Frames are produced in this process and streamed through a bounded queue
+    to an encoder running in a separate process.
+
+    Args:
+        config (dict): Configuration data with questions and answers.
+        seed (int): Seed for the session's random generator.
+        output_path (str): Path of the video file; the extension selects the format.
+        fps (int): Virtual frames per second of the output.
+        responses (dict): Response pools, loaded from TEXT_RESP_PATH if None.
+        queue_size (int): Maximum number of frames waiting for the encoder.
+        gif_dir (str): Directory whose GIFs are shown.
+
+    Returns:
+        dict: Report with output, frames, video_seconds, render_seconds and speedup.
+    """
+    responses = responses if responses is not None else load_json_file(TEXT_RESP_PATH)
+    gif_index = GifIndex(gif_dir)
+    gif_index.scan()
+    session = OffscreenSession(config, responses, fps, gif_index)
+    ctx = multiprocessing.get_context()
+    frame_queue = ctx.Queue(maxsize=queue_size)
+    encoder = ctx.Process(target=_encode_frames, args=(frame_queue, str(output_path), fps, (WIDTH, HEIGHT)))
+    encoder.start()
+    start = time.perf_counter()
+    frame_count = 0
+    try:
+        for surface in session.frames(seed):
+            _put_frame(frame_queue, pygame.image.tobytes(surface, "RGB"), encoder)
+            frame_count += 1
+    finally:
+        if encoder.is_alive():
+            frame_queue.put(None)
+        encoder.join()
+    elapsed = time.perf_counter() - start
+    if encoder.exitcode != 0:
+        raise RuntimeError(f"Video encoder exited with code {encoder.exitcode}")
+    video_seconds = frame_count / fps
+    logger.info("Rendered %.1fs session %d to %s in %.2fs", video_seconds, seed, output_path, elapsed)
+    return {
+        "output": str(output_path),
+        "frames": frame_count,
+        "video_seconds": video_seconds,
+        "render_seconds": elapsed,
+        "speedup": video_seconds / elapsed if elapsed > 0 else float('inf'),
+    }
+
+def _render_worker(args):
+    config, seed, output_path, fps, responses = args
+    logging.getLogger().setLevel(logging.WARNING)
+    return render_session(config, seed, output_path, fps, responses)
+
+def render_sessions(config, seeds, output_dir, workers=None, fps=VIDEO_FPS, fmt=VIDEO_FORMAT):
+    """Render several sessions in parallel, one process per session.
+
+    Args:
+        config (dict): Configuration data with questions and answers.
+        seeds (list): Seeds of the sessions to render.
+        output_dir (str): Directory for the video files.
+        workers (int): Number of sessions rendered at once, defaults to the CPU count.
+        fps (int): Virtual frames per second of the output.
+        fmt (str): Video file extension, e.g. "mp4" or "gif".
+
+    Returns:
+        list: One report per session, in seed order.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    responses = load_json_file(TEXT_RESP_PATH)
+    jobs = [(config, seed, output_dir / f"session_{seed}.{fmt}", fps, responses) for seed in seeds]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        return list(pool.map(_render_worker, jobs))
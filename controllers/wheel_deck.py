@@ -0,0 +1,234 @@
+import copy
+import threading
+import logging
+import time
+
+from models.metrics import metrics
+from models.spin_wheel import SpinWheelModel
+
+logger = logging.getLogger(__name__)
+deck_build_seconds = metrics.histogram("kft_wheel_deck_build_seconds", "Time to build one wheel of the deck.")
+deck_wait_seconds = metrics.histogram("kft_wheel_deck_wait_seconds",
+                                      "Time the game waited for a wheel the deck had not built yet.",
+                                      buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
+
+class WheelCard:
+    """Everything one question needs to be played, built ahead of time."""
+
+    __slots__ = ("draw", "wheel", "layout", "base")
+
+    def __init__(self, draw, wheel, layout=None, base=None):
+        """Initialize the WheelCard.
+
+        Args:
+            draw (int): Zero-based question index.
+            wheel (SpinWheelModel): Wheel of the question.
+            layout (WheelLayout): Geometry of the wheel image, or None without a renderer.
+            base (pygame.Surface): Unrotated wheel image once painted on the main thread, or None.
+        """
+        self.draw = draw
+        self.wheel = wheel
+        self.layout = layout
+        self.base = base
+
+class WheelDeck:
+    """Builds the wheels of every configured question on a background thread.
+
+    This class starts building as soon as it is created, in question order.
+    When the game asks for a wheel that is not ready yet, that wheel jumps the
+    queue and the caller waits for it alone; once built, handing a wheel out
+    is a list lookup. The thread only computes wheels and their image
+    layouts; painting the images needs pygame, so it is handed to the main
+    thread through the job scheduler, one wheel per call within its budget.
+    """
+
+    def __init__(self, questions, renderer=None, sound=None, gif_index=None, jobs=None):
+        """Initialize the WheelDeck.
+
+        Args:
+            questions (list): Question dicts from the configuration; a copy is kept to detect changes.
+            renderer (WheelRenderer): Renderer whose base image cache is filled, or None to skip images.
+            sound (pygame.mixer.Sound): Spin sound shared by every wheel, or None for silent wheels.
+            gif_index (GifIndex): Index the wheels choose GIF variants from, or None.
+            jobs (JobScheduler): Scheduler whose pump paints the images on the main thread, or None to
+                leave painting to the renderer's first draw.
+        """
+        self.questions = copy.deepcopy(list(questions))
+        self.renderer = renderer
+        self.sound = sound
+        self.gif_index = gif_index
+        self.jobs = jobs
+        self.cards = [None] * len(self.questions)
+        self.errors = {}
+        self._pending = list(range(len(self.questions)))
+        self._versions = [0] * len(self.questions)
+        self._priority = None
+        self._cancelled = False
+        self._running = True
+        self._condition = threading.Condition()
+        if renderer is not None:
+            renderer.reserve(len(self.questions))
+        self._thread = threading.Thread(target=self._worker, name="WheelDeck", daemon=True)
+        self._thread.start()
+
+    @property
+    def progress(self):
+        """float: Share of the wheels built so far, from 0 to 1."""
+        with self._condition:
+            done = len(self.questions) - len(self._pending)
+        return done / len(self.questions) if self.questions else 1.0
+
+    def ready(self, draw):
+        """Check if a wheel has been built.
+
+        Args:
+            draw (int): Zero-based question index.
+
+        Returns:
+            bool: True if the card is available without waiting.
+        """
+        return self.cards[draw] is not None
+
+    def card(self, draw):
+        """Get the card of a question, building it first if the deck has not reached it.
+
+        Args:
+            draw (int): Zero-based question index.
+
+        Returns:
+            WheelCard: Card of the question.
+
+        Raises:
+            Exception: Whatever building the wheel raised, e.g. ValueError for invalid weights.
+        """
+        card = self.cards[draw]
+        if card is not None:
+            return card
+        start = time.perf_counter()
+        with self._condition:
+            self._priority = draw
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self.cards[draw] is not None or draw in self.errors or self._cancelled)
+        if self.cards[draw] is None and draw not in self.errors:
+            # A cancelled deck still answers, by building on the caller's thread.
+            self.cards[draw] = self._build(draw)
+        waited = time.perf_counter() - start
+        deck_wait_seconds.observe(waited)
+        logger.info("Waited %.1f ms for wheel %d", waited * 1000, draw + 1)
+        if draw in self.errors:
+            raise self.errors[draw]
+        return self.cards[draw]
+
+    def wheel(self, draw):
+        """Get the wheel of a question.
+
+        Args:
+            draw (int): Zero-based question index.
+
+        Returns:
+            SpinWheelModel: Wheel of the question.
+        """
+        return self.card(draw).wheel
+
+    def cancel(self):
+        """Stop building; wheels already built stay available."""
+        with self._condition:
+            self._cancelled = True
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def rebuild(self, draws, questions):
+        """Replace edited questions and rebuild only their wheels.
+
+        Args:
+            draws (list): Zero-based indices of the edited questions; indices outside the deck are ignored.
+            questions (list): Question dicts from the new configuration.
+        """
+        with self._condition:
+            if self._cancelled:
+                return
+            for draw in draws:
+                if draw >= len(self.questions) or draw >= len(questions):
+                    continue
+                self.questions[draw] = copy.deepcopy(questions[draw])
+                self._versions[draw] += 1
+                self.cards[draw] = None
+                self.errors.pop(draw, None)
+                if draw not in self._pending:
+                    self._pending.append(draw)
+            restart = self._pending and not self._running
+            if restart:
+                self._running = True
+        if restart:
+            self._thread = threading.Thread(target=self._worker, name="WheelDeck", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout=None):
+        """Block until the builder thread has finished.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds, or None to wait forever.
+
+        Returns:
+            bool: True if every wheel was built or the deck was cancelled.
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _worker(self):
+        """Build pending wheels, the prioritized one first, until none are left."""
+        start = time.perf_counter()
+        while True:
+            with self._condition:
+                if self._cancelled or not self._pending:
+                    self._running = False
+                    break
+                draw = self._priority if self._priority in self._pending else self._pending[0]
+                version = self._versions[draw]
+            try:
+                card = self._build(draw)
+            except Exception as e:
+                logger.error("Error building wheel %d: %s", draw + 1, e)
+                with self._condition:
+                    if version == self._versions[draw]:
+                        self.errors[draw] = e
+                        self._pending.remove(draw)
+                        self._condition.notify_all()
+                continue
+            with self._condition:
+                if version != self._versions[draw]:
+                    # The question was edited while building; its new version is still pending.
+                    continue
+                self.cards[draw] = card
+                if draw in self._pending:
+                    self._pending.remove(draw)
+                self._condition.notify_all()
+            if self.jobs is not None and card.layout is not None:
+                self.jobs.call_soon(self._paint, card, name="wheel_paint")
+        logger.info("Wheel deck built %d/%d wheels in %.1f ms", sum(card is not None for card in self.cards),
+                    len(self.cards), (time.perf_counter() - start) * 1000)
+
+    def _build(self, draw):
+        """Build the card of one question.
+
+        Args:
+            draw (int): Zero-based question index.
+
+        Returns:
+            WheelCard: Built card.
+        """
+        start = time.perf_counter()
+        wheel = SpinWheelModel.from_question(self.questions[draw], sound=self.sound, gif_index=self.gif_index)
+        layout = self.renderer.layout(wheel.segments, wheel.boundaries) if self.renderer is not None else None
+        deck_build_seconds.observe(time.perf_counter() - start)
+        return WheelCard(draw, wheel, layout)
+
+    def _paint(self, card):
+        """Paint the image of a built card into the renderer's cache. Runs on the main thread.
+
+        Args:
+            card (WheelCard): Card built by the thread; skipped if the deck dropped or replaced it.
+        """
+        if self._cancelled or self.cards[card.draw] is not card:
+            return
+        card.base = self.renderer.base_image(card.wheel, card.layout)
@@ -0,0 +1,61 @@
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from constants import HISTORY_DIR
+from models.logger import setup_logging
+from models.session_history import load_history, outcome_frequencies, duration_stats, universe_stats
+from models.universe_library import universe_library, normalize_name
+
+logger = logging.getLogger(__name__)
+
+def main():
+    """Report outcome frequencies, session durations and per-universe stats of the session history."""
+    parser = argparse.ArgumentParser(description="Session history analytics for Spin The Wheel.")
+    parser.add_argument("-d", "--dir", default=HISTORY_DIR, help="Session history directory.")
+    parser.add_argument("-u", "--universe", default=None, help="Only report sessions of this universe.")
+    parser.add_argument("-t", "--top", type=int, default=5, help="Most frequent outcomes per question and universes shown.")
+    args = parser.parse_args()
+    setup_logging()
+
+    start = time.perf_counter()
+    records, universes = load_history(args.dir)
+    loaded = time.perf_counter() - start
+    answers = None
+    if args.universe is not None:
+        ids = [i for i, name in enumerate(universes) if normalize_name(name) == normalize_name(args.universe)]
+        records = records[np.isin(records["universe"], ids)]
+        stored = universe_library.load(args.universe)
+        answers = [question["answers"] for question in stored["questions"]] if stored else None
+    print(f"{len(records)} sessions loaded in {loaded:.2f}s")
+    if not len(records):
+        return
+
+    durations = duration_stats(records)
+    print(f"Session duration: mean {durations['mean']:.1f}s, p50 {durations['p50']:.1f}s, "
+          f"p95 {durations['p95']:.1f}s, max {durations['max']:.1f}s")
+
+    print("\nUniverses:")
+    by_universe = sorted(universe_stats(records, universes).items(), key=lambda item: -item[1]["sessions"])
+    for name, stats in by_universe[:args.top]:
+        print(f"  {name}: {stats['sessions']} sessions, mean duration {stats['mean_duration']:.1f}s, "
+              f"mean spin {stats['mean_spin']:.1f}s")
+
+    print("\nOutcomes:")
+    for draw, counts in enumerate(outcome_frequencies(records)):
+        total = counts.sum()
+        if not total:
+            continue
+        top = np.argsort(counts, kind="stable")[::-1][:args.top]
+        labels = []
+        for segment in top[counts[top] > 0]:
+            label = f"#{segment}"
+            if answers is not None and draw < len(answers) and segment < len(answers[draw]):
+                label = answers[draw][segment]
+            labels.append(f"{label} {counts[segment] / total:.1%}")
+        print(f"  Question {draw + 1} ({total} draws): " + ", ".join(labels))
+
+if __name__ == "__main__":
+    main()
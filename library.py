@@ -0,0 +1,44 @@
+import argparse
+import logging
+
+from models.logger import setup_logging
+from models.universe_library import UniverseLibrary
+from constants import UNIVERSE_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+def main():
+    """Import, export and list the universes of the universe library."""
+    parser = argparse.ArgumentParser(description="Universe library of Spin The Wheel.")
+    parser.add_argument("--db", default=UNIVERSE_DB_PATH, help="Library database path.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="Store universes from config.json files.")
+    import_parser.add_argument("files", nargs="+", help="A config.json file or an exported list of universes.")
+    export_parser = commands.add_parser("export", help="Write universes in the config.json format.")
+    export_parser.add_argument("output", help="JSON output path.")
+    export_parser.add_argument("-n", "--name", default=None, help="Universe to export (default: all as a list).")
+    list_parser = commands.add_parser("list", help="List stored universes.")
+    list_parser.add_argument("prefix", nargs="?", default="", help="Start of the universe names.")
+    list_parser.add_argument("-l", "--limit", type=int, default=50, help="Maximum number of names.")
+    args = parser.parse_args()
+    setup_logging()
+
+    library = UniverseLibrary(args.db)
+    try:
+        if args.command == "import":
+            count = sum(library.import_json(path) for path in args.files)
+            print(f"Imported {count} universes, {len(library)} in the library")
+        elif args.command == "export":
+            try:
+                count = library.export_json(args.output, args.name)
+            except KeyError:
+                parser.error(f"universe {args.name!r} is not in the library")
+            print(f"Exported {count} universes to {args.output}")
+        else:
+            for name in library.search(args.prefix, args.limit):
+                print(name)
+    finally:
+        library.close()
+
+if __name__ == "__main__":
+    main()
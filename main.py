@@ -1,62 +1,219 @@
 import pygame
+import os
 import sys
 import logging
+import time
 from pathlib import Path
-from constants import WIDTH, HEIGHT, FPS
-from models.logger import GameStateTracker
+from constants import (
+    FPS, FRAME_PROFILER_HOTKEY, FRAME_PROFILER_ENV, FRAME_PROFILE_DUMP_PATH, PROFILE_HOTKEY,
+    METRICS_PORT_ENV, METRICS_TEXTFILE_PATH, METRICS_EXPORT_INTERVAL, FRAME_TIME_BUCKETS, MEMORY_TRACE_ENV,
+    MEMORY_OVERLAY_HOTKEY, BACKGROUNDS_DIR, CONFIG_PATH, ASSETS_DIR
+)
+from models.file_watcher import file_watcher
+from models.frame_profiler import frame_profiler
+from models.gif_index import gif_index
+from models.latency_tracer import latency_tracer
+from models.assets import asset_store
+from models.logger import GameStateTracker, setup_logging
+from models.memory_tracker import memory_tracker
+from models.metrics import metrics
 from models.config_manager import ConfigManager
+from models.session_history import session_history
+from models.snapshot import SnapshotStore
+from models.universe_library import universe_library
 from views.game_view import GameView
+from views.loading_view import LoadingView
 from views.config_view import ConfigView
+from views.display import display, window_settings
+from views.memory_overlay import MemoryOverlay
 from views.menu_view import MenuView
+from views.profiler_overlay import ProfilerOverlay
+from controllers.asset_preloader import AssetPreloader, LoadingController, load_manifest, required_assets
+from controllers.config_reloader import ConfigReloader
 from controllers.game_controller import GameController
 from controllers.config_controller import ConfigController
+from controllers.event_router import allow_events
 from controllers.menu_controller import MenuController
+from controllers.session_snapshot import SessionSnapshotter
 from controllers.state_manager import StateManager
 
 logger = logging.getLogger(__name__)
 
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Spin The Wheel Game")
-clock = pygame.time.Clock()
+def play_music(name):
+    """Loop the configured background music, or stop the music when none is configured or found.
 
-def main():
-    """Main game loop.
+    Args:
+        name (str): Music file name in the backgrounds directory.
+    """
+    path = Path(BACKGROUNDS_DIR) / name
+    try:
+        pygame.mixer.music.stop()
+        if name and asset_store.exists(path):
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(0.01)
+            pygame.mixer.music.play(-1)
+    except pygame.error as e:
+        logger.error("Music loading error: %s", e)
 
-    This function initializes and runs the game with state management.
+def build_app(screen, sound=True):
+    """Create the models, views and controllers and register them for each state.
+
+    The "loading" state preloads the assets when entered; the app starts in
+    "menu" unless the caller switches to "loading" first. Edits of the config
+    file and assets are applied once file_watcher is started.
+
+    Args:
+        screen: Pygame surface all views render to.
+        sound (bool): Play the wheel spin sound if True.
+
+    Returns:
+        tuple: (StateManager, ConfigManager).
     """
     config_manager = ConfigManager()
+    manifest = load_manifest()
+    asset_store.use_manifest(manifest)
+    gif_index.scan()
     state_manager = StateManager()
     menu_view = MenuView(screen)
     menu_controller = MenuController(menu_view)
     config_view = ConfigView(screen, config_manager.config)
-    config_controller = ConfigController(config_view, config_manager, state_manager)
+    config_controller = ConfigController(config_view, config_manager, state_manager, state_manager.jobs,
+                                         universe_library)
     game_state = GameStateTracker(len(config_manager.config["questions"]))
     game_view = GameView(screen, config_manager.config)
-    game_controller = GameController(game_state, game_view, config_manager)
+    game_controller = GameController(game_state, game_view, config_manager, sound, state_manager.jobs,
+                                     session_history)
+
+    preloader = AssetPreloader(manifest, required_assets(config_manager.config))
+    loading_controller = LoadingController(LoadingView(screen), preloader, state_manager)
 
+    state_manager.register_controller("loading", loading_controller)
     state_manager.register_controller("menu", menu_controller)
     state_manager.register_controller("config", config_controller)
     state_manager.register_controller("game", game_controller)
 
+    memory_tracker.register("menu_view", menu_view)
+    memory_tracker.register("config_view", config_view)
+    memory_tracker.register("game_view", game_view)
+    memory_tracker.register("media_loader", lambda: game_controller.media_loader, kind="loader")
+    memory_tracker.register("background_cache", lambda: game_view.background, kind="cache")
+
+    resources = state_manager.resources
+    resources.register("game", "wheel_deck", game_controller.deck_bytes, game_controller.release_deck,
+                       load=game_controller.preload_deck, priority=2)
+    resources.register("game", "background", game_view.background_bytes, game_view.release_background, priority=1)
+    resources.register("game", "gif_frames", lambda: game_controller.media_loader.frame_bytes(),
+                       lambda: game_controller.media_loader.release())
+    resources.register("config", "widget_caches", config_view.cache_bytes, config_view.release_caches)
+
+    reloader = ConfigReloader(config_manager, state_manager.jobs, manifest)
+    reloader.on(("bg_img",), game_view.config_changed)
+    reloader.on(("questions",), game_controller.config_changed)
+    reloader.on(("prompt", "music", "bg_img", "bg_color", "questions"), config_view.config_changed)
+    reloader.on_assets(game_view.assets_changed)
+    reloader.on_assets(lambda paths: gif_index.refresh())
+    if sound:
+        def music_changed(_):
+            play_music(config_manager.config["music"])
+
+        def music_file_changed(paths):
+            if (Path(BACKGROUNDS_DIR) / config_manager.config["music"]).as_posix() in paths:
+                play_music(config_manager.config["music"])
+        reloader.on(("music",), music_changed)
+        reloader.on_assets(music_file_changed)
+    file_watcher.watch(CONFIG_PATH, reloader.config_file_changed)
+    file_watcher.watch(ASSETS_DIR, reloader.assets_changed)
+    return state_manager, config_manager
+
+def main():
+    """Main game loop.
+
+    This function initializes and runs the game with state management.
+    """
+    started = time.perf_counter()
+    setup_logging()
+    pygame.init()
+    window_size, fullscreen = window_settings()
+    screen = display.open(window_size, fullscreen, caption="Spin The Wheel Game")
+    clock = pygame.time.Clock()
+    state_manager, config_manager = build_app(screen)
+    snapshotter = SessionSnapshotter(state_manager, config_manager, SnapshotStore(jobs=state_manager.jobs))
+    resumed = snapshotter.resume()
+    if not resumed:
+        state_manager.set_state("loading")
+    file_watcher.start(state_manager.jobs)
+    allow_events(*(controller.router for controller in state_manager.controllers.values()),
+                 extra=(pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED, pygame.VIDEORESIZE))
+
+    record_always = bool(os.environ.get(FRAME_PROFILER_ENV))
+    if record_always:
+        frame_profiler.enable()
+    profiler_overlay = ProfilerOverlay(screen, frame_profiler, record_always)
+    memory_overlay = MemoryOverlay(screen, memory_tracker)
+    if os.environ.get(MEMORY_TRACE_ENV):
+        memory_tracker.start_tracing(int(os.environ[MEMORY_TRACE_ENV]))
+
+    frame_seconds = metrics.histogram("kft_frame_seconds", "Frame time by application state.", ("state",),
+                                      buckets=FRAME_TIME_BUCKETS)
+    metrics.start_textfile_exporter(METRICS_TEXTFILE_PATH, METRICS_EXPORT_INTERVAL)
+    if os.environ.get(METRICS_PORT_ENV):
+        metrics.start_http_server(int(os.environ[METRICS_PORT_ENV]))
+
+    if config_manager.config["music"]:
+        play_music(config_manager.config["music"])
+
     try:
-        music_path = Path('assets') / 'backgrounds' / config_manager.config["music"]
-        pygame.mixer.music.load(music_path)
-        pygame.mixer.music.set_volume(0.01)
-        pygame.mixer.music.play(-1)
-    except (FileNotFoundError, pygame.error) as e:
-        logger.error(f"Music loading error: {e}")
-
-    while True:
-        dt = clock.tick(FPS) / 1000.0
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                logger.info("Game exited")
-                pygame.quit()
-                sys.exit()
-            state_manager.handle_event(event)
-        state_manager.update(dt)
-        pygame.display.flip()
+        while True:
+            dt = clock.tick(FPS) / 1000.0
+            frame_seconds.observe(dt, state=state_manager.current_state)
+            for event in pygame.event.get():
+                event = display.map_event(event)
+                latency_tracer.stamp(event)
+                if event.type == pygame.QUIT:
+                    logger.info("Game exited")
+                    pygame.quit()
+                    sys.exit()
+                if display.handle_event(event):
+                    continue
+                if event.type == pygame.WINDOWMINIMIZED:
+                    state_manager.suspend()
+                    continue
+                if event.type == pygame.WINDOWRESTORED:
+                    state_manager.resume()
+                    continue
+                if event.type == pygame.KEYDOWN and event.key == FRAME_PROFILER_HOTKEY:
+                    profiler_overlay.toggle()
+                    continue
+                if event.type == pygame.KEYDOWN and event.key == MEMORY_OVERLAY_HOTKEY:
+                    memory_overlay.toggle()
+                    continue
+                if event.type == pygame.KEYDOWN and event.key == PROFILE_HOTKEY:
+                    state_manager.state_profiler.toggle(state_manager.profile_state())
+                    continue
+                state_manager.handle_event(event)
+            state_manager.update(dt)
+            snapshotter.update()
+            with frame_profiler.phase("overlay"):
+                profiler_overlay.render(state_manager.current_state)
+                memory_overlay.render(state_manager.current_state)
+            with frame_profiler.phase("flip"):
+                display.present()
+            latency_tracer.on_flip()
+            if resumed:
+                logger.info("Resumed game shown %.0f ms after start", (time.perf_counter() - started) * 1000)
+                resumed = False
+            frame_profiler.end_frame(state_manager.current_state)
+    finally:
+        state_manager.jobs.shutdown()
+        state_manager.state_profiler.stop()
+        file_watcher.stop()
+        universe_library.close()
+        session_history.close()
+        latency_tracer.log_summary()
+        metrics.write_textfile(METRICS_TEXTFILE_PATH)
+        metrics.stop()
+        if frame_profiler.buffers:
+            frame_profiler.dump(FRAME_PROFILE_DUMP_PATH)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
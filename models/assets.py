@@ -0,0 +1,313 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import pygame
+
+from constants import ASSETS_DIR, ASSET_MANIFEST_PATH, ASSET_TYPES, ASSET_HASH_CHUNK, RENDER_SCALE
+
+logger = logging.getLogger(__name__)
+
+def asset_type(relative_path):
+    """Classify an asset by its extension and top-level directory.
+
+    Args:
+        relative_path (str): Path relative to the assets directory, e.g. "sfx/spin.mp3".
+
+    Returns:
+        str or None: "image", "gif", "sound" or "music", or None for files that are not assets.
+    """
+    path = Path(relative_path)
+    kind = ASSET_TYPES.get(path.suffix.lower())
+    if kind == "audio":
+        return "sound" if path.parts[0] == "sfx" else "music"
+    return kind
+
+def file_hash(path):
+    """Hash a file's content in chunks.
+
+    Args:
+        path (Path): File to hash.
+
+    Returns:
+        str: Hex SHA-1 digest.
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(ASSET_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def presize(surface, scale):
+    """Scale a decoded image to the render resolution, so it is not scaled again per frame.
+
+    Args:
+        surface (pygame.Surface): Image at its authored size, for the logical resolution.
+        scale (float): Render scale.
+
+    Returns:
+        pygame.Surface: The scaled image, or the same surface at scale 1.
+    """
+    if scale == 1:
+        return surface
+    size = (max(1, round(surface.get_width() * scale)), max(1, round(surface.get_height() * scale)))
+    return pygame.transform.smoothscale(surface, size)
+
+class AssetManifest:
+    """Index of the files under the assets directory.
+
+    This class records type, size, content hash and modification time per
+    asset. Rescanning only rehashes files whose size or modification time
+    changed, so it can run at every startup.
+    """
+
+    def __init__(self, root=ASSETS_DIR, entries=None):
+        """Initialize the AssetManifest.
+
+        Args:
+            root (str): Assets directory the entry paths are relative to.
+            entries (dict): Entries keyed by relative POSIX path.
+        """
+        self.root = Path(root)
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path=ASSET_MANIFEST_PATH, root=ASSETS_DIR):
+        """Load a saved manifest, or return an empty one if it is missing or unreadable.
+
+        Args:
+            path (str): Manifest JSON file.
+            root (str): Assets directory.
+
+        Returns:
+            AssetManifest: Loaded manifest.
+        """
+        try:
+            with open(path, encoding='utf-8') as f:
+                return cls(root, json.load(f)["assets"])
+        except FileNotFoundError:
+            return cls(root)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Ignoring unreadable asset manifest %s: %s", path, e)
+            return cls(root)
+
+    def save(self, path=ASSET_MANIFEST_PATH):
+        """Write the manifest as JSON.
+
+        Args:
+            path (str): Manifest JSON file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open('w', encoding='utf-8') as f:
+            json.dump({"root": self.root.as_posix(), "assets": self.entries}, f, indent=2, sort_keys=True)
+
+    def scan(self):
+        """Bring the entries in line with the files on disk.
+
+        Returns:
+            bool: True if any entry was added, changed or removed.
+        """
+        entries = {}
+        if self.root.is_dir():
+            for directory, _, files in os.walk(self.root):
+                for name in files:
+                    full_path = Path(directory) / name
+                    relative = full_path.relative_to(self.root).as_posix()
+                    kind = asset_type(relative)
+                    if kind is None:
+                        continue
+                    stat = full_path.stat()
+                    old = self.entries.get(relative)
+                    if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+                        entries[relative] = old
+                        continue
+                    entries[relative] = {"type": kind, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                                         "sha1": file_hash(full_path)}
+        changed = entries != self.entries
+        self.entries = entries
+        logger.info("Asset manifest lists %d files under %s", len(entries), self.root)
+        return changed
+
+    def relative(self, path):
+        """Get the manifest key of a path given relative to the working directory or the assets root.
+
+        Args:
+            path (str or Path): Asset path, e.g. "assets/sfx/spin.mp3".
+
+        Returns:
+            str: Key relative to the assets root.
+        """
+        path = Path(path)
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def __contains__(self, path):
+        return self.relative(path) in self.entries
+
+    def of_type(self, kind):
+        """List the paths of one asset type.
+
+        Args:
+            kind (str): "image", "gif", "sound" or "music".
+
+        Returns:
+            list: Paths relative to the working directory, sorted.
+        """
+        return sorted((self.root / key).as_posix() for key, entry in self.entries.items() if entry["type"] == kind)
+
+class AssetStore:
+    """Holds decoded assets by path and remembers which ones are missing.
+
+    This class is filled by the preloader, which converts images to the
+    display format on the main thread. Assets asked for before or without a
+    preload are loaded on first use. A path that turns out to be missing is
+    logged once and answered with None from then on. Images are stored
+    scaled by image_scale, the render scale their layout is drawn at.
+    """
+
+    def __init__(self, image_scale=RENDER_SCALE):
+        """Initialize the AssetStore.
+
+        Args:
+            image_scale (float): Scale applied to images as they are loaded.
+        """
+        self.image_scale = image_scale
+        self.manifest = None
+        self.images = {}
+        self.sounds = {}
+        self.gif_info = {}
+        self.missing = set()
+
+    def use_manifest(self, manifest):
+        """Check later lookups against a scanned manifest.
+
+        Args:
+            manifest (AssetManifest): Manifest of the files on disk.
+        """
+        self.manifest = manifest
+
+    def report_missing(self, path):
+        """Log a missing asset the first time it is reported.
+
+        Args:
+            path (str or Path): Asset path.
+
+        Returns:
+            bool: True if this was the first report.
+        """
+        key = Path(path).as_posix()
+        if key in self.missing:
+            return False
+        self.missing.add(key)
+        logger.warning("Asset missing: %s", key)
+        return True
+
+    def exists(self, path):
+        """Check if an asset exists, reporting it once if it does not.
+
+        Args:
+            path (str or Path): Asset path.
+
+        Returns:
+            bool: True if the file is in the manifest, or on disk when no manifest is used.
+        """
+        key = Path(path).as_posix()
+        if key in self.missing:
+            return False
+        found = path in self.manifest if self.manifest is not None else Path(path).is_file()
+        if not found:
+            self.report_missing(key)
+        return found
+
+    def image(self, path):
+        """Get an image converted to the display format and scaled to the render resolution.
+
+        Args:
+            path (str or Path): Image path.
+
+        Returns:
+            pygame.Surface or None: Image, or None if missing or unreadable.
+        """
+        key = Path(path).as_posix()
+        if key in self.images:
+            return self.images[key]
+        if not self.exists(key):
+            return None
+        try:
+            self.add_image(key, presize(pygame.image.load(key), self.image_scale))
+        except (FileNotFoundError, pygame.error) as e:
+            logger.error("Error loading image %s: %s", key, e)
+            self.missing.add(key)
+            return None
+        return self.images[key]
+
+    def add_image(self, path, surface):
+        """Store a decoded image, converting it for fast blits when a display exists.
+
+        Must be called on the main thread.
+
+        Args:
+            path (str): Image path.
+            surface (pygame.Surface): Decoded image.
+        """
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+        self.images[Path(path).as_posix()] = surface
+
+    def evict(self, path):
+        """Drop a loaded image so its memory can be freed; it is loaded again on next use.
+
+        Args:
+            path (str or Path): Image path.
+        """
+        self.images.pop(Path(path).as_posix(), None)
+
+    def invalidate(self, paths):
+        """Forget changed assets, including missing reports, so they are looked up again on next use.
+
+        Args:
+            paths (iterable): Changed asset paths.
+        """
+        for path in paths:
+            key = Path(path).as_posix()
+            self.images.pop(key, None)
+            self.sounds.pop(key, None)
+            self.gif_info.pop(key, None)
+            self.missing.discard(key)
+
+    def sound(self, path):
+        """Get a sound effect, loading it on first use.
+
+        Args:
+            path (str or Path): Sound path.
+
+        Returns:
+            pygame.mixer.Sound or None: Sound, or None if missing or unreadable.
+        """
+        key = Path(path).as_posix()
+        if key in self.sounds:
+            return self.sounds[key]
+        if not self.exists(key):
+            return None
+        try:
+            self.sounds[key] = pygame.mixer.Sound(key)
+        except (FileNotFoundError, pygame.error) as e:
+            logger.error("Error loading sound %s: %s", key, e)
+            self.missing.add(key)
+            return None
+        return self.sounds[key]
+
+    def clear(self):
+        """Forget every loaded asset and missing report."""
+        self.manifest = None
+        self.images.clear()
+        self.sounds.clear()
+        self.gif_info.clear()
+        self.missing.clear()
+
+asset_store = AssetStore()
@@ -1,11 +1,62 @@
 from pathlib import Path
 import json
 import logging
+import os
+import tempfile
+import time
 from gpt import get_ai_request, create_prompt
 from constants import CONFIG_PATH, QUESTIONS
+from models.metrics import metrics
 from utils import load_json_file
 
 logger = logging.getLogger(__name__)
+CONFIG_KEYS = ("questions", "bg_img", "bg_color", "prompt", "music")
+ai_generation_seconds = metrics.histogram("kft_ai_generation_seconds", "Latency of AI answer generation.",
+                                          buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0))
+ai_generation_failures = metrics.counter("kft_ai_generation_failures_total", "Failed AI answer generations.")
+config_save_seconds = metrics.histogram("kft_config_save_seconds", "Time to write the configuration file.")
+
+def diff_config(old, new):
+    """Compare two configurations.
+
+    Args:
+        old (dict): Current configuration.
+        new (dict): Replacement configuration.
+
+    Returns:
+        dict: Changed keys mapped to True, except "questions", mapped to the
+            sorted indices of the questions that were edited, added or removed.
+    """
+    changes = {key: True for key in set(old) | set(new) if key != "questions" and old.get(key) != new.get(key)}
+    old_questions, new_questions = old.get("questions", []), new.get("questions", [])
+    touched = [i for i in range(max(len(old_questions), len(new_questions)))
+               if i >= len(old_questions) or i >= len(new_questions) or old_questions[i] != new_questions[i]]
+    if touched:
+        changes["questions"] = touched
+    return changes
+
+def drop_invalid_weights(config):
+    """Remove answer weights that cannot weight a question's answers, so a bad file cannot break a wheel.
+
+    Weights must be one non-negative number per answer with a positive sum.
+
+    Args:
+        config (dict): Configuration, changed in place.
+
+    Returns:
+        dict: The same configuration.
+    """
+    for i, question in enumerate(config.get("questions", [])):
+        if "weights" not in question:
+            continue
+        weights, answers = question["weights"], question.get("answers", [])
+        valid = (isinstance(weights, list) and len(weights) == len(answers)
+                 and all(isinstance(w, (int, float)) and not isinstance(w, bool) and w >= 0 for w in weights)
+                 and sum(weights) > 0)
+        if not valid:
+            logger.warning("Ignoring invalid weights of question %d: %s", i + 1, weights)
+            del question["weights"]
+    return config
 
 class ConfigManager:
     """Manages game configuration loading and saving.
@@ -27,15 +78,50 @@ class ConfigManager:
             FileNotFoundError: If config file is missing.
         """
         try:
-            config = load_json_file(CONFIG_PATH)
-            logger.info(f"Configuration loaded from {CONFIG_PATH}")
+            config = drop_invalid_weights(load_json_file(CONFIG_PATH))
+            logger.info("Configuration loaded from %s", CONFIG_PATH)
             return config
         except FileNotFoundError:
-            logger.warning(f"Config file {CONFIG_PATH} not found, using default")
+            logger.warning("Config file %s not found, using default", CONFIG_PATH)
             return {"questions": [], "bg_img": "None", "bg_color": [60, 30, 30], "prompt": "", "music": ""}
 
+    def apply_config(self, data):
+        """Replace the configuration in place, so views holding it see the new values.
+
+        Args:
+            data (dict): New configuration.
+
+        Returns:
+            dict: Changes from diff_config().
+
+        Raises:
+            ValueError: If data lacks a configuration key.
+        """
+        if not isinstance(data, dict) or any(key not in data for key in CONFIG_KEYS):
+            raise ValueError(f"Configuration must contain {', '.join(CONFIG_KEYS)}")
+        drop_invalid_weights(data)
+        changes = diff_config(self.config, data)
+        for key in set(self.config) - set(data):
+            del self.config[key]
+        self.config.update(data)
+        return changes
+
     def save_config(self, prompt, music, bg_img, bg_color, answer_counts):
-        """Save the configuration to file.
+        """Save the configuration to file, then apply it.
+
+        Args:
+            prompt (str): Universe prompt.
+            music (str): Music file path.
+            bg_img (str): Background image path.
+            bg_color (tuple): Background color.
+            answer_counts (list): Number of answers per question.
+        """
+        data = self.config_data(prompt, music, bg_img, bg_color, answer_counts)
+        self.write_config(data)
+        self.apply_config(data)
+
+    def config_data(self, prompt, music, bg_img, bg_color, answer_counts):
+        """Build the configuration to save, keeping the current answers and weights.
 
         Args:
             prompt (str): Universe prompt.
@@ -43,42 +129,99 @@ class ConfigManager:
             bg_img (str): Background image path.
             bg_color (tuple): Background color.
             answer_counts (list): Number of answers per question.
+
+        Returns:
+            dict: Configuration in the config.json format.
         """
-        data = {
+        return {
             "prompt": prompt,
             "music": music,
             "bg_img": bg_img,
             "bg_color": list(bg_color),
             "questions": [
-                {"text": q, "num_answers": n, "answers": self.config["questions"][i]["answers"] if i < len(self.config["questions"]) else []}
-                for i, (q, n) in enumerate(zip(QUESTIONS, answer_counts))
+                self._question(i, q, n) for i, (q, n) in enumerate(zip(QUESTIONS, answer_counts))
             ]
         }
+
+    @staticmethod
+    def write_config(data, path=None):
+        """Atomically write a configuration to file. Safe to call from a worker thread.
+
+        The file is written to a unique temporary file next to it, then
+        renamed over it, so readers never see a partial file.
+
+        Args:
+            data (dict): Configuration to write; pass a copy when this runs on a worker thread.
+            path (str): Output path, CONFIG_PATH by default.
+        """
+        path = Path(path or CONFIG_PATH)
         try:
-            with Path(CONFIG_PATH).open('w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-            self.config = data
-            logger.info(f"Configuration saved to {CONFIG_PATH}")
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+            try:
+                with config_save_seconds.time(), os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=4, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            logger.info("Configuration saved to %s", path)
         except IOError as e:
-            logger.error(f"Error saving config: {e}")
+            logger.error("Error saving config: %s", e)
             raise
 
+    def _question(self, i, text, num_answers):
+        """Build a saved question entry, keeping the current answers and weights of question i."""
+        current = self.config["questions"][i] if i < len(self.config["questions"]) else {}
+        question = {"text": text, "num_answers": num_answers, "answers": current.get("answers", [])}
+        if "weights" in current:
+            question["weights"] = current["weights"]
+        return question
+
+    def apply_answers(self, questions):
+        """Take the answers and weights of stored questions, e.g. a universe from the library.
+
+        Args:
+            questions (list): Questions in the config.json format.
+        """
+        for current, stored in zip(self.config["questions"], questions):
+            current["answers"] = list(stored["answers"])
+            if "weights" in stored:
+                current["weights"] = list(stored["weights"])
+            else:
+                current.pop("weights", None)
+        logger.info("Answers applied")
+
     def generate_ai_answers(self, universe):
         """Generate AI answers for the questions.
 
         Args:
             universe (str): Universe name for AI prompt.
 
+        Raises:
+            Exception: If AI request fails.
+        """
+        self.apply_answers(self.request_ai_answers(universe))
+
+    def request_ai_answers(self, universe):
+        """Ask the AI for answers without touching the configuration, so it can run off the main thread.
+
+        Args:
+            universe (str): Universe name for AI prompt.
+
+        Returns:
+            list: One question dict with an "answers" list per generated question, for apply_answers().
+
         Raises:
             Exception: If AI request fails.
         """
         prompt = create_prompt(universe)
+        start = time.perf_counter()
         try:
             answers = get_ai_request(prompt)
-            for i, field_name in enumerate(answers.model_dump().keys()):
-                if i < len(self.config["questions"]):
-                    self.config["questions"][i]["answers"] = answers.__getattribute__(field_name)
+            ai_generation_seconds.observe(time.perf_counter() - start)
             logger.info("AI answers generated")
+            return [{"answers": list(getattr(answers, field_name))} for field_name in answers.model_dump()]
         except Exception as e:
-            logger.error(f"Error generating AI answers: {e}")
+            ai_generation_failures.inc()
+            logger.error("Error generating AI answers: %s", e)
             raise
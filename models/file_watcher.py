@@ -0,0 +1,212 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import logging
+from pathlib import Path
+
+from constants import FILE_WATCH_INTERVAL, FILE_WATCH_SETTLE
+
+logger = logging.getLogger(__name__)
+
+IN_EVENT = struct.Struct("iIII")
+IN_WATCH_MASK = 0x8 | 0x40 | 0x80 | 0x100 | 0x200  # CLOSE_WRITE, MOVED_FROM, MOVED_TO, CREATE, DELETE
+IN_ISDIR = 0x40000000
+
+class _Inotify:
+    """Minimal inotify binding over libc, Linux only."""
+
+    def __init__(self):
+        """Initialize the _Inotify.
+
+        Raises:
+            OSError: If inotify is not available.
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify needs Linux")
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, directory):
+        """Watch a directory for files being written, moved, created or deleted.
+
+        Args:
+            directory (Path): Directory to watch.
+
+        Returns:
+            int: Watch descriptor.
+        """
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        return wd
+
+    def read(self, timeout):
+        """Wait for events.
+
+        Args:
+            timeout (float): Seconds to wait.
+
+        Returns:
+            list: (wd, mask, name) per event, empty on timeout.
+        """
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        data = os.read(self.fd, 64 * 1024)
+        events, offset = [], 0
+        while offset < len(data):
+            wd, mask, _, length = IN_EVENT.unpack_from(data, offset)
+            offset += IN_EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+class FileWatcher:
+    """Reports changes of watched files and directory trees on the main thread.
+
+    This class watches with inotify where it is available and falls back to
+    polling modification times. Bursts of events, such as an editor saving
+    through a temporary file, are merged until the tree has been quiet for a
+    short settle time. Callbacks are handed to the job scheduler, which runs
+    them on the main thread at the start of a frame.
+    """
+
+    def __init__(self):
+        """Initialize the FileWatcher."""
+        self.watches = {}
+        self.backend = None
+        self._jobs = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def watch(self, path, callback):
+        """Call back when a file, or anything under a directory, changes.
+
+        Args:
+            path (str or Path): File or directory; it does not need to exist yet.
+            callback (callable): Called on the main thread with the watched path.
+        """
+        self.watches.setdefault(Path(path), []).append(callback)
+
+    def start(self, jobs, interval=FILE_WATCH_INTERVAL):
+        """Start watching on a background thread.
+
+        Args:
+            jobs (JobScheduler): Scheduler whose pump() runs the callbacks.
+            interval (float): Seconds between polls, and the longest inotify wait before checking for stop.
+        """
+        if self._thread is not None:
+            return
+        self._jobs = jobs
+        self._stop.clear()
+        try:
+            inotify = _Inotify()
+            self.backend = "inotify"
+        except (OSError, AttributeError) as e:
+            logger.info("inotify unavailable (%s), polling for file changes", e)
+            inotify = None
+            self.backend = "polling"
+        # Watches and snapshots are taken before returning, so no later change is missed.
+        if inotify is not None:
+            targets = {}
+            for path in self.watches:
+                self._add_watches(inotify, targets, path)
+            self._thread = threading.Thread(target=self._run_inotify, args=(inotify, targets, interval),
+                                            name="FileWatcher", daemon=True)
+        else:
+            snapshots = {path: self.snapshot(path) for path in self.watches}
+            self._thread = threading.Thread(target=self._run_polling, args=(snapshots, interval),
+                                            name="FileWatcher", daemon=True)
+        self._thread.start()
+        logger.info("Watching %d paths with %s", len(self.watches), self.backend)
+
+    def stop(self):
+        """Stop the watching thread."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def snapshot(self, path):
+        """Stat a watched file or every file under a watched directory.
+
+        Args:
+            path (Path): Watched path.
+
+        Returns:
+            dict: (size, mtime_ns) by file path; empty if nothing exists.
+        """
+        if path.is_dir():
+            files = (Path(directory) / name for directory, _, names in os.walk(path) for name in names)
+        else:
+            files = [path]
+        stats = {}
+        for file in files:
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            stats[file] = (stat.st_size, stat.st_mtime_ns)
+        return stats
+
+    def _notify(self, changed):
+        """Queue the callbacks of changed watched paths for the main thread."""
+        for path in changed:
+            logger.info("Detected change in %s", path)
+            for callback in self.watches[path]:
+                self._jobs.call_soon(callback, path, name="file_changed")
+
+    def _run_polling(self, snapshots, interval):
+        """Compare snapshots of every watched path each interval."""
+        while not self._stop.wait(interval):
+            changed = []
+            for path in self.watches:
+                current = self.snapshot(path)
+                if current != snapshots[path]:
+                    snapshots[path] = current
+                    changed.append(path)
+            self._notify(changed)
+
+    def _run_inotify(self, inotify, targets, interval):
+        """Map inotify events on watched directories back to the watched paths."""
+        try:
+            while not self._stop.is_set():
+                changed = set()
+                events = inotify.read(interval)
+                while events:
+                    for wd, mask, name in events:
+                        for path in targets.get(wd, ()):
+                            if path.is_dir() or name == path.name:
+                                changed.add(path)
+                                if mask & IN_ISDIR:
+                                    self._add_watches(inotify, targets, path)
+                    events = inotify.read(FILE_WATCH_SETTLE)
+                self._notify(sorted(changed))
+        finally:
+            inotify.close()
+
+    def _add_watches(self, inotify, targets, path):
+        """Watch a file's directory, or every directory of a tree; watching a directory again is harmless.
+
+        A file is watched through its directory, so replacing it by a rename is seen too.
+        """
+        directories = [Path(d) for d, _, _ in os.walk(path)] if path.is_dir() else [path.parent]
+        for directory in directories:
+            try:
+                wd = inotify.add_watch(directory)
+            except OSError as e:
+                logger.warning("Not watching %s: %s", directory, e)
+                continue
+            if path not in targets.setdefault(wd, []):
+                targets[wd].append(path)
+
+file_watcher = FileWatcher()
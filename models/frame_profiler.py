@@ -0,0 +1,174 @@
+import csv
+import json
+import logging
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+import numpy as np
+
+from constants import FRAME_PROFILER_CAPACITY
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("events", "jobs", "update", "render", "overlay", "flip")
+
+_NULL_PHASE = nullcontext()
+
+class _Phase:
+    """Context manager that charges exclusive time to one phase of the current frame."""
+
+    __slots__ = ("profiler", "index", "start")
+
+    def __init__(self, profiler, index):
+        self.profiler = profiler
+        self.index = index
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        self.profiler._stack.append(self)
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        stack = self.profiler._stack
+        stack.pop()
+        self.profiler._current[self.index] += elapsed
+        if stack:
+            # Nested phases are exclusive: the parent does not pay for the child.
+            self.profiler._current[stack[-1].index] -= elapsed
+        return False
+
+class FrameProfiler:
+    """Records per-phase frame timings in a fixed-size ring buffer per state.
+
+    This class is disabled by default; while disabled, phase() returns a
+    shared no-op context and frame bookkeeping returns immediately.
+    """
+
+    def __init__(self, capacity=FRAME_PROFILER_CAPACITY):
+        """Initialize the FrameProfiler.
+
+        Args:
+            capacity (int): Number of frames kept per state.
+        """
+        self.capacity = capacity
+        self.enabled = False
+        self.buffers = {}
+        self.counts = {}
+        self._current = np.zeros(len(PHASES))
+        self._stack = []
+        self._phases = {name: i for i, name in enumerate(PHASES)}
+        self._frame_start = None
+
+    def enable(self):
+        """Start recording frames."""
+        self.enabled = True
+        self._frame_start = None
+
+    def disable(self):
+        """Stop recording frames, keeping what was recorded."""
+        self.enabled = False
+
+    def phase(self, name):
+        """Return a context manager that times one phase of the current frame.
+
+        Args:
+            name (str): Phase name from PHASES.
+
+        Returns:
+            Context manager charging elapsed time to the phase.
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, self._phases[name])
+
+    def end_frame(self, state):
+        """Close the current frame and store it in the state's ring buffer.
+
+        The frame time is measured between consecutive end_frame calls, so it
+        includes time spent waiting in clock.tick.
+
+        Args:
+            state (str): Application state the frame belongs to.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            buffer = self.buffers.get(state)
+            if buffer is None:
+                buffer = self.buffers[state] = np.zeros((self.capacity, len(PHASES) + 1))
+                self.counts[state] = 0
+            row = self.counts[state] % self.capacity
+            buffer[row, 0] = now - self._frame_start
+            buffer[row, 1:] = self._current
+            self.counts[state] += 1
+        self._frame_start = now
+        self._current[:] = 0
+
+    def frames(self, state):
+        """Get the recorded frames of a state, oldest first.
+
+        Args:
+            state (str): Application state.
+
+        Returns:
+            numpy.ndarray: Array of shape (n, 1 + len(PHASES)) with the frame time
+                followed by each phase time, in seconds.
+        """
+        if state not in self.buffers:
+            return np.zeros((0, len(PHASES) + 1))
+        count, buffer = self.counts[state], self.buffers[state]
+        if count <= self.capacity:
+            return buffer[:count]
+        row = count % self.capacity
+        return np.concatenate((buffer[row:], buffer[:row]))
+
+    def stats(self, state):
+        """Summarize the recorded frames of a state.
+
+        Args:
+            state (str): Application state.
+
+        Returns:
+            dict or None: fps, p50/p95/p99 frame time in ms and the mean ms per
+                phase, or None if no frames were recorded.
+        """
+        frames = self.frames(state)
+        if not len(frames):
+            return None
+        frame_ms = frames[:, 0] * 1000.0
+        p50, p95, p99 = np.percentile(frame_ms, [50, 95, 99])
+        mean = frame_ms.mean()
+        return {
+            "frames": len(frames),
+            "fps": 1000.0 / mean if mean > 0 else 0.0,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+            "phases": {name: frames[:, i + 1].mean() * 1000.0 for i, name in enumerate(PHASES)},
+        }
+
+    def dump(self, path):
+        """Write all recorded frames to CSV or JSON, chosen by the file extension.
+
+        Args:
+            path (str): Output path ending in .csv or .json.
+        """
+        path = Path(path)
+        columns = ["frame"] + list(PHASES)
+        if path.suffix.lower() == ".json":
+            data = {state: [dict(zip(columns, row)) for row in self.frames(state).tolist()]
+                    for state in self.buffers}
+            with path.open('w', encoding='utf-8') as f:
+                json.dump(data, f)
+        else:
+            with path.open('w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(["state"] + columns)
+                for state in self.buffers:
+                    for row in self.frames(state).tolist():
+                        writer.writerow([state] + row)
+        logger.info("Frame profile written to %s", path)
+
+frame_profiler = FrameProfiler()
@@ -0,0 +1,127 @@
+import os
+import re
+import logging
+from pathlib import Path
+from types import MappingProxyType
+
+from constants import GIF_DIR
+
+logger = logging.getLogger(__name__)
+
+GIF_NAME = re.compile(r"^(\d+)\.(\d+)\.gif$", re.IGNORECASE)
+
+class GifSnapshot:
+    """Read-only result of one scan of the GIF directory."""
+
+    __slots__ = ("names", "variants_by_segment", "mtime_ns")
+
+    def __init__(self, names=None, variants_by_segment=None, mtime_ns=None):
+        """Initialize the GifSnapshot.
+
+        Args:
+            names (dict): File name per GIF id "<segment>.<variant>".
+            variants_by_segment (dict): Sorted variant tuple per one-based segment.
+            mtime_ns (int): Modification time of the directory when scanned, or None if it was missing.
+        """
+        self.names = MappingProxyType(dict(names or {}))
+        self.variants_by_segment = MappingProxyType(dict(variants_by_segment or {}))
+        self.mtime_ns = mtime_ns
+
+class GifIndex:
+    """In-memory index of the GIF variants available per segment.
+
+    This class lists the GIF directory once, so choosing and loading a GIF
+    needs no filesystem access. refresh() keeps it current when the asset
+    watcher reports changes; each rescan builds a new GifSnapshot and swaps
+    it in with one assignment, so readers on other threads never see a
+    half-built or mixed index.
+    """
+
+    def __init__(self, gif_dir=GIF_DIR):
+        """Initialize the GifIndex.
+
+        Args:
+            gif_dir (str): Directory with "<segment>.<variant>.gif" files.
+        """
+        self.gif_dir = Path(gif_dir)
+        self.snapshot = GifSnapshot()
+
+    def scan(self):
+        """List the GIF directory and rebuild the index.
+
+        Returns:
+            int: Number of GIFs indexed.
+        """
+        variants, names = {}, {}
+        try:
+            mtime_ns = self.gif_dir.stat().st_mtime_ns
+            with os.scandir(self.gif_dir) as entries:
+                for entry in entries:
+                    match = GIF_NAME.match(entry.name)
+                    if match and entry.is_file():
+                        segment, variant = int(match.group(1)), int(match.group(2))
+                        variants.setdefault(segment, []).append(variant)
+                        names[f"{segment}.{variant}"] = entry.name
+        except FileNotFoundError:
+            mtime_ns = None
+            logger.warning("GIF directory %s not found, results will be shown without GIFs", self.gif_dir)
+        self.snapshot = GifSnapshot(names, {segment: tuple(sorted(found)) for segment, found in variants.items()},
+                                    mtime_ns)
+        logger.info("Indexed %d GIFs for %d segments", len(names), len(variants))
+        return len(names)
+
+    def variants(self, segment):
+        """Get the existing variants of a segment.
+
+        Args:
+            segment (int): One-based segment number.
+
+        Returns:
+            tuple: Sorted variant numbers, empty if the segment has no GIF.
+        """
+        return self.snapshot.variants_by_segment.get(segment, ())
+
+    def choose(self, segment, rng):
+        """Pick one of a segment's existing variants at random.
+
+        Args:
+            segment (int): One-based segment number.
+            rng (random.Random): Random source.
+
+        Returns:
+            str or None: GIF id "<segment>.<variant>", or None if the segment has no GIF.
+        """
+        variants = self.variants(segment)
+        return f"{segment}.{rng.choice(variants)}" if variants else None
+
+    def __contains__(self, gif_id):
+        return str(gif_id) in self.snapshot.names
+
+    def path(self, gif_id):
+        """Get the file of an indexed GIF.
+
+        Args:
+            gif_id (str): GIF id "<segment>.<variant>".
+
+        Returns:
+            Path or None: GIF path, or None if it is not indexed.
+        """
+        name = self.snapshot.names.get(str(gif_id))
+        return self.gif_dir / name if name else None
+
+    def refresh(self):
+        """Rescan if the directory changed since the last scan.
+
+        Returns:
+            bool: True if the index was rebuilt.
+        """
+        try:
+            mtime_ns = self.gif_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if mtime_ns == self.snapshot.mtime_ns:
+            return False
+        self.scan()
+        return True
+
+gif_index = GifIndex()
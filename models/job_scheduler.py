@@ -0,0 +1,319 @@
+import itertools
+import queue
+import threading
+import time
+import types
+import logging
+from collections import deque
+from enum import Enum
+
+from constants import JOB_WORKERS, JOB_COMPLETION_BUDGET_MS, JOB_PRIORITY_NORMAL
+from models.metrics import metrics
+
+logger = logging.getLogger(__name__)
+job_seconds = metrics.histogram("kft_job_seconds", "Worker time of background jobs.", ("name",))
+jobs_total = metrics.counter("kft_jobs_total", "Background jobs by outcome.", ("name", "result"))
+
+class JobState(Enum):
+    """Enumeration of background job states."""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+class Job:
+    """Handle of a job submitted to a JobScheduler.
+
+    This class is what controllers keep to follow or cancel their work. The
+    worker only stores the outcome; state changes and callbacks happen on
+    the main thread, so a job reads as DONE only once its on_done callback
+    has finished.
+    """
+
+    def __init__(self, name, fn, args, priority, on_done, on_error, with_job):
+        """Initialize the Job.
+
+        Args:
+            name (str): Job name used in logs and metrics.
+            fn (callable): Work run on a worker thread.
+            args (tuple): Positional arguments for fn.
+            priority (int): Higher priorities are started first.
+            on_done (callable): Called on the main thread with the result.
+            on_error (callable): Called on the main thread with the exception.
+            with_job (bool): Pass the job to fn as the job keyword, for progress and cancellation checks.
+        """
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.priority = priority
+        self.on_done = on_done
+        self.on_error = on_error
+        self.with_job = with_job
+        self.state = JobState.PENDING
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self._ran = threading.Event()
+
+    def report(self, progress):
+        """Report progress from inside fn.
+
+        Args:
+            progress (float): Fraction done, from 0.0 to 1.0.
+        """
+        self.progress = min(max(progress, 0.0), 1.0)
+
+    def cancel(self):
+        """Cancel the job from the main thread.
+
+        A pending job never runs. A running job finishes its fn, which can
+        stop early by checking cancelled, but its callbacks are skipped.
+
+        Returns:
+            bool: True if the job had not finished yet.
+        """
+        if self.done:
+            return False
+        self.cancelled = True
+        self.state = JobState.CANCELLED
+        return True
+
+    @property
+    def done(self):
+        """bool: True once the job finished, failed or was cancelled and its callbacks ran."""
+        return self.state in (JobState.DONE, JobState.FAILED, JobState.CANCELLED)
+
+class JobScheduler:
+    """Runs slow work on a worker pool and applies results on the main thread.
+
+    This class keeps threads out of the controllers: they submit a function
+    with completion callbacks and keep the returned Job. Workers take jobs
+    by priority, then submission order. pump(), called once per frame,
+    runs completion callbacks until the frame's budget is spent; at least
+    one runs per frame so results always make progress. A callback that
+    returns a generator is resumed across frames, one step at a time, for
+    main-thread work that is too long for one budget (e.g. converting many
+    surfaces). With workers=0 jobs and callbacks run inline on submit,
+    which suits tests and batch runs.
+    """
+
+    def __init__(self, workers=JOB_WORKERS, budget_ms=JOB_COMPLETION_BUDGET_MS):
+        """Initialize the JobScheduler.
+
+        Args:
+            workers (int): Worker threads, started on the first submit; 0 runs jobs inline.
+            budget_ms (float): Main-thread time pump() spends on callbacks per frame.
+        """
+        self.workers = workers
+        self.budget_ms = budget_ms
+        self.active = []
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads = []
+        self._completed = deque()
+        self._continuations = deque()
+
+    def submit(self, fn, *args, name=None, priority=JOB_PRIORITY_NORMAL, on_done=None, on_error=None,
+               with_job=False):
+        """Queue fn(*args) for a worker thread. Must be called on the main thread.
+
+        Args:
+            fn (callable): Work to run; it must not touch the display.
+            *args: Positional arguments for fn.
+            name (str): Job name, fn's name by default.
+            priority (int): Higher priorities are started first.
+            on_done (callable): Called on the main thread with fn's result; may return a generator.
+            on_error (callable): Called on the main thread with fn's exception; errors are logged if None.
+            with_job (bool): Pass the Job to fn as the job keyword.
+
+        Returns:
+            Job: Handle to follow or cancel the job.
+        """
+        job = Job(name or fn.__name__, fn, args, priority, on_done, on_error, with_job)
+        self.active.append(job)
+        if self.workers == 0:
+            self._run(job)
+            self._drain()
+            return job
+        if not self._threads:
+            self._threads = [threading.Thread(target=self._worker, name=f"Job-{i}", daemon=True)
+                             for i in range(self.workers)]
+            for thread in self._threads:
+                thread.start()
+        self._queue.put((-priority, next(self._sequence), job))
+        return job
+
+    def call_soon(self, fn, *args, name=None):
+        """Run fn(*args) on the main thread at the next pump. Unlike submit(), safe to call from any thread.
+
+        Args:
+            fn (callable): Main-thread work, e.g. applying what a watcher thread noticed.
+            *args: Positional arguments for fn.
+            name (str): Job name, fn's name by default.
+
+        Returns:
+            Job: Handle of the call.
+        """
+        job = Job(name or fn.__name__, fn, args, JOB_PRIORITY_NORMAL, lambda _: fn(*args), None, False)
+        job._ran.set()
+        self._completed.append(job)
+        return job
+
+    def pending(self, name=None):
+        """List the jobs that are not done yet.
+
+        Args:
+            name (str): Only list jobs with this name, or None for all.
+
+        Returns:
+            list: Unfinished jobs in submission order.
+        """
+        return [job for job in self.active if name is None or job.name == name]
+
+    def pump(self, budget_ms=None):
+        """Run completion callbacks until the budget is spent. Must be called on the main thread.
+
+        Args:
+            budget_ms (float): Time budget, the scheduler's budget_ms by default.
+
+        Returns:
+            int: Callbacks or callback steps run.
+        """
+        deadline = time.perf_counter() + (self.budget_ms if budget_ms is None else budget_ms) / 1000.0
+        steps = 0
+        while self._step():
+            steps += 1
+            if time.perf_counter() >= deadline:
+                break
+        return steps
+
+    def wait(self, jobs=None, timeout=None):
+        """Block until jobs finished, then run all their callbacks. Must be called on the main thread.
+
+        Args:
+            jobs (list): Jobs to wait for, or None for every active job.
+            timeout (float): Maximum time to wait in seconds, or None to wait forever.
+
+        Returns:
+            bool: True if every job finished in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for job in list(self.active if jobs is None else jobs):
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            if not job.cancelled and not job._ran.wait(remaining):
+                self._drain()
+                return False
+        self._drain()
+        return True
+
+    def shutdown(self):
+        """Finish queued jobs and their callbacks, then stop the workers. Must be called on the main thread."""
+        for _ in self._threads:
+            self._queue.put((float("inf"), next(self._sequence), None))
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._drain()
+
+    def _worker(self):
+        """Run queued jobs until a None sentinel arrives."""
+        while True:
+            _, _, job = self._queue.get()
+            if job is None:
+                return
+            if job.cancelled:
+                self._completed.append(job)
+                job._ran.set()
+                continue
+            self._run(job)
+
+    def _run(self, job):
+        """Run a job's fn and queue it for completion on the main thread; a cancelled job is only queued."""
+        if job.cancelled:
+            self._completed.append(job)
+            job._ran.set()
+            return
+        job.state = JobState.RUNNING
+        start = time.perf_counter()
+        try:
+            job.result = job.fn(*job.args, job=job) if job.with_job else job.fn(*job.args)
+        except Exception as e:
+            job.error = e
+        job_seconds.observe(time.perf_counter() - start, name=job.name)
+        self._completed.append(job)
+        job._ran.set()
+
+    def _drain(self):
+        """Run every pending callback and callback step."""
+        while self._step():
+            pass
+
+    def _step(self):
+        """Run one callback or one step of a resumed callback.
+
+        Returns:
+            bool: False if there was nothing to run.
+        """
+        if self._continuations:
+            job, steps = self._continuations[0]
+            if job.cancelled:
+                self._continuations.popleft()
+                steps.close()
+                self._finish(job, JobState.CANCELLED)
+                return True
+            try:
+                next(steps)
+                return True
+            except StopIteration:
+                self._continuations.popleft()
+                self._finish(job, JobState.DONE)
+            except Exception as e:
+                self._continuations.popleft()
+                logger.error("Completion of job %s failed: %s", job.name, e)
+                self._finish(job, JobState.FAILED)
+            return True
+        try:
+            job = self._completed.popleft()
+        except IndexError:
+            return False
+        self._complete(job)
+        return True
+
+    def _complete(self, job):
+        """Apply a finished job's outcome through its callbacks."""
+        if job.cancelled:
+            self._finish(job, JobState.CANCELLED)
+            return
+        if job.error is not None:
+            if job.on_error is None:
+                logger.error("Job %s failed: %s", job.name, job.error)
+            else:
+                try:
+                    job.on_error(job.error)
+                except Exception as e:
+                    logger.error("Error handler of job %s failed: %s", job.name, e)
+            self._finish(job, JobState.FAILED)
+            return
+        job.progress = 1.0
+        try:
+            steps = job.on_done(job.result) if job.on_done is not None else None
+        except Exception as e:
+            logger.error("Completion of job %s failed: %s", job.name, e)
+            self._finish(job, JobState.FAILED)
+            return
+        if isinstance(steps, types.GeneratorType):
+            self._continuations.append((job, steps))
+        else:
+            self._finish(job, JobState.DONE)
+
+    def _finish(self, job, state):
+        """Record a job's final state and forget it.
+
+        A job cancelled while it ran ends CANCELLED, even if its worker marked it RUNNING after the cancel.
+        """
+        job.state = JobState.CANCELLED if job.cancelled else state
+        jobs_total.inc(name=job.name, result=job.state.value)
+        if job in self.active:
+            self.active.remove(job)
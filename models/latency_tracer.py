@@ -0,0 +1,91 @@
+import time
+import logging
+from collections import deque
+
+import numpy as np
+import pygame
+
+from constants import LATENCY_HISTORY, LATENCY_BUCKETS
+from models.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+class LatencyTracer:
+    """Measures input-to-display latency per event type.
+
+    This class stamps events when they are dequeued. Code that turns an event
+    into a visible change reports it with input_applied(), and the next flip
+    closes every pending input, since that is the first frame showing it.
+    """
+
+    def __init__(self, history=LATENCY_HISTORY):
+        """Initialize the LatencyTracer.
+
+        Args:
+            history (int): Number of latencies kept per event type.
+        """
+        self.history = history
+        self.samples = {}
+        self.pending = []
+        self._histogram = metrics.histogram("kft_input_latency_seconds", "Input dequeue to display flip latency.",
+                                            ("event", "action"), buckets=LATENCY_BUCKETS)
+
+    def stamp(self, event, now=None):
+        """Record the dequeue time on an event.
+
+        Args:
+            event: Pygame event object.
+            now (float): perf_counter timestamp, defaults to the current time.
+        """
+        event.dequeued_at = time.perf_counter() if now is None else now
+
+    def input_applied(self, event, action):
+        """Mark an event as producing a visible change in the frame being built.
+
+        Args:
+            event: Pygame event stamped by stamp(); unstamped events are ignored.
+            action (str): What the input did, e.g. "spin" or "switch".
+        """
+        dequeued_at = getattr(event, "dequeued_at", None)
+        if dequeued_at is not None:
+            self.pending.append((pygame.event.event_name(event.type), action, dequeued_at))
+
+    def on_flip(self, now=None):
+        """Close the pending inputs after the display flip.
+
+        Args:
+            now (float): perf_counter timestamp of the flip, defaults to the current time.
+        """
+        if not self.pending:
+            return
+        now = time.perf_counter() if now is None else now
+        for event_name, action, dequeued_at in self.pending:
+            latency = now - dequeued_at
+            samples = self.samples.get(event_name)
+            if samples is None:
+                samples = self.samples[event_name] = deque(maxlen=self.history)
+            samples.append(latency)
+            self._histogram.observe(latency, event=event_name, action=action)
+        self.pending.clear()
+
+    def stats(self):
+        """Summarize the recorded latencies.
+
+        Returns:
+            dict: {event type: {"count", "p50", "p95", "p99", "max"}} in milliseconds.
+        """
+        report = {}
+        for event_name, samples in self.samples.items():
+            latency_ms = np.asarray(samples) * 1000.0
+            p50, p95, p99 = np.percentile(latency_ms, [50, 95, 99])
+            report[event_name] = {"count": len(latency_ms), "p50": p50, "p95": p95, "p99": p99,
+                                  "max": latency_ms.max()}
+        return report
+
+    def log_summary(self):
+        """Log the latency percentiles of every event type."""
+        for event_name, stats in self.stats().items():
+            logger.info("Input latency %s: p50 %.1f ms, p95 %.1f ms, p99 %.1f ms (%d inputs)",
+                        event_name, stats["p50"], stats["p95"], stats["p99"], stats["count"])
+
+latency_tracer = LatencyTracer()
@@ -1,8 +1,109 @@
+import atexit
 import logging
+import queue
+import sys
+import threading
+import time
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+
+from constants import LOG_LEVEL, LOG_FORMAT, HOT_PATH_LOG_LEVEL, HOT_PATH_LOG_INTERVAL, HOT_PATH_LOG_SAMPLE
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
+_listener = None
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread."""
+
+    def prepare(self, record):
+        """Return the record unchanged so %-style arguments are merged off the caller's thread."""
+        return record
+
+def setup_logging(level=LOG_LEVEL, fmt=LOG_FORMAT, stream=None):
+    """Route all logging through a queue drained by a background listener.
+
+    Callers only enqueue records; formatting and stream writes happen on the
+    listener thread. Calling it again replaces the running listener, after
+    flushing it. The listener is stopped and flushed at interpreter exit.
+
+    Args:
+        level (int): Root logger level.
+        fmt (str): Log record format.
+        stream: Output stream, defaults to sys.stderr.
+
+    Returns:
+        QueueListener: The running listener.
+    """
+    global _listener
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(stream or sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(fmt))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    root.setLevel(level)
+    stop_logging()
+    _listener = listener
+    listener.start()
+    return listener
+
+def stop_logging():
+    """Flush and stop the listener started by setup_logging(), if one is running."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+atexit.register(stop_logging)
+
+class HotPathLogger:
+    """Rate-limited, sampled logging for per-frame and per-event call sites.
+
+    Each message template is limited independently to one record per
+    interval; suppressed calls are counted and reported with the next record.
+    """
+
+    def __init__(self, logger, level=HOT_PATH_LOG_LEVEL, interval=HOT_PATH_LOG_INTERVAL, sample=HOT_PATH_LOG_SAMPLE):
+        """Initialize the HotPathLogger.
+
+        Args:
+            logger (logging.Logger): Logger to emit records to.
+            level (int): Level the hot-path messages are logged at.
+            interval (float): Minimum seconds between records of the same template, 0 to disable.
+            sample (int): Only every n-th call of a template is considered for logging.
+        """
+        self.logger = logger
+        self.level = level
+        self.interval = interval
+        self.sample = max(1, sample)
+        self._state = {}
+        self._lock = threading.Lock()
+
+    def log(self, msg, *args):
+        """Log a message if the level is enabled and the template is not throttled.
+
+        Args:
+            msg (str): %-style message template.
+            *args: Arguments merged into the template by the log handler.
+        """
+        if not self.logger.isEnabledFor(self.level):
+            return
+        now = time.monotonic()
+        with self._lock:
+            calls, last, suppressed = self._state.get(msg, (0, float('-inf'), 0))
+            calls += 1
+            if calls % self.sample or now - last < self.interval:
+                self._state[msg] = (calls, last, suppressed + 1)
+                return
+            self._state[msg] = (calls, now, 0)
+        if suppressed:
+            self.logger.log(self.level, msg + " (%d similar suppressed)", *args, suppressed)
+        else:
+            self.logger.log(self.level, msg, *args)
+
+hot_logger = HotPathLogger(logger)
 
 class GameState(Enum):
     """Enumeration of possible game states."""
@@ -24,13 +125,17 @@ class GameStateTracker:
         Args:
             total_draws (int): Total number of draws in the game.
         """
+        self.total_draws = total_draws
+        self.reset()
+        hot_logger.log("GameStateModel initialized with %d draws", total_draws)
+
+    def reset(self):
+        """Reset the tracker to the start of a new game."""
         self.state = GameState.WAITING
         self.current_draw = -1
-        self.total_draws = total_draws
         self.results = []
         self.result_responses = []
         self.wait_timer = 0
-        logger.info(f"GameStateModel initialized with {total_draws} draws")
 
     def set_state(self, new_state):
         """Set the game state.
@@ -38,7 +143,7 @@ class GameStateTracker:
         Args:
             new_state (GameState): New state to transition to.
         """
-        logger.info(f"State changed from {self.state} to {new_state}")
+        hot_logger.log("State changed from %s to %s", self.state, new_state)
         self.state = new_state
 
     def increment_draw(self):
@@ -46,7 +151,7 @@ class GameStateTracker:
         self.current_draw += 1
         if self.current_draw >= self.total_draws:
             self.set_state(GameState.RESULTS)
-        logger.info(f"Current draw incremented to {self.current_draw}/{self.total_draws}")
+        hot_logger.log("Current draw incremented to %d/%d", self.current_draw, self.total_draws)
 
     def add_result(self, result, response):
         """Add a result and response.
@@ -57,7 +162,7 @@ class GameStateTracker:
         """
         self.results.append(result)
         self.result_responses.append(response)
-        logger.info(f"Added result: {result}, response: {response}")
+        hot_logger.log("Added result: %s, response: %s", result, response)
 
     def reset_wait_timer(self, duration):
         """Reset the wait timer.
@@ -66,7 +171,7 @@ class GameStateTracker:
             duration (float): Duration in seconds.
         """
         self.wait_timer = duration
-        logger.info(f"Wait timer set to {duration} seconds")
+        hot_logger.log("Wait timer set to %s seconds", duration)
 
     def update_timer(self, dt):
         """Update the wait timer.
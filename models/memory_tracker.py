@@ -0,0 +1,202 @@
+import time
+import tracemalloc
+import logging
+from collections import deque
+
+import pygame
+
+from constants import MEMORY_TOP_ALLOCATORS, MEMORY_TRANSITION_HISTORY, MEMORY_WALK_DEPTH
+from models.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_CONTAINERS = (dict, list, tuple, set, frozenset, deque)
+
+def surface_bytes(surface):
+    """Get the pixel memory held by a Surface.
+
+    Args:
+        surface (pygame.Surface): Surface to measure.
+
+    Returns:
+        int: Bytes of pixel data, including row padding.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+class MemoryTracker:
+    """Accounts for the pixel memory held by Surfaces, grouped by owner and state.
+
+    This class walks the attributes of registered owners (views, loaders,
+    caches) to find the Surfaces and fonts they hold. Each Surface is counted
+    once, for the first owner that reaches it; the display surface is reported
+    as its own owner. At state transitions it records the usage of the state
+    being left and, while tracemalloc is tracing, the top allocation diffs
+    since the previous transition.
+    """
+
+    def __init__(self, top=MEMORY_TOP_ALLOCATORS, history=MEMORY_TRANSITION_HISTORY, depth=MEMORY_WALK_DEPTH):
+        """Initialize the MemoryTracker.
+
+        Args:
+            top (int): Number of allocation diffs kept per transition.
+            history (int): Number of transitions kept.
+            depth (int): Maximum attribute depth walked below an owner.
+        """
+        self.top = top
+        self.depth = depth
+        self.owners = {}
+        self.states = {}
+        self.transitions = deque(maxlen=history)
+        self._snapshot = None
+        self._gauge = metrics.gauge("kft_surface_bytes", "Pixel bytes held by Surfaces per owner.", ("owner",))
+
+    def register(self, name, owner, kind="view"):
+        """Register an object whose Surfaces are accounted to a name.
+
+        Args:
+            name (str): Owner name, e.g. "game_view".
+            owner: Object to walk, or a callable returning it for owners that get replaced.
+            kind (str): Owner group, e.g. "view", "loader" or "cache".
+        """
+        self.owners[name] = (kind, owner)
+
+    def unregister(self, name):
+        """Stop accounting for an owner.
+
+        Args:
+            name (str): Owner name.
+        """
+        self.owners.pop(name, None)
+
+    def measure(self):
+        """Measure the Surfaces and fonts held by each owner.
+
+        Returns:
+            dict: {owner: {"kind", "bytes", "surfaces", "fonts"}}.
+        """
+        roots = {name: owner() if callable(owner) else owner for name, (_, owner) in self.owners.items()}
+        seen = {id(root) for root in roots.values() if root is not None}
+        usage = {}
+        display = pygame.display.get_surface() if pygame.display.get_init() else None
+        if display is not None:
+            seen.add(id(display))
+            usage["display"] = {"kind": "display", "bytes": surface_bytes(display), "surfaces": 1, "fonts": 0}
+        for name, root in roots.items():
+            entry = usage[name] = {"kind": self.owners[name][0], "bytes": 0, "surfaces": 0, "fonts": 0}
+            if root is not None:
+                self._walk(root, entry, seen, 0)
+        return usage
+
+    def _walk(self, obj, entry, seen, depth):
+        """Add the Surfaces and fonts reachable from obj to entry."""
+        if isinstance(obj, pygame.Surface):
+            entry["bytes"] += surface_bytes(obj)
+            entry["surfaces"] += 1
+            return
+        if isinstance(obj, pygame.font.Font):
+            entry["fonts"] += 1
+            return
+        if depth >= self.depth:
+            return
+        if isinstance(obj, dict):
+            children = obj.values()
+        elif isinstance(obj, _CONTAINERS):
+            children = obj
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type) and not callable(obj):
+            children = vars(obj).values()
+        else:
+            return
+        for child in children:
+            if id(child) in seen or isinstance(child, (str, bytes, int, float, bool)) or child is None:
+                continue
+            seen.add(id(child))
+            self._walk(child, entry, seen, depth + 1)
+
+    @staticmethod
+    def by_kind(usage):
+        """Sum a measurement by owner group.
+
+        Args:
+            usage (dict): Result of measure().
+
+        Returns:
+            dict: {kind: bytes}.
+        """
+        totals = {}
+        for entry in usage.values():
+            totals[entry["kind"]] = totals.get(entry["kind"], 0) + entry["bytes"]
+        return totals
+
+    def sample(self, state):
+        """Measure now and keep the per-owner peak for a state.
+
+        Args:
+            state (str): Application state the measurement belongs to.
+
+        Returns:
+            dict: Result of measure().
+        """
+        usage = self.measure()
+        peaks = self.states.setdefault(state, {})
+        for name, entry in usage.items():
+            peaks[name] = max(peaks.get(name, 0), entry["bytes"])
+            self._gauge.set(entry["bytes"], owner=name)
+        return usage
+
+    def peak(self, state):
+        """Get the highest total Surface bytes sampled in a state.
+
+        Args:
+            state (str): Application state.
+
+        Returns:
+            int: Sum of the per-owner peaks, 0 if the state was never sampled.
+        """
+        return sum(self.states.get(state, {}).values())
+
+    @property
+    def tracing(self):
+        """bool: True if tracemalloc snapshots are taken at transitions."""
+        return tracemalloc.is_tracing()
+
+    def start_tracing(self, frames=1):
+        """Start tracemalloc so transitions record allocation diffs.
+
+        Args:
+            frames (int): Number of stack frames stored per allocation.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+        self._snapshot = tracemalloc.take_snapshot()
+        logger.info("Memory tracing started (%d frames)", frames)
+
+    def on_transition(self, old_state, new_state):
+        """Record the usage of the state being left and the allocation diff.
+
+        Args:
+            old_state (str): State being left.
+            new_state (str): State being entered.
+
+        Returns:
+            dict: Transition record with states, time, per-owner usage and, while
+                tracing, traced bytes and the top allocation diffs.
+        """
+        usage = self.sample(old_state)
+        record = {"from": old_state, "to": new_state, "time": time.time(), "usage": usage}
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+            ))
+            record["traced_bytes"] = tracemalloc.get_traced_memory()[0]
+            if self._snapshot is not None:
+                stats = snapshot.compare_to(self._snapshot, "lineno")[:self.top]
+                record["top_diffs"] = [
+                    {"where": str(stat.traceback), "bytes": stat.size_diff, "count": stat.count_diff} for stat in stats
+                ]
+            self._snapshot = snapshot
+        self.transitions.append(record)
+        logger.debug("Surfaces in %s: %d bytes before switching to %s",
+                     old_state, sum(entry["bytes"] for entry in usage.values()), new_state)
+        return record
+
+memory_tracker = MemoryTracker()
@@ -0,0 +1,296 @@
+import bisect
+import math
+import os
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from constants import METRICS_DEFAULT_BUCKETS, METRICS_HOST
+
+logger = logging.getLogger(__name__)
+
+def _label_key(labelnames, labels):
+    """Order label values by the metric's label names."""
+    if set(labels) != set(labelnames):
+        raise ValueError(f"Expected labels {labelnames}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in labelnames)
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+def _format_value(value):
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        """Initialize the Counter.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            labelnames (tuple): Names of the labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        """Increase the counter.
+
+        Args:
+            amount (float): Non-negative increment.
+            **labels: Label values.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels):
+        """Get the current value for a label set."""
+        return self.values.get(_label_key(self.labelnames, labels), 0)
+
+    def samples(self):
+        """List (name, label values, extra labels, value) tuples for export."""
+        with self._lock:
+            return [(self.name, key, (), value) for key, value in self.values.items()]
+
+class Gauge(Counter):
+    """Value per label set that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        """Set the gauge.
+
+        Args:
+            value (float): New value.
+            **labels: Label values.
+        """
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self.values[key] = value
+
+    def inc(self, amount=1, **labels):
+        """Add to the gauge; the amount may be negative."""
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+class Histogram:
+    """Cumulative bucketed distribution per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=METRICS_DEFAULT_BUCKETS):
+        """Initialize the Histogram.
+
+        Args:
+            name (str): Metric name.
+            documentation (str): Help text.
+            labelnames (tuple): Names of the labels.
+            buckets (tuple): Sorted upper bounds; +Inf is added automatically.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        """Record one observation.
+
+        Args:
+            value (float): Observed value.
+            **labels: Label values.
+        """
+        key = _label_key(self.labelnames, labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self.values.get(key)
+            if state is None:
+                state = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Context manager observing the elapsed seconds of its block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels):
+        """Get the number of observations for a label set."""
+        state = self.values.get(_label_key(self.labelnames, labels))
+        return state[2] if state else 0
+
+    def samples(self):
+        """List bucket, sum and count samples for export."""
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in self.values.items():
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += bucket_count
+                    samples.append((f"{self.name}_bucket", key, (("le", _format_value(bound)),), cumulative))
+                samples.append((f"{self.name}_sum", key, (), total))
+                samples.append((f"{self.name}_count", key, (), count))
+        return samples
+
+class MetricsRegistry:
+    """Named collection of metrics with Prometheus text export.
+
+    This class creates metrics on first use and returns the existing one on
+    later calls with the same name.
+    """
+
+    def __init__(self):
+        """Initialize the MetricsRegistry."""
+        self.metrics = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._exporter = None
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self.metrics.get(name)
+            if metric is None:
+                metric = self.metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Get or create a Counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        """Get or create a Gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=METRICS_DEFAULT_BUCKETS):
+        """Get or create a Histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def record_cache(self, cache, hit):
+        """Count a cache lookup for hit-rate reporting.
+
+        Args:
+            cache (str): Cache name.
+            hit (bool): True for a hit, False for a miss.
+        """
+        self.counter("kft_cache_requests_total", "Cache lookups by cache and result.",
+                     ("cache", "result")).inc(cache=cache, result="hit" if hit else "miss")
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text.
+        """
+        lines = []
+        with self._lock:
+            metrics = list(self.metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, key, extra, value in metric.samples():
+                lines.append(f"{name}{_format_labels(metric.labelnames, key, extra)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Atomically write the exposition text to a file, e.g. for a textfile collector.
+
+        Args:
+            path (str): Output path.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(self.render(), encoding='utf-8')
+        os.replace(tmp_path, path)
+
+    def start_textfile_exporter(self, path, interval):
+        """Rewrite the text file periodically on a daemon thread.
+
+        Args:
+            path (str): Output path.
+            interval (float): Seconds between writes.
+        """
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    self.write_textfile(path)
+                except OSError as e:
+                    logger.error("Error writing metrics to %s: %s", path, e)
+
+        self._exporter = stop
+        threading.Thread(target=run, name="MetricsExporter", daemon=True).start()
+        logger.info("Writing metrics to %s every %ss", path, interval)
+
+    def start_http_server(self, port, host=METRICS_HOST):
+        """Serve the exposition text on http://host:port/metrics from a daemon thread.
+
+        Args:
+            port (int): TCP port, 0 for any free port.
+            host (str): Bind address, localhost by default.
+
+        Returns:
+            int: Port the server listens on.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="MetricsHTTP", daemon=True).start()
+        port = self._server.server_address[1]
+        logger.info("Serving metrics on http://%s:%d/metrics", host, port)
+        return port
+
+    def stop(self):
+        """Stop the HTTP server and the text file exporter."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._exporter is not None:
+            self._exporter.set()
+            self._exporter = None
+
+metrics = MetricsRegistry()
@@ -0,0 +1,165 @@
+import os
+import logging
+
+from constants import RESOURCE_BUDGET_BYTES, RESOURCE_BUDGET_ENV
+from models.metrics import metrics
+
+logger = logging.getLogger(__name__)
+resource_releases = metrics.counter("kft_resource_releases_total", "Resources released to stay within the budget.",
+                                    ("state", "name"))
+
+class Resource:
+    """A releasable resource owned by one state."""
+
+    __slots__ = ("state", "name", "size", "release", "load", "priority")
+
+    def __init__(self, state, name, size, release, load=None, priority=0):
+        """Initialize the Resource.
+
+        Args:
+            state (str): State the resource belongs to.
+            name (str): Resource name, unique within the state.
+            size (callable): Returns the bytes the resource currently holds, 0 when released.
+            release (callable): Frees the resource; it must be rebuilt on demand afterwards.
+            load (callable): Builds the resource ahead of use, or None if it is only built on demand.
+            priority (int): Higher priorities are released later.
+        """
+        self.state = state
+        self.name = name
+        self.size = size
+        self.release = release
+        self.load = load
+        self.priority = priority
+
+class ResourceManager:
+    """Keeps the resources of inactive states within a memory budget.
+
+    This class does not hold resources itself: owners register callbacks that
+    report a resource's size, free it and optionally build it ahead of time.
+    Whenever the active state changes, resources of the other states are
+    released, lowest priority and then largest first, until the total is
+    within the budget. The active state's resources are never released.
+    preload() calls the load hooks of a state when a transition to it is
+    predicted. Hooks run on the caller's thread, the main thread, so they may
+    use pygame; slow work such as building wheels is left to the background
+    jobs a hook starts.
+    """
+
+    def __init__(self, budget_bytes=RESOURCE_BUDGET_BYTES):
+        """Initialize the ResourceManager.
+
+        Args:
+            budget_bytes (int): Total bytes resources may hold before inactive ones are released.
+        """
+        self.budget_bytes = budget_bytes
+        self.resources = {}
+        self.active = None
+        self._gauge = metrics.gauge("kft_resource_bytes", "Bytes held by registered resources per state.", ("state",))
+
+    @classmethod
+    def from_env(cls):
+        """Create a ResourceManager with the budget from KFT_RESOURCE_BUDGET_MB, if set.
+
+        Returns:
+            ResourceManager: Configured manager.
+        """
+        budget = os.environ.get(RESOURCE_BUDGET_ENV)
+        return cls(int(float(budget) * 1024 * 1024)) if budget else cls()
+
+    def register(self, state, name, size, release, load=None, priority=0):
+        """Register a resource, replacing any earlier one with the same state and name.
+
+        Args:
+            state (str): State the resource belongs to.
+            name (str): Resource name.
+            size (callable): Returns the bytes currently held.
+            release (callable): Frees the resource.
+            load (callable): Builds the resource ahead of use, or None.
+            priority (int): Higher priorities are released later.
+
+        Returns:
+            Resource: Registered resource.
+        """
+        resource = Resource(state, name, size, release, load, priority)
+        self.resources[(state, name)] = resource
+        return resource
+
+    def usage(self):
+        """Measure every resource.
+
+        Returns:
+            dict: Bytes per resource name, grouped by state.
+        """
+        usage = {}
+        for resource in self.resources.values():
+            usage.setdefault(resource.state, {})[resource.name] = resource.size()
+        return usage
+
+    def total(self):
+        """int: Bytes held by all registered resources."""
+        return sum(resource.size() for resource in self.resources.values())
+
+    def activate(self, state):
+        """Make a state active and enforce the budget.
+
+        Args:
+            state (str or None): New active state, or None while the app is suspended.
+        """
+        self.active = state
+        self.enforce()
+
+    def enforce(self):
+        """Release inactive resources until the total is within the budget.
+
+        Returns:
+            list: (state, name) of the released resources.
+        """
+        sizes = {key: resource.size() for key, resource in self.resources.items()}
+        total = sum(sizes.values())
+        released = []
+        if total > self.budget_bytes:
+            candidates = sorted((key for key, resource in self.resources.items()
+                                 if resource.state != self.active and sizes[key] > 0),
+                                key=lambda key: (self.resources[key].priority, -sizes[key]))
+            for key in candidates:
+                if total <= self.budget_bytes:
+                    break
+                self.release(*key)
+                total -= sizes[key]
+                released.append(key)
+            logger.info("Resources over budget, released %s; %d of %d bytes held",
+                        ", ".join(f"{state}/{name}" for state, name in released) or "nothing",
+                        total, self.budget_bytes)
+        for state, names in self.usage().items():
+            self._gauge.set(sum(names.values()), state=state)
+        return released
+
+    def release(self, state, name):
+        """Release one resource.
+
+        Args:
+            state (str): State of the resource.
+            name (str): Resource name.
+        """
+        self.resources[(state, name)].release()
+        resource_releases.inc(state=state, name=name)
+        logger.debug("Released resource %s/%s", state, name)
+
+    def preload(self, state):
+        """Call the load hooks of a state's resources. Must be called on the main thread.
+
+        Args:
+            state (str): State whose resources are built.
+
+        Returns:
+            int: Number of load hooks called.
+        """
+        loads = [resource for resource in self.resources.values() if resource.state == state and resource.load]
+        for resource in loads:
+            try:
+                resource.load()
+            except Exception as e:
+                logger.error("Error preloading %s/%s: %s", resource.state, resource.name, e)
+        if loads:
+            logger.info("Preloaded %d resources for %s", len(loads), state)
+        return len(loads)
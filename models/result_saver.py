@@ -0,0 +1,160 @@
+import os
+import re
+import tempfile
+import time
+import logging
+from enum import Enum
+from pathlib import Path
+
+import pygame
+from PIL import Image
+
+from constants import (
+    RESULT_IMAGE_PATH, RESULT_IMAGE_NAMING, RESULT_IMAGE_FORMAT, RESULT_IMAGE_COMPRESSION,
+    RESULT_IMAGE_QUALITY, JOB_PRIORITY_LOW
+)
+from models.job_scheduler import JobScheduler
+
+logger = logging.getLogger(__name__)
+
+class SaveStatus(Enum):
+    """Enumeration of result image saving states."""
+    IDLE = "idle"
+    SAVING = "saving"
+    SAVED = "saved"
+    FAILED = "failed"
+
+class ResultSaver:
+    """Saves result images as background jobs.
+
+    This class copies the surface pixels on the caller's thread, then encodes
+    and writes the file on a job scheduler worker with an atomic rename. The
+    status is updated by the job callbacks on the main thread.
+    """
+
+    FORMATS = {"png": "PNG", "jpg": "JPEG", "jpeg": "JPEG", "bmp": "BMP", "webp": "WEBP"}
+
+    def __init__(self, base_path=RESULT_IMAGE_PATH, naming=RESULT_IMAGE_NAMING, fmt=RESULT_IMAGE_FORMAT,
+                 compression=RESULT_IMAGE_COMPRESSION, quality=RESULT_IMAGE_QUALITY, jobs=None):
+        """Initialize the ResultSaver.
+
+        Args:
+            base_path (str): Path of the image; its stem and directory are used for generated names.
+            naming (str): "overwrite", "timestamp" or "sequence".
+            fmt (str): Image format extension, e.g. "png" or "jpg".
+            compression (int): PNG compression level from 0 to 9.
+            quality (int): JPEG/WebP quality from 1 to 95.
+            jobs (JobScheduler): Scheduler running the writes, or None to write inline.
+        """
+        if fmt.lower() not in self.FORMATS:
+            raise ValueError(f"Unsupported image format: {fmt}")
+        if naming not in ("overwrite", "timestamp", "sequence"):
+            raise ValueError(f"Unsupported naming mode: {naming}")
+        self.base_path = Path(base_path)
+        self.naming = naming
+        self.fmt = fmt.lower()
+        self.compression = compression
+        self.quality = quality
+        self.status = SaveStatus.IDLE
+        self.last_path = None
+        self.last_error = None
+        self._sequence = None
+        self.jobs = jobs if jobs is not None else JobScheduler(workers=0)
+        self._saves = []
+
+    def save(self, surface):
+        """Copy the surface and schedule it for encoding.
+
+        Args:
+            surface: Pygame surface to save.
+
+        Returns:
+            Path: Path the image will be written to.
+        """
+        data = pygame.image.tobytes(surface, "RGB")
+        path = self._next_path()
+        self.status = SaveStatus.SAVING
+        self._saves.append(self.jobs.submit(self._write, data, surface.get_size(), path, name="result_save",
+                                            priority=JOB_PRIORITY_LOW,
+                                            on_done=lambda _: self._on_saved(path),
+                                            on_error=lambda e: self._on_failed(path, e)))
+        logger.info("Result image queued for %s", path)
+        return path
+
+    def wait(self, timeout=None):
+        """Block until every queued image has been written. Must be called on the main thread.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds, or None to wait forever.
+
+        Returns:
+            bool: True if every save finished in time.
+        """
+        return self.jobs.wait(self._saves, timeout)
+
+    def shutdown(self):
+        """Finish queued saves; the scheduler belongs to the caller and keeps running."""
+        self.wait()
+
+    def _next_path(self):
+        """Build the output path for the next save.
+
+        Returns:
+            Path: Output path with the configured naming and extension.
+        """
+        directory, stem = self.base_path.parent, self.base_path.stem
+        if self.naming == "timestamp":
+            now = time.time()
+            name = f"{stem}_{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}_{int(now * 1000) % 1000:03d}"
+        elif self.naming == "sequence":
+            if self._sequence is None:
+                pattern = re.compile(rf"^{re.escape(stem)}_(\d+)\.")
+                numbers = [int(m.group(1)) for p in directory.glob(f"{stem}_*")
+                           if (m := pattern.match(p.name))]
+                self._sequence = max(numbers, default=0)
+            self._sequence += 1
+            name = f"{stem}_{self._sequence:04d}"
+        else:
+            name = stem
+        return directory / f"{name}.{self.fmt}"
+
+    def _on_saved(self, path):
+        """Record a finished save."""
+        self._saves = [job for job in self._saves if not job.done]
+        self.last_path = path
+        self.last_error = None
+        if len(self._saves) <= 1:
+            self.status = SaveStatus.SAVED
+        logger.info("Results saved to %s", path)
+
+    def _on_failed(self, path, error):
+        """Record a failed save."""
+        self._saves = [job for job in self._saves if not job.done]
+        self.last_error = error
+        self.status = SaveStatus.FAILED
+        logger.error("Error saving results to %s: %s", path, error)
+
+    def _write(self, data, size, path):
+        """Encode raw RGB bytes and atomically move the file into place.
+
+        Args:
+            data (bytes): Raw RGB pixels.
+            size (tuple): (width, height) of the image.
+            path (Path): Final output path.
+        """
+        image = Image.frombytes("RGB", size, data)
+        pil_format = self.FORMATS[self.fmt]
+        options = {}
+        if pil_format == "PNG":
+            options["compress_level"] = self.compression
+        elif pil_format in ("JPEG", "WEBP"):
+            options["quality"] = self.quality
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temporary file per save, so concurrent saves to the same path never share one.
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                image.save(f, format=pil_format, **options)
+            os.replace(tmp_path, path)
+        finally:
+            Path(tmp_path).unlink(missing_ok=True)
@@ -0,0 +1,347 @@
+import json
+import logging
+import struct
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from constants import (
+    HISTORY_DIR, HISTORY_SEGMENT_BYTES, HISTORY_FLUSH_INTERVAL, HISTORY_BATCH_SIZE, HISTORY_MAX_DRAWS
+)
+from models.metrics import metrics
+
+logger = logging.getLogger(__name__)
+sessions_recorded = metrics.counter("kft_history_sessions_total", "Sessions appended to the session history.")
+
+HEADER = struct.Struct("<4sHH")  # magic, format version, draw slots per record
+MAGIC = b"KFTH"
+VERSION = 1
+UNIVERSES_FILE = "universes.jsonl"
+SEGMENT_GLOB = "sessions-*.bin"
+
+def record_dtype(max_draws=HISTORY_MAX_DRAWS):
+    """Get the fixed-size layout of one session record.
+
+    Args:
+        max_draws (int): Draw slots per record; unused slots are zero.
+
+    Returns:
+        numpy.dtype: Packed little-endian record with the finish time, seed (-1 when unseeded),
+            session duration, universe id, draw count and per-draw segment index, GIF variant
+            (0 for none), response index and spin time.
+    """
+    return np.dtype([
+        ("time", "<f8"), ("seed", "<i8"), ("duration_ms", "<u4"), ("universe", "<u4"), ("draws", "u1"),
+        ("segment", "<u2", (max_draws,)), ("variant", "u1", (max_draws,)),
+        ("response", "<u2", (max_draws,)), ("spin_ms", "<u4", (max_draws,)),
+    ])
+
+def gif_variant(gif_id):
+    """Get the variant number of a GIF id "<segment>.<variant>", 0 for no GIF."""
+    return int(gif_id.split(".")[1]) if gif_id else 0
+
+class SessionHistory:
+    """Appends every completed session to fixed-size binary records on disk.
+
+    This class queues a session on the caller's thread. A writer thread
+    encodes the pending sessions and appends them in one write every flush
+    interval, or sooner when a batch fills up. Records go to segment files
+    that are rotated at a size limit and never rewritten, so the whole
+    history loads straight into a NumPy array. Universe names are kept
+    once in a side file and referenced by id.
+    """
+
+    def __init__(self, directory=HISTORY_DIR, segment_bytes=HISTORY_SEGMENT_BYTES,
+                 flush_interval=HISTORY_FLUSH_INTERVAL, batch_size=HISTORY_BATCH_SIZE, max_draws=HISTORY_MAX_DRAWS):
+        """Initialize the SessionHistory.
+
+        Args:
+            directory (str or Path): Directory of the segment files, created on the first write.
+            segment_bytes (int): Size at which a new segment file is started.
+            flush_interval (float): Longest time in seconds a record waits before it is written.
+            batch_size (int): Number of pending records that triggers a write before the interval.
+            max_draws (int): Draw slots per record.
+        """
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.dtype = record_dtype(max_draws)
+        self._pending = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._universes = None
+        self._segment = None
+
+    def append(self, universe, draws, seed=-1, duration=0.0, finished=None):
+        """Queue a completed session for writing.
+
+        Args:
+            universe (str): Universe name of the session.
+            draws (list): (segment index, GIF variant, response index, spin seconds) per draw.
+            seed (int): Session seed, -1 for an unseeded interactive session.
+            duration (float): Seconds from the first spin to the results.
+            finished (float): Unix time the session ended, now if None.
+
+        Raises:
+            ValueError: If there are more draws than record slots.
+        """
+        if len(draws) > self.dtype["segment"].shape[0]:
+            raise ValueError(f"A session record holds at most {self.dtype['segment'].shape[0]} draws")
+        entry = (time.time() if finished is None else finished, seed, duration, universe, draws)
+        with self._lock:
+            self._pending.append(entry)
+            full = len(self._pending) >= self.batch_size
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="SessionHistory", daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def _run(self):
+        """Write pending records every flush interval, or as soon as a batch is full."""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                # The sessions stay pending and are retried on the next wake-up.
+                logger.error("Error writing session history to %s: %s", self.directory, e)
+
+    def flush(self):
+        """Write all pending records now.
+
+        Returns:
+            int: Number of records written.
+
+        Raises:
+            OSError: If the write failed; the records stay pending for the next flush.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return 0
+        try:
+            with self._write_lock:
+                self._write(self.encode(pending).tobytes())
+        except Exception:
+            with self._lock:
+                self._pending[:0] = pending
+            raise
+        sessions_recorded.inc(len(pending))
+        logger.debug("Wrote %d sessions to the history", len(pending))
+        return len(pending)
+
+    def encode(self, sessions):
+        """Pack queued sessions into records; call with the write lock held, as new universes get ids.
+
+        Args:
+            sessions (list): (finished, seed, duration, universe, draws) tuples as queued by append().
+
+        Returns:
+            numpy.ndarray: One record per session.
+        """
+        finished, seeds, durations, names, draws = zip(*sessions)
+        records = np.zeros(len(sessions), dtype=self.dtype)
+        records["time"] = finished
+        records["seed"] = seeds
+        records["duration_ms"] = np.round(np.asarray(durations) * 1000)
+        records["universe"] = [self._universe_id(name) for name in names]
+        counts = np.fromiter(map(len, draws), dtype=np.int64, count=len(draws))
+        records["draws"] = counts
+        flat = np.array([draw for session in draws for draw in session], dtype=np.float64).reshape(-1, 4)
+        rows = np.repeat(np.arange(len(sessions)), counts)
+        slots = np.arange(len(flat)) - np.repeat(np.cumsum(counts) - counts, counts)
+        records["segment"][rows, slots] = flat[:, 0]
+        records["variant"][rows, slots] = flat[:, 1]
+        records["response"][rows, slots] = flat[:, 2]
+        records["spin_ms"][rows, slots] = np.round(flat[:, 3] * 1000)
+        return records
+
+    def close(self):
+        """Stop the writer thread and write the remaining records."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            self._wake.set()
+            thread.join()
+            self._stop.clear()
+        self.flush()
+
+    def _universe_id(self, name):
+        """Get the id of a universe name, adding it to the universe file if it is new; call with the write lock held."""
+        if self._universes is None:
+            self._universes = {name: i for i, name in enumerate(load_universes(self.directory))}
+        if name not in self._universes:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with (self.directory / UNIVERSES_FILE).open("a", encoding="utf-8") as f:
+                f.write(json.dumps(name, ensure_ascii=False) + "\n")
+            self._universes[name] = len(self._universes)
+        return self._universes[name]
+
+    def _write(self, data):
+        """Append encoded records to the current segment, starting a new one at the size limit."""
+        if self._segment is None:
+            self._segment = self._open_segment()
+        elif self._segment.stat().st_size >= self.segment_bytes:
+            self._segment = self._new_segment(int(self._segment.stem.split("-")[1]) + 1)
+        with self._segment.open("ab") as f:
+            f.write(data)
+
+    def _open_segment(self):
+        """Find the segment to append to, cutting off a record left half-written by a crash."""
+        segments = sorted(self.directory.glob(SEGMENT_GLOB))
+        if not segments:
+            return self._new_segment(1)
+        last = segments[-1]
+        size = last.stat().st_size
+        try:
+            max_draws = read_header(last)
+        except ValueError as e:
+            # E.g. a crash between creating the segment and writing its header.
+            logger.warning("Starting a new segment after an unreadable one: %s", e)
+            max_draws = None
+        if size >= self.segment_bytes or max_draws != self.dtype["segment"].shape[0]:
+            return self._new_segment(int(last.stem.split("-")[1]) + 1)
+        torn = (size - HEADER.size) % self.dtype.itemsize
+        if torn:
+            logger.warning("Dropping %d bytes of a torn record at the end of %s", torn, last)
+            with last.open("r+b") as f:
+                f.truncate(size - torn)
+        return last
+
+    def _new_segment(self, number):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"sessions-{number:06d}.bin"
+        with path.open("wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.dtype["segment"].shape[0]))
+        return path
+
+def read_header(path):
+    """Read a segment file header.
+
+    Args:
+        path (Path): Segment file.
+
+    Returns:
+        int: Draw slots per record.
+
+    Raises:
+        ValueError: If the file is not a session history segment.
+    """
+    with Path(path).open("rb") as f:
+        magic, version, max_draws = HEADER.unpack(f.read(HEADER.size).ljust(HEADER.size, b"\0"))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} session history segment")
+    return max_draws
+
+def load_universes(directory=HISTORY_DIR):
+    """Load the universe names of a history, indexed by universe id.
+
+    Args:
+        directory (str or Path): History directory.
+
+    Returns:
+        list: Universe names.
+    """
+    path = Path(directory) / UNIVERSES_FILE
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def load_history(directory=HISTORY_DIR):
+    """Load every recorded session into one array.
+
+    Args:
+        directory (str or Path): History directory.
+
+    Returns:
+        tuple: (numpy structured array of records, list of universe names by id).
+
+    Raises:
+        ValueError: If segments have different record layouts.
+    """
+    parts, dtype = [], None
+    for path in sorted(Path(directory).glob(SEGMENT_GLOB)):
+        try:
+            segment_dtype = record_dtype(read_header(path))
+        except ValueError as e:
+            logger.warning("Skipping %s", e)
+            continue
+        if dtype is not None and segment_dtype != dtype:
+            raise ValueError(f"{path} has a different record layout than earlier segments")
+        dtype = segment_dtype
+        count = (path.stat().st_size - HEADER.size) // dtype.itemsize
+        parts.append(np.fromfile(path, dtype=dtype, count=count, offset=HEADER.size))
+    if not parts:
+        return np.zeros(0, dtype=record_dtype()), load_universes(directory)
+    return np.concatenate(parts), load_universes(directory)
+
+def outcome_frequencies(records):
+    """Count how often each segment was landed on, per draw.
+
+    Args:
+        records (numpy.ndarray): Session records from load_history().
+
+    Returns:
+        numpy.ndarray: Counts shaped (draw slots, highest segment index + 1).
+    """
+    slots = records.dtype["segment"].shape[0]
+    played = np.arange(slots) < records["draws"][:, None]
+    segments = records["segment"][played].astype(np.int64)
+    draws = np.broadcast_to(np.arange(slots), played.shape)[played]
+    width = int(segments.max()) + 1 if segments.size else 1
+    return np.bincount(draws * width + segments, minlength=slots * width).reshape(slots, width)
+
+def duration_stats(records):
+    """Summarize session durations.
+
+    Args:
+        records (numpy.ndarray): Session records from load_history().
+
+    Returns:
+        dict: Mean, p50, p95 and max duration in seconds; zeros without records.
+    """
+    seconds = records["duration_ms"] / 1000.0
+    if not seconds.size:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    p50, p95 = np.percentile(seconds, [50, 95])
+    return {"mean": float(seconds.mean()), "p50": float(p50), "p95": float(p95), "max": float(seconds.max())}
+
+def universe_stats(records, universes):
+    """Summarize sessions per universe.
+
+    Args:
+        records (numpy.ndarray): Session records from load_history().
+        universes (list): Universe names by id.
+
+    Returns:
+        dict: Universe name mapped to its session count and mean duration and spin time in seconds.
+    """
+    ids = records["universe"].astype(np.int64)
+    size = max(len(universes), int(ids.max()) + 1 if ids.size else 0)
+    sessions = np.bincount(ids, minlength=size)
+    durations = np.bincount(ids, weights=records["duration_ms"] / 1000.0, minlength=size)
+    slots = records.dtype["spin_ms"].shape[0]
+    played = np.arange(slots) < records["draws"][:, None]
+    spins = np.bincount(ids, weights=(records["spin_ms"] * played).sum(axis=1) / 1000.0, minlength=size)
+    draws = np.bincount(ids, weights=records["draws"], minlength=size)
+    stats = {}
+    for universe_id in np.flatnonzero(sessions):
+        name = universes[universe_id] if universe_id < len(universes) else f"#{universe_id}"
+        stats[name] = {
+            "sessions": int(sessions[universe_id]),
+            "mean_duration": float(durations[universe_id] / sessions[universe_id]),
+            "mean_spin": float(spins[universe_id] / draws[universe_id]) if draws[universe_id] else 0.0,
+        }
+    return stats
+
+session_history = SessionHistory()
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+from constants import SNAPSHOT_PATH, JOB_PRIORITY_LOW
+from models.job_scheduler import JobScheduler
+from models.logger import GameState
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct("<4sHI")  # magic, format version, CRC-32 of the body
+MAGIC = b"KFTS"
+VERSION = 1
+# config hash, game state, draw, wait timer, wheel angle, target angle, angular velocity, deceleration,
+# spinning, spin time, seconds since the session started
+FIXED = struct.Struct("<8sBhfdddd?ff")
+DRAW = struct.Struct("<HBHf")  # segment, GIF variant, response index, spin seconds
+LENGTH = struct.Struct("<H")
+COUNT = struct.Struct("<B")
+GAME_STATES = list(GameState)
+
+def config_hash(config):
+    """Fingerprint the parts of a configuration a snapshot depends on.
+
+    Args:
+        config (dict): Configuration data.
+
+    Returns:
+        bytes: 8-byte hash of the prompt and questions.
+    """
+    data = json.dumps([config.get("prompt"), config.get("questions")], sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest()
+
+def _pack_text(text):
+    data = text.encode("utf-8")[:0xFFFF]
+    return LENGTH.pack(len(data)) + data
+
+def encode_snapshot(snapshot):
+    """Pack a snapshot into the binary format.
+
+    Args:
+        snapshot (dict): Keys app_state, config_hash, game_state (GameState), draw, wait_timer,
+            wheel (angle, target_angle, angular_velocity, deceleration, spinning, spin_time),
+            session_elapsed, gif (str or None), results, responses and session_draws
+            ((segment, variant, response, spin seconds) per draw).
+
+    Returns:
+        bytes: Header followed by the body.
+    """
+    parts = [
+        FIXED.pack(snapshot["config_hash"], GAME_STATES.index(snapshot["game_state"]), snapshot["draw"],
+                   snapshot["wait_timer"], *snapshot["wheel"], snapshot["session_elapsed"]),
+        _pack_text(snapshot["app_state"]),
+        _pack_text(snapshot["gif"] or ""),
+    ]
+    for items in (snapshot["results"], snapshot["responses"]):
+        parts.append(COUNT.pack(len(items)))
+        parts += [_pack_text(str(item)) for item in items]
+    parts.append(COUNT.pack(len(snapshot["session_draws"])))
+    parts += [DRAW.pack(*draw) for draw in snapshot["session_draws"]]
+    body = b"".join(parts)
+    return HEADER.pack(MAGIC, VERSION, zlib.crc32(body)) + body
+
+def decode_snapshot(data):
+    """Unpack a snapshot written by encode_snapshot().
+
+    Args:
+        data (bytes): Snapshot file contents.
+
+    Returns:
+        dict: Snapshot with the keys described in encode_snapshot().
+
+    Raises:
+        ValueError: If the data is not a complete snapshot of this version.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Snapshot is truncated")
+    magic, version, crc = HEADER.unpack_from(data)
+    body = memoryview(data)[HEADER.size:]
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Not a version {VERSION} snapshot")
+    if zlib.crc32(body) != crc:
+        raise ValueError("Snapshot checksum mismatch")
+    try:
+        fields = FIXED.unpack_from(body)
+        offset = FIXED.size
+
+        def text():
+            nonlocal offset
+            (length,) = LENGTH.unpack_from(body, offset)
+            offset += LENGTH.size + length
+            return bytes(body[offset - length:offset]).decode("utf-8")
+
+        def count():
+            nonlocal offset
+            (n,) = COUNT.unpack_from(body, offset)
+            offset += COUNT.size
+            return n
+
+        app_state, gif = text(), text()
+        results = [text() for _ in range(count())]
+        responses = [text() for _ in range(count())]
+        draws = []
+        for _ in range(count()):
+            draws.append(DRAW.unpack_from(body, offset))
+            offset += DRAW.size
+        game_state = GAME_STATES[fields[1]]
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed snapshot: {e}") from e
+    return {
+        "app_state": app_state, "config_hash": fields[0], "game_state": game_state, "draw": fields[2],
+        "wait_timer": fields[3], "wheel": fields[4:10], "session_elapsed": fields[10], "gif": gif or None,
+        "results": results, "responses": responses, "session_draws": draws,
+    }
+
+class SnapshotStore:
+    """Keeps the latest snapshot of the running session on disk.
+
+    This class encodes a snapshot on the caller's thread and writes it as
+    a background job: to a temporary file that is synced and then renamed
+    over the previous snapshot, so a crash or power loss leaves either the
+    old or the new snapshot. A write that finishes after a newer one was
+    written is dropped.
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH, jobs=None):
+        """Initialize the SnapshotStore.
+
+        Args:
+            path (str or Path): Snapshot file.
+            jobs (JobScheduler): Scheduler running the writes, or None to write inline.
+        """
+        self.path = Path(path)
+        self.jobs = jobs if jobs is not None else JobScheduler(workers=0)
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._written = 0
+
+    def save(self, snapshot):
+        """Write a snapshot in the background.
+
+        Args:
+            snapshot (dict): Snapshot as described in encode_snapshot().
+
+        Returns:
+            Job: The write job.
+        """
+        self._sequence += 1
+        return self.jobs.submit(self._write, self._sequence, encode_snapshot(snapshot), name="snapshot",
+                                priority=JOB_PRIORITY_LOW, on_error=self._write_failed)
+
+    def _write(self, sequence, data):
+        """Atomically replace the snapshot file unless a newer snapshot was written already."""
+        with self._lock:
+            if sequence <= self._written:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            try:
+                with tmp_path.open("wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            self._written = sequence
+
+    def _write_failed(self, error):
+        logger.error("Error writing snapshot to %s: %s", self.path, error)
+
+    def load(self):
+        """Read the latest snapshot.
+
+        Returns:
+            dict or None: Snapshot, or None if there is none or it is unreadable.
+        """
+        try:
+            return decode_snapshot(self.path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring snapshot %s: %s", self.path, e)
+            return None
@@ -1,6 +1,6 @@
 import random
+import numpy as np
 import pygame.mixer
-from pathlib import Path
 import logging
 
 from constants import (
@@ -12,39 +12,162 @@ from constants import (
     SPIN_SOUND_PATH,
     FULL_CIRCLE,
     ANG_VELOCITY,
-    INDICATOR_POSITION
+    INDICATOR_POSITION,
+    SPIN_DURATION_BUCKETS,
+    GIF_VARIANTS
 )
+from models.assets import asset_store
+from models.latency_tracer import latency_tracer
+from models.logger import HotPathLogger
+from models.metrics import metrics
 
 logger = logging.getLogger(__name__)
+hot_logger = HotPathLogger(logger)
+spin_duration = metrics.histogram("kft_spin_duration_seconds", "Animated duration of wheel spins.",
+                                  buckets=SPIN_DURATION_BUCKETS)
+
+def segment_boundaries(weights):
+    """Turn segment weights into cumulative boundary angles.
+
+    Args:
+        weights (list): Non-negative weight per segment.
+
+    Returns:
+        numpy.ndarray: n + 1 ascending angles in degrees from 0 to FULL_CIRCLE.
+
+    Raises:
+        ValueError: If a weight is negative or no weight is positive.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if weights.size == 0 or (weights < 0).any() or not weights.sum() > 0:
+        raise ValueError(f"Segment weights must be non-negative with a positive sum: {weights.tolist()}")
+    boundaries = np.concatenate(([0.0], np.cumsum(weights)))
+    boundaries *= FULL_CIRCLE / boundaries[-1]
+    boundaries[-1] = FULL_CIRCLE
+    return boundaries
+
+class AliasTable:
+    """Samples segment indices in proportion to their weights in constant time.
+
+    This class builds Vose's alias table once in O(n); each draw then costs
+    one uniform index and one biased coin flip, however many segments there are.
+    """
+
+    def __init__(self, weights):
+        """Initialize the AliasTable.
+
+        Args:
+            weights (list): Non-negative weight per segment, with a positive sum.
+        """
+        weights = np.asarray(weights, dtype=float)
+        count = len(weights)
+        scaled = weights * count / weights.sum()
+        self.prob = np.ones(count)
+        self.alias = np.arange(count)
+        small = [i for i in range(count) if scaled[i] < 1]
+        large = [i for i in range(count) if scaled[i] >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Whatever is left over differs from 1 only by rounding error.
+        self.prob = self.prob.tolist()
+        self.alias = self.alias.tolist()
+
+    def sample(self, rng):
+        """Draw one index.
+
+        Args:
+            rng (random.Random): Random source.
+
+        Returns:
+            int: Segment index.
+        """
+        index = int(rng.random() * len(self.prob))
+        return index if rng.random() < self.prob[index] else self.alias[index]
 
 class SpinWheelModel:
-    """Manages the spinning wheel's logic."""
-    def __init__(self, segments):
+    """Manages the spinning wheel's logic.
+
+    Segments may be weighted: each one spans an angle proportional to its
+    weight, taken from the cumulative boundaries array that the renderer
+    draws from as well.
+    """
+    def __init__(self, segments, rng=None, sound=True, weights=None, gif_index=None):
         """Initialize the SpinWheelModel.
         Args:
             segments (list): List of segment labels.
+            rng (random.Random): Random source, defaults to the module-level generator.
+            sound (bool or pygame.mixer.Sound): Load and play the spin sound if True, or play
+                an already loaded sound shared between wheels.
+            weights (list): Weight per segment, equal weights if None.
+            gif_index (GifIndex): Index the GIF variant is chosen from, or None to draw
+                one of GIF_VARIANTS blindly.
         """
         self.segments = segments
+        self.rng = rng or random
         self.segment_count = len(segments)
         self.segment_angle = FULL_CIRCLE / self.segment_count
+        self.weights = [1.0] * self.segment_count if weights is None else list(weights)
+        self.boundaries = segment_boundaries(self.weights)
+        self._alias_table = None
+        self.gif_index = gif_index
         self.angle = 0
         self.target_angle = 0
+        self.angular_velocity = 0
         self.deceleration = 0
         self.spinning = False
-        self.spin_sound = pygame.mixer.Sound(str(Path(SPIN_SOUND_PATH)))
-        logger.info(f"SpinWheelModel initialized with {self.segment_count} segments")
+        self.spin_time = 0
+        if sound is True:
+            self.spin_sound = asset_store.sound(SPIN_SOUND_PATH)
+        else:
+            self.spin_sound = sound or None
+        hot_logger.log("SpinWheelModel initialized with %d segments", self.segment_count)
+
+    @classmethod
+    def from_question(cls, question, **kwargs):
+        """Create the wheel of a configured question.
+
+        Args:
+            question (dict): Question with 'answers', 'num_answers' and optional 'weights'.
+            **kwargs: Passed on to SpinWheelModel.
+
+        Returns:
+            SpinWheelModel: Wheel with the first num_answers answers, missing weights counting as 1.
+        """
+        answers = question["answers"][:question["num_answers"]]
+        weights = list(question.get("weights") or [])[:len(answers)]
+        weights += [1.0] * (len(answers) - len(weights))
+        return cls(answers, weights=weights, **kwargs)
+
+    @property
+    def alias_table(self):
+        """AliasTable: Sampler over the segment weights, built on first use."""
+        if self._alias_table is None:
+            self._alias_table = AliasTable(self.weights)
+        return self._alias_table
 
-    def spin(self):
-        """Start spinning the wheel."""
+    def spin(self, event=None):
+        """Start spinning the wheel.
+
+        Args:
+            event: Input event that triggered the spin, traced for input latency.
+        """
         if not self.spinning:
+            if event is not None:
+                latency_tracer.input_applied(event, "spin")
             self.spinning = True
-            self.spin_sound.play(-1)
-            modifier = random.uniform(SPIN_VELOCITY_MODIFIER_MIN, SPIN_VELOCITY_MODIFIER_MAX)
+            self.spin_time = 0
+            if self.spin_sound:
+                self.spin_sound.play(-1)
+            modifier = self.rng.uniform(SPIN_VELOCITY_MODIFIER_MIN, SPIN_VELOCITY_MODIFIER_MAX)
             self.angular_velocity = ANG_VELOCITY * modifier
             additional_rotation = SPIN_ADDITIONAL_ROTATIONS * modifier * FULL_CIRCLE
             self.target_angle = self.angle - additional_rotation
             self.deceleration = (self.angular_velocity ** 2) / (2 * -additional_rotation)
-            logger.info("Wheel spinning started")
+            hot_logger.log("Wheel spinning started")
 
     def update(self, dt):
         """Update the wheel's rotation.
@@ -52,26 +175,100 @@ class SpinWheelModel:
             dt (float): Delta time in seconds.
         """
         if self.spinning:
+            self.spin_time += dt
             self.angle += self.angular_velocity * dt
             self.angular_velocity -= self.deceleration * dt
             if self.angular_velocity >= 0:
                 self.angular_velocity = 0
                 self.spinning = False
                 self.angle = self.target_angle
-                self.spin_sound.stop()
-                logger.info("Wheel spinning stopped")
+                if self.spin_sound:
+                    self.spin_sound.stop()
+                spin_duration.observe(self.spin_time)
+                hot_logger.log("Wheel spinning stopped")
         self.angle %= FULL_CIRCLE
 
+    @property
+    def motion(self):
+        """tuple: (angle, target_angle, angular_velocity, deceleration, spinning, spin_time), enough to resume a spin."""
+        return (self.angle, self.target_angle, self.angular_velocity, self.deceleration,
+                self.spinning, self.spin_time)
+
+    def restore_motion(self, motion):
+        """Continue from a motion taken from another wheel of the same segments.
+
+        Args:
+            motion (tuple): Value of the motion property.
+        """
+        self.angle, self.target_angle, self.angular_velocity, self.deceleration, spinning, self.spin_time = motion
+        self.spinning = bool(spinning)
+        if self.spinning and self.spin_sound:
+            self.spin_sound.play(-1)
+
+    def finish_spin(self):
+        """Skip the spin animation and land on the target angle immediately."""
+        if self.spinning:
+            self.angular_velocity = 0
+            self.spinning = False
+            self.angle = self.target_angle % FULL_CIRCLE
+            if self.spin_sound:
+                self.spin_sound.stop()
+
+    def land(self, index=None):
+        """Stop the wheel on a segment without animating the spin.
+
+        Headless runs use this instead of spin() and finish_spin(): the
+        segment is drawn from the alias table in O(1) and the wheel is
+        turned to a uniformly random point inside it, so get_selected_segment
+        resolves it like any other landing.
+
+        Args:
+            index (int): Segment to land on, sampled by weight if None.
+
+        Returns:
+            int: Index of the segment landed on.
+        """
+        if index is None:
+            index = self.alias_table.sample(self.rng)
+        low, high = self.boundaries[index], self.boundaries[index + 1]
+        position = low + (high - low) * self.rng.random()
+        self.spinning = False
+        self.angular_velocity = 0
+        self.angle = (INDICATOR_POSITION - position) % FULL_CIRCLE
+        return index
+
+    def segment_at(self, position):
+        """Find the segment covering an angle by binary search over the boundaries.
+
+        Args:
+            position (float): Angle in degrees on the unrotated wheel.
+
+        Returns:
+            int: Segment index.
+        """
+        index = int(np.searchsorted(self.boundaries, position % FULL_CIRCLE, side='right')) - 1
+        return min(max(index, 0), self.segment_count - 1)
+
+    def selected_index(self):
+        """Get the index of the segment under the indicator.
+
+        Returns:
+            int: Segment index.
+        """
+        adjusted_angle = (FULL_CIRCLE - self.angle % FULL_CIRCLE)
+        return self.segment_at((adjusted_angle + INDICATOR_POSITION) % FULL_CIRCLE)
+
     def get_selected_segment(self):
         """Get the selected segment.
         Returns:
-            tuple: (selected segment, index string).
+            tuple: (selected segment, GIF id "<segment>.<variant>"); with a GIF index the
+                id is None when the segment has no GIF.
         """
-        indicator_position = INDICATOR_POSITION
-        adjusted_angle = (FULL_CIRCLE - self.angle % FULL_CIRCLE)
-        relative_position = (adjusted_angle + indicator_position) % FULL_CIRCLE
-        segment_index = int(relative_position / self.segment_angle)
-        idx = random.randint(1, 5)
-        selected = self.segments[segment_index % self.segment_count]
-        logger.info(f"Selected segment: {selected}, index: {(segment_index % self.segment_count) + 1}.{idx}")
-        return selected, f"{(segment_index % self.segment_count) + 1}.{idx}"
\ No newline at end of file
+        segment_index = self.selected_index()
+        if self.gif_index is None:
+            gif_id = f"{segment_index + 1}.{self.rng.randint(1, GIF_VARIANTS)}"
+        else:
+            gif_id = self.gif_index.choose(segment_index + 1, self.rng)
+        selected = self.segments[segment_index]
+        hot_logger.log("Selected segment: %s, GIF: %s", selected, gif_id)
+        return selected, gif_id
\ No newline at end of file
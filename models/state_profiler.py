@@ -0,0 +1,245 @@
+import cProfile
+import itertools
+import os
+import pstats
+import sys
+import threading
+import time
+import logging
+from collections import Counter
+from pathlib import Path
+
+from constants import (
+    PROFILE_OUTPUT_DIR, PROFILE_MODE, PROFILE_SAMPLE_INTERVAL, PROFILE_STATES_ENV, PROFILE_FRAMES_ENV,
+    PROFILE_MODE_ENV
+)
+
+logger = logging.getLogger(__name__)
+
+def _frame_label(code):
+    """Format a code object as a collapsed-stack frame name."""
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})".replace(';', ':')
+
+class _Sampler:
+    """Samples the stack of one thread at a fixed interval on a daemon thread."""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="StateSampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+class StateProfiler:
+    """Captures cProfile or sampling profiles scoped to application states.
+
+    A capture is armed for a set of states and starts on the first frame
+    spent in one of them. It stops when the armed states are left, e.g. a
+    capture armed for "game" runs through every game sub-state, or after a
+    set number of frames. It then writes files named by state, timestamp
+    and a sequence number.
+    States are matched as "app" or "app.sub", e.g. "game" or "game.showing_gif".
+    """
+
+    def __init__(self, output_dir=PROFILE_OUTPUT_DIR, mode=PROFILE_MODE, sample_interval=PROFILE_SAMPLE_INTERVAL):
+        """Initialize the StateProfiler.
+
+        Args:
+            output_dir (str): Directory the capture files are written to.
+            mode (str): "cprofile" for deterministic profiling or "sample" for a sampling thread.
+            sample_interval (float): Seconds between stack samples in "sample" mode.
+        """
+        if mode not in ("cprofile", "sample"):
+            raise ValueError(f"Unsupported profile mode: {mode}")
+        self.output_dir = Path(output_dir)
+        self.mode = mode
+        self.sample_interval = sample_interval
+        self.targets = None
+        self.max_frames = None
+        self.active_state = None
+        self.capture_targets = None
+        self.frames = 0
+        self.last_files = []
+        self._profile = None
+        self._sampler = None
+        self._sequence = itertools.count(1)
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        """Create a profiler armed from environment variables.
+
+        PROFILE_STATES_ENV holds comma-separated states, PROFILE_FRAMES_ENV an
+        optional frame limit and PROFILE_MODE_ENV the mode.
+
+        Args:
+            environ (dict): Environment mapping.
+
+        Returns:
+            StateProfiler: Profiler, armed if states were given.
+        """
+        profiler = cls(mode=environ.get(PROFILE_MODE_ENV, PROFILE_MODE))
+        states = [s.strip() for s in environ.get(PROFILE_STATES_ENV, "").split(",") if s.strip()]
+        if states:
+            frames = environ.get(PROFILE_FRAMES_ENV)
+            profiler.arm(states, int(frames) if frames else None)
+        return profiler
+
+    @property
+    def armed(self):
+        """bool: True if a capture is waiting for one of its states."""
+        return self.targets is not None
+
+    @property
+    def capturing(self):
+        """bool: True while a capture is running."""
+        return self.active_state is not None
+
+    def arm(self, states, frames=None):
+        """Arm a one-shot capture.
+
+        Args:
+            states (list): States to capture, e.g. ["game.showing_gif"].
+            frames (int): Stop after this many frames, or None to run until the state is left.
+        """
+        self.targets = set(states)
+        self.max_frames = frames
+        logger.info("Profiler armed for %s (%s frames)", ", ".join(sorted(self.targets)), frames or "all")
+
+    def toggle(self, state):
+        """Hotkey action: stop a running capture, or arm one for the given state.
+
+        Args:
+            state (str): State to capture.
+        """
+        if self.capturing:
+            self.stop()
+        elif self.armed:
+            self.targets = None
+            logger.info("Profiler disarmed")
+        else:
+            self.arm([state])
+
+    def on_frame(self, state):
+        """Start, count or stop a capture for the frame that just ran.
+
+        Args:
+            state (str): Detailed state of the frame, e.g. "game.spinning".
+        """
+        if self.active_state is not None:
+            if not self._matches(state, self.capture_targets):
+                self.stop()
+            else:
+                self.frames += 1
+                if self.max_frames and self.frames >= self.max_frames:
+                    self.stop()
+                return
+        if self.targets is not None and self._matches(state, self.targets):
+            self.start(state)
+
+    def start(self, state):
+        """Start a capture for the given state.
+
+        Args:
+            state (str): Detailed state being captured.
+        """
+        self.active_state = state
+        self.capture_targets = self.targets or {state}
+        self.targets = None
+        self.frames = 0
+        if self.mode == "cprofile":
+            self._profile = cProfile.Profile()
+            try:
+                self._profile.enable()
+            except ValueError as e:
+                logger.error("Cannot start cProfile capture: %s", e)
+                self._profile = None
+                self.active_state = self.capture_targets = None
+                return
+        else:
+            self._sampler = _Sampler(threading.get_ident(), self.sample_interval)
+            self._sampler.start()
+        logger.info("Profiling %s started (%s)", state, self.mode)
+
+    def stop(self):
+        """Stop the running capture and write its files.
+
+        Returns:
+            list: Paths of the written files.
+        """
+        if self.active_state is None:
+            return []
+        state, self.active_state, self.capture_targets = self.active_state, None, None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = self.output_dir / (f"{state.replace('.', '_')}_{time.strftime('%Y%m%d-%H%M%S')}"
+                                  f"_{next(self._sequence):03d}")
+        files = []
+        if self._profile is not None:
+            self._profile.disable()
+            stats = pstats.Stats(self._profile)
+            stats.dump_stats(f"{stem}.pstats")
+            files.append(Path(f"{stem}.pstats"))
+            stacks = self._collapse_pstats(stats)
+            self._profile = None
+        else:
+            self._sampler.stop()
+            stacks = self._sampler.stacks
+            self._sampler = None
+        with open(f"{stem}.collapsed", 'w', encoding='utf-8') as f:
+            for stack, count in stacks.items():
+                f.write(f"{stack} {count}\n")
+        files.append(Path(f"{stem}.collapsed"))
+        self.last_files = files
+        logger.info("Profile of %s (%d frames) written to %s", state, self.frames, ", ".join(map(str, files)))
+        return files
+
+    @staticmethod
+    def _matches(state, targets):
+        """Check whether a detailed state falls under any of the targets."""
+        return state in targets or state.split('.', 1)[0] in targets
+
+    @staticmethod
+    def _collapse_pstats(stats):
+        """Build caller;callee stacks weighted by own time in microseconds.
+
+        cProfile only records one level of callers, so the result is a
+        two-level flame graph rather than full stacks.
+
+        Args:
+            stats (pstats.Stats): Loaded profile.
+
+        Returns:
+            Counter: Collapsed stacks and their weights.
+        """
+        def label(func):
+            filename, line, name = func
+            return f"{name} ({Path(filename).name}:{line})".replace(';', ':')
+
+        stacks = Counter()
+        for func, (_, _, tottime, _, callers) in stats.stats.items():
+            if not callers:
+                weight = int(tottime * 1e6)
+                if weight:
+                    stacks[label(func)] += weight
+                continue
+            for caller, caller_stats in callers.items():
+                weight = int(caller_stats[2] * 1e6)
+                if weight:
+                    stacks[f"{label(caller)};{label(func)}"] += weight
+        return stacks
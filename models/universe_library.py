@@ -0,0 +1,292 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+
+from constants import UNIVERSE_DB_PATH, UNIVERSE_SEARCH_LIMIT
+from models.metrics import metrics
+
+logger = logging.getLogger(__name__)
+library_query_seconds = metrics.histogram("kft_library_query_seconds", "Latency of universe library queries.",
+                                          ("query",), buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS universes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    normalized_name TEXT NOT NULL UNIQUE,
+    music TEXT NOT NULL,
+    bg_img TEXT NOT NULL,
+    bg_color TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    universe_id INTEGER NOT NULL REFERENCES universes(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    num_answers INTEGER NOT NULL,
+    UNIQUE (universe_id, position)
+);
+CREATE TABLE IF NOT EXISTS answers (
+    question_id INTEGER NOT NULL REFERENCES questions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    weight REAL,
+    PRIMARY KEY (question_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS answer_metadata (
+    question_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (question_id, position, key),
+    FOREIGN KEY (question_id, position) REFERENCES answers(question_id, position) ON DELETE CASCADE
+) WITHOUT ROWID;
+"""
+
+def normalize_name(name):
+    """Normalize a universe name for lookups.
+
+    Args:
+        name (str): Universe name as typed, e.g. " Pokémon  Go".
+
+    Returns:
+        str: Case-folded name without accents and with single spaces, e.g. "pokemon go".
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+class UniverseLibrary:
+    """Stores generated universes in SQLite, so switching between them needs no AI request.
+
+    This class keeps one row per universe, indexed by normalized name, with
+    its questions, answers and per-answer metadata in child tables. Configs
+    go in and come out in the config.json format; a universe is read only
+    when it is loaded by name. Every save is one transaction, and
+    save_many() writes a whole batch in a single one. The connection is
+    opened on first use and shared by threads under a lock.
+    """
+
+    def __init__(self, path=UNIVERSE_DB_PATH):
+        """Initialize the UniverseLibrary.
+
+        Args:
+            path (str or Path): Database file, created on first use; ":memory:" for a private in-memory database.
+        """
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """Open the database and create the schema on first use; call with the lock held."""
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            logger.info("Universe library opened at %s", self.path)
+        return self._conn
+
+    def save(self, config):
+        """Store a universe, replacing a stored one of the same normalized name.
+
+        Args:
+            config (dict): Configuration in the config.json format; its "prompt" names the universe.
+        """
+        self.save_many([config])
+
+    def save_many(self, configs):
+        """Store several universes in one transaction.
+
+        Args:
+            configs (iterable): Configurations in the config.json format.
+
+        Returns:
+            int: Number of universes stored.
+
+        Raises:
+            ValueError: If a configuration has no universe name; nothing is stored then.
+        """
+        count = 0
+        with self._lock, library_query_seconds.time(query="save"):
+            conn = self._connection()
+            with conn:
+                for config in configs:
+                    self._insert(conn, config)
+                    count += 1
+        logger.info("Stored %d universes in the library", count)
+        return count
+
+    def _insert(self, conn, config):
+        """Write one universe and its children inside the caller's transaction."""
+        name = str(config.get("prompt", "")).strip()
+        if not normalize_name(name):
+            raise ValueError("A universe needs a name in its 'prompt'")
+        conn.execute(
+            "INSERT INTO universes (name, normalized_name, music, bg_img, bg_color, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (normalized_name) DO UPDATE SET"
+            " name = excluded.name, music = excluded.music, bg_img = excluded.bg_img,"
+            " bg_color = excluded.bg_color, updated_at = excluded.updated_at",
+            (name, normalize_name(name), config.get("music", ""), config.get("bg_img", ""),
+             json.dumps(list(config.get("bg_color", []))), time.time()))
+        universe_id = conn.execute("SELECT id FROM universes WHERE normalized_name = ?",
+                                   (normalize_name(name),)).fetchone()[0]
+        conn.execute("DELETE FROM questions WHERE universe_id = ?", (universe_id,))
+        answers, metadata = [], []
+        for position, question in enumerate(config.get("questions", [])):
+            question_id = conn.execute(
+                "INSERT INTO questions (universe_id, position, text, num_answers) VALUES (?, ?, ?, ?)",
+                (universe_id, position, question["text"], question["num_answers"])).lastrowid
+            weights = question.get("weights") or []
+            for i, text in enumerate(question["answers"]):
+                answers.append((question_id, i, text, weights[i] if i < len(weights) else None))
+            for i, entry in enumerate(question.get("metadata") or []):
+                metadata += [(question_id, i, key, json.dumps(value)) for key, value in entry.items()]
+        conn.executemany("INSERT INTO answers (question_id, position, text, weight) VALUES (?, ?, ?, ?)", answers)
+        conn.executemany("INSERT INTO answer_metadata (question_id, position, key, value) VALUES (?, ?, ?, ?)",
+                         metadata)
+
+    def load(self, name):
+        """Load one universe by name.
+
+        Args:
+            name (str): Universe name; case, accents and extra spaces are ignored.
+
+        Returns:
+            dict or None: Configuration in the config.json format, None if the universe is not stored.
+                Questions with answer metadata carry a "metadata" list with one dict per answer.
+        """
+        with self._lock, library_query_seconds.time(query="load"):
+            conn = self._connection()
+            row = conn.execute("SELECT id, name, music, bg_img, bg_color FROM universes WHERE normalized_name = ?",
+                               (normalize_name(name),)).fetchone()
+            if row is None:
+                return None
+            universe_id, stored_name, music, bg_img, bg_color = row
+            questions = conn.execute(
+                "SELECT id, text, num_answers FROM questions WHERE universe_id = ? ORDER BY position",
+                (universe_id,)).fetchall()
+            answers = conn.execute(
+                "SELECT a.question_id, a.text, a.weight FROM answers a JOIN questions q ON q.id = a.question_id"
+                " WHERE q.universe_id = ? ORDER BY a.question_id, a.position", (universe_id,)).fetchall()
+            metadata = conn.execute(
+                "SELECT m.question_id, m.position, m.key, m.value FROM answer_metadata m"
+                " JOIN questions q ON q.id = m.question_id WHERE q.universe_id = ?", (universe_id,)).fetchall()
+        by_question = {question_id: {"text": text, "num_answers": num_answers, "answers": []}
+                       for question_id, text, num_answers in questions}
+        weights = {question_id: [] for question_id in by_question}
+        for question_id, text, weight in answers:
+            by_question[question_id]["answers"].append(text)
+            weights[question_id].append(weight)
+        for question_id, question in by_question.items():
+            if any(weight is not None for weight in weights[question_id]):
+                question["weights"] = [1.0 if weight is None else weight for weight in weights[question_id]]
+        for question_id, position, key, value in metadata:
+            question = by_question[question_id]
+            entries = question.setdefault("metadata", [{} for _ in question["answers"]])
+            entries[position][key] = json.loads(value)
+        return {"prompt": stored_name, "music": music, "bg_img": bg_img, "bg_color": json.loads(bg_color),
+                "questions": list(by_question.values())}
+
+    def search(self, prefix="", limit=UNIVERSE_SEARCH_LIMIT):
+        """List stored universes whose normalized name starts with a prefix.
+
+        The lookup is a range scan of the name index, so it stays fast with
+        thousands of universes.
+
+        Args:
+            prefix (str): Start of the universe name; case, accents and extra spaces are ignored.
+            limit (int): Maximum number of names.
+
+        Returns:
+            list: Stored universe names in normalized order.
+        """
+        low = normalize_name(prefix)
+        with self._lock, library_query_seconds.time(query="search"):
+            rows = self._connection().execute(
+                "SELECT name FROM universes WHERE normalized_name >= ? AND normalized_name < ?"
+                " ORDER BY normalized_name LIMIT ?", (low, low + "\U0010ffff", limit)).fetchall()
+        return [name for (name,) in rows]
+
+    def __contains__(self, name):
+        with self._lock:
+            row = self._connection().execute("SELECT 1 FROM universes WHERE normalized_name = ?",
+                                             (normalize_name(name),)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM universes").fetchone()[0]
+
+    def delete(self, name):
+        """Remove a universe with its questions, answers and metadata.
+
+        Args:
+            name (str): Universe name.
+
+        Returns:
+            bool: True if a universe was removed.
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                deleted = conn.execute("DELETE FROM universes WHERE normalized_name = ?",
+                                       (normalize_name(name),)).rowcount
+        return deleted > 0
+
+    def import_json(self, path):
+        """Store the universes of a JSON file.
+
+        Args:
+            path (str or Path): A config.json file, or a list of configurations as written by export_json().
+
+        Returns:
+            int: Number of universes stored.
+        """
+        with Path(path).open(encoding="utf-8") as f:
+            data = json.load(f)
+        return self.save_many(data if isinstance(data, list) else [data])
+
+    def export_json(self, path, name=None):
+        """Write universes in the config.json format.
+
+        Args:
+            path (str or Path): Output file.
+            name (str): Universe to write as a single configuration, or None to write a list of all of them.
+
+        Returns:
+            int: Number of universes written.
+
+        Raises:
+            KeyError: If the named universe is not stored.
+        """
+        if name is not None:
+            data = self.load(name)
+            if data is None:
+                raise KeyError(name)
+        else:
+            with self._lock:
+                names = [row[0] for row in self._connection().execute(
+                    "SELECT name FROM universes ORDER BY normalized_name")]
+            data = [self.load(stored) for stored in names]
+        with Path(path).open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        return 1 if name is not None else len(data)
+
+    def close(self):
+        """Close the database connection; it is reopened on the next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+universe_library = UniverseLibrary()
@@ -0,0 +1,32 @@
+import argparse
+import logging
+import os
+
+from constants import VIDEO_FPS, VIDEO_FORMAT, VIDEO_OUTPUT_DIR
+from models.config_manager import ConfigManager
+from models.logger import setup_logging
+from controllers.video_renderer import render_sessions
+
+logger = logging.getLogger(__name__)
+
+def main():
+    """Render whole sessions offscreen to video files."""
+    parser = argparse.ArgumentParser(description="Offscreen video renderer for Spin The Wheel sessions.")
+    parser.add_argument("seeds", type=int, nargs="+", help="Seeds of the sessions to render.")
+    parser.add_argument("-o", "--output-dir", default=VIDEO_OUTPUT_DIR, help="Directory for the video files.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Sessions rendered in parallel.")
+    parser.add_argument("--fps", type=int, default=VIDEO_FPS, help="Virtual frame rate of the output.")
+    parser.add_argument("--format", default=VIDEO_FORMAT, help="Video format extension (mp4 needs imageio-ffmpeg).")
+    args = parser.parse_args()
+    # Set before pygame.init() in this or any worker process, which inherit the environment.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    setup_logging()
+
+    config_manager = ConfigManager()
+    for report in render_sessions(config_manager.config, args.seeds, args.output_dir,
+                                  args.workers, args.fps, args.format):
+        print(f"{report['output']}: {report['video_seconds']:.1f}s of video in "
+              f"{report['render_seconds']:.2f}s ({report['speedup']:.1f}x real time)")
+
+if __name__ == "__main__":
+    main()
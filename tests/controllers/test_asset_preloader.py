@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from PIL import Image
+
+from controllers.asset_preloader import AssetPreloader, LoadingController, required_assets
+from models.assets import AssetManifest, AssetStore
+
+class TestAssetPreloader(unittest.TestCase):
+
+    def setUp(self):
+        """Create an assets directory with a background and a two-frame GIF."""
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        os.makedirs(os.path.join(root, "backgrounds"))
+        os.makedirs(os.path.join(root, "gifs"))
+        self.bg = os.path.join(root, "backgrounds", "bg.png")
+        Image.new("RGB", (8, 6), (255, 0, 0)).save(self.bg)
+        frames = [Image.new("RGB", (10, 4), color) for color in ((0, 0, 0), (255, 255, 255))]
+        self.gif = os.path.join(root, "gifs", "1.1.gif")
+        frames[0].save(self.gif, save_all=True, append_images=frames[1:], duration=70, loop=0)
+        self.manifest = AssetManifest(root)
+        self.manifest.scan()
+        self.store = AssetStore()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_preload_stores_images_and_gif_info(self):
+        """Test that required images are decoded and every GIF's metadata is read."""
+        preloader = AssetPreloader(self.manifest, [self.bg], store=self.store, workers=2)
+        preloader.wait()
+        self.assertEqual(preloader.progress, 1.0)
+        self.assertEqual(preloader.total, 2)
+        self.assertIn(self.bg.replace(os.sep, "/"), self.store.images)
+        info = self.store.gif_info[self.gif.replace(os.sep, "/")]
+        self.assertEqual(info["size"], (10, 4))
+        self.assertEqual(info["duration"], 70)
+
+    def test_missing_required_asset_reported_at_start(self):
+        """Test that a missing required asset is known before it is first used."""
+        missing = os.path.join(self.tmp.name, "backgrounds", "gone.png").replace(os.sep, "/")
+        preloader = AssetPreloader(self.manifest, [missing], store=self.store)
+        preloader.start()
+        self.assertIn(missing, self.store.missing)
+        self.assertEqual(preloader.total, 1)
+
+    def test_required_assets_follow_the_config(self):
+        """Test that the configured background and music are required."""
+        paths = required_assets({"bg_img": "bg.png", "music": "theme.mp3"})
+        self.assertIn("assets/backgrounds/bg.png", paths)
+        self.assertIn("assets/backgrounds/theme.mp3", paths)
+        self.assertEqual(len(required_assets({"bg_img": "None", "music": ""})), 1)
+
+class TestLoadingController(unittest.TestCase):
+
+    def test_switches_to_menu_when_done(self):
+        """Test that the loading screen leaves once the preload has finished."""
+        preloader = Mock(started=False, progress=1.0, done=0, total=0)
+        preloader.step.return_value = True
+        state_manager = Mock()
+        controller = LoadingController(Mock(), preloader, state_manager)
+        controller.on_enter()
+        preloader.start.assert_called_once_with()
+        controller.update(0.016)
+        state_manager.set_state.assert_called_once_with("menu")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
+import threading
 import unittest
 import pygame
 from unittest.mock import Mock, patch
 
 from controllers.config_controller import ConfigController, InputHandler, ConfigSaver
+from models.job_scheduler import JobScheduler
 
 class TestInputHandler(unittest.TestCase):
 
@@ -30,14 +32,100 @@ class TestConfigController(unittest.TestCase):
         self.view.color_picker = Mock(selected_color=(0, 0, 0))
         self.view.answer_inputs = [Mock(get_value=Mock(return_value=2)), Mock(get_value=Mock(return_value=3))]
         self.config_manager = Mock()
+        self.config_manager.config_data.return_value = {"prompt": "prompt"}
         self.state_manager = Mock()
         self.controller = ConfigController(self.view, self.config_manager, self.state_manager)
 
     def test_handle_event_save(self):
         self.controller.input_handler.done = True
         self.controller.handle_event(Mock())
-        self.config_manager.generate_ai_answers.assert_called_once_with("prompt")
-        self.config_manager.save_config.assert_called_once_with("prompt", "music.mp3", "bg.png", (0, 0, 0), [2, 3])
+        self.config_manager.request_ai_answers.assert_called_once_with("prompt")
+        self.config_manager.apply_answers.assert_called_once_with(self.config_manager.request_ai_answers.return_value)
+        self.config_manager.config_data.assert_called_once_with("prompt", "music.mp3", "bg.png", (0, 0, 0), [2, 3])
+        self.config_manager.apply_config.assert_called_once_with({"prompt": "prompt"})
+        self.config_manager.write_config.assert_called_once_with({"prompt": "prompt"})
+
+    def test_save_changes_config_on_main_thread(self):
+        jobs = JobScheduler(workers=1)
+        threads = {}
+        self.config_manager.request_ai_answers.side_effect = \
+            lambda prompt: threads.setdefault("request", threading.current_thread())
+        self.config_manager.apply_answers.side_effect = \
+            lambda questions: threads.setdefault("apply", threading.current_thread())
+        self.config_manager.apply_config.side_effect = \
+            lambda data: threads.setdefault("apply_config", threading.current_thread())
+        self.config_manager.write_config.side_effect = \
+            lambda data: threads.setdefault("write", threading.current_thread())
+        controller = ConfigController(self.view, self.config_manager, self.state_manager, jobs)
+        controller.save()
+        jobs.wait()
+        self.assertTrue(controller.saving)
+        jobs.wait()
+        jobs.shutdown()
+        self.assertFalse(controller.saving)
+        self.assertIsNot(threads["request"], threading.current_thread())
+        self.assertIs(threads["apply"], threading.current_thread())
+        self.assertIs(threads["apply_config"], threading.current_thread())
+        self.assertIsNot(threads["write"], threading.current_thread())
+
+    def test_save_waits_for_background_job(self):
+        jobs = JobScheduler(workers=1)
+        gate = threading.Event()
+        self.config_manager.request_ai_answers.side_effect = lambda prompt: gate.wait(5)
+        controller = ConfigController(self.view, self.config_manager, self.state_manager, jobs)
+        controller.input_handler.done = True
+        controller.handle_event(Mock())
+        self.assertTrue(controller.saving)
+        controller.update(0.1)
+        self.state_manager.set_state.assert_not_called()
+        gate.set()
+        jobs.wait()
+        self.assertTrue(controller.saving)
+        jobs.wait()
+        self.view.set_saving.assert_called_with(False)
+        controller.update(0.1)
+        self.state_manager.set_state.assert_called_once_with('menu')
+        jobs.shutdown()
+
+    def test_failed_save_stays_on_screen(self):
+        self.config_manager.request_ai_answers.side_effect = RuntimeError("offline")
+        self.controller.input_handler.done = True
+        self.controller.handle_event(Mock())
+        self.controller.update(0.1)
+        self.state_manager.set_state.assert_not_called()
+        self.config_manager.apply_config.assert_not_called()
+        self.config_manager.write_config.assert_not_called()
+
+    def test_save_switches_to_stored_universe_without_generating(self):
+        library = Mock()
+        library.load.return_value = {"prompt": "Prompt", "questions": [{"answers": ["A"]}]}
+        data = {"prompt": "Prompt", "questions": [{"answers": ["A"]}]}
+        self.config_manager.config_data.return_value = data
+        controller = ConfigController(self.view, self.config_manager, self.state_manager, library=library)
+        controller.input_handler.done = True
+        controller.handle_event(Mock())
+        self.config_manager.request_ai_answers.assert_not_called()
+        self.config_manager.apply_answers.assert_called_once_with([{"answers": ["A"]}])
+        library.save.assert_called_once_with(data)
+        self.assertIsNot(library.save.call_args.args[0], data)
+
+    def test_save_generates_and_stores_new_universe(self):
+        library = Mock()
+        library.load.return_value = None
+        saver = ConfigSaver(self.config_manager, library)
+        saver.save("prompt", "music.mp3", "bg.png", (0, 0, 0), [2, 3])
+        self.config_manager.request_ai_answers.assert_called_once_with("prompt")
+        library.save.assert_called_once_with({"prompt": "prompt"})
+
+    def test_update_searches_library_when_prompt_changes(self):
+        library = Mock()
+        library.search.return_value = ["Star Wars"]
+        self.view.prompt_box.text = "star"
+        controller = ConfigController(self.view, self.config_manager, self.state_manager, library=library)
+        controller.update(0.1)
+        controller.update(0.1)
+        library.search.assert_called_once_with("star")
+        self.view.prompt_preview.set_matches.assert_called_once_with(["Star Wars"])
 
     def test_handle_event_back(self):
         self.controller.input_handler.go_back = True
@@ -0,0 +1,67 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from controllers.config_reloader import ConfigReloader
+from models.assets import AssetManifest, AssetStore
+from models.job_scheduler import JobScheduler
+
+class TestConfigReloader(unittest.TestCase):
+
+    def setUp(self):
+        self.config_manager = Mock()
+        self.config_manager.config = {"bg_img": "a.png", "bg_color": [0, 0, 0], "questions": [{"answers": ["A"]}]}
+        self.reloader = ConfigReloader(self.config_manager, JobScheduler(workers=0))
+
+    def test_only_handlers_of_changed_keys_run(self):
+        """Test that handlers are called once, and only for the keys they depend on."""
+        background, wheels = Mock(), Mock()
+        self.reloader.on(("bg_img", "bg_color"), background)
+        self.reloader.on(("questions",), wheels)
+        self.reloader.apply({"bg_img": "b.png", "bg_color": [1, 1, 1], "questions": [{"answers": ["A"]}]})
+        background.assert_called_once_with({"bg_img": True, "bg_color": True})
+        wheels.assert_not_called()
+
+    def test_reload_after_a_save_notifies_handlers(self):
+        """Test that a file saved from the config screen, already applied to the live config, still notifies."""
+        handler = Mock()
+        self.reloader.on(("questions",), handler)
+        saved = {"bg_img": "a.png", "bg_color": [0, 0, 0], "questions": [{"answers": ["B"]}, {"answers": ["C"]}]}
+        self.config_manager.config = saved
+        self.reloader.apply(saved)
+        handler.assert_called_once_with({"questions": [0, 1]})
+        self.reloader.apply(saved)
+        handler.assert_called_once()
+
+    def test_invalid_file_keeps_configuration(self):
+        """Test that an unreadable config file leaves the configuration alone."""
+        handler = Mock()
+        self.reloader.on(("bg_img",), handler)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text("{not json", encoding="utf-8")
+            self.reloader.config_file_changed(path)
+        self.config_manager.apply_config.assert_not_called()
+        handler.assert_not_called()
+
+    def test_changed_assets_are_evicted(self):
+        """Test that a rescan reports new files and clears their missing report."""
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = AssetManifest(tmp)
+            manifest.scan()
+            store = AssetStore()
+            store.use_manifest(manifest)
+            path = (Path(tmp) / "bg.png").as_posix()
+            self.assertFalse(store.exists(path))
+            (Path(tmp) / "bg.png").write_bytes(b"png")
+            reloader = ConfigReloader(self.config_manager, JobScheduler(workers=0), manifest, store)
+            handler = Mock()
+            reloader.on_assets(handler)
+            reloader.assets_changed(Path(tmp))
+            handler.assert_called_once_with({path})
+            self.assertTrue(store.exists(path))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import Mock, patch
+import pygame
+
+from controllers.config_controller import InputHandler
+from controllers.event_router import EventRouter, allow_events
+from views.config_view import ModernInputBox
+
+class TestEventRouter(unittest.TestCase):
+
+    def setUp(self):
+        self.layout = Mock(return_value=[(pygame.Rect(0, 0, 100, 40), "a"), (pygame.Rect(150, 150, 20, 20), "b")])
+        self.router = EventRouter(self.layout, cell_size=64)
+
+    def test_dispatch_returns_first_handler_result(self):
+        self.router.on(pygame.KEYDOWN, Mock(return_value=None))
+        self.router.on(pygame.KEYDOWN, Mock(return_value="menu"))
+        self.assertEqual(self.router.dispatch(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)), "menu")
+        self.assertIsNone(self.router.dispatch(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0))))
+        self.assertEqual(self.router.event_types, {pygame.KEYDOWN})
+
+    def test_hit_index_is_built_once(self):
+        self.assertEqual(self.router.hit((99, 39)), "a")
+        self.assertEqual(self.router.hit((160, 160)), "b")
+        self.assertIsNone(self.router.hit((120, 120)))
+        self.assertEqual(self.layout.call_count, 1)
+
+    def test_unsupported_rects_are_skipped(self):
+        router = EventRouter(lambda: [((0, 0, 10, 10), "tuple"), (pygame.Rect(0, 0, 10, 10), "rect")])
+        self.assertEqual(router.hit((5, 5)), "rect")
+        self.assertEqual(len(router.targets), 1)
+
+    @patch('pygame.event.set_allowed')
+    @patch('pygame.event.set_blocked')
+    def test_allow_events_blocks_everything_else(self, set_blocked, set_allowed):
+        self.router.on(pygame.MOUSEBUTTONDOWN, Mock())
+        allowed = allow_events(self.router, extra=(pygame.QUIT,))
+        self.assertEqual(allowed, {pygame.QUIT, pygame.MOUSEBUTTONDOWN})
+        set_blocked.assert_called_once_with(None)
+        set_allowed.assert_called_once_with(sorted(allowed))
+
+class TestInputHandlerRouting(unittest.TestCase):
+
+    def setUp(self):
+        self.view = Mock()
+        self.view.save_button = {"rect": pygame.Rect(0, 700, 100, 50)}
+        self.view.back_button = {"rect": pygame.Rect(200, 700, 100, 50)}
+        self.view.prompt_box = ModernInputBox(0, 0, 200, 40, "Star")
+        self.view.music_box = ModernInputBox(0, 100, 200, 40, "music.mp3")
+        self.view.bg_box = ModernInputBox(0, 200, 200, 40, "bg.png")
+        self.view.answer_inputs = [ModernInputBox(300, 0, 50, 30, "5", numeric=True)]
+        self.view.color_picker = Mock(rects=[])
+        self.handler = InputHandler(self.view)
+
+    def click(self, pos):
+        self.handler.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+
+    def test_keys_go_to_the_focused_box_only(self):
+        self.click((10, 10))
+        self.handler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_s, unicode='s'))
+        self.assertEqual(self.view.prompt_box.text, "Stars")
+        self.assertEqual(self.view.music_box.text, "music.mp3")
+        self.click((310, 10))
+        self.assertFalse(self.view.prompt_box.active)
+        self.assertTrue(self.view.answer_inputs[0].active)
+
+    def test_button_clicks_set_flags_and_drop_focus(self):
+        self.click((10, 10))
+        self.click((210, 710))
+        self.assertTrue(self.handler.go_back)
+        self.assertFalse(self.view.prompt_box.active)
+        self.assertIsNone(self.handler.focused)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 import pygame
 
 from controllers.config_controller import InputHandler, ConfigSaver, ConfigController
+from controllers.game_controller import GameController
+from models.logger import GameState, GameStateTracker
 from utils import handle_button_click
 
 class DummyEvent:
@@ -57,10 +59,11 @@ class TestConfigSaver(unittest.TestCase):
         bg_color = (255, 255, 255)
         answer_counts = [1, 2, 3]
         self.saver.save(prompt, music, bg_img, bg_color, answer_counts)
-        self.config_manager.generate_ai_answers.assert_called_once_with(prompt)
-        self.config_manager.save_config.assert_called_once_with(
+        self.config_manager.request_ai_answers.assert_called_once_with(prompt)
+        self.config_manager.config_data.assert_called_once_with(
             prompt, music, bg_img, bg_color, answer_counts
         )
+        self.config_manager.write_config.assert_called_once()
 
 class TestConfigController(unittest.TestCase):
     def setUp(self):
@@ -101,8 +104,8 @@ class TestConfigController(unittest.TestCase):
         # Handle event triggers save
         self.controller.handle_event(event)
         # Check save was called on saver
-        self.config_manager.generate_ai_answers.assert_called_once_with("Prompt")
-        self.config_manager.save_config.assert_called_once_with(
+        self.config_manager.request_ai_answers.assert_called_once_with("Prompt")
+        self.config_manager.config_data.assert_called_once_with(
             "Prompt", "song.mp3", "bg.png", (0, 0, 0), [5, 10]
         )
         # State change on update
@@ -117,5 +120,39 @@ class TestConfigController(unittest.TestCase):
         self.controller.update(dt=0)
         self.state_manager.set_state.assert_called_with('menu')
 
+class TestGameController(unittest.TestCase):
+    def setUp(self):
+        self.config = {"prompt": "Test", "questions": [
+            {"text": "Q1", "num_answers": 2, "answers": ["A", "B"]},
+            {"text": "Q2", "num_answers": 2, "answers": ["C", "D"]},
+        ]}
+        self.game = GameController(GameStateTracker(2), MagicMock(), MagicMock(config=self.config), sound=False)
+
+    def test_config_changed_follows_question_count(self):
+        self.config["questions"].append({"text": "Q3", "num_answers": 2, "answers": ["E", "F"]})
+        self.game.config_changed({"questions": [2]})
+        self.assertEqual(self.game.game_state.total_draws, 3)
+
+    def test_played_session_is_appended_to_history(self):
+        history = MagicMock()
+        game = GameController(GameStateTracker(2), MagicMock(), MagicMock(config=self.config), sound=False,
+                              history=history)
+        game.responses = {"1": {"1/10": ["r1"]}, "2": {"2/10": ["r2a", "r2b"]}}
+        game.media_loader.decode_gif = MagicMock(return_value=None)
+        game.next_draw()
+        for _ in range(1000):
+            if game.game_state.state == GameState.RESULTS:
+                break
+            game.update(0.1)
+            game.jobs.pump()
+        self.assertEqual(game.game_state.state, GameState.RESULTS)
+        history.append.assert_called_once_with("Test", ANY, duration=ANY)
+        draws = history.append.call_args.args[1]
+        self.assertEqual([draw[0] for draw in draws],
+                         [answers.index(result) for answers, result in zip((["A", "B"], ["C", "D"]),
+                                                                           game.game_state.results)])
+        self.assertEqual(draws[1][2], game.responses["2"]["2/10"].index(game.game_state.result_responses[1]))
+        self.assertTrue(all(draw[3] > 0 for draw in draws))
+
 if __name__ == '__main__':
     unittest.main()
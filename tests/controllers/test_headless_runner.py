@@ -0,0 +1,85 @@
+import json
+import os
+import tempfile
+import unittest
+
+from controllers.headless_runner import HeadlessGame, run_batch
+from models.gif_index import GifIndex
+from models.session_history import SessionHistory, load_history
+
+CONFIG = {
+    "prompt": "Test",
+    "questions": [
+        {"text": "Q1", "num_answers": 2, "answers": ["A", "B", "C"]},
+        {"text": "Q2", "num_answers": 3, "answers": ["D", "E", "F"]},
+    ]
+}
+RESPONSES = {
+    "1": {"1/10": ["r1a", "r1b"]},
+    "2": {"2/10": ["r2a"]},
+}
+
+class TestHeadlessGame(unittest.TestCase):
+
+    def setUp(self):
+        """Prepare a HeadlessGame with a two-question config."""
+        self.game = HeadlessGame(CONFIG, RESPONSES)
+
+    def test_play_records_every_draw(self):
+        """Test that a session contains one draw per question."""
+        record = self.game.play(7)
+        self.assertEqual(record["seed"], 7)
+        self.assertEqual(len(record["draws"]), 2)
+        self.assertIn(record["draws"][0]["result"], ["A", "B"])
+        self.assertIn(record["draws"][1]["result"], ["D", "E", "F"])
+        self.assertEqual(record["draws"][1]["response"], "r2a")
+
+    def test_play_is_deterministic(self):
+        """Test that the same seed replays the same session."""
+        self.assertEqual(self.game.play(42), self.game.play(42))
+
+    def test_gif_id_matches_segment(self):
+        """Test that the GIF id starts with the one-based segment index."""
+        draw = self.game.play(3)["draws"][0]
+        self.assertEqual(draw["gif"].split('.')[0], str(draw["segment"] + 1))
+
+    def test_gifs_come_from_the_index(self):
+        """Test that only indexed GIFs are listed, and segments without one get None."""
+        with tempfile.TemporaryDirectory() as tmp:
+            open(os.path.join(tmp, "1.2.gif"), "w").close()
+            index = GifIndex(tmp)
+            index.scan()
+            game = HeadlessGame(CONFIG, RESPONSES, index)
+            draws = [draw for seed in range(20) for draw in game.play(seed)["draws"]]
+        self.assertEqual({draw["gif"] for draw in draws if draw["segment"] == 0}, {"1.2"})
+        self.assertEqual({draw["gif"] for draw in draws if draw["segment"] != 0}, {None})
+
+class TestRunBatch(unittest.TestCase):
+
+    def test_run_batch_writes_json_lines(self):
+        """Test that every session is streamed to the output file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.jsonl")
+            report = run_batch(CONFIG, 10, path, workers=2, responses=RESPONSES, gif_dir=tmp)
+            with open(path, encoding='utf-8') as f:
+                seeds = sorted(json.loads(line)["seed"] for line in f)
+        self.assertEqual(seeds, list(range(10)))
+        self.assertEqual(report["sessions"], 10)
+        self.assertGreater(report["sessions_per_second_per_core"], 0)
+
+    def test_run_batch_appends_to_history(self):
+        """Test that sessions also land in the session history with their seeds and draws."""
+        with tempfile.TemporaryDirectory() as tmp:
+            history = SessionHistory(os.path.join(tmp, "history"))
+            run_batch(CONFIG, 5, os.path.join(tmp, "out.jsonl"), workers=1, responses=RESPONSES, history=history,
+                      gif_dir=tmp)
+            history.close()
+            records, universes = load_history(os.path.join(tmp, "history"))
+        self.assertEqual(universes, ["Test"])
+        self.assertEqual(sorted(records["seed"].tolist()), list(range(5)))
+        self.assertTrue((records["draws"] == 2).all())
+        self.assertEqual(records["segment"][records["seed"] == 3][0][:2].tolist(),
+                         [draw["segment"] for draw in HeadlessGame(CONFIG, RESPONSES, GifIndex(tmp)).play(3)["draws"]])
+
+if __name__ == "__main__":
+    unittest.main()
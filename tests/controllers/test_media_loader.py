@@ -30,6 +30,17 @@ class TestMediaLoader(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(len(self.loader.gif_frames), 0)
 
+    @patch('pathlib.Path.exists')
+    def test_indexed_load_skips_stat(self, mock_exists):
+        """Test that a GIF missing from the index is skipped without touching the disk."""
+        index = Mock()
+        index.path.return_value = None
+        loader = MediaLoader(index)
+        self.assertFalse(loader.load_gif("3.2"))
+        self.assertFalse(loader.load_gif(None))
+        index.path.assert_called_once_with("3.2")
+        mock_exists.assert_not_called()
+
     def test_update(self):
         """Test updating the frame timer."""
         self.loader.gif_frames = [Mock(), Mock()]
@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from controllers.game_controller import GameController
+from controllers.session_snapshot import SessionSnapshotter
+from models.logger import GameState, GameStateTracker
+from models.snapshot import SnapshotStore
+
+CONFIG = {
+    "prompt": "Test",
+    "questions": [
+        {"text": "Q1", "num_answers": 2, "answers": ["A", "B", "C"]},
+        {"text": "Q2", "num_answers": 3, "answers": ["D", "E", "F"]},
+    ]
+}
+
+def make_app(path):
+    """Build a state manager stub with a real GameController and a snapshotter writing to path."""
+    config_manager = Mock(config=CONFIG)
+    game = GameController(GameStateTracker(2), Mock(), config_manager, sound=False)
+    state_manager = Mock(current_state="menu", controllers={"game": game})
+    state_manager.set_state.side_effect = lambda state: setattr(state_manager, "current_state", state)
+    return state_manager, SessionSnapshotter(state_manager, config_manager, SnapshotStore(path))
+
+class TestSessionSnapshotter(unittest.TestCase):
+
+    def setUp(self):
+        """Prepare a game spinning its second wheel."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = f"{self.tmp.name}/session.snap"
+        self.state_manager, self.snapshotter = make_app(self.path)
+        self.game = self.state_manager.controllers["game"]
+        self.state_manager.current_state = "game"
+        self.game.update(0.1)  # the first wheel starts spinning
+        self.game.wheel.finish_spin()
+        self.game.update(0.1)  # it lands and the GIF wait starts
+        self.game.game_state.wait_timer = 0
+        self.game.update(0.1)  # the second wheel starts spinning
+        self.game.update(0.5)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_snapshots_only_on_transitions(self):
+        self.snapshotter.store = Mock(wraps=self.snapshotter.store)
+        self.snapshotter.update()
+        self.snapshotter.update()
+        self.assertEqual(self.snapshotter.store.save.call_count, 1)
+        self.game.wheel.finish_spin()
+        self.game.update(0.1)
+        self.snapshotter.update()
+        self.assertEqual(self.snapshotter.store.save.call_count, 2)
+
+    def test_resume_continues_the_spin(self):
+        self.snapshotter.update()
+        state_manager, snapshotter = make_app(self.path)
+        self.assertTrue(snapshotter.resume())
+        game = state_manager.controllers["game"]
+        self.assertEqual(state_manager.current_state, "game")
+        self.assertEqual(game.game_state.state, GameState.SPINNING)
+        self.assertEqual(game.game_state.current_draw, 1)
+        self.assertEqual(game.game_state.results, self.game.game_state.results)
+        self.assertEqual(game.wheel.segments, ["D", "E", "F"])
+        self.assertEqual(game.wheel.motion, self.game.wheel.motion)
+        self.assertEqual(game.session_draws, self.game.session_draws)
+
+    def test_no_resume_outside_a_game_or_after_config_change(self):
+        self.state_manager.current_state = "menu"
+        self.snapshotter.update()
+        state_manager, snapshotter = make_app(self.path)
+        self.assertFalse(snapshotter.resume())
+        self.state_manager.current_state = "game"
+        self.snapshotter.update()
+        state_manager, snapshotter = make_app(self.path)
+        snapshotter.config_manager = Mock(config=dict(CONFIG, prompt="Other"))
+        self.assertFalse(snapshotter.resume())
+        state_manager.set_state.assert_not_called()
+
+    def test_no_resume_of_a_finished_game(self):
+        self.game.wheel.finish_spin()
+        self.game.update(0.1)
+        self.game.game_state.wait_timer = 0
+        self.game.update(0.1)
+        self.assertEqual(self.game.game_state.state, GameState.RESULTS)
+        self.snapshotter.update()
+        state_manager, snapshotter = make_app(self.path)
+        self.assertFalse(snapshotter.resume())
+        state_manager.set_state.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
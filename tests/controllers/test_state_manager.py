@@ -28,14 +28,54 @@ class TestStateManager(unittest.TestCase):
         self.manager.register_controller("game", controller)
         with patch.object(logging.Logger, 'info') as mock_logger:
             self.manager.set_state("game")
-            mock_logger.assert_called_with("Switching state from menu to game")
+            mock_logger.assert_called_with("Switching state from %s to %s", "menu", "game")
         self.assertEqual(self.manager.current_state, "game")
 
+    def test_set_state_calls_on_enter(self):
+        """Test that the new state's controller is told it was entered."""
+        controller = Mock()
+        self.manager.register_controller("game", controller)
+        self.manager.set_state("game")
+        controller.on_enter.assert_called_once_with()
+
+    def test_set_state_calls_on_exit_before_switching(self):
+        """Test that the old state's controller is told it was left."""
+        menu, game = Mock(), Mock()
+        menu.on_exit.side_effect = lambda: self.assertEqual(self.manager.current_state, "menu")
+        self.manager.register_controller("menu", menu)
+        self.manager.register_controller("game", game)
+        self.manager.set_state("game")
+        menu.on_exit.assert_called_once_with()
+        self.assertEqual(self.manager.resources.active, "game")
+
+    def test_suspend_and_resume(self):
+        """Test that suspending deactivates every state until resumed, once each."""
+        controller = Mock()
+        self.manager.register_controller("menu", controller)
+        self.manager.suspend()
+        self.manager.suspend()
+        self.assertIsNone(self.manager.resources.active)
+        controller.on_suspend.assert_called_once_with()
+        self.manager.resume()
+        self.assertEqual(self.manager.resources.active, "menu")
+        controller.on_resume.assert_called_once_with()
+
+    def test_update_preloads_predicted_state_once(self):
+        """Test that a predicted transition preloads that state's resources once."""
+        menu = Mock()
+        menu.predicted_state = "game"
+        self.manager.register_controller("menu", menu)
+        self.manager.register_controller("game", Mock())
+        with patch.object(self.manager.resources, "preload") as preload:
+            self.manager.update(0.1)
+            self.manager.update(0.1)
+        preload.assert_called_once_with("game")
+
     def test_set_state_failure(self):
         """Test switching to an unregistered state."""
         with patch.object(logging.Logger, 'warning') as mock_logger:
             self.manager.set_state("unregistered")
-            mock_logger.assert_called_with("State unregistered not registered")
+            mock_logger.assert_called_with("State %s not registered", "unregistered")
         self.assertEqual(self.manager.current_state, "menu")
 
     def test_update(self):
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from controllers.video_renderer import OffscreenSession, render_session
+
+CONFIG = {
+    "prompt": "Test",
+    "questions": [{"text": "Q1", "num_answers": 2, "answers": ["A", "B"]}]
+}
+RESPONSES = {"1": {"1/10": ["r1"]}}
+
+class TestOffscreenSession(unittest.TestCase):
+
+    def setUp(self):
+        """Prepare an OffscreenSession with a mocked view and a real offscreen screen."""
+        patcher = patch('controllers.video_renderer.GameView')
+        self.view_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        with patch('pygame.display.set_mode', return_value=pygame.Surface((8, 8))):
+            self.session = OffscreenSession(CONFIG, RESPONSES, fps=4)
+        self.session.media_loader.load_gif = lambda result: False
+
+    def test_frames_cover_spin_wait_and_results(self):
+        """Test that every phase of the session is rendered at the virtual frame rate."""
+        frames = list(self.session.frames(1))
+        view = self.view_cls.return_value
+        self.assertEqual(view.render_waiting.call_count, 6)
+        self.assertEqual(view.render_results.call_count, 16)
+        self.assertEqual(len(frames), view.render_spinning.call_count + 22)
+
+    def test_frames_are_deterministic(self):
+        """Test that the same seed yields the same number of frames."""
+        self.assertEqual(len(list(self.session.frames(5))), len(list(self.session.frames(5))))
+
+class TestRenderSession(unittest.TestCase):
+
+    @patch('controllers.video_renderer.WIDTH', 8)
+    @patch('controllers.video_renderer.HEIGHT', 8)
+    @patch('controllers.video_renderer.GameView')
+    def test_render_session_writes_video(self, mock_view):
+        """Test that frames reach the encoder process and a file is written."""
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch('pygame.display.set_mode', return_value=pygame.Surface((8, 8))), \
+                patch('controllers.media_loader.MediaLoader.load_gif', return_value=False):
+            path = os.path.join(tmp, "session.gif")
+            report = render_session(CONFIG, 1, path, fps=4, responses=RESPONSES)
+            self.assertTrue(os.path.getsize(path) > 0)
+        self.assertGreater(report["frames"], 0)
+        self.assertEqual(report["video_seconds"], report["frames"] / 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from controllers.wheel_deck import WheelDeck
+from models.job_scheduler import JobScheduler
+
+QUESTIONS = [{"text": f"Q{i}", "num_answers": 3, "answers": ["A", "B", "C", "D"]} for i in range(6)]
+
+class GatedDeck(WheelDeck):
+    """WheelDeck whose first build waits for a gate, recording the build order."""
+
+    def __init__(self, *args, **kwargs):
+        self.gate = threading.Event()
+        self.order = []
+        super().__init__(*args, **kwargs)
+
+    def _build(self, draw):
+        self.order.append(draw)
+        if len(self.order) == 1:
+            self.gate.wait(5)
+        return super()._build(draw)
+
+class TestWheelDeck(unittest.TestCase):
+
+    def test_builds_every_question(self):
+        """Test that the deck builds one wheel per question in the background."""
+        deck = WheelDeck(QUESTIONS)
+        self.assertTrue(deck.wait(5))
+        self.assertEqual(deck.progress, 1.0)
+        self.assertTrue(all(deck.ready(i) for i in range(len(QUESTIONS))))
+        self.assertEqual(deck.wheel(2).segments, ["A", "B", "C"])
+
+    def test_requested_wheel_jumps_the_queue(self):
+        """Test that asking for a wheel that is not built yet builds it next."""
+        deck = GatedDeck(QUESTIONS)
+        waiter = threading.Thread(target=deck.card, args=(4,))
+        waiter.start()
+        while deck._priority != 4:
+            time.sleep(0.001)
+        deck.gate.set()
+        waiter.join(5)
+        deck.wait(5)
+        self.assertEqual(deck.order[:2], [0, 4])
+
+    def test_images_are_painted_on_the_main_thread(self):
+        """Test that the deck thread only lays wheels out and the scheduler's pump paints them."""
+        renderer = MagicMock()
+        painted_on = []
+        renderer.base_image.side_effect = lambda wheel, layout: painted_on.append(threading.current_thread())
+        jobs = JobScheduler(workers=0)
+        deck = WheelDeck(QUESTIONS[:3], renderer, jobs=jobs)
+        self.assertTrue(deck.wait(5))
+        self.assertEqual(renderer.layout.call_count, 3)
+        renderer.base_image.assert_not_called()
+        jobs.wait()
+        self.assertEqual(painted_on, [threading.main_thread()] * 3)
+        renderer.base_image.assert_called_with(deck.cards[2].wheel, deck.cards[2].layout)
+
+    def test_rebuild_replaces_only_edited_wheels(self):
+        """Test that editing a question rebuilds its wheel and keeps the others."""
+        deck = WheelDeck(QUESTIONS)
+        deck.wait(5)
+        before = list(deck.cards)
+        questions = [dict(q) for q in QUESTIONS]
+        questions[2] = {"text": "Q2", "num_answers": 2, "answers": ["X", "Y"]}
+        deck.rebuild([2, 99], questions)
+        self.assertTrue(deck.wait(5))
+        self.assertEqual(deck.wheel(2).segments, ["X", "Y"])
+        self.assertEqual(deck.questions, questions)
+        self.assertEqual([i for i, card in enumerate(deck.cards) if card is not before[i]], [2])
+
+    def test_build_error_reaches_the_caller(self):
+        """Test that an invalid question raises where its wheel is requested."""
+        questions = [{"text": "Q", "num_answers": 2, "answers": ["A", "B"], "weights": [0, 0]}]
+        deck = WheelDeck(questions)
+        with self.assertRaises(ValueError):
+            deck.card(0)
+
+    def test_cancelled_deck_still_answers(self):
+        """Test that a cancelled deck builds missing wheels on request."""
+        deck = GatedDeck(QUESTIONS)
+        deck.cancel()
+        deck.gate.set()
+        deck.wait(5)
+        self.assertEqual(deck.wheel(5).segments, ["A", "B", "C"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import logging
+
+import pygame
+import pytest
+
+from models.assets import AssetManifest, AssetStore, asset_type
+
+@pytest.fixture
+def assets_dir(tmp_path):
+    (tmp_path / "backgrounds").mkdir()
+    (tmp_path / "sfx").mkdir()
+    (tmp_path / "backgrounds" / "bg.png").write_bytes(b"png data")
+    (tmp_path / "backgrounds" / "theme.mp3").write_bytes(b"music")
+    (tmp_path / "sfx" / "spin.mp3").write_bytes(b"sound")
+    (tmp_path / "notes.txt").write_text("not an asset")
+    return tmp_path
+
+def test_asset_type_by_extension_and_directory():
+    assert asset_type("backgrounds/bg.PNG") == "image"
+    assert asset_type("gifs/1.1.gif") == "gif"
+    assert asset_type("sfx/spin.mp3") == "sound"
+    assert asset_type("backgrounds/theme.mp3") == "music"
+    assert asset_type("readme.md") is None
+
+def test_scan_records_types_sizes_and_hashes(assets_dir):
+    manifest = AssetManifest(assets_dir)
+    assert manifest.scan()
+    assert set(manifest.entries) == {"backgrounds/bg.png", "backgrounds/theme.mp3", "sfx/spin.mp3"}
+    entry = manifest.entries["backgrounds/bg.png"]
+    assert entry["type"] == "image" and entry["size"] == 8 and len(entry["sha1"]) == 40
+    assert assets_dir / "sfx" / "spin.mp3" in manifest
+    assert manifest.of_type("sound") == [(assets_dir / "sfx" / "spin.mp3").as_posix()]
+
+def test_rescan_rehashes_only_changed_files(assets_dir, mocker):
+    manifest = AssetManifest(assets_dir)
+    manifest.scan()
+    file_hash = mocker.patch('models.assets.file_hash', return_value="new")
+    assert not manifest.scan()
+    file_hash.assert_not_called()
+    path = assets_dir / "sfx" / "spin.mp3"
+    path.write_bytes(b"longer sound")
+    assert manifest.scan()
+    file_hash.assert_called_once_with(path)
+
+def test_manifest_round_trip(assets_dir, tmp_path):
+    manifest = AssetManifest(assets_dir)
+    manifest.scan()
+    manifest.save(tmp_path / "manifest.json")
+    loaded = AssetManifest.load(tmp_path / "manifest.json", assets_dir)
+    assert loaded.entries == manifest.entries
+    assert AssetManifest.load(tmp_path / "absent.json", assets_dir).entries == {}
+
+def test_missing_asset_reported_once(assets_dir, caplog):
+    manifest = AssetManifest(assets_dir)
+    manifest.scan()
+    store = AssetStore()
+    store.use_manifest(manifest)
+    missing = (assets_dir / "backgrounds" / "gone.png").as_posix()
+    with caplog.at_level(logging.WARNING, logger="models.assets"):
+        for _ in range(3):
+            assert store.image(missing) is None
+    assert [r.getMessage() for r in caplog.records] == [f"Asset missing: {missing}"]
+
+def test_image_loaded_once(assets_dir):
+    manifest = AssetManifest(assets_dir)
+    manifest.scan()
+    store = AssetStore()
+    store.use_manifest(manifest)
+    path = (assets_dir / "backgrounds" / "bg.png").as_posix()
+    first = store.image(path)
+    assert store.image(path) is first
+    pygame.image.load.assert_called_once_with(path)
+
+def test_images_are_presized_for_the_render_scale(assets_dir):
+    manifest = AssetManifest(assets_dir)
+    manifest.scan()
+    store = AssetStore(image_scale=0.5)
+    store.use_manifest(manifest)
+    pygame.image.load.return_value = pygame.Surface((1200, 800))
+    assert store.image((assets_dir / "backgrounds" / "bg.png").as_posix()).get_size() == (600, 400)
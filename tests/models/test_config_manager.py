@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import mock_open, patch
-from models.config_manager import ConfigManager
+from models.config_manager import ConfigManager, diff_config
 import json
 
 @pytest.fixture
@@ -29,4 +29,54 @@ def test_load_config_file_not_found(mocker, config_manager):
         "bg_color": [60, 30, 30],
         "prompt": "",
         "music": ""
-    }
\ No newline at end of file
+    }
+
+def test_diff_config_lists_touched_questions():
+    old = {"bg_img": "a.png", "music": "m.mp3", "questions": [{"answers": ["A"]}, {"answers": ["B"]}]}
+    new = {"bg_img": "b.png", "music": "m.mp3", "questions": [{"answers": ["A"]}, {"answers": ["C"]}, {}]}
+    assert diff_config(old, new) == {"bg_img": True, "questions": [1, 2]}
+    assert diff_config(old, old) == {}
+
+def test_apply_config_updates_in_place(config_manager):
+    held = config_manager.config
+    new = dict(held, bg_color=[1, 2, 3], extra=True)
+    assert config_manager.apply_config(new)["bg_color"] is True
+    assert held is config_manager.config and held["bg_color"] == [1, 2, 3]
+    with pytest.raises(ValueError):
+        config_manager.apply_config({"bg_color": [0, 0, 0]})
+    assert held["bg_color"] == [1, 2, 3]
+
+def test_apply_answers_takes_stored_answers_and_weights(config_manager):
+    config_manager.config = {"questions": [{"text": "Q1", "num_answers": 2, "answers": ["A"], "weights": [2.0]},
+                                           {"text": "Q2", "num_answers": 1, "answers": ["B"]}]}
+    config_manager.apply_answers([{"answers": ["C", "D"]}, {"answers": ["E"], "weights": [3.0]}])
+    assert config_manager.config["questions"] == [
+        {"text": "Q1", "num_answers": 2, "answers": ["C", "D"]},
+        {"text": "Q2", "num_answers": 1, "answers": ["E"], "weights": [3.0]},
+    ]
+
+def test_generated_answers_drop_old_weights(mocker, config_manager):
+    config_manager.config = {"questions": [{"text": "Q1", "num_answers": 3, "answers": ["A", "B"],
+                                            "weights": [1.0, 5.0]}]}
+    answers = mocker.Mock()
+    answers.model_dump.return_value = {"q1": None}
+    answers.q1 = ["C", "D", "E"]
+    mocker.patch('models.config_manager.get_ai_request', return_value=answers)
+    config_manager.generate_ai_answers("Star Wars")
+    assert config_manager.config["questions"] == [{"text": "Q1", "num_answers": 3, "answers": ["C", "D", "E"]}]
+
+def test_invalid_weights_are_dropped_when_applied(config_manager):
+    questions = [{"text": "Q1", "num_answers": 2, "answers": ["A", "B"], "weights": [1.0]},
+                 {"text": "Q2", "num_answers": 2, "answers": ["C", "D"], "weights": [-1, 2]},
+                 {"text": "Q3", "num_answers": 2, "answers": ["E", "F"], "weights": [0, 0]},
+                 {"text": "Q4", "num_answers": 2, "answers": ["G", "H"], "weights": [1, 3.5]}]
+    config_manager.apply_config({"prompt": "", "music": "", "bg_img": "None", "bg_color": [0, 0, 0],
+                                 "questions": questions})
+    assert ["weights" in question for question in config_manager.config["questions"]] == [False, False, False, True]
+
+def test_write_config_replaces_the_file_atomically(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text("{}", encoding='utf-8')
+    ConfigManager.write_config({"prompt": "Ząb"}, path)
+    assert json.loads(path.read_text(encoding='utf-8')) == {"prompt": "Ząb"}
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
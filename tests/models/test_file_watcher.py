@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+import models.file_watcher as file_watcher_module
+from models.file_watcher import FileWatcher
+from models.job_scheduler import JobScheduler
+
+@pytest.fixture(params=["inotify", "polling"])
+def backend(request, monkeypatch):
+    if request.param == "polling":
+        def unavailable(self):
+            raise OSError("disabled")
+        monkeypatch.setattr(file_watcher_module._Inotify, "__init__", unavailable)
+    return request.param
+
+def wait_for(jobs, seen, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not seen and time.monotonic() < deadline:
+        jobs.pump()
+        time.sleep(0.01)
+
+def test_reports_file_and_tree_changes(tmp_path, backend):
+    config = tmp_path / "config.json"
+    config.write_text("{}")
+    assets = tmp_path / "assets"
+    (assets / "sfx").mkdir(parents=True)
+    jobs = JobScheduler(workers=1)
+    watcher = FileWatcher()
+    seen = []
+    watcher.watch(config, seen.append)
+    watcher.watch(assets, seen.append)
+    watcher.start(jobs, interval=0.05)
+    try:
+        if watcher.backend != backend:
+            pytest.skip("inotify is not available here")
+        (tmp_path / "other.json").write_text("{}")
+        (assets / "sfx" / "spin.mp3").write_bytes(b"mp3")
+        wait_for(jobs, seen)
+        assert seen == [assets]
+        seen.clear()
+        config.write_text('{"a": 1}')
+        wait_for(jobs, seen)
+        assert seen == [config]
+    finally:
+        watcher.stop()
+        jobs.shutdown()
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from models.frame_profiler import FrameProfiler, PHASES
+
+@pytest.fixture
+def profiler():
+    profiler = FrameProfiler(capacity=4)
+    profiler.enable()
+    return profiler
+
+def test_disabled_profiler_records_nothing():
+    profiler = FrameProfiler(capacity=4)
+    with profiler.phase("update"):
+        pass
+    profiler.end_frame("game")
+    profiler.end_frame("game")
+    assert profiler.buffers == {}
+
+def test_nested_phases_are_exclusive(mocker, profiler):
+    clock = mocker.patch('models.frame_profiler.time.perf_counter')
+    clock.side_effect = [0.0, 1.0, 2.0, 5.0, 6.0, 10.0]
+    profiler.end_frame("game")
+    with profiler.phase("update"):
+        with profiler.phase("render"):
+            pass
+    profiler.end_frame("game")
+    frame = profiler.frames("game")[0]
+    assert frame[0] == 10.0
+    assert frame[1 + PHASES.index("update")] == 2.0
+    assert frame[1 + PHASES.index("render")] == 3.0
+
+def test_ring_buffer_keeps_latest_frames(mocker, profiler):
+    clock = mocker.patch('models.frame_profiler.time.perf_counter')
+    clock.side_effect = [0, 1, 3, 6, 10, 15, 21]
+    for _ in range(7):
+        profiler.end_frame("menu")
+    assert profiler.frames("menu")[:, 0].tolist() == [3, 4, 5, 6]
+
+def test_stats_and_dump(tmp_path, profiler):
+    for _ in range(3):
+        with profiler.phase("flip"):
+            pass
+        profiler.end_frame("config")
+    stats = profiler.stats("config")
+    assert stats["frames"] == 2
+    assert set(stats["phases"]) == set(PHASES)
+    assert profiler.stats("game") is None
+
+    profiler.dump(tmp_path / "profile.json")
+    data = json.loads((tmp_path / "profile.json").read_text())
+    assert len(data["config"]) == 2
+    profiler.dump(tmp_path / "profile.csv")
+    assert (tmp_path / "profile.csv").read_text().splitlines()[0] == "state,frame," + ",".join(PHASES)
@@ -0,0 +1,67 @@
+import os
+import random
+
+import pytest
+
+from models.gif_index import GifIndex
+from models.spin_wheel import SpinWheelModel
+
+def touch(directory, *names):
+    for name in names:
+        (directory / name).write_bytes(b"GIF89a")
+
+def test_scan_groups_variants_by_segment(tmp_path):
+    touch(tmp_path, "1.1.gif", "1.4.gif", "3.2.GIF", "notes.gif", "2.1.png")
+    index = GifIndex(tmp_path)
+    assert index.scan() == 3
+    assert index.variants(1) == (1, 4)
+    assert index.variants(2) == ()
+    assert "3.2" in index and "2.1" not in index
+    assert index.path("3.2") == tmp_path / "3.2.GIF"
+    assert index.path("2.1") is None
+
+def test_choose_only_draws_existing_variants(tmp_path):
+    touch(tmp_path, "1.2.gif", "1.5.gif")
+    index = GifIndex(tmp_path)
+    index.scan()
+    rng = random.Random(0)
+    assert {index.choose(1, rng) for _ in range(50)} == {"1.2", "1.5"}
+    assert index.choose(2, rng) is None
+
+def test_refresh_rescans_only_after_a_change(tmp_path):
+    index = GifIndex(tmp_path)
+    index.scan()
+    assert not index.refresh()
+    touch(tmp_path, "1.1.gif")
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert index.refresh()
+    assert index.variants(1) == (1,)
+
+def test_missing_directory_gives_an_empty_index(tmp_path):
+    index = GifIndex(tmp_path / "absent")
+    assert index.scan() == 0
+    assert index.choose(1, random.Random(0)) is None
+
+def test_wheel_picks_gif_from_index(tmp_path):
+    touch(tmp_path, "1.3.gif")
+    index = GifIndex(tmp_path)
+    index.scan()
+    wheel = SpinWheelModel(["A", "B"], rng=random.Random(0), sound=False, gif_index=index)
+    wheel.land(0)
+    assert wheel.get_selected_segment() == ("A", "1.3")
+    wheel.land(1)
+    assert wheel.get_selected_segment() == ("B", None)
+
+def test_rescan_swaps_in_a_new_snapshot(tmp_path):
+    touch(tmp_path, "1.1.gif")
+    index = GifIndex(tmp_path)
+    index.scan()
+    before = index.snapshot
+    touch(tmp_path, "2.1.gif")
+    index.scan()
+    assert index.snapshot is not before
+    assert dict(before.names) == {"1.1": "1.1.gif"}
+    assert index.snapshot.variants_by_segment == {1: (1,), 2: (1,)}
+    with pytest.raises(TypeError):
+        index.snapshot.names["3.1"] = "3.1.gif"
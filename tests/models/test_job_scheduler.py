@@ -0,0 +1,107 @@
+import threading
+
+from models.job_scheduler import JobScheduler, JobState
+
+def test_callbacks_run_on_pump_in_calling_thread():
+    scheduler = JobScheduler(workers=2)
+    results = []
+    job = scheduler.submit(lambda x: (x * 2, threading.current_thread().name), 21,
+                           on_done=lambda result: results.append((result, threading.current_thread().name)))
+    assert scheduler.wait([job], timeout=5)
+    scheduler.shutdown()
+    (value, worker), caller = results[0]
+    assert value == 42
+    assert worker.startswith("Job-")
+    assert caller == threading.current_thread().name
+    assert job.state == JobState.DONE and job.progress == 1.0
+    assert scheduler.pending() == []
+
+def test_higher_priority_starts_first():
+    scheduler = JobScheduler(workers=1)
+    gate = threading.Event()
+    order = []
+    scheduler.submit(gate.wait, 5, name="gate")
+    scheduler.submit(order.append, "low", priority=0)
+    scheduler.submit(order.append, "high", priority=2)
+    gate.set()
+    scheduler.shutdown()
+    assert order == ["high", "low"]
+
+def test_cancelled_job_skips_callbacks():
+    scheduler = JobScheduler(workers=1)
+    gate = threading.Event()
+    done = []
+    scheduler.submit(gate.wait, 5)
+    job = scheduler.submit(lambda: "never", on_done=done.append)
+    assert job.cancel()
+    gate.set()
+    scheduler.shutdown()
+    assert done == []
+    assert job.state == JobState.CANCELLED
+    assert not job.cancel()
+    assert scheduler.pending() == []
+
+def test_errors_go_to_on_error():
+    scheduler = JobScheduler(workers=0)
+    errors = []
+    job = scheduler.submit(lambda: 1 / 0, on_error=errors.append)
+    assert isinstance(errors[0], ZeroDivisionError)
+    assert job.state == JobState.FAILED
+
+def test_failing_error_handler_still_finishes_the_job():
+    scheduler = JobScheduler(workers=1)
+
+    def on_error(error):
+        raise RuntimeError("handler failed")
+    job = scheduler.submit(lambda: 1 / 0, on_error=on_error)
+    assert scheduler.wait([job], timeout=5)
+    scheduler.shutdown()
+    assert job.state == JobState.FAILED
+    assert scheduler.pending() == []
+
+def test_generator_callback_is_resumed_within_budget():
+    scheduler = JobScheduler(workers=1, budget_ms=0)
+    steps = []
+
+    def convert(frames):
+        for frame in range(frames):
+            steps.append(frame)
+            yield
+
+    job = scheduler.submit(lambda: 3, on_done=convert)
+    job._ran.wait(5)
+    assert scheduler.pump() == 1
+    assert steps == [] and not job.done
+    scheduler.pump()
+    assert steps == [0]
+    while scheduler.pump():
+        pass
+    assert steps == [0, 1, 2]
+    assert job.state == JobState.DONE
+    scheduler.shutdown()
+
+def test_job_reports_progress():
+    scheduler = JobScheduler(workers=0)
+    seen = []
+
+    def work(job):
+        job.report(0.5)
+        seen.append(job.progress)
+
+    scheduler.submit(work, with_job=True)
+    assert seen == [0.5]
+
+def test_job_cancelled_as_its_worker_starts_it_ends_cancelled():
+    scheduler = JobScheduler(workers=1)
+    run = scheduler._run
+
+    def cancel_then_run(job):
+        job.cancel()
+        run(job)
+    scheduler._run = cancel_then_run
+    done = []
+    job = scheduler.submit(lambda: "never", on_done=done.append)
+    assert scheduler.wait([job], timeout=5)
+    scheduler.shutdown()
+    assert job.state == JobState.CANCELLED and job.done
+    assert done == [] and scheduler.pending() == []
@@ -0,0 +1,42 @@
+import pygame
+import pytest
+
+from models.latency_tracer import LatencyTracer
+
+@pytest.fixture
+def tracer():
+    return LatencyTracer(history=10)
+
+def key_event():
+    return pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+def test_flip_closes_applied_inputs_per_event_type(tracer):
+    for start in (0.0, 0.1, 0.2):
+        event = key_event()
+        tracer.stamp(event, now=start)
+        tracer.input_applied(event, "spin")
+        tracer.on_flip(now=start + 0.02)
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1)
+    tracer.stamp(click, now=1.0)
+    tracer.input_applied(click, "switch")
+    tracer.on_flip(now=1.05)
+    stats = tracer.stats()
+    assert stats["KeyDown"]["count"] == 3
+    assert stats["KeyDown"]["p50"] == pytest.approx(20.0)
+    assert stats["MouseButtonDown"]["max"] == pytest.approx(50.0)
+    assert tracer.pending == []
+
+def test_unstamped_or_unapplied_events_are_not_recorded(tracer):
+    tracer.input_applied(key_event(), "spin")
+    stamped = key_event()
+    tracer.stamp(stamped)
+    tracer.on_flip()
+    assert tracer.stats() == {}
+
+def test_spin_reports_the_triggering_event(mocker):
+    from models.spin_wheel import SpinWheelModel
+    applied = mocker.patch("models.spin_wheel.latency_tracer.input_applied")
+    event = key_event()
+    wheel = SpinWheelModel(["A", "B"], sound=False)
+    wheel.spin(event)
+    applied.assert_called_once_with(event, "spin")
@@ -0,0 +1,81 @@
+import io
+import logging
+
+import pytest
+
+from models.logger import GameState, GameStateTracker, HotPathLogger, setup_logging, stop_logging
+
+@pytest.fixture
+def test_logger():
+    logger = logging.getLogger("tests.hot_path")
+    logger.setLevel(logging.DEBUG)
+    return logger
+
+def test_hot_path_logger_rate_limits_per_template(mocker, test_logger):
+    log = mocker.patch.object(test_logger, 'log')
+    hot = HotPathLogger(test_logger, level=logging.DEBUG, interval=60)
+    for i in range(5):
+        hot.log("frame %d", i)
+    hot.log("other %d", 1)
+    assert log.call_args_list == [
+        mocker.call(logging.DEBUG, "frame %d", 0),
+        mocker.call(logging.DEBUG, "other %d", 1),
+    ]
+
+def test_hot_path_logger_reports_suppressed_count(mocker, test_logger):
+    log = mocker.patch.object(test_logger, 'log')
+    hot = HotPathLogger(test_logger, level=logging.DEBUG, interval=0, sample=3)
+    for i in range(6):
+        hot.log("event %d", i)
+    assert log.call_args_list == [
+        mocker.call(logging.DEBUG, "event %d (%d similar suppressed)", 2, 2),
+        mocker.call(logging.DEBUG, "event %d (%d similar suppressed)", 5, 2),
+    ]
+
+def test_hot_path_logger_skips_disabled_level(mocker, test_logger):
+    log = mocker.patch.object(test_logger, 'log')
+    hot = HotPathLogger(test_logger, level=logging.NOTSET + 1, interval=0)
+    hot.log("hidden")
+    log.assert_not_called()
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    yield root
+    stop_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in saved_handlers:
+        root.addHandler(handler)
+    root.setLevel(saved_level)
+
+def test_setup_logging_formats_on_listener(test_logger, root_logger):
+    stream = io.StringIO()
+    setup_logging(logging.INFO, '%(message)s', stream)
+    test_logger.info("hello %s", "world")
+    stop_logging()
+    assert stream.getvalue() == "hello world\n"
+    stop_logging()
+
+def test_setup_logging_again_replaces_the_listener(test_logger, root_logger):
+    first, second = io.StringIO(), io.StringIO()
+    setup_logging(logging.INFO, '%(message)s', first)
+    test_logger.info("one")
+    setup_logging(logging.INFO, '%(message)s', second)
+    test_logger.info("two")
+    stop_logging()
+    assert first.getvalue() == "one\n"
+    assert second.getvalue() == "two\n"
+    assert len(root_logger.handlers) == 1
+
+def test_game_state_tracker_reset_starts_a_new_game():
+    tracker = GameStateTracker(3)
+    tracker.set_state(GameState.SPINNING)
+    tracker.increment_draw()
+    tracker.add_result("A", "response")
+    tracker.reset()
+    assert tracker.state == GameState.WAITING
+    assert tracker.current_draw == -1
+    assert tracker.results == [] and tracker.result_responses == []
+    assert tracker.total_draws == 3
@@ -0,0 +1,52 @@
+import tracemalloc
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+from models.memory_tracker import MemoryTracker, surface_bytes
+
+@pytest.fixture
+def tracker(mocker):
+    mocker.patch('pygame.display.get_init', return_value=False)
+    return MemoryTracker(top=3)
+
+def test_surface_bytes_uses_pitch_and_height():
+    surface = pygame.Surface((10, 4), pygame.SRCALPHA)
+    assert surface_bytes(surface) == surface.get_pitch() * 4 >= 160
+
+def test_measure_groups_surfaces_by_owner_and_counts_each_once(tracker):
+    shared = pygame.Surface((8, 8))
+    loader = SimpleNamespace(gif_frames=[pygame.Surface((4, 4)), pygame.Surface((4, 4))], shared=shared)
+    view = SimpleNamespace(cache={"bg": shared}, loader=loader)
+    tracker.register("view", view)
+    tracker.register("loader", lambda: loader, kind="loader")
+    usage = tracker.measure()
+    assert usage["view"]["surfaces"] == 1
+    assert usage["view"]["bytes"] == surface_bytes(shared)
+    assert usage["loader"]["surfaces"] == 2
+    assert tracker.by_kind(usage) == {"view": surface_bytes(shared), "loader": 2 * surface_bytes(loader.gif_frames[0])}
+
+def test_sample_keeps_peak_per_state(tracker):
+    owner = SimpleNamespace(frames=[pygame.Surface((16, 16))])
+    tracker.register("loader", owner, kind="loader")
+    tracker.sample("game")
+    peak = tracker.peak("game")
+    owner.frames = []
+    tracker.sample("game")
+    assert tracker.peak("game") == peak > 0
+    assert tracker.peak("menu") == 0
+
+def test_transition_records_usage_and_allocation_diffs(tracker):
+    tracker.start_tracing()
+    try:
+        tracker.on_transition("menu", "game")
+        data = [bytearray(1024) for _ in range(50)]
+        record = tracker.on_transition("game", "menu")
+    finally:
+        tracemalloc.stop()
+    assert record["from"] == "game" and record["to"] == "menu"
+    assert len(record["top_diffs"]) <= 3
+    assert record["top_diffs"][0]["bytes"] > 0
+    assert len(tracker.transitions) == 2
+    assert data
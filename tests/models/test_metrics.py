@@ -0,0 +1,50 @@
+import urllib.request
+
+import pytest
+
+from models.metrics import MetricsRegistry
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    yield registry
+    registry.stop()
+
+def test_counter_and_cache_hits(registry):
+    registry.record_cache("background", True)
+    registry.record_cache("background", True)
+    registry.record_cache("background", False)
+    counter = registry.counter("kft_cache_requests_total", "")
+    assert counter.get(cache="background", result="hit") == 2
+    assert counter.get(cache="background", result="miss") == 1
+    with pytest.raises(ValueError):
+        counter.inc(-1, cache="background", result="hit")
+
+def test_histogram_renders_cumulative_buckets(registry):
+    histogram = registry.histogram("kft_test_seconds", "Test.", ("state",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, state="game")
+    histogram.observe(0.5, state="game")
+    histogram.observe(5.0, state="game")
+    text = registry.render()
+    assert "# TYPE kft_test_seconds histogram" in text
+    assert 'kft_test_seconds_bucket{state="game",le="0.1"} 1' in text
+    assert 'kft_test_seconds_bucket{state="game",le="1.0"} 2' in text
+    assert 'kft_test_seconds_bucket{state="game",le="+Inf"} 3' in text
+    assert 'kft_test_seconds_count{state="game"} 3' in text
+
+def test_registry_rejects_kind_mismatch(registry):
+    registry.counter("kft_thing", "")
+    with pytest.raises(ValueError):
+        registry.histogram("kft_thing", "")
+
+def test_write_textfile(tmp_path, registry):
+    registry.gauge("kft_gauge", "A gauge.").set(3)
+    registry.write_textfile(tmp_path / "metrics.prom")
+    assert "kft_gauge 3" in (tmp_path / "metrics.prom").read_text()
+
+def test_http_server_serves_metrics(registry):
+    registry.counter("kft_requests_total", "Requests.").inc()
+    port = registry.start_http_server(0)
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+        body = response.read().decode()
+    assert "kft_requests_total 1" in body
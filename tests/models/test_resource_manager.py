@@ -0,0 +1,61 @@
+import threading
+
+from models.resource_manager import ResourceManager
+
+class Held:
+    def __init__(self, size):
+        self.bytes = size
+        self.loaded = False
+
+    def size(self):
+        return self.bytes
+
+    def release(self):
+        self.bytes = 0
+
+    def load(self):
+        self.loaded = True
+
+def test_enforce_releases_inactive_low_priority_first():
+    manager = ResourceManager(budget_bytes=100)
+    deck, frames, widgets = Held(80), Held(50), Held(40)
+    manager.register("game", "deck", deck.size, deck.release, priority=2)
+    manager.register("game", "frames", frames.size, frames.release)
+    manager.register("config", "widgets", widgets.size, widgets.release)
+    manager.activate("menu")
+    assert manager.resources[("game", "frames")].size() == 0
+    assert widgets.bytes == 0
+    assert deck.bytes == 80
+    assert manager.total() == 80
+
+def test_active_state_is_never_released():
+    manager = ResourceManager(budget_bytes=10)
+    deck = Held(80)
+    manager.register("game", "deck", deck.size, deck.release)
+    manager.activate("game")
+    assert deck.bytes == 80
+    manager.activate(None)
+    assert deck.bytes == 0
+
+def test_within_budget_keeps_everything():
+    manager = ResourceManager(budget_bytes=1000)
+    deck = Held(80)
+    manager.register("game", "deck", deck.size, deck.release)
+    assert manager.activate("menu") is None
+    assert manager.usage() == {"game": {"deck": 80}}
+
+def test_preload_calls_load_hooks_on_the_calling_thread():
+    manager = ResourceManager()
+    deck, frames = Held(0), Held(0)
+    threads = []
+    manager.register("game", "deck", deck.size, deck.release,
+                     load=lambda: threads.append(threading.current_thread()) or deck.load())
+    manager.register("game", "frames", frames.size, frames.release)
+    assert manager.preload("game") == 1
+    assert deck.loaded
+    assert threads == [threading.current_thread()]
+    assert manager.preload("config") == 0
+
+def test_from_env_reads_budget_in_megabytes(monkeypatch):
+    monkeypatch.setenv("KFT_RESOURCE_BUDGET_MB", "2.5")
+    assert ResourceManager.from_env().budget_bytes == int(2.5 * 1024 * 1024)
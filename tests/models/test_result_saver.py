@@ -0,0 +1,68 @@
+import pygame
+import pytest
+from PIL import Image
+
+from models.job_scheduler import JobScheduler
+from models.result_saver import ResultSaver, SaveStatus
+
+@pytest.fixture
+def surface():
+    surface = pygame.Surface((20, 10))
+    surface.fill((255, 0, 0))
+    return surface
+
+def test_save_writes_image_atomically(tmp_path, surface):
+    saver = ResultSaver(tmp_path / "result.png", naming="overwrite")
+    path = saver.save(surface)
+    assert saver.wait(5)
+    saver.shutdown()
+    assert path == tmp_path / "result.png"
+    assert saver.status == SaveStatus.SAVED
+    assert Image.open(path).getpixel((0, 0)) == (255, 0, 0)
+    assert [p.name for p in tmp_path.iterdir()] == ["result.png"]
+
+def test_concurrent_overwrites_do_not_share_a_temporary_file(tmp_path):
+    surface = pygame.Surface((400, 300))
+    for x in range(0, 400, 4):
+        pygame.draw.line(surface, (x % 256, 255 - x % 256, x * 7 % 256), (x, 0), (399 - x, 299))
+    jobs = JobScheduler(workers=2)
+    saver = ResultSaver(tmp_path / "result.png", naming="overwrite", jobs=jobs)
+    for _ in range(20):
+        saver.save(surface)
+        saver.save(surface)
+        assert saver.wait(5)
+        assert saver.status == SaveStatus.SAVED and saver.last_error is None
+    jobs.shutdown()
+    assert [p.name for p in tmp_path.iterdir()] == ["result.png"]
+
+def test_save_without_a_scheduler_completes_inline(tmp_path, surface):
+    saver = ResultSaver(tmp_path / "result.png", naming="overwrite")
+    saver.save(surface)
+    assert saver.status == SaveStatus.SAVED
+    assert saver.last_path == tmp_path / "result.png"
+
+def test_sequence_naming_continues_after_existing_files(tmp_path, surface):
+    (tmp_path / "result_0007.png").write_bytes(b"")
+    saver = ResultSaver(tmp_path / "result.png", naming="sequence")
+    assert saver.save(surface).name == "result_0008.png"
+    assert saver.save(surface).name == "result_0009.png"
+    saver.shutdown()
+
+def test_jpeg_format(tmp_path, surface):
+    saver = ResultSaver(tmp_path / "result.png", naming="timestamp", fmt="jpg", quality=80)
+    path = saver.save(surface)
+    saver.shutdown()
+    assert path.suffix == ".jpg"
+    assert Image.open(path).format == "JPEG"
+
+def test_failed_save_reports_status(tmp_path, surface):
+    blocker = tmp_path / "blocker"
+    blocker.write_bytes(b"")
+    saver = ResultSaver(blocker / "result.png", naming="overwrite")
+    saver.save(surface)
+    saver.shutdown()
+    assert saver.status == SaveStatus.FAILED
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        ResultSaver(fmt="tiff")
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from models.session_history import (
+    SessionHistory, load_history, outcome_frequencies, duration_stats, universe_stats, gif_variant, HEADER
+)
+
+@pytest.fixture
+def history(tmp_path):
+    history = SessionHistory(tmp_path, flush_interval=60, max_draws=3)
+    yield history
+    history.close()
+
+def test_gif_variant():
+    assert gif_variant("3.2") == 2
+    assert gif_variant(None) == 0
+
+def test_sessions_round_trip(history, tmp_path):
+    history.append("Star Wars", [(1, 2, 7, 3.25), (0, 0, 1, 2.5)], duration=12.5, finished=100.0)
+    history.append("Dune", [(2, 1, 0, 4.0)], seed=42, finished=200.0)
+    assert history.flush() == 2
+    records, universes = load_history(tmp_path)
+    assert universes == ["Star Wars", "Dune"]
+    assert records["time"].tolist() == [100.0, 200.0]
+    assert records["seed"].tolist() == [-1, 42]
+    assert records["duration_ms"].tolist() == [12500, 0]
+    assert records["draws"].tolist() == [2, 1]
+    assert records["segment"].tolist() == [[1, 0, 0], [2, 0, 0]]
+    assert records["variant"].tolist() == [[2, 0, 0], [1, 0, 0]]
+    assert records["response"].tolist() == [[7, 1, 0], [0, 0, 0]]
+    assert records["spin_ms"].tolist() == [[3250, 2500, 0], [4000, 0, 0]]
+
+def test_too_many_draws_are_rejected(history):
+    with pytest.raises(ValueError):
+        history.append("Dune", [(0, 0, 0, 0.0)] * 4)
+
+def test_writer_thread_flushes_full_batches(tmp_path):
+    history = SessionHistory(tmp_path, flush_interval=60, batch_size=10, max_draws=3)
+    for i in range(10):
+        history.append("Dune", [(i % 3, 0, 0, 1.0)])
+    for _ in range(200):
+        if len(load_history(tmp_path)[0]) == 10:
+            break
+        history._wake.wait(0.01)
+    assert len(load_history(tmp_path)[0]) == 10
+    history.close()
+
+def test_segments_rotate_and_torn_records_are_dropped(tmp_path):
+    history = SessionHistory(tmp_path, segment_bytes=HEADER.size + 1, max_draws=3)
+    for i in range(3):
+        history.append("Dune", [(i, 0, 0, 1.0)])
+        history.flush()
+    segments = sorted(tmp_path.glob("sessions-*.bin"))
+    assert len(segments) == 3
+    with segments[-1].open("ab") as f:
+        f.write(b"\x01\x02\x03")
+    reopened = SessionHistory(tmp_path, segment_bytes=1 << 20, max_draws=3)
+    reopened.append("Alien", [(5, 0, 0, 1.0)])
+    reopened.flush()
+    records, universes = load_history(tmp_path)
+    assert records["segment"][:, 0].tolist() == [0, 1, 2, 5]
+    assert universes == ["Dune", "Alien"]
+
+def test_segment_without_a_header_is_followed_by_a_new_one(tmp_path):
+    (tmp_path / "sessions-000001.bin").write_bytes(b"")
+    history = SessionHistory(tmp_path, max_draws=3)
+    history.append("Dune", [(4, 0, 0, 1.0)])
+    assert history.flush() == 1
+    assert (tmp_path / "sessions-000002.bin").exists()
+    records, _ = load_history(tmp_path)
+    assert records["segment"][:, 0].tolist() == [4]
+
+def test_failed_write_keeps_sessions_pending(tmp_path, mocker):
+    history = SessionHistory(tmp_path, max_draws=3)
+    history.append("Dune", [(1, 0, 0, 1.0)])
+    mocker.patch.object(history, "_write", side_effect=OSError("disk full"))
+    with pytest.raises(OSError):
+        history.flush()
+    mocker.stopall()
+    history.append("Dune", [(2, 0, 0, 1.0)])
+    assert history.flush() == 2
+    assert load_history(tmp_path)[0]["segment"][:, 0].tolist() == [1, 2]
+
+def test_analytics(history, tmp_path):
+    history.append("Dune", [(0, 0, 0, 1.0), (1, 0, 0, 3.0)], duration=10.0)
+    history.append("Dune", [(0, 0, 0, 2.0)], duration=20.0)
+    history.append("Alien", [(2, 0, 0, 5.0)], duration=30.0)
+    history.flush()
+    records, universes = load_history(tmp_path)
+    counts = outcome_frequencies(records)
+    assert counts.tolist() == [[2, 0, 1], [0, 1, 0], [0, 0, 0]]
+    assert duration_stats(records) == {"mean": 20.0, "p50": 20.0, "p95": 29.0, "max": 30.0}
+    assert universe_stats(records, universes) == {
+        "Dune": {"sessions": 2, "mean_duration": 15.0, "mean_spin": 2.0},
+        "Alien": {"sessions": 1, "mean_duration": 30.0, "mean_spin": 5.0},
+    }
+
+def test_empty_history(tmp_path):
+    records, universes = load_history(tmp_path)
+    assert len(records) == 0 and universes == []
+    assert duration_stats(records)["mean"] == 0.0
+    assert outcome_frequencies(records).sum() == 0
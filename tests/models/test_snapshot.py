@@ -0,0 +1,62 @@
+import pytest
+
+from models.logger import GameState
+from models.snapshot import SnapshotStore, config_hash, decode_snapshot, encode_snapshot
+from models.job_scheduler import JobScheduler
+
+def make_snapshot(**overrides):
+    snapshot = {
+        "app_state": "game",
+        "config_hash": config_hash({"prompt": "Dune", "questions": []}),
+        "game_state": GameState.SHOWING_GIF,
+        "draw": 2,
+        "wait_timer": 1.5,
+        "wheel": (12.5, -700.0, 0.0, 0.0, False, 4.25),
+        "session_elapsed": 30.5,
+        "gif": "3.2",
+        "results": ["Tatooine", "Jedi", "Ucieczka"],
+        "responses": ["Odpowiedź 1", "r2", "r3"],
+        "session_draws": [(0, 1, 3, 4.5), (2, 0, 1, 4.0), (1, 2, 0, 4.25)],
+    }
+    snapshot.update(overrides)
+    return snapshot
+
+def test_snapshot_round_trip():
+    data = encode_snapshot(make_snapshot())
+    assert len(data) < 200
+    assert decode_snapshot(data) == make_snapshot()
+
+def test_snapshot_without_gif_or_results():
+    snapshot = make_snapshot(gif=None, results=[], responses=[], session_draws=[], game_state=GameState.SPINNING)
+    assert decode_snapshot(encode_snapshot(snapshot)) == snapshot
+
+def test_config_hash_ignores_visuals():
+    config = {"prompt": "Dune", "questions": [{"answers": ["A"]}], "bg_img": "a.png"}
+    assert config_hash(config) == config_hash(dict(config, bg_img="b.png"))
+    assert config_hash(config) != config_hash(dict(config, questions=[{"answers": ["B"]}]))
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: data[:-3],
+    lambda data: data[:5],
+    lambda data: b"XXXX" + data[4:],
+    lambda data: data[:-1] + bytes([data[-1] ^ 0xFF]),
+])
+def test_corrupt_snapshots_are_rejected(corrupt):
+    with pytest.raises(ValueError):
+        decode_snapshot(corrupt(encode_snapshot(make_snapshot())))
+
+def test_store_replaces_snapshot_and_ignores_bad_files(tmp_path):
+    store = SnapshotStore(tmp_path / "session.snap")
+    assert store.load() is None
+    store.save(make_snapshot(draw=0))
+    store.save(make_snapshot(draw=1))
+    assert store.load()["draw"] == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["session.snap"]
+    (tmp_path / "session.snap").write_bytes(b"garbage")
+    assert store.load() is None
+
+def test_store_drops_write_older_than_the_latest(tmp_path):
+    store = SnapshotStore(tmp_path / "session.snap", JobScheduler(workers=0))
+    store._write(2, encode_snapshot(make_snapshot(draw=2)))
+    store._write(1, encode_snapshot(make_snapshot(draw=1)))
+    assert store.load()["draw"] == 2
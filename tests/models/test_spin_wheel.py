@@ -1,3 +1,5 @@
+import random
+from collections import Counter
 import pytest
 from unittest.mock import Mock
 from models.spin_wheel import SpinWheelModel
@@ -29,4 +31,50 @@ def test_spin_wheel_spin(mocker):
     wheel.spin()
     assert wheel.spinning
     assert wheel.angular_velocity < 0
-    assert wheel.target_angle < 0
\ No newline at end of file
+    assert wheel.target_angle < 0
+
+def test_spin_wheel_finish_spin():
+    wheel = SpinWheelModel(["A", "B", "C"], sound=False)
+    wheel.spin()
+    wheel.finish_spin()
+    assert not wheel.spinning
+    assert wheel.angle == wheel.target_angle % FULL_CIRCLE
+
+def test_weighted_boundaries_follow_weights():
+    wheel = SpinWheelModel(["A", "B", "C"], sound=False, weights=[1, 2, 1])
+    assert wheel.boundaries.tolist() == [0, 90, 270, 360]
+    assert wheel.segment_at(89.9) == 0
+    assert wheel.segment_at(90) == 1
+    assert wheel.segment_at(359.9) == 2
+
+def test_zero_weight_segment_is_never_selected():
+    wheel = SpinWheelModel(["A", "B", "C"], sound=False, weights=[1, 0, 1])
+    assert wheel.segment_at(180) == 2
+    assert wheel.alias_table.prob[1] == 0
+
+def test_invalid_weights_rejected():
+    with pytest.raises(ValueError):
+        SpinWheelModel(["A", "B"], sound=False, weights=[0, 0])
+    with pytest.raises(ValueError):
+        SpinWheelModel(["A", "B"], sound=False, weights=[1, -1])
+
+def test_land_resolves_to_the_landed_segment():
+    wheel = SpinWheelModel(list("ABCDE"), rng=random.Random(1), sound=False, weights=[5, 1, 0.5, 2, 1])
+    for index in range(5):
+        assert wheel.land(index) == index
+        assert wheel.get_selected_segment()[0] == "ABCDE"[index]
+
+def test_land_samples_in_proportion_to_weights():
+    wheel = SpinWheelModel(list("ABCD"), rng=random.Random(2), sound=False, weights=[1, 2, 3, 4])
+    counts = Counter()
+    for _ in range(20000):
+        wheel.land()
+        counts[wheel.get_selected_segment()[0]] += 1
+    for label, weight in zip("ABCD", [1, 2, 3, 4]):
+        assert counts[label] / 20000 == pytest.approx(weight / 10, abs=0.015)
+
+def test_from_question_pads_missing_weights():
+    question = {"text": "Q", "num_answers": 3, "answers": ["A", "B", "C", "D"], "weights": [2]}
+    wheel = SpinWheelModel.from_question(question, sound=False)
+    assert wheel.segments == ["A", "B", "C"]
+    assert wheel.weights == [2, 1.0, 1.0]
@@ -0,0 +1,81 @@
+import pstats
+import time
+
+import pytest
+
+from models.state_profiler import StateProfiler
+
+def busy():
+    return sum(i * i for i in range(2000))
+
+@pytest.fixture
+def profiler(tmp_path):
+    return StateProfiler(output_dir=tmp_path)
+
+def test_capture_scoped_to_frames(profiler):
+    profiler.arm(["game"], frames=2)
+    profiler.on_frame("menu")
+    assert not profiler.capturing
+    profiler.on_frame("game.spinning")
+    assert profiler.capturing
+    busy()
+    profiler.on_frame("game.spinning")
+    busy()
+    profiler.on_frame("game.spinning")
+    assert not profiler.capturing
+    assert not profiler.armed
+    pstats_file, collapsed_file = profiler.last_files
+    assert pstats_file.name.startswith("game_spinning_")
+    assert any("busy" in key[2] for key in pstats.Stats(str(pstats_file)).stats)
+    assert collapsed_file.read_text().strip()
+
+def test_capture_stops_when_state_is_left(profiler):
+    profiler.arm(["game.showing_gif"])
+    profiler.on_frame("game.spinning")
+    assert not profiler.capturing
+    profiler.on_frame("game.showing_gif")
+    assert profiler.capturing
+    profiler.on_frame("game.waiting")
+    assert not profiler.capturing
+    assert len(profiler.last_files) == 2
+
+def test_capture_spans_sub_states_of_an_armed_state(profiler):
+    profiler.arm(["game"])
+    profiler.on_frame("game.spinning")
+    profiler.on_frame("game.waiting")
+    profiler.on_frame("game.showing_gif")
+    assert profiler.capturing and profiler.frames == 2
+    profiler.on_frame("menu")
+    assert not profiler.capturing
+    assert profiler.last_files[0].name.startswith("game_spinning_")
+
+def test_captures_in_the_same_second_get_distinct_files(profiler):
+    names = set()
+    for _ in range(2):
+        profiler.start("menu")
+        names.update(path.name for path in profiler.stop())
+    assert len(names) == 4
+
+def test_sample_mode_writes_collapsed_stacks(tmp_path):
+    profiler = StateProfiler(output_dir=tmp_path, mode="sample", sample_interval=0.001)
+    profiler.start("config")
+    deadline = time.monotonic() + 5
+    while not profiler._sampler.stacks and time.monotonic() < deadline:
+        busy()
+    files = profiler.stop()
+    assert [f.suffix for f in files] == [".collapsed"]
+    lines = files[0].read_text().splitlines()
+    assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+def test_toggle_and_from_env(tmp_path):
+    profiler = StateProfiler.from_env({"KFT_PROFILE_STATES": "game, config", "KFT_PROFILE_FRAMES": "30"})
+    assert profiler.targets == {"game", "config"}
+    assert profiler.max_frames == 30
+    profiler.toggle("menu")
+    assert not profiler.armed
+    profiler.toggle("menu")
+    assert profiler.targets == {"menu"}
+
+def test_unsupported_mode():
+    with pytest.raises(ValueError):
+        StateProfiler(mode="perf")
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from models.universe_library import UniverseLibrary, normalize_name
+
+def make_config(prompt, answers=("A", "B", "C")):
+    return {
+        "prompt": prompt,
+        "music": "music.mp3",
+        "bg_img": "bg.png",
+        "bg_color": [60, 30, 30],
+        "questions": [
+            {"text": "Skąd pochodzisz?", "num_answers": 2, "answers": list(answers)},
+            {"text": "Kim jesteś?", "num_answers": 3, "answers": ["X", "Y", "Z"], "weights": [1.0, 2.0, 0.5]},
+        ],
+    }
+
+@pytest.fixture
+def library(tmp_path):
+    library = UniverseLibrary(tmp_path / "universes.db")
+    yield library
+    library.close()
+
+def test_normalize_name_ignores_case_accents_and_spaces():
+    assert normalize_name("  Pokémon   GO ") == "pokemon go"
+    assert normalize_name("STAR wars") == normalize_name("star Wars")
+
+def test_save_and_load_round_trip(library):
+    config = make_config("Star Wars")
+    library.save(config)
+    assert library.load("star  wars") == config
+    assert library.load("Star Trek") is None
+    assert "STAR WARS" in library and len(library) == 1
+
+def test_save_replaces_universe_of_same_normalized_name(library):
+    library.save(make_config("Pokémon"))
+    library.save(make_config("pokemon", answers=("Pikachu", "Eevee")))
+    assert len(library) == 1
+    assert library.load("Pokemon")["questions"][0]["answers"] == ["Pikachu", "Eevee"]
+
+def test_answer_metadata_round_trips(library):
+    config = make_config("Dune")
+    config["questions"][0]["metadata"] = [{"gif": "planet.1"}, {}, {"tags": ["desert"]}]
+    library.save(config)
+    assert library.load("Dune")["questions"][0]["metadata"] == [{"gif": "planet.1"}, {}, {"tags": ["desert"]}]
+    assert "metadata" not in library.load("Dune")["questions"][1]
+
+def test_save_many_is_one_transaction(library):
+    with pytest.raises(ValueError):
+        library.save_many([make_config("Alien"), make_config("  ")])
+    assert len(library) == 0
+    assert library.save_many(make_config(f"Universe {i:04d}") for i in range(2000)) == 2000
+    assert library.search("universe 001", limit=3) == ["Universe 0010", "Universe 0011", "Universe 0012"]
+    assert library.search("zzz") == []
+
+def test_delete_removes_children(library):
+    library.save(make_config("Matrix"))
+    assert library.delete("matrix")
+    assert not library.delete("matrix")
+    conn = library._connection()
+    assert conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0] == 0
+
+def test_export_and_import_json(library, tmp_path):
+    library.save_many([make_config("Star Wars"), make_config("Dune")])
+    library.export_json(tmp_path / "star_wars.json", "star wars")
+    assert json.loads((tmp_path / "star_wars.json").read_text(encoding="utf-8")) == make_config("Star Wars")
+    assert library.export_json(tmp_path / "all.json") == 2
+    with pytest.raises(KeyError):
+        library.export_json(tmp_path / "none.json", "Alien")
+
+    other = UniverseLibrary(":memory:")
+    assert other.import_json(tmp_path / "all.json") == 2
+    assert other.import_json(tmp_path / "star_wars.json") == 1
+    assert other.search() == ["Dune", "Star Wars"]
+    assert other.load("Dune") == make_config("Dune")
+    other.close()
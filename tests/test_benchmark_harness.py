@@ -0,0 +1,16 @@
+import json
+
+from benchmarks.harness import compare, save_baseline, time_callable
+
+def test_time_callable_calibrates_loops():
+    result = time_callable(lambda: None, repeats=3, min_repeat_time=0.001)
+    assert result["loops"] > 1
+    assert result["repeats"] == 3
+    assert result["min_ms"] <= result["median_ms"]
+
+def test_compare_flags_regressions_beyond_threshold(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline({"fast": {"median_ms": 1.0}, "slow": {"median_ms": 1.0}}, path)
+    assert "results" in json.loads(path.read_text())
+    current = {"fast": {"median_ms": 1.1}, "slow": {"median_ms": 1.5}, "new": {"median_ms": 9.0}}
+    assert compare(current, path, threshold=0.2) == [("slow", 1.0, 1.5, 1.5)]
@@ -0,0 +1,18 @@
+import pytest
+
+from benchmarks.soak import analyze, detect_growth
+
+def test_detect_growth_flags_steady_increase():
+    result = detect_growth([100 + 5 * i for i in range(20)], threshold=0.1)
+    assert result["flagged"]
+    assert result["slope"] == pytest.approx(5.0)
+    assert result["monotonic"] == 1.0
+
+def test_detect_growth_ignores_noise_around_a_plateau():
+    values = [100, 103, 99, 101, 98, 102, 100, 99, 101, 100]
+    assert not detect_growth(values, threshold=0.05)["flagged"]
+
+def test_analyze_skips_warmup_iterations():
+    rows = [{"surfaces": value} for value in (10, 20, 30, 40, 40, 40, 40, 40)]
+    assert analyze(rows, warmup=0, thresholds={"surfaces": 0.05})["surfaces"]["flagged"]
+    assert not analyze(rows, warmup=3, thresholds={"surfaces": 0.05})["surfaces"]["flagged"]
@@ -0,0 +1,72 @@
+import pygame
+import pytest
+
+from constants import px, render_scale
+from views.display import Display, fit_rect, parse_size
+
+@pytest.fixture
+def cpu_display(mocker):
+    window = pygame.Surface((1920, 1080))
+    mocker.patch('pygame.display.get_surface', return_value=window)
+    mocker.patch('pygame.display.flip')
+    display = Display(size=(600, 400))
+    display.window = window
+    display.canvas = pygame.Surface((600, 400))
+    display.resize(window.get_size())
+    return display
+
+def test_px_scales_and_keeps_thin_lines():
+    assert px(300, 0.5) == 150
+    assert px(2, 0.25) == 1
+    assert px(-100, 0.5) == -50
+    assert px(0, 0.5) == 0
+    assert px(300, 1.0) == 300
+
+def test_render_scale_falls_back_for_invalid_values():
+    assert render_scale("0.5") == 0.5
+    assert render_scale(None) == 1.0
+    for text in ("0", "-2", "fast", "nan", "inf"):
+        assert render_scale(text) == 1.0
+
+def test_parse_size():
+    assert parse_size("3840x2160") == (3840, 2160)
+    assert parse_size("") is None
+    with pytest.raises(ValueError):
+        parse_size("0x100")
+
+def test_fit_rect_letterboxes_to_keep_aspect_ratio():
+    assert fit_rect((600, 400), (1920, 1080)) == pygame.Rect(150, 0, 1620, 1080)
+    assert fit_rect((600, 400), (1200, 800)) == pygame.Rect(0, 0, 1200, 800)
+    assert fit_rect((600, 400), (800, 800)) == pygame.Rect(0, 134, 800, 533)
+
+def test_cpu_scaling_maps_window_positions_to_the_canvas(cpu_display):
+    assert cpu_display.dest == pygame.Rect(150, 0, 1620, 1080)
+    assert cpu_display.to_canvas((150, 0)) == (0, 0)
+    assert cpu_display.to_canvas((960, 540)) == (300, 200)
+    assert cpu_display.to_canvas((0, 2000)) == (0, 399)
+    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(960, 540), button=1)
+    assert cpu_display.map_event(event).pos == (300, 200)
+
+def test_scaled_display_leaves_positions_to_sdl():
+    display = Display(size=(600, 400))
+    display.scaled = True
+    event = pygame.event.Event(pygame.MOUSEMOTION, pos=(960, 540))
+    assert display.map_event(event).pos == (960, 540)
+
+def test_present_scales_into_a_cached_frame(cpu_display):
+    cpu_display.canvas.fill((200, 10, 10))
+    cpu_display.present()
+    frame = cpu_display._frame
+    cpu_display.present()
+    assert cpu_display._frame is frame
+    assert cpu_display.window.get_at((960, 540))[:3] == (200, 10, 10)
+    assert cpu_display.window.get_at((10, 540))[:3] == (0, 0, 0)
+    pygame.display.flip.assert_called()
+
+def test_resize_refits_the_canvas(cpu_display):
+    cpu_display.window = pygame.Surface((600, 400))
+    pygame.display.get_surface.return_value = cpu_display.window
+    assert cpu_display.handle_event(pygame.event.Event(pygame.VIDEORESIZE, size=(600, 400), w=600, h=400))
+    assert cpu_display.dest == pygame.Rect(0, 0, 600, 400)
+    assert cpu_display._frame is None
+    assert cpu_display.to_canvas((10, 20)) == (10, 20)
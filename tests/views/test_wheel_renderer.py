@@ -0,0 +1,76 @@
+import numpy as np
+import pygame
+import pytest
+
+from models.spin_wheel import SpinWheelModel
+from views.wheel_renderer import WheelRenderer, arc_polygons, segment_colors
+
+@pytest.fixture(autouse=True)
+def real_fonts(mocker):
+    pygame.font.init()
+    mocker.patch('pygame.font.SysFont', side_effect=lambda name, size, **kwargs: pygame.font.Font(None, size))
+
+def test_arc_polygons_share_boundary_points():
+    boundaries = np.arange(5) * 90.0
+    polygons = arc_polygons(boundaries, (100, 100), 50, step=10)
+    assert len(polygons) == 4
+    for polygon, following in zip(polygons, polygons[1:]):
+        assert polygon[0] == (100.0, 100.0)
+        assert polygon[-1] == following[1]
+    assert all(len(polygon) == 11 for polygon in polygons)
+    assert polygons[0][1] == pytest.approx([150, 100])
+    assert polygons[1][1] == pytest.approx([100, 50])
+
+def test_segment_colors_do_not_repeat_across_the_seam():
+    colors = segment_colors(7, palette=[1, 2, 3])
+    assert colors[0] != colors[-1]
+    assert colors[-2] != colors[-1]
+
+def test_truncate_fits_width():
+    font = pygame.font.Font(None, 20)
+    text = WheelRenderer._truncate("A very long answer that cannot fit", font, 80)
+    assert text.endswith("…")
+    assert font.size(text)[0] <= 80
+    assert WheelRenderer._truncate("Short", font, 80) == "Short"
+
+def test_labels_hidden_on_crowded_wheel(mocker):
+    renderer = WheelRenderer()
+    font = mocker.spy(renderer, 'font')
+    renderer.build([str(i) for i in range(200)], np.arange(201) * 1.8)
+    assert font.call_count == 0
+    renderer.build(["a", "b", "c"], np.arange(4) * 120.0)
+    assert font.call_count == 3
+
+def test_base_image_built_once_per_wheel(mocker):
+    renderer = WheelRenderer()
+    wheel = SpinWheelModel(["a", "b", "c"], sound=False)
+    paint = mocker.spy(renderer, 'paint')
+    screen = pygame.Surface((800, 800))
+    for angle in (0, 10, 20):
+        wheel.angle = angle
+        renderer.draw(screen, wheel, (400, 400))
+    assert paint.call_count == 1
+    renderer.draw(screen, SpinWheelModel(["x", "y"], sound=False), (400, 400))
+    assert paint.call_count == 2
+
+def test_layout_is_painted_as_built(mocker):
+    renderer = WheelRenderer()
+    wheel = SpinWheelModel(["a", "b", "c"], sound=False)
+    layout = renderer.layout(wheel.segments, wheel.boundaries)
+    assert [label[0] for label in layout.labels] == ["a", "b", "c"]
+    built = renderer.build(wheel.segments, wheel.boundaries)
+    painted = renderer.base_image(wheel, layout)
+    center = built.get_width() // 2
+    for pos in ((center + 100, center - 30), (center - 100, center + 30), (center, center + 150)):
+        assert painted.get_at(pos) == built.get_at(pos)
+
+def test_weighted_wheel_draws_variable_width_slices():
+    renderer = WheelRenderer()
+    wheel = SpinWheelModel(["a", "b"], sound=False, weights=[3, 1])
+    assert renderer.boundaries(wheel).tolist() == [0, 270, 360]
+    base = renderer.base_image(wheel)
+    center = base.get_width() // 2
+    # About 160 degrees lies in the first, wider slice; about 290 degrees in the second.
+    first = base.get_at((center - 150, center - 55))
+    second = base.get_at((center + 50, center + 150))
+    assert first[:3] != second[:3]
@@ -0,0 +1,67 @@
+import pygame
+import pytest
+
+from views.config_view import ConfigView, ModernColorPicker, ModernInputBox
+
+@pytest.fixture(autouse=True)
+def real_fonts(mocker):
+    pygame.font.init()
+    mocker.patch('pygame.font.SysFont', side_effect=lambda *args, **kwargs: pygame.font.Font(None, 20))
+
+@pytest.fixture
+def screen():
+    return pygame.Surface((1200, 800))
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+def key(k, unicode=''):
+    return pygame.event.Event(pygame.KEYDOWN, key=k, unicode=unicode)
+
+def test_input_box_redraws_only_after_its_own_changes(screen):
+    box = ModernInputBox(10, 40, 200, 30, "abc", label="Name:")
+    box.draw(screen)
+    box.draw(screen)
+    assert box.redraws == 1
+    box.handle_event(click((500, 500)))
+    box.draw(screen)
+    assert box.redraws == 1
+    box.handle_event(click(box.rect.center))
+    box.handle_event(key(pygame.K_d, 'd'))
+    box.draw(screen)
+    assert box.redraws == 2
+    assert box.get_value() == "abcd"
+
+def test_color_picker_invalidates_on_new_selection_only(screen):
+    picker = ModernColorPicker(10, 40, [(1, 1, 1), (2, 2, 2)])
+    picker.draw(screen)
+    picker.handle_event(click(picker.rects[0][0].center))
+    assert not picker.dirty
+    picker.handle_event(click(picker.rects[1][0].center))
+    assert picker.dirty and picker.selected_color == (2, 2, 2)
+
+def test_typing_in_universe_box_leaves_other_widgets_cached(screen, mocker):
+    mocker.patch('pygame.mouse.get_pos', return_value=(0, 0))
+    view = ConfigView(screen, {"prompt": "Star Wars", "questions": []})
+    answer_y = [box.rect.y for box in view.answer_inputs]
+    view.render()
+    view.prompt_box.handle_event(click(view.prompt_box.rect.center))
+    view.render()
+    before = {id(widget): widget.redraws for widget in view.widgets}
+    view.prompt_box.handle_event(key(pygame.K_x, 'x'))
+    view.render()
+    redrawn = [widget for widget in view.widgets if widget.redraws != before[id(widget)]]
+    assert redrawn == [view.prompt_box, view.prompt_preview]
+    assert [box.rect.y for box in view.answer_inputs] == answer_y
+
+def test_prompt_preview_redraws_on_new_library_matches(screen):
+    view = ConfigView(screen, {"prompt": "Star Wars", "questions": []})
+    preview = view.prompt_preview
+    preview.set_universe("star wars")
+    preview.draw(screen)
+    preview.set_matches([])
+    assert not preview.dirty
+    preview.set_matches(["Star Wars"])
+    assert preview.dirty
+    preview.draw(screen)
+    assert preview.redraws == 2
@@ -3,9 +3,12 @@ from pathlib import Path
 import json
 import logging
 from constants import BORDER_RADIUS, BORDER_THICKNESS, SAVE_BUTTON_BORDER_COLOR, PADDING, MENU_BUTTON_WIDTH, \
-    MENU_BUTTON_HEIGHT
+    MENU_BUTTON_HEIGHT, px
+from models.logger import HotPathLogger
 
 logger = logging.getLogger(__name__)
+hot_logger = HotPathLogger(logger)
+frame_error_logger = HotPathLogger(logger, level=logging.ERROR)
 
 def load_json_file(file_path):
     """Load a JSON file.
@@ -24,10 +27,10 @@ def load_json_file(file_path):
         with Path(file_path).open('r', encoding='utf-8-sig') as f:
             return json.load(f)
     except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
+        logger.error("File not found: %s", file_path)
         raise
     except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in {file_path}: {e}")
+        logger.error("Invalid JSON in %s: %s", file_path, e)
         raise
 
 def render_text(font, text, color, x, y, surface, center=False):
@@ -51,7 +54,7 @@ def render_text(font, text, color, x, y, surface, center=False):
     surface.blit(text_surface, (x, y))
     return text_surface
 
-def draw_button(surface, rect, base_color, text, font, border_color=SAVE_BUTTON_BORDER_COLOR, shadow_offset=4):
+def draw_button(surface, rect, base_color, text, font, border_color=SAVE_BUTTON_BORDER_COLOR, shadow_offset=px(4)):
     """Draw a button with shadow and hover effect.
 
     Args:
@@ -65,7 +68,7 @@ def draw_button(surface, rect, base_color, text, font, border_color=SAVE_BUTTON_
     """
     # Ensure valid colors
     if not isinstance(base_color, (tuple, list)) or len(base_color) != 3:
-        logger.error(f"Invalid base_color: {base_color}, defaulting to (80, 80, 160)")
+        frame_error_logger.log("Invalid base_color: %s, defaulting to (80, 80, 160)", base_color)
         base_color = (80, 80, 160)
 
     # Draw shadow
@@ -116,8 +119,7 @@ def handle_button_click(event, buttons):
     if event.type != pygame.MOUSEBUTTONDOWN:
         return False
 
-    mouse_pos = pygame.mouse.get_pos()
-    logger.debug(f"Mouse click at {mouse_pos}")
+    mouse_pos = getattr(event, 'pos', None) or pygame.mouse.get_pos()
 
     for button in buttons:
         if isinstance(button, tuple):
@@ -138,12 +140,11 @@ def handle_button_click(event, buttons):
             button_label = button.get('label') or button.get('action', '')
 
         else:
-            logger.error(f"Unsupported button format: {button}")
+            logger.error("Unsupported button format: %s", button)
             continue
 
-        logger.debug(f"Button rect: {rect}")
         if rect.collidepoint(mouse_pos):
-            logger.info(f"Button clicked: {button_label}")
+            hot_logger.log("Button clicked: %s", button_label)
             return True
 
     return False
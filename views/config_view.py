@@ -10,16 +10,22 @@ from constants import (
     CONFIG_QUESTIONS_RECT_X, CONFIG_QUESTIONS_RECT_Y, CONFIG_QUESTIONS_RECT_WIDTH,
     CONFIG_QUESTIONS_RECT_HEIGHT, CONFIG_PROMPT_Y, CONFIG_COLOR_PICKER_Y,
     CONFIG_MUSIC_Y, CONFIG_BG_IMAGE_Y, BORDER_RADIUS, BORDER_THICKNESS, CONFIG_FONT_SIZE,
-    LABEL_FONT_SIZE, PADDING, INPUT_BOX_OFFSET, WIDTH, HEIGHT, CONFIG_PROMPT_X
+    LABEL_FONT_SIZE, PADDING, INPUT_BOX_OFFSET, WIDTH, HEIGHT, CONFIG_PROMPT_X, CONFIG_SAVE_TEXT,
+    CONFIG_SAVING_TEXT, px
 )
-from utils import render_text, draw_button, draw_gradient_background
+from models.memory_tracker import surface_bytes
+from models.universe_library import normalize_name
+from utils import render_text, draw_gradient_background
+from views.display import display
+from views.widgets import Widget, ButtonWidget
 
 logger = logging.getLogger(__name__)
 
-class ModernInputBox:
+class ModernInputBox(Widget):
     """Input box for configuration UI with shadow effect.
 
-    This class manages an input field with shadow and event handling.
+    This class manages an input field with shadow and event handling. Its
+    cached surface is redrawn only when the text, focus or color changes.
     """
     def __init__(self, x, y, w, h, text='', numeric=False, label='', placeholder=''):
         """Initialize the ModernInputBox.
@@ -34,22 +40,35 @@ class ModernInputBox:
                 label (str): Label text.
                 placeholder (str): Placeholder text.
         """
+        super().__init__()
         self.rect = pygame.Rect(x, y, w, h)
         self.color_inactive = INPUT_COLOR_INACTIVE
         self.color_active = INPUT_COLOR_ACTIVE
         self.color = self.color_inactive
-        self.text = str(text) if text else ''
         self.label = label
         self.placeholder = placeholder
         self.font = pygame.font.SysFont("Roboto", CONFIG_FONT_SIZE)
         self.label_font = pygame.font.SysFont("Roboto", LABEL_FONT_SIZE)
-        self.txt_surface = self.font.render(self.text or placeholder, True,
-                                            TEXT_COLOR if self.text else (150, 150, 170))
+        self._text = None
+        self.text = str(text) if text else ''
         self.active = False
         self.numeric = numeric
         self.padding = PADDING
         self.bg_color = INPUT_BG_COLOR
 
+    @property
+    def text(self):
+        """str: Current text; setting it re-renders the text and invalidates the box."""
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        if value != self._text:
+            self._text = value
+            self.txt_surface = self.font.render(value or self.placeholder, True,
+                                                TEXT_COLOR if value else (150, 150, 170))
+            self.invalidate()
+
     def handle_event(self, event):
         """Handle input events.
 
@@ -59,6 +78,7 @@ class ModernInputBox:
         Returns:
             bool: True if input is active.
         """
+        was_active = self.active
         if event.type == pygame.MOUSEBUTTONDOWN:
             self.active = self.rect.collidepoint(event.pos)
             self.color = self.color_active if self.active else self.color_inactive
@@ -72,25 +92,33 @@ class ModernInputBox:
                 self.text += event.unicode
             elif not self.numeric:
                 self.text += event.unicode
-            self.txt_surface = self.font.render(self.text or self.placeholder, True,
-                                                TEXT_COLOR if self.text else (150, 150, 170))
+        if self.active != was_active:
+            self.invalidate()
         return self.active
 
-    def draw(self, screen):
-        """Draw the input box with shadow.
+    def _text_pos(self):
+        return self.rect.x + self.padding, self.rect.y + (self.rect.height - self.txt_surface.get_height()) // 2
 
-        Args:
-            screen: Pygame surface to draw on.
-        """
+    def _bounds(self):
+        bounds = self.rect.union(self.rect.move(px(4), px(4)))
+        bounds.union_ip(self.txt_surface.get_rect(topleft=self._text_pos()))
+        if self.label:
+            bounds.union_ip(pygame.Rect((self.rect.x, self.rect.y - INPUT_BOX_OFFSET), self.label_font.size(self.label)))
+        return bounds
+
+    def _redraw(self, surface, origin):
+        """Draw the input box with shadow onto its cache surface."""
+        rect = self.local(self.rect, origin)
         if self.label:
-            render_text(self.label_font, self.label, LABEL_COLOR, self.rect.x, self.rect.y - INPUT_BOX_OFFSET, screen)
+            render_text(self.label_font, self.label, LABEL_COLOR, rect.x, rect.y - INPUT_BOX_OFFSET, surface)
         # Draw shadow
-        shadow_rect = self.rect.move(4, 4)
-        pygame.draw.rect(screen, (30, 30, 40), shadow_rect, border_radius=BORDER_RADIUS)
+        shadow_rect = rect.move(px(4), px(4))
+        pygame.draw.rect(surface, (30, 30, 40), shadow_rect, border_radius=BORDER_RADIUS)
         # Draw input box
-        pygame.draw.rect(screen, self.bg_color, self.rect, border_radius=BORDER_RADIUS)
-        pygame.draw.rect(screen, self.color, self.rect, BORDER_THICKNESS, border_radius=BORDER_RADIUS)
-        screen.blit(self.txt_surface, (self.rect.x + self.padding, self.rect.y + (self.rect.height - self.txt_surface.get_height()) // 2))
+        pygame.draw.rect(surface, self.bg_color, rect, border_radius=BORDER_RADIUS)
+        pygame.draw.rect(surface, self.color, rect, BORDER_THICKNESS, border_radius=BORDER_RADIUS)
+        x, y = self._text_pos()
+        surface.blit(self.txt_surface, (x - origin[0], y - origin[1]))
 
     def get_value(self):
         """Get the input value.
@@ -100,10 +128,11 @@ class ModernInputBox:
         """
         return int(self.text) if self.numeric and self.text.isdigit() else self.text
 
-class ModernColorPicker:
+class ModernColorPicker(Widget):
     """Color picker for configuration UI with shadow effect.
 
-    This class manages color selection with visual feedback.
+    This class manages color selection with visual feedback. Its cached
+    surface is redrawn only when the selection changes.
     """
     def __init__(self, x, y, colors, label=''):
         """Initialize the ModernColorPicker.
@@ -114,12 +143,24 @@ class ModernColorPicker:
                 colors (list): List of color tuples.
                 label (str): Label text.
         """
+        super().__init__()
         self.colors = colors
-        self.rects = [(pygame.Rect(x + i * 45, y, 35, 35), color) for i, color in enumerate(colors)]
-        self.selected_color = colors[0]
+        self.rects = [(pygame.Rect(x + i * px(45), y, px(35), px(35)), color) for i, color in enumerate(colors)]
+        self._selected_color = colors[0]
         self.label = label
         self.label_font = pygame.font.SysFont("Roboto", LABEL_FONT_SIZE)
 
+    @property
+    def selected_color(self):
+        """tuple: Selected color; setting a different one invalidates the picker."""
+        return self._selected_color
+
+    @selected_color.setter
+    def selected_color(self, color):
+        if color != self._selected_color:
+            self._selected_color = color
+            self.invalidate()
+
     def handle_event(self, event):
         """Handle color selection events.
 
@@ -136,42 +177,125 @@ class ModernColorPicker:
                     return True
         return False
 
-    def draw(self, screen):
-        """Draw the color picker with shadow.
+    def _bounds(self):
+        first = self.rects[0][0]
+        bounds = first.unionall([rect.move(px(2), px(2)) for rect, _ in self.rects])
+        if self.label:
+            bounds.union_ip(pygame.Rect((first.x, first.y - px(25)), self.label_font.size(self.label)))
+        return bounds
 
-        Args:
-            screen: Pygame surface to draw on.
-        """
+    def _redraw(self, surface, origin):
+        """Draw the color picker with shadow onto its cache surface."""
         if self.label:
-            render_text(self.label_font, self.label, LABEL_COLOR, self.rects[0][0].x, self.rects[0][0].y - 25, screen)
-        for rect, color in self.rects:
+            first = self.local(self.rects[0][0], origin)
+            render_text(self.label_font, self.label, LABEL_COLOR, first.x, first.y - px(25), surface)
+        for screen_rect, color in self.rects:
+            rect = self.local(screen_rect, origin)
             # Draw shadow
-            shadow_rect = rect.move(2, 2)
-            pygame.draw.rect(screen, (30, 30, 40), shadow_rect, border_radius=5)
+            shadow_rect = rect.move(px(2), px(2))
+            pygame.draw.rect(surface, (30, 30, 40), shadow_rect, border_radius=px(5))
             # Draw color box
-            pygame.draw.rect(screen, color, rect, border_radius=5)
+            pygame.draw.rect(surface, color, rect, border_radius=px(5))
             if color == self.selected_color:
-                pygame.draw.rect(screen, TEXT_COLOR, rect, 2, border_radius=5)
-                check_x = rect.centerx - 7
-                check_y = rect.centery - 3
-                pygame.draw.line(screen, TEXT_COLOR, (check_x, check_y), (check_x + 5, check_y + 5), 2)
-                pygame.draw.line(screen, TEXT_COLOR, (check_x + 5, check_y + 5), (check_x + 12, check_y - 7), 2)
+                pygame.draw.rect(surface, TEXT_COLOR, rect, BORDER_THICKNESS, border_radius=px(5))
+                check_x = rect.centerx - px(7)
+                check_y = rect.centery - px(3)
+                pygame.draw.line(surface, TEXT_COLOR, (check_x, check_y), (check_x + px(5), check_y + px(5)), BORDER_THICKNESS)
+                pygame.draw.line(surface, TEXT_COLOR, (check_x + px(5), check_y + px(5)), (check_x + px(12), check_y - px(7)),
+                                 BORDER_THICKNESS)
+
+class PromptPreview(Widget):
+    """Preview panel of the AI prompt, redrawn only when the universe text or library matches change."""
+
+    def __init__(self, rect, title_font, text_font):
+        """Initialize the PromptPreview.
+
+        Args:
+            rect (pygame.Rect): Panel area.
+            title_font: Pygame font for the panel title.
+            text_font: Pygame font for the prompt text.
+        """
+        super().__init__()
+        self.rect = rect
+        self.title_font = title_font
+        self.text_font = text_font
+        self.universe = None
+        self.matches = []
+
+    def set_matches(self, matches):
+        """Show the stored universes matching the typed name.
+
+        Args:
+            matches (list): Universe names from the library.
+        """
+        if matches != self.matches:
+            self.matches = list(matches)
+            self.invalidate()
+
+    def set_universe(self, universe):
+        """Update the universe shown in the prompt, invalidating only on a change.
+
+        Args:
+            universe (str): Universe name from the prompt box.
+        """
+        if universe != self.universe:
+            self.universe = universe
+            self.invalidate()
+
+    def _bounds(self):
+        return self.rect
+
+    def _redraw(self, surface, origin):
+        prompt = (f"Jesteś twórcą wideo w stylu 'Spin the wheel'. "
+                  f"Odpowiadasz na poniższe pytania, korzystając wyłącznie z uniwersum {self.universe}. "
+                  "Odpowiadaj tylko w formacie JSON, bez żadnych wyjaśnień...")
+        panel = self.local(self.rect, origin)
+        pygame.draw.rect(surface, (45, 45, 65), panel, border_radius=BORDER_RADIUS)
+        render_text(self.title_font, "Podgląd zapytania AI", LABEL_COLOR, panel.x + px(20), panel.y + px(10), surface)
+        if any(normalize_name(match) == normalize_name(self.universe or "") for match in self.matches):
+            render_text(self.text_font, "W bibliotece - zapis bez generowania", CONFIG_ACCENT_COLOR,
+                        panel.x + px(260), panel.y + px(13), surface)
+        elif self.matches:
+            render_text(self.text_font, "Biblioteka: " + ", ".join(self.matches), CONFIG_ACCENT_COLOR,
+                        panel.x + px(260), panel.y + px(13), surface)
+        self._render_multiline(surface, prompt, panel.x + px(20), panel.y + px(35), self.text_font, LABEL_COLOR,
+                               max_width=px(650))
+
+    def _render_multiline(self, surface, text, x, y, font, color, max_width):
+        words = text.split()
+        line = ''
+        for word in words:
+            test = (line + ' ' + word).strip()
+            if font.size(test)[0] < max_width:
+                line = test
+            else:
+                render_text(font, line, color, x, y, surface)
+                y += font.get_linesize()
+                line = word
+        if line:
+            render_text(font, line, color, x, y, surface)
 
 class ConfigView:
-    """Handles rendering of the configuration UI."""
+    """Handles rendering of the configuration UI.
+
+    The static panels are painted once into a background layer; inputs, the
+    color picker, buttons and the prompt preview are retained widgets whose
+    cached surfaces are composed over it each frame.
+    """
     def __init__(self, screen, config):
         self.screen = screen
         self.config = config
         self.screen_width, self.screen_height = WIDTH, HEIGHT
         self.fonts = self._load_fonts()
         self._init_controls()
+        self._static_layer = None
         logger.info("ConfigView initialized")
 
     def _load_fonts(self):
         return {
-            'title': pygame.font.SysFont("Roboto", 26),
-            'small': pygame.font.SysFont("Roboto", 20),
-            'tiny': pygame.font.SysFont("Roboto", 16),
+            'title': pygame.font.SysFont("Roboto", px(26)),
+            'small': pygame.font.SysFont("Roboto", px(20)),
+            'tiny': pygame.font.SysFont("Roboto", px(16)),
             'input': pygame.font.SysFont("Roboto", CONFIG_FONT_SIZE),
             'label': pygame.font.SysFont("Roboto", LABEL_FONT_SIZE),
         }
@@ -185,108 +309,122 @@ class ConfigView:
             cfg.get("prompt", "Star Wars"), label="Uniwersum:", placeholder="Podaj nazwę uniwersum..."
         )
         self.music_box = ModernInputBox(
-            800, CONFIG_MUSIC_Y, 360, CONFIG_INPUT_HEIGHT,
+            px(800), CONFIG_MUSIC_Y, px(360), CONFIG_INPUT_HEIGHT,
             cfg.get("music", "music.mp3"), label="Plik muzyczny:", placeholder="Podaj nazwę pliku..."
         )
         self.bg_box = ModernInputBox(
-            800, CONFIG_BG_IMAGE_Y, 360, CONFIG_INPUT_HEIGHT,
+            px(800), CONFIG_BG_IMAGE_Y, px(360), CONFIG_INPUT_HEIGHT,
             cfg.get("bg_img", "bg.png"), label="Plik tła:", placeholder="Podaj nazwę pliku..."
         )
         # Number of answers per question
         self.answer_inputs = []
         for i, _ in enumerate(QUESTIONS):
-            y = 150 + i * 45
+            y = px(160 + i * 45)
             num = (cfg['questions'][i]['num_answers'] if i < len(cfg.get('questions', [])) else 5)
             box = ModernInputBox(
-                655, y, CONFIG_NUM_INPUT_WIDTH, CONFIG_NUM_INPUT_HEIGHT,
+                px(655), y, CONFIG_NUM_INPUT_WIDTH, CONFIG_NUM_INPUT_HEIGHT,
                 str(num), numeric=True
             )
             self.answer_inputs.append(box)
         # Color picker
         colors = [(30, 30, 60), (60, 30, 60), (30, 60, 30), (60, 30, 30), (30, 30, 30), (60, 60, 30)]
-        self.color_picker = ModernColorPicker(800, CONFIG_COLOR_PICKER_Y, colors, label="Kolor tła:")
+        self.color_picker = ModernColorPicker(px(800), CONFIG_COLOR_PICKER_Y, colors, label="Kolor tła:")
         # Buttons
-        self.save_button = self._make_button(CONFIG_BUTTON_X, CONFIG_BUTTON_Y, 180, 50,
-                                             "Zapisz i Generuj", CONFIG_BUTTON_COLOR, CONFIG_BUTTON_HOVER_COLOR)
-        self.back_button = self._make_button(CONFIG_BUTTON_X + 30, CONFIG_BACK_BUTTON_Y, 150, 50,
+        self.save_button = self._make_button(CONFIG_BUTTON_X, CONFIG_BUTTON_Y, px(180), px(50),
+                                             CONFIG_SAVE_TEXT, CONFIG_BUTTON_COLOR, CONFIG_BUTTON_HOVER_COLOR)
+        self.back_button = self._make_button(CONFIG_BUTTON_X + px(30), CONFIG_BACK_BUTTON_Y, px(150), px(50),
                                              "Powrót", BACK_BUTTON_COLOR, BACK_BUTTON_HOVER_COLOR)
+        self.button_widgets = [ButtonWidget(btn, self.fonts['title']) for btn in (self.save_button, self.back_button)]
+        self.prompt_preview = PromptPreview(pygame.Rect(px(40), px(660), px(720), px(90)), self.fonts['small'], self.fonts['tiny'])
+        self.widgets = (self.answer_inputs + [self.prompt_box, self.color_picker, self.music_box, self.bg_box]
+                        + self.button_widgets + [self.prompt_preview])
 
     def _make_button(self, x, y, w, h, text, color, hover_color):
         return {'rect': pygame.Rect(x, y, w, h), 'text': text,
                 'color': color, 'hover': hover_color}
 
     def render(self):
-        self._draw_background()
-        self._draw_main_panel()
-        self._draw_questions_panel()
-        self._draw_inputs()
-        self._draw_buttons()
-        self._draw_prompt_preview()
+        if self._static_layer is None:
+            self._static_layer = self._build_static_layer()
+        self.screen.blit(self._static_layer, (0, 0))
+        mouse = display.mouse_pos()
+        for button in self.button_widgets:
+            button.set_hovered(button.button['rect'].collidepoint(mouse))
+        self.prompt_preview.set_universe(self.prompt_box.text)
+        for widget in self.widgets:
+            widget.draw(self.screen)
+
+    def config_changed(self, changes):
+        """Show reloaded values in the controls that are not being edited.
+
+        Args:
+            changes (dict): Changes from diff_config().
+        """
+        cfg = self.config
+        for key, box in (("prompt", self.prompt_box), ("music", self.music_box), ("bg_img", self.bg_box)):
+            if key in changes and not box.active:
+                box.text = str(cfg[key])
+        if "bg_color" in changes and tuple(cfg["bg_color"]) in self.color_picker.colors:
+            self.color_picker.selected_color = tuple(cfg["bg_color"])
+        for i in changes.get("questions", []):
+            if i < len(self.answer_inputs) and i < len(cfg["questions"]) and not self.answer_inputs[i].active:
+                self.answer_inputs[i].text = str(cfg["questions"][i]["num_answers"])
 
-    def _draw_background(self):
-        draw_gradient_background(self.screen, self.screen_height, CONFIG_BG_COLOR, (50, 50, 100))
+    def set_saving(self, saving):
+        """Show on the save button whether a save is running.
 
-    def _draw_main_panel(self):
+        Args:
+            saving (bool): True while answers are generated and the configuration is written.
+        """
+        self.button_widgets[0].set_text(CONFIG_SAVING_TEXT if saving else CONFIG_SAVE_TEXT)
+
+    def cache_bytes(self):
+        """Get the pixel memory of the static layer and the widget caches.
+
+        Returns:
+            int: Bytes held by cached surfaces.
+        """
+        surfaces = [self._static_layer] + [widget._surface for widget in self.widgets]
+        return sum(surface_bytes(surface) for surface in surfaces if surface is not None)
+
+    def release_caches(self):
+        """Drop the static layer and the widget caches; they are rebuilt on the next render."""
+        self._static_layer = None
+        for widget in self.widgets:
+            widget.release()
+
+    def _build_static_layer(self):
+        """Paint the background and the panels that never change into one surface."""
+        layer = pygame.Surface((self.screen_width, self.screen_height))
+        self._draw_background(layer)
+        self._draw_main_panel(layer)
+        self._draw_questions_panel(layer)
+        return layer
+
+    def _draw_background(self, surface):
+        draw_gradient_background(surface, self.screen_height, CONFIG_BG_COLOR, (50, 50, 100))
+
+    def _draw_main_panel(self, surface):
         panel = pygame.Rect(CONFIG_PANEL_X, CONFIG_PANEL_Y,
                             CONFIG_PANEL_WIDTH, CONFIG_PANEL_HEIGHT)
-        pygame.draw.rect(self.screen, CONFIG_PANEL_COLOR, panel, border_radius=BORDER_RADIUS)
-        pygame.draw.rect(self.screen, (60, 60, 80), panel, BORDER_THICKNESS, border_radius=BORDER_RADIUS)
+        pygame.draw.rect(surface, CONFIG_PANEL_COLOR, panel, border_radius=BORDER_RADIUS)
+        pygame.draw.rect(surface, (60, 60, 80), panel, BORDER_THICKNESS, border_radius=BORDER_RADIUS)
         render_text(self.fonts['title'], "KONFIGURACJA", TEXT_COLOR,
-                    self.screen_width / 2, 10, self.screen, center=True)
+                    self.screen_width / 2, px(10), surface, center=True)
 
-    def _draw_questions_panel(self):
+    def _draw_questions_panel(self, surface):
         rect = pygame.Rect(CONFIG_QUESTIONS_RECT_X,
-                           CONFIG_QUESTIONS_RECT_Y + 10,
+                           CONFIG_QUESTIONS_RECT_Y + px(10),
                            CONFIG_QUESTIONS_RECT_WIDTH,
                            CONFIG_QUESTIONS_RECT_HEIGHT)
-        pygame.draw.rect(self.screen, (45, 45, 65), rect, border_radius=BORDER_RADIUS)
+        pygame.draw.rect(surface, (45, 45, 65), rect, border_radius=BORDER_RADIUS)
         render_text(self.fonts['small'], "Pytania i liczba odpowiedzi", LABEL_COLOR,
-                    rect.centerx, CONFIG_QUESTIONS_RECT_Y + PADDING + 4,
-                    self.screen, center=True)
+                    rect.centerx, CONFIG_QUESTIONS_RECT_Y + PADDING + px(4),
+                    surface, center=True)
         for i, text in enumerate(QUESTIONS):
-            y = 160 + i * 45
-            circle_pos = (95, y + 12)
-            pygame.draw.circle(self.screen, CONFIG_ACCENT_COLOR, circle_pos, 15)
+            y = px(160 + i * 45)
+            circle_pos = (px(95), y + px(12))
+            pygame.draw.circle(surface, CONFIG_ACCENT_COLOR, circle_pos, px(15))
             render_text(self.fonts['small'], f"{i+1}", TEXT_COLOR,
-                        circle_pos[0], circle_pos[1] - 6, self.screen, center=True)
-            render_text(self.fonts['small'], text, TEXT_COLOR, 120, y + 6, self.screen)
-            self.answer_inputs[i].rect.y = y
-            self.answer_inputs[i].draw(self.screen)
-
-    def _draw_inputs(self):
-        self.prompt_box.draw(self.screen)
-        self.color_picker.draw(self.screen)
-        self.music_box.draw(self.screen)
-        self.bg_box.draw(self.screen)
-
-    def _draw_buttons(self):
-        mouse = pygame.mouse.get_pos()
-        for btn in (self.save_button, self.back_button):
-            shadow = btn['rect'].move(4, 4)
-            pygame.draw.rect(self.screen, (40, 40, 50), shadow, border_radius=BORDER_RADIUS)
-            color = btn['hover'] if btn['rect'].collidepoint(mouse) else btn['color']
-            draw_button(self.screen, btn['rect'], color, btn['text'], self.fonts['title'])
-
-    def _draw_prompt_preview(self):
-        prompt = (f"Jesteś twórcą wideo w stylu 'Spin the wheel'. "
-                  f"Odpowiadasz na poniższe pytania, korzystając wyłącznie z uniwersum {self.prompt_box.text}. "
-                  "Odpowiadaj tylko w formacie JSON, bez żadnych wyjaśnień...")
-        panel = pygame.Rect(40, 660, 720, 90)
-        pygame.draw.rect(self.screen, (45, 45, 65), panel, border_radius=BORDER_RADIUS)
-        render_text(self.fonts['small'], "Podgląd zapytania AI", LABEL_COLOR,
-                    panel.x + 20, panel.y + 10, self.screen)
-        self._render_multiline(prompt, panel.x + 20, panel.y + 35, self.fonts['tiny'], LABEL_COLOR, max_width=650)
-
-    def _render_multiline(self, text, x, y, font, color, max_width):
-        words = text.split()
-        line = ''
-        for word in words:
-            test = (line + ' ' + word).strip()
-            if font.size(test)[0] < max_width:
-                line = test
-            else:
-                render_text(font, line, color, x, y, self.screen)
-                y += font.get_linesize()
-                line = word
-        if line:
-            render_text(font, line, color, x, y, self.screen)
\ No newline at end of file
+                        circle_pos[0], circle_pos[1] - px(6), surface, center=True)
+            render_text(self.fonts['small'], text, TEXT_COLOR, px(120), y + px(6), surface)
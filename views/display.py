@@ -0,0 +1,188 @@
+import os
+import logging
+
+import pygame
+
+from constants import WIDTH, HEIGHT, RENDER_SCALE, WINDOW_SIZE_ENV, FULLSCREEN_ENV, DISPLAY_SMOOTH_SCALE
+
+logger = logging.getLogger(__name__)
+
+def parse_size(text):
+    """Parse a window size such as "1920x1080".
+
+    Args:
+        text (str): Width and height separated by "x".
+
+    Returns:
+        tuple: (width, height), or None for an empty text.
+
+    Raises:
+        ValueError: If the text is not a positive size.
+    """
+    if not text:
+        return None
+    width, height = (int(part) for part in text.lower().split("x"))
+    if width <= 0 or height <= 0:
+        raise ValueError(f"Invalid window size: {text}")
+    return width, height
+
+def fit_rect(size, window):
+    """Place a surface scaled to fit a window, keeping its aspect ratio.
+
+    Args:
+        size (tuple): Size of the surface.
+        window (tuple): Size of the window.
+
+    Returns:
+        pygame.Rect: Area of the window the surface covers, centered with letterbox bars.
+    """
+    scale = min(window[0] / size[0], window[1] / size[1])
+    rect = pygame.Rect(0, 0, max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+    rect.center = (window[0] // 2, window[1] // 2)
+    return rect
+
+def window_settings():
+    """Read the window size and fullscreen settings from the environment.
+
+    Returns:
+        tuple: (window size or None, fullscreen).
+    """
+    return parse_size(os.environ.get(WINDOW_SIZE_ENV, "")), bool(os.environ.get(FULLSCREEN_ENV))
+
+class Display:
+    """Owns the window and the canvas all views draw on.
+
+    This class gives the views a canvas of the render resolution, WIDTH x
+    HEIGHT, and presents it at any window or fullscreen size. By default
+    pygame.SCALED lets SDL scale the canvas, usually on the GPU, and map
+    mouse positions back. When a window size is requested, or SCALED is not
+    available, the canvas is an offscreen surface scaled on the CPU into a
+    cached surface of the fitted size, and map_event() and mouse_pos()
+    translate window positions to canvas positions.
+    """
+
+    def __init__(self, size=(WIDTH, HEIGHT), smooth=DISPLAY_SMOOTH_SCALE):
+        """Initialize the Display.
+
+        Args:
+            size (tuple): Render resolution of the canvas.
+            smooth (bool): Scale bilinearly instead of nearest neighbour when scaling on the CPU.
+        """
+        self.size = size
+        self.smooth = smooth
+        self.canvas = None
+        self.window = None
+        self.scaled = False
+        self.dest = pygame.Rect((0, 0), size)
+        self._frame = None
+
+    def open(self, window_size=None, fullscreen=False, caption=None):
+        """Open the window.
+
+        Args:
+            window_size (tuple): Window size, or None to let SDL size the window for the render resolution.
+            fullscreen (bool): Fill the screen.
+            caption (str): Window title.
+
+        Returns:
+            pygame.Surface: Canvas to render to.
+        """
+        if caption:
+            pygame.display.set_caption(caption)
+        if window_size is None:
+            os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "1")
+            flags = pygame.SCALED | (pygame.FULLSCREEN if fullscreen else 0)
+            try:
+                self.window = self.canvas = pygame.display.set_mode(self.size, flags)
+                self.scaled = True
+                self.dest = pygame.Rect((0, 0), self.size)
+                logger.info("Rendering at %dx%d (scale %.2f), scaled by SDL", *self.size, RENDER_SCALE)
+                return self.canvas
+            except pygame.error as e:
+                logger.warning("Scaled display unavailable (%s), scaling on the CPU", e)
+        if fullscreen:
+            self.window = pygame.display.set_mode(window_size or (0, 0), pygame.FULLSCREEN)
+        else:
+            self.window = pygame.display.set_mode(window_size or self.size, pygame.RESIZABLE)
+        self.canvas = pygame.Surface(self.size).convert()
+        self.scaled = False
+        self.resize(self.window.get_size())
+        logger.info("Rendering at %dx%d (scale %.2f), scaled to %dx%d on the CPU",
+                    *self.size, RENDER_SCALE, *self.window.get_size())
+        return self.canvas
+
+    def resize(self, window_size):
+        """Fit the canvas to a new window size; only needed when scaling on the CPU.
+
+        Args:
+            window_size (tuple): New window size.
+        """
+        if self.scaled:
+            return
+        self.window = pygame.display.get_surface()
+        self.dest = fit_rect(self.size, window_size)
+        self._frame = None if self.dest.size == self.size else pygame.Surface(self.dest.size, 0, self.window)
+        self.window.fill((0, 0, 0))
+
+    def handle_event(self, event):
+        """Follow window resizes.
+
+        Args:
+            event: Pygame event object.
+
+        Returns:
+            bool: True if the event was a resize and is consumed.
+        """
+        if event.type == pygame.VIDEORESIZE:
+            self.resize(event.size)
+            return True
+        return False
+
+    def to_canvas(self, pos):
+        """Translate a window position into canvas coordinates.
+
+        Args:
+            pos (tuple): Window position.
+
+        Returns:
+            tuple: Canvas position, clamped to the canvas.
+        """
+        if self.scaled or self.dest.size == self.size and self.dest.topleft == (0, 0):
+            return pos
+        x = (pos[0] - self.dest.x) * self.size[0] // self.dest.width
+        y = (pos[1] - self.dest.y) * self.size[1] // self.dest.height
+        return min(max(x, 0), self.size[0] - 1), min(max(y, 0), self.size[1] - 1)
+
+    def map_event(self, event):
+        """Translate the position of a mouse event into canvas coordinates in place.
+
+        Args:
+            event: Pygame event object.
+
+        Returns:
+            The same event.
+        """
+        if not self.scaled and hasattr(event, "pos"):
+            event.pos = self.to_canvas(event.pos)
+        return event
+
+    def mouse_pos(self):
+        """Get the mouse position in canvas coordinates.
+
+        Returns:
+            tuple: Canvas position (x, y).
+        """
+        return self.to_canvas(pygame.mouse.get_pos())
+
+    def present(self):
+        """Show the canvas in the window."""
+        if not self.scaled:
+            if self._frame is None:
+                self.window.blit(self.canvas, self.dest)
+            else:
+                scale = pygame.transform.smoothscale if self.smooth else pygame.transform.scale
+                scale(self.canvas, self.dest.size, self._frame)
+                self.window.blit(self._frame, self.dest)
+        pygame.display.flip()
+
+display = Display()
@@ -1,18 +1,23 @@
 from pathlib import Path
 
 import pygame
-import math
 import logging
 from constants import (
-    WIDTH, HEIGHT, CENTER, WHEEL_RADIUS, SEGMENT_COLORS, FONT_SIZE, RESPONSE_FONT_SCALE,
+    WIDTH, HEIGHT, CENTER, WHEEL_RADIUS, FONT_SIZE, RESPONSE_FONT_SCALE,
     SMALL_FONT_SCALE, QUESTIONS, PROGRESS_TEXT_POS, RESULT_TEXT_Y, INSTRUCTIONS_Y, TITLE_Y,
     RESPONSE_TEXT_Y_OFFSET, TEXT_BG_ALPHA, TEXT_MARGIN, RESULT_Y_START, RESULT_Y_GAP,
     RESPONSE_Y_GAP, BUTTON_WIDTH, SAVE_BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_Y_OFFSET,
-    EXIT_BUTTON_COLOR, SAVE_BUTTON_COLOR, TEXT_RADIUS_SCALE, FONT_SIZE_REDUCTION,
+    EXIT_BUTTON_COLOR, SAVE_BUTTON_COLOR,
     CIRCLE_RADIUS, CIRCLE_BORDER_COLOR, CIRCLE_FILL_COLOR, INDICATOR_Y_OFFSET,
-    INDICATOR_SIZE, INDICATOR_COLOR, BORDER_THICKNESS, PADDING
+    INDICATOR_SIZE, INDICATOR_COLOR, BORDER_THICKNESS, PADDING, SAVING_BUTTON_COLOR, SAVE_FAILED_BUTTON_COLOR,
+    BACKGROUNDS_DIR, px
 )
+from models.assets import asset_store
+from models.memory_tracker import memory_tracker, surface_bytes
+from models.metrics import metrics
+from models.result_saver import SaveStatus
 from utils import render_text, draw_button, wrap_text
+from views.wheel_renderer import WheelRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -34,21 +39,72 @@ class GameView:
         self.font = pygame.font.SysFont("Arial", FONT_SIZE, bold=True)
         self.response_font = pygame.font.SysFont("Arial", int(FONT_SIZE * RESPONSE_FONT_SCALE))
         self.small_font = pygame.font.SysFont("Arial", int(FONT_SIZE * SMALL_FONT_SCALE), bold=True)
+        self._bg_name = None
+        self._bg_image = None
+        self._text_bg = pygame.Surface((WIDTH, px(80)), pygame.SRCALPHA)
+        self._text_bg.fill((0, 0, 0, TEXT_BG_ALPHA))
+        self.wheel_renderer = WheelRenderer()
+        self.exit_rect = pygame.Rect(WIDTH // 2 - BUTTON_WIDTH - PADDING, HEIGHT + BUTTON_Y_OFFSET, BUTTON_WIDTH, BUTTON_HEIGHT)
+        self.save_rect = pygame.Rect(WIDTH // 2 + PADDING, HEIGHT + BUTTON_Y_OFFSET, SAVE_BUTTON_WIDTH, BUTTON_HEIGHT)
         logger.info("GameView initialized")
 
+    @property
+    def background(self):
+        """pygame.Surface or None: Cached background image, without loading it."""
+        return self._bg_image
+
+    def background_bytes(self):
+        """int: Pixel memory of the cached background image."""
+        return surface_bytes(self._bg_image) if self._bg_image is not None else 0
+
+    def release_background(self):
+        """Drop the background image; it is loaded again on the next render."""
+        if self._bg_name not in (None, "None"):
+            asset_store.evict(Path(BACKGROUNDS_DIR) / self._bg_name)
+        self._bg_name = None
+        self._bg_image = None
+
+    def config_changed(self, changes):
+        """Drop the background image when another one is configured; bg_color is read every frame.
+
+        Args:
+            changes (dict): Changes from diff_config().
+        """
+        if "bg_img" in changes:
+            self.release_background()
+
+    def assets_changed(self, paths):
+        """Drop the background image when its file changed.
+
+        Args:
+            paths (set): Changed asset paths.
+        """
+        if self._bg_name not in (None, "None") and (Path(BACKGROUNDS_DIR) / self._bg_name).as_posix() in paths:
+            self._bg_name = None
+            self._bg_image = None
+
     def render_background(self):
         """Render the background."""
         self.screen.fill(tuple(self.config["bg_color"]))
-        if self.config["bg_img"] != "None":
-            try:
-                img_path = Path('assets') / 'backgrounds' / self.config["bg_img"]
-                img = pygame.image.load(img_path)
-                self.screen.fill((128, 128, 128))
-                self.screen.blit(img, (0, 0), None, pygame.BLEND_RGB_ADD)
-            except FileNotFoundError:
-                logger.error(f"Background image not found: {self.config['bg_img']}")
-            except pygame.error as e:
-                logger.error(f"Error loading background image: {e}")
+        img = self._background_image()
+        if img is not None:
+            self.screen.fill((128, 128, 128))
+            self.screen.blit(img, (0, 0), None, pygame.BLEND_RGB_ADD)
+
+    def _background_image(self):
+        """Get the configured background image, loading it only when the name changes.
+
+        Returns:
+            pygame.Surface or None: Background image, or None if unset, missing or unreadable.
+        """
+        name = self.config["bg_img"]
+        if name == self._bg_name:
+            metrics.record_cache("background", True)
+            return self._bg_image
+        metrics.record_cache("background", False)
+        self._bg_name = name
+        self._bg_image = asset_store.image(Path(BACKGROUNDS_DIR) / name) if name != "None" else None
+        return self._bg_image
 
     def render_spinning(self, wheel_model, current_draw):
         """Render the spinning state.
@@ -87,11 +143,8 @@ class GameView:
         if media_loader.current_frame_surface:
             frame_rect = media_loader.current_frame_surface.get_rect(center=CENTER)
             self.screen.blit(media_loader.current_frame_surface, frame_rect)
-        render_text(self.font, f"Result: {result}", (0, 0, 0), WIDTH // 2, 30, self.screen, center=True)
-        text_bg_rect = pygame.Rect(0, HEIGHT + RESPONSE_TEXT_Y_OFFSET, WIDTH, 80)
-        s = pygame.Surface((text_bg_rect.width, text_bg_rect.height), pygame.SRCALPHA)
-        s.fill((0, 0, 0, TEXT_BG_ALPHA))
-        self.screen.blit(s, text_bg_rect)
+        render_text(self.font, f"Result: {result}", (0, 0, 0), WIDTH // 2, px(30), self.screen, center=True)
+        self.screen.blit(self._text_bg, (0, HEIGHT + RESPONSE_TEXT_Y_OFFSET))
         max_width = WIDTH - TEXT_MARGIN
         lines = wrap_text(response, self.response_font, max_width)
         line_height = self.response_font.get_height()
@@ -99,26 +152,68 @@ class GameView:
             render_text(self.response_font, line, (255, 255, 255), WIDTH // 2,
                         HEIGHT + RESPONSE_TEXT_Y_OFFSET + (i * line_height), self.screen, center=True)
 
-    def render_results(self, results, responses, is_saved):
+    def render_results(self, results, responses, save_status):
         """Render the results state.
 
         Args:
             results (list): List of results.
             responses (list): List of responses.
-            is_saved (bool): Whether results are saved.
+            save_status (SaveStatus): State of the result image saving.
         """
         self.render_background()
-        render_text(self.font, "Final Results", (0, 0, 0), WIDTH // 2, TITLE_Y, self.screen, center=True)
-        result_y = RESULT_Y_START
+        self._draw_results_list(self.screen, results, responses, self.font, self.small_font)
+        save_rect = self.save_rect
+        draw_button(self.screen, self.exit_rect, EXIT_BUTTON_COLOR, "Zakończ", self.font)
+        if save_status == SaveStatus.SAVING:
+            draw_button(self.screen, save_rect, SAVING_BUTTON_COLOR, "Zapisywanie...", self.font)
+        elif save_status == SaveStatus.FAILED:
+            draw_button(self.screen, save_rect, SAVE_FAILED_BUTTON_COLOR, "Błąd zapisu", self.font)
+        else:
+            color = SAVE_BUTTON_COLOR if save_status == SaveStatus.SAVED else EXIT_BUTTON_COLOR
+            draw_button(self.screen, save_rect, color, "Zapisz wynik", self.font)
+
+    def render_results_print(self, results, responses, scale):
+        """Re-render the results list offscreen at a higher resolution, without buttons.
+
+        Args:
+            results (list): List of results.
+            responses (list): List of responses.
+            scale (float): Resolution multiplier relative to the window size.
+
+        Returns:
+            pygame.Surface: Offscreen surface of size (WIDTH * scale, HEIGHT * scale).
+        """
+        surface = pygame.Surface((int(WIDTH * scale), int(HEIGHT * scale)))
+        surface.fill(tuple(self.config["bg_color"]))
+        img = self._background_image()
+        if img is not None:
+            img = pygame.transform.smoothscale(img, (int(img.get_width() * scale), int(img.get_height() * scale)))
+            surface.fill((128, 128, 128))
+            surface.blit(img, (0, 0), None, pygame.BLEND_RGB_ADD)
+        font = pygame.font.SysFont("Arial", int(FONT_SIZE * scale), bold=True)
+        small_font = pygame.font.SysFont("Arial", int(FONT_SIZE * SMALL_FONT_SCALE * scale), bold=True)
+        self._draw_results_list(surface, results, responses, font, small_font, scale)
+        return surface
+
+    def _draw_results_list(self, surface, results, responses, font, small_font, scale=1):
+        """Draw the results title and the list of draws.
+
+        Args:
+            surface: Pygame surface to draw on.
+            results (list): List of results.
+            responses (list): List of responses.
+            font: Title font.
+            small_font: Font for the result rows.
+            scale (float): Multiplier for all layout positions.
+        """
+        center_x = int(WIDTH * scale) // 2
+        render_text(font, "Final Results", (0, 0, 0), center_x, int(TITLE_Y * scale), surface, center=True)
+        result_y = RESULT_Y_START * scale
         for i, (result, response) in enumerate(zip(results, responses)):
-            render_text(self.small_font, f"Draw {i+1}: {result}", (0, 0, 0), WIDTH // 2, result_y, self.screen, center=True)
-            result_y += RESULT_Y_GAP
-            render_text(self.small_font, f'"{response}"', (80, 80, 80), WIDTH // 2, result_y, self.screen, center=True)
-            result_y += RESPONSE_Y_GAP
-        exit_rect = pygame.Rect(WIDTH // 2 - BUTTON_WIDTH - PADDING, HEIGHT + BUTTON_Y_OFFSET, BUTTON_WIDTH, BUTTON_HEIGHT)
-        save_rect = pygame.Rect(WIDTH // 2 + PADDING, HEIGHT + BUTTON_Y_OFFSET, SAVE_BUTTON_WIDTH, BUTTON_HEIGHT)
-        draw_button(self.screen, exit_rect, EXIT_BUTTON_COLOR, "Zakończ", self.font)
-        draw_button(self.screen, save_rect, SAVE_BUTTON_COLOR if is_saved else EXIT_BUTTON_COLOR, "Zapisz wynik", self.font)
+            render_text(small_font, f"Draw {i+1}: {result}", (0, 0, 0), center_x, int(result_y), surface, center=True)
+            result_y += RESULT_Y_GAP * scale
+            render_text(small_font, f'"{response}"', (80, 80, 80), center_x, int(result_y), surface, center=True)
+            result_y += RESPONSE_Y_GAP * scale
 
     def _draw_wheel(self, wheel_model):
         """Draw the wheel based on the model.
@@ -126,25 +221,7 @@ class GameView:
         Args:
             wheel_model: SpinWheelModel instance.
         """
-        for i in range(wheel_model.segment_count):
-            start_angle = math.radians(wheel_model.angle + i * wheel_model.segment_angle)
-            end_angle = math.radians(wheel_model.angle + (i + 1) * wheel_model.segment_angle)
-            points = [CENTER]
-            for angle in [start_angle, end_angle]:
-                x = CENTER[0] + WHEEL_RADIUS * math.cos(angle)
-                y = CENTER[1] - WHEEL_RADIUS * math.sin(angle)
-                points.append((int(x), int(y)))
-            color = SEGMENT_COLORS[i % len(SEGMENT_COLORS)]
-            pygame.draw.polygon(self.screen, color, points)
-            pygame.draw.polygon(self.screen, (0, 0, 0), points, BORDER_THICKNESS)
-            mid_angle = (start_angle + end_angle) / 2
-            text_radius = WHEEL_RADIUS * TEXT_RADIUS_SCALE
-            text_x = CENTER[0] + text_radius * math.cos(mid_angle)
-            text_y = CENTER[1] - text_radius * math.sin(mid_angle)
-            text_font = pygame.font.SysFont("Arial", FONT_SIZE - FONT_SIZE_REDUCTION, bold=True)
-            text_surface = text_font.render(wheel_model.segments[i], True, (0, 0, 0))
-            text_rect = text_surface.get_rect(center=(text_x, text_y))
-            self.screen.blit(text_surface, text_rect)
+        self.wheel_renderer.draw(self.screen, wheel_model, CENTER)
         pygame.draw.circle(self.screen, CIRCLE_FILL_COLOR, CENTER, CIRCLE_RADIUS)
         pygame.draw.circle(self.screen, CIRCLE_BORDER_COLOR, CENTER, CIRCLE_RADIUS, BORDER_THICKNESS)
         indicator_point = (CENTER[0], CENTER[1] - WHEEL_RADIUS + INDICATOR_Y_OFFSET)
@@ -0,0 +1,46 @@
+import pygame
+import logging
+from constants import MENU_BG_COLOR, TEXT_COLOR, BORDER_RADIUS, BORDER_THICKNESS, LOADING_BAR_SIZE, LOADING_BAR_COLOR, px
+from utils import draw_gradient_background
+
+logger = logging.getLogger(__name__)
+
+class LoadingView:
+    """Handles rendering of the loading screen.
+
+    This class draws a title and a progress bar while assets are preloaded.
+    """
+
+    def __init__(self, screen):
+        """Initialize the LoadingView.
+
+        Args:
+            screen: Pygame surface for rendering.
+        """
+        self.screen = screen
+        self.font = pygame.font.SysFont("Roboto", px(44), bold=True)
+        self.small_font = pygame.font.SysFont("Roboto", px(22))
+        self.screen_width, self.screen_height = self.screen.get_size()
+        self.bar_rect = pygame.Rect(0, 0, *LOADING_BAR_SIZE)
+        self.bar_rect.center = (self.screen_width // 2, self.screen_height // 2)
+        logger.info("LoadingView initialized")
+
+    def render(self, progress, done, total):
+        """Render the loading screen.
+
+        Args:
+            progress (float): Share of the assets loaded, from 0 to 1.
+            done (int): Number of assets loaded.
+            total (int): Number of assets to load.
+        """
+        draw_gradient_background(self.screen, self.screen_height, MENU_BG_COLOR, (50, 50, 100))
+        title = self.font.render("LOADING", True, TEXT_COLOR)
+        self.screen.blit(title, title.get_rect(center=(self.screen_width // 2, self.screen_height // 3)))
+        pygame.draw.rect(self.screen, (60, 60, 70), self.bar_rect, border_radius=BORDER_RADIUS)
+        filled = self.bar_rect.copy()
+        filled.width = int(self.bar_rect.width * min(max(progress, 0), 1))
+        if filled.width:
+            pygame.draw.rect(self.screen, LOADING_BAR_COLOR, filled, border_radius=BORDER_RADIUS)
+        pygame.draw.rect(self.screen, TEXT_COLOR, self.bar_rect, BORDER_THICKNESS, border_radius=BORDER_RADIUS)
+        count = self.small_font.render(f"{done}/{total}", True, TEXT_COLOR)
+        self.screen.blit(count, count.get_rect(midtop=(self.screen_width // 2, self.bar_rect.bottom + px(12))))
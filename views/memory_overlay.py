@@ -0,0 +1,80 @@
+import time
+import pygame
+import logging
+from constants import (
+    MEMORY_OVERLAY_POS, MEMORY_OVERLAY_SIZE, MEMORY_OVERLAY_REFRESH, PROFILER_OVERLAY_ALPHA, PROFILER_FONT_SIZE,
+    TEXT_COLOR, px
+)
+from utils import render_text
+
+logger = logging.getLogger(__name__)
+
+def _format_bytes(value):
+    """Format a byte count as KB or MB."""
+    return f"{value / 1048576:.1f} MB" if value >= 1048576 else f"{value / 1024:.0f} KB"
+
+class MemoryOverlay:
+    """Draws Surface memory per owner on top of the current screen.
+
+    This class re-measures at most every MEMORY_OVERLAY_REFRESH seconds, since
+    walking the owners is too slow to repeat every frame.
+    """
+
+    def __init__(self, screen, tracker):
+        """Initialize the MemoryOverlay.
+
+        Args:
+            screen: Pygame surface for rendering.
+            tracker: MemoryTracker instance to read from.
+        """
+        self.screen = screen
+        self.tracker = tracker
+        self.visible = False
+        self.font = pygame.font.SysFont("Consolas", PROFILER_FONT_SIZE)
+        self.background = pygame.Surface(MEMORY_OVERLAY_SIZE, pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, PROFILER_OVERLAY_ALPHA))
+        self.lines = []
+        self._last_sample = 0.0
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self._last_sample = 0.0
+        logger.info("Memory overlay %s", "shown" if self.visible else "hidden")
+
+    def refresh(self, state):
+        """Measure now and rebuild the overlay text.
+
+        Args:
+            state (str): Current application state.
+        """
+        usage = self.tracker.sample(state)
+        total = sum(entry["bytes"] for entry in usage.values())
+        self.lines = [f"[{state}] surfaces {_format_bytes(total)} (peak {_format_bytes(self.tracker.peak(state))})"]
+        for name, entry in sorted(usage.items(), key=lambda item: -item[1]["bytes"]):
+            self.lines.append(f"  {name:<16} {_format_bytes(entry['bytes']):>9} {entry['surfaces']:>4} surf "
+                              f"{entry['fonts']:>2} fnt")
+        if self.tracker.transitions:
+            last = self.tracker.transitions[-1]
+            self.lines.append(f"last switch {last['from']} -> {last['to']}")
+            for diff in last.get("top_diffs", [])[:3]:
+                self.lines.append(f"  {diff['bytes'] / 1024:+8.0f} KB {diff['where'][-28:]}")
+
+    def render(self, state):
+        """Draw the overlay for the given state.
+
+        Args:
+            state (str): Current application state.
+        """
+        if not self.visible:
+            return
+        now = time.perf_counter()
+        if now - self._last_sample >= MEMORY_OVERLAY_REFRESH:
+            self._last_sample = now
+            self.refresh(state)
+        x, y = MEMORY_OVERLAY_POS
+        self.screen.blit(self.background, (x, y))
+        line_height = self.font.get_linesize()
+        max_lines = (MEMORY_OVERLAY_SIZE[1] - px(12)) // line_height
+        for i, line in enumerate(self.lines[:max_lines]):
+            render_text(self.font, line, TEXT_COLOR, x + px(8), y + px(6) + i * line_height, self.screen)
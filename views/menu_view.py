@@ -1,8 +1,9 @@
 import pygame
 import logging
 from constants import MENU_BG_COLOR, MENU_BUTTON_HEIGHT, TEXT_COLOR, MENU_BUTTON_SPACING, MENU_BUTTON_WIDTH, \
-    SAVE_BUTTON_BORDER_COLOR, MENU_BUTTONS_OFFSET
+    SAVE_BUTTON_BORDER_COLOR, MENU_BUTTONS_OFFSET, px
 from utils import draw_button, draw_gradient_background
+from views.display import display
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,8 @@ class MenuView:
             screen: Pygame surface for rendering.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont("Roboto", 44, bold=True)
-        self.button_font = pygame.font.SysFont("Roboto", 28, bold=True)
+        self.font = pygame.font.SysFont("Roboto", px(44), bold=True)
+        self.button_font = pygame.font.SysFont("Roboto", px(28), bold=True)
         self.screen_width, self.screen_height = self.screen.get_size()
         self.buttons = [
             {"label": "CONFIGURE", "action": "config", "w": MENU_BUTTON_WIDTH, "h": MENU_BUTTON_HEIGHT},
@@ -43,7 +44,7 @@ class MenuView:
         self.screen.blit(title, title_rect)
 
         # Buttons
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display.mouse_pos()
         self.hovered_button = None
         for button in self.buttons:
             rect = pygame.Rect(
@@ -0,0 +1,63 @@
+import pygame
+import logging
+from constants import (
+    PROFILER_OVERLAY_POS, PROFILER_OVERLAY_SIZE, PROFILER_OVERLAY_ALPHA, PROFILER_FONT_SIZE, TEXT_COLOR, px
+)
+from models.frame_profiler import PHASES
+from utils import render_text
+
+logger = logging.getLogger(__name__)
+
+class ProfilerOverlay:
+    """Draws frame timing statistics on top of the current screen.
+
+    This class renders FPS, frame time percentiles and the per-phase breakdown.
+    """
+
+    def __init__(self, screen, profiler, record_always=False):
+        """Initialize the ProfilerOverlay.
+
+        Args:
+            screen: Pygame surface for rendering.
+            profiler: FrameProfiler instance to read from.
+            record_always (bool): Keep recording frames while the overlay is hidden.
+        """
+        self.screen = screen
+        self.profiler = profiler
+        self.record_always = record_always
+        self.visible = False
+        self.font = pygame.font.SysFont("Consolas", PROFILER_FONT_SIZE)
+        self.background = pygame.Surface(PROFILER_OVERLAY_SIZE, pygame.SRCALPHA)
+        self.background.fill((0, 0, 0, PROFILER_OVERLAY_ALPHA))
+
+    def toggle(self):
+        """Show or hide the overlay, recording frames while it is shown."""
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.enable()
+        elif not self.record_always:
+            self.profiler.disable()
+        logger.info("Profiler overlay %s", "shown" if self.visible else "hidden")
+
+    def render(self, state):
+        """Draw the overlay for the given state.
+
+        Args:
+            state (str): Application state whose frames are summarized.
+        """
+        if not self.visible:
+            return
+        x, y = PROFILER_OVERLAY_POS
+        self.screen.blit(self.background, (x, y))
+        stats = self.profiler.stats(state)
+        line_height = self.font.get_linesize()
+        if stats is None:
+            render_text(self.font, f"[{state}] collecting...", TEXT_COLOR, x + px(8), y + px(6), self.screen)
+            return
+        lines = [
+            f"[{state}] {stats['fps']:.1f} FPS ({stats['frames']} frames)",
+            f"frame p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  p99 {stats['p99']:.2f} ms",
+        ]
+        lines += [f"  {name:<8} {stats['phases'][name]:6.2f} ms" for name in PHASES]
+        for i, line in enumerate(lines):
+            render_text(self.font, line, TEXT_COLOR, x + px(8), y + px(6) + i * line_height, self.screen)
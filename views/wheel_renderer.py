@@ -0,0 +1,278 @@
+import math
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from constants import (
+    WHEEL_RADIUS, SEGMENT_COLORS, FONT_SIZE, FONT_SIZE_REDUCTION, BORDER_THICKNESS, CIRCLE_RADIUS,
+    WHEEL_ARC_STEP, WHEEL_LABEL_MIN_PX, WHEEL_LABEL_PADDING, WHEEL_LABEL_FILL, WHEEL_BORDER_MIN_PX, WHEEL_CACHE_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+ELLIPSIS = "…"
+
+def segment_colors(count, palette=SEGMENT_COLORS):
+    """Cycle the palette over the segments without giving the first and last segment the same color.
+
+    Args:
+        count (int): Number of segments.
+        palette (list): Colors to cycle.
+
+    Returns:
+        list: One color per segment.
+    """
+    colors = [palette[i % len(palette)] for i in range(count)]
+    if count > 1 and len(palette) > 2 and count % len(palette) == 1:
+        colors[-1] = palette[1]
+    return colors
+
+def arc_polygons(boundaries, center, radius, step=WHEEL_ARC_STEP):
+    """Compute the outline of every segment in one pass.
+
+    The rim is sampled once on a grid of at most step degrees that includes
+    every segment boundary, and each segment takes its slice of that grid.
+
+    Args:
+        boundaries (numpy.ndarray): Segment boundary angles in degrees, n + 1 ascending values.
+        center (tuple): Wheel center in pixels.
+        radius (float): Wheel radius in pixels.
+        step (float): Maximum angle between rim points in degrees.
+
+    Returns:
+        list: One list of (x, y) points per segment, starting at the center.
+    """
+    boundaries = np.asarray(boundaries, dtype=float)
+    grid = np.arange(boundaries[0], boundaries[-1], step)
+    angles = np.unique(np.concatenate((grid, boundaries)))
+    radians = np.radians(angles)
+    points = np.column_stack((center[0] + radius * np.cos(radians), center[1] - radius * np.sin(radians)))
+    index = np.searchsorted(angles, boundaries)
+    center = (float(center[0]), float(center[1]))
+    return [[center] + points[index[i]:index[i + 1] + 1].tolist() for i in range(len(boundaries) - 1)]
+
+class WheelLayout:
+    """Geometry of one wheel image, free of pygame objects."""
+
+    __slots__ = ("size", "center", "polygons", "colors", "borders", "labels", "label_width")
+
+    def __init__(self, size, center, polygons, colors, borders, labels, label_width):
+        """Initialize the WheelLayout.
+
+        Args:
+            size (int): Width and height of the image.
+            center (tuple): Wheel center in the image.
+            polygons (list): Outline points of every segment.
+            colors (list): Color of every segment.
+            borders (list): (start, end) points of the radial borders.
+            labels (list): (text, font size, angle in degrees, center) of every label large enough to show.
+            label_width (float): Length of the radius available to a label, in pixels.
+        """
+        self.size = size
+        self.center = center
+        self.polygons = polygons
+        self.colors = colors
+        self.borders = borders
+        self.labels = labels
+        self.label_width = label_width
+
+class WheelRenderer:
+    """Draws wheels with any number of segments from a cached base image.
+
+    This class renders each distinct wheel once, unrotated, with arc-shaped
+    segments and radial labels, then rotates that image per frame. Level of
+    detail is decided per segment when the base image is built: labels
+    shrink with the segment, are truncated to fit the radius and are hidden
+    below WHEEL_LABEL_MIN_PX; radial borders only start where a segment is wide enough.
+    """
+
+    def __init__(self, radius=WHEEL_RADIUS, max_font_size=FONT_SIZE - FONT_SIZE_REDUCTION, cache_size=WHEEL_CACHE_SIZE):
+        """Initialize the WheelRenderer.
+
+        Args:
+            radius (int): Wheel radius in pixels.
+            max_font_size (int): Largest label font size.
+            cache_size (int): Number of base images kept.
+        """
+        self.radius = radius
+        self.max_font_size = max_font_size
+        self.cache_size = cache_size
+        self.bases = OrderedDict()
+        self._lock = threading.Lock()
+        self.fonts = {}
+        self._rotated_from = None
+        self._rotated = None
+
+    def font(self, size):
+        """Get the label font of a size, loading it once."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.SysFont("Arial", size, bold=True)
+        return font
+
+    @staticmethod
+    def boundaries(wheel_model):
+        """Get the segment boundary angles of a wheel, in degrees from 0 to 360."""
+        return wheel_model.boundaries
+
+    def reserve(self, count):
+        """Keep at least count base images cached, e.g. one per wheel of a prebuilt deck.
+
+        Args:
+            count (int): Number of base images that must fit in the cache.
+        """
+        self.cache_size = max(self.cache_size, count)
+
+    def clear(self):
+        """Drop every cached base image and the cached resting rotation."""
+        with self._lock:
+            self.bases.clear()
+            self._rotated_from = None
+            self._rotated = None
+
+    def base_image(self, wheel_model, layout=None):
+        """Get the unrotated wheel image, building it on first use. Must be called on the main thread.
+
+        Args:
+            wheel_model: SpinWheelModel instance.
+            layout (WheelLayout): Geometry of the wheel computed ahead with layout(), or None to compute it here.
+
+        Returns:
+            pygame.Surface: Wheel image of size (2 * radius + 2) squared.
+        """
+        key = (tuple(wheel_model.segments), self.boundaries(wheel_model).tobytes())
+        base = self._cached(key)
+        if base is not None:
+            return base
+        if layout is None:
+            layout = self.layout(wheel_model.segments, self.boundaries(wheel_model))
+        base = self.paint(layout)
+        with self._lock:
+            self.bases[key] = base
+            if len(self.bases) > self.cache_size:
+                self.bases.popitem(last=False)
+        return base
+
+    def _cached(self, key):
+        """Look up a base image and mark it as recently used."""
+        with self._lock:
+            base = self.bases.get(key)
+            if base is not None:
+                self.bases.move_to_end(key)
+            return base
+
+    def build(self, segments, boundaries):
+        """Render a wheel at angle 0.
+
+        Args:
+            segments (list): Segment labels.
+            boundaries (numpy.ndarray): Segment boundary angles in degrees.
+
+        Returns:
+            pygame.Surface: Transparent wheel image.
+        """
+        return self.paint(self.layout(segments, boundaries))
+
+    def layout(self, segments, boundaries):
+        """Compute where the segments, borders and labels of a wheel go.
+
+        Only NumPy and math are used, so a background thread can prepare the
+        layout while the main thread keeps the pygame work.
+
+        Args:
+            segments (list): Segment labels.
+            boundaries (numpy.ndarray): Segment boundary angles in degrees.
+
+        Returns:
+            WheelLayout: Geometry of the wheel image.
+        """
+        size = 2 * self.radius + 2
+        center = (size / 2, size / 2)
+        polygons = arc_polygons(boundaries, center, self.radius)
+        spans = np.radians(np.diff(boundaries))
+        borders = []
+        if len(segments) > 1:
+            # Radial borders start where the segment is WHEEL_BORDER_MIN_PX wide, so thin
+            # segments get short border ticks at the rim and none near the crowded center.
+            starts = np.minimum(WHEEL_BORDER_MIN_PX / np.maximum(spans, 1e-9), self.radius)
+            radians = np.radians(boundaries[:-1])
+            for start, angle in zip(starts, radians):
+                if start < self.radius - BORDER_THICKNESS:
+                    direction = (math.cos(angle), -math.sin(angle))
+                    borders.append(((center[0] + start * direction[0], center[1] + start * direction[1]),
+                                    (center[0] + self.radius * direction[0], center[1] + self.radius * direction[1])))
+        inner = CIRCLE_RADIUS + WHEEL_LABEL_PADDING
+        outer = self.radius - WHEEL_LABEL_PADDING
+        radius = (inner + outer) / 2
+        labels = []
+        mids = np.radians(boundaries[:-1]) + spans / 2
+        for label, span, mid in zip(segments, spans, mids):
+            height = 2 * radius * math.sin(min(span, math.pi) / 2) * WHEEL_LABEL_FILL
+            font_size = int(min(self.max_font_size, height))
+            if font_size >= WHEEL_LABEL_MIN_PX:
+                pos = (center[0] + radius * math.cos(mid), center[1] - radius * math.sin(mid))
+                labels.append((str(label), font_size, math.degrees(mid), pos))
+        return WheelLayout(size, center, polygons, segment_colors(len(segments)), borders, labels, outer - inner)
+
+    def paint(self, layout):
+        """Render a wheel from its layout. Must be called on the main thread.
+
+        Args:
+            layout (WheelLayout): Geometry from layout().
+
+        Returns:
+            pygame.Surface: Transparent wheel image.
+        """
+        surface = pygame.Surface((layout.size, layout.size), pygame.SRCALPHA)
+        for polygon, color in zip(layout.polygons, layout.colors):
+            pygame.draw.polygon(surface, color, polygon)
+        for start, end in layout.borders:
+            pygame.draw.line(surface, (0, 0, 0), start, end, BORDER_THICKNESS)
+        pygame.draw.circle(surface, (0, 0, 0), layout.center, self.radius, BORDER_THICKNESS)
+        for label, font_size, angle, pos in layout.labels:
+            font = self.font(font_size)
+            text = self._truncate(label, font, layout.label_width)
+            if text:
+                text_surface = pygame.transform.rotozoom(font.render(text, True, (0, 0, 0)), angle, 1)
+                surface.blit(text_surface, text_surface.get_rect(center=pos))
+        logger.debug("Wheel base image built for %d segments", len(layout.polygons))
+        return surface.convert_alpha() if pygame.display.get_surface() else surface
+
+    @staticmethod
+    def _truncate(text, font, width):
+        """Shorten text with an ellipsis until it fits the width."""
+        if font.size(text)[0] <= width:
+            return text
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if font.size(text[:mid] + ELLIPSIS)[0] <= width:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low] + ELLIPSIS if low else ""
+
+    def draw(self, screen, wheel_model, center):
+        """Draw the wheel rotated to the model's angle.
+
+        While spinning, the base image is rotated without filtering; at rest
+        it is rotated once with smoothing and reused until the angle changes.
+
+        Args:
+            screen: Pygame surface to draw on.
+            wheel_model: SpinWheelModel instance.
+            center (tuple): Wheel center on the screen.
+        """
+        base = self.base_image(wheel_model)
+        angle = wheel_model.angle % 360
+        if wheel_model.spinning:
+            rotated = pygame.transform.rotate(base, angle)
+        else:
+            if self._rotated_from != (base, angle):
+                self._rotated_from = (base, angle)
+                self._rotated = pygame.transform.rotozoom(base, angle, 1)
+            rotated = self._rotated
+        screen.blit(rotated, rotated.get_rect(center=center))
@@ -0,0 +1,126 @@
+import pygame
+import logging
+from constants import BORDER_RADIUS, px
+from utils import draw_button
+
+logger = logging.getLogger(__name__)
+
+class Widget:
+    """Retained UI element that caches its rendered surface.
+
+    This class redraws the widget only after invalidate() was called; every
+    other frame draw() blits the cached surface. Subclasses implement
+    _bounds() for the screen area they cover (including labels and shadows)
+    and _redraw() to paint that area in local coordinates.
+    """
+
+    def __init__(self):
+        """Initialize the Widget."""
+        self.dirty = True
+        self.redraws = 0
+        self._surface = None
+        self._origin = (0, 0)
+
+    def invalidate(self):
+        """Mark the cached surface as stale."""
+        self.dirty = True
+
+    def _bounds(self):
+        """Get the screen area covered by the widget.
+
+        Returns:
+            pygame.Rect: Screen-space bounds.
+        """
+        raise NotImplementedError
+
+    def _redraw(self, surface, origin):
+        """Paint the widget onto its cache surface.
+
+        Args:
+            surface (pygame.Surface): Transparent surface the size of the bounds.
+            origin (tuple): Screen position of the surface's top-left corner.
+        """
+        raise NotImplementedError
+
+    def release(self):
+        """Drop the cached surface; the next draw() renders it again."""
+        self._surface = None
+        self.dirty = True
+
+    def local(self, rect, origin):
+        """Translate a screen-space rect into the cache surface's coordinates."""
+        return rect.move(-origin[0], -origin[1])
+
+    def surface(self):
+        """Get the cached surface, redrawing it if the widget was invalidated.
+
+        Returns:
+            pygame.Surface: Rendered widget.
+        """
+        if self.dirty or self._surface is None:
+            bounds = self._bounds()
+            if self._surface is None or self._surface.get_size() != bounds.size:
+                self._surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            else:
+                self._surface.fill((0, 0, 0, 0))
+            self._origin = bounds.topleft
+            self._redraw(self._surface, self._origin)
+            self.dirty = False
+            self.redraws += 1
+        return self._surface
+
+    def draw(self, screen):
+        """Blit the cached surface to the screen.
+
+        Args:
+            screen: Pygame surface to draw on.
+        """
+        surface = self.surface()
+        screen.blit(surface, self._origin)
+
+class ButtonWidget(Widget):
+    """Button drawn from a button dict, redrawn only when its hover state changes."""
+
+    def __init__(self, button, font, shadow_color=(40, 40, 50)):
+        """Initialize the ButtonWidget.
+
+        Args:
+            button (dict): Button with 'rect', 'text', 'color' and 'hover' keys.
+            font: Pygame font for the label.
+            shadow_color (tuple): Color of the outer shadow.
+        """
+        super().__init__()
+        self.button = button
+        self.font = font
+        self.shadow_color = shadow_color
+        self.hovered = False
+
+    def set_hovered(self, hovered):
+        """Update the hover state, invalidating only on a change.
+
+        Args:
+            hovered (bool): True if the mouse is over the button.
+        """
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self.invalidate()
+
+    def set_text(self, text):
+        """Change the label, invalidating only on a change.
+
+        Args:
+            text (str): New label.
+        """
+        if text != self.button['text']:
+            self.button['text'] = text
+            self.invalidate()
+
+    def _bounds(self):
+        rect = self.button['rect']
+        return rect.union(rect.move(px(8), px(8)))
+
+    def _redraw(self, surface, origin):
+        rect = self.local(self.button['rect'], origin)
+        pygame.draw.rect(surface, self.shadow_color, rect.move(px(4), px(4)), border_radius=BORDER_RADIUS)
+        color = self.button['hover'] if self.hovered else self.button['color']
+        draw_button(surface, rect, color, self.button['text'], self.font)